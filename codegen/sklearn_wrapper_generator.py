@@ -8,7 +8,10 @@ from typing import Any, Dict, List, Tuple
 
 import inflection
 import numpy as np
-from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.experimental import (  # noqa: F401
+    enable_halving_search_cv,
+    enable_iterative_imputer,
+)
 
 NP_CONSTANTS = [c for c in dir(np) if type(getattr(np, c, None)) == float or type(getattr(np, c, None)) == int]
 LOAD_BREAST_CANCER = "load_breast_cancer"
@@ -350,6 +353,30 @@ class WrapperGeneratorFactory:
         """
         return WrapperGeneratorFactory._is_class_of_type(class_object[1], "RandomizedSearchCV")
 
+    @staticmethod
+    def _is_halving_grid_search_cv(class_object: Tuple[str, type]) -> bool:
+        """Check if given module is HalvingGridSearchCV.
+
+        Args:
+            class_object: Meta class object which needs to be checked.
+
+        Returns:
+            True if class is HalvingGridSearchCV, otherwise False.
+        """
+        return WrapperGeneratorFactory._is_class_of_type(class_object[1], "HalvingGridSearchCV")
+
+    @staticmethod
+    def _is_halving_random_search_cv(class_object: Tuple[str, type]) -> bool:
+        """Check if given module is HalvingRandomSearchCV.
+
+        Args:
+            class_object: Meta class object which needs to be checked.
+
+        Returns:
+            True if class is HalvingRandomSearchCV, otherwise False.
+        """
+        return WrapperGeneratorFactory._is_class_of_type(class_object[1], "HalvingRandomSearchCV")
+
     @staticmethod
     def _is_column_transformer(class_object: Tuple[str, type]) -> bool:
         """Check if given module is ColumnTransformer.
@@ -617,6 +644,8 @@ class WrapperGeneratorBase:
         self._is_column_transformer = WrapperGeneratorFactory._is_column_transformer(self.class_object)
         self._is_grid_search_cv = WrapperGeneratorFactory._is_grid_search_cv(self.class_object)
         self._is_randomized_search_cv = WrapperGeneratorFactory._is_randomized_search_cv(self.class_object)
+        self._is_halving_grid_search_cv = WrapperGeneratorFactory._is_halving_grid_search_cv(self.class_object)
+        self._is_halving_random_search_cv = WrapperGeneratorFactory._is_halving_random_search_cv(self.class_object)
         self._is_iterative_imputer = WrapperGeneratorFactory._is_iterative_imputer(self.class_object)
 
     def _populate_import_statements(self) -> None:
@@ -624,6 +653,10 @@ class WrapperGeneratorBase:
         if self.original_class_name == "IterativeImputer":
             self.estimator_imports_list.append("from sklearn.experimental import enable_iterative_imputer")
             self.test_estimator_imports_list.append("from sklearn.experimental import enable_iterative_imputer")
+        if self._is_halving_grid_search_cv or self._is_halving_random_search_cv:
+            # The successive halving searches are experimental and only importable once enabled.
+            self.estimator_imports_list.append("from sklearn.experimental import enable_halving_search_cv")
+            self.test_estimator_imports_list.append("from sklearn.experimental import enable_halving_search_cv")
 
     def _populate_class_doc_fields(self) -> None:
         # It's possible to use inspect.getmro(transformer[1]) to get class inheritance.
@@ -841,7 +874,7 @@ class WrapperGeneratorBase:
         if self._is_column_transformer:
             self.test_estimator_imports_list.append("from sklearn.preprocessing import StandardScaler, RobustScaler")
 
-        if self._is_randomized_search_cv:
+        if self._is_randomized_search_cv or self._is_halving_random_search_cv:
             self.test_estimator_imports_list.append("from scipy.stats import uniform")
 
     def _construct_string_from_lists(self) -> None:
@@ -952,10 +985,10 @@ class SklearnWrapperGenerator(WrapperGeneratorBase):
                         ),
                     ]
                 )
-        elif self._is_grid_search_cv:
+        elif self._is_grid_search_cv or self._is_halving_grid_search_cv:
             self.test_estimator_input_args_list.append("estimator=SkLogisticRegression(random_state=0, solver='saga')")
             self.test_estimator_input_args_list.append('param_grid={"C": [1, 10], "penalty": ("l1", "l2")}')
-        elif self._is_randomized_search_cv:
+        elif self._is_randomized_search_cv or self._is_halving_random_search_cv:
             self.test_estimator_input_args_list.append("estimator=SkLogisticRegression(random_state=0, solver='saga')")
             self.test_estimator_input_args_list.append(
                 'param_distributions=dict(C=uniform(loc=0, scale=4),penalty=["l2", "l1"])'
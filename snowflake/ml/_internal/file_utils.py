@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import hashlib
 import importlib
 import io
@@ -10,7 +11,9 @@ import shutil
 import sys
 import tarfile
 import tempfile
+import time
 import zipfile
+from concurrent import futures
 from typing import (
     Any,
     Callable,
@@ -31,6 +34,13 @@ from snowflake.ml._internal.exceptions import exceptions
 
 GENERATED_PY_FILE_EXT = (".pyc", ".pyo", ".pyd", ".pyi")
 
+# The default number of PUT or GET commands run at the same time when transferring a directory to or from a stage.
+STAGE_TRANSFER_MAX_WORKERS = 8
+# Characters making a local directory path unusable as the base of a wildcard PUT.
+_PUT_WILDCARD_SPECIAL_CHARS = frozenset("*?[]")
+
+logger = logging.getLogger(__name__)
+
 
 def copytree(
     src: "Union[str, os.PathLike[str]]",
@@ -286,49 +296,165 @@ def stage_file_exists(
         return False
 
 
+def _compute_file_md5(file_path: pathlib.Path) -> str:
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _list_stage_files(
+    session: snowpark.Session, stage_path: pathlib.PurePosixPath
+) -> Dict[pathlib.PurePosixPath, Tuple[int, str]]:
+    """List the files in a stage directory recursively.
+
+    Args:
+        session: Snowpark Session.
+        stage_path: Stage path to list.
+
+    Returns:
+        A dict from the paths of the files relative to stage_path to their sizes and md5 digests.
+    """
+    stage_files = {}
+    for row in session.sql(f"ls {stage_path}").collect():
+        stage_file_path = pathlib.PurePosixPath(stage_path.parts[0], *pathlib.PurePosixPath(row.name).parts[1:])
+        try:
+            rel_path = stage_file_path.relative_to(stage_path)
+        except ValueError:
+            # LIST matches the stage path as a prefix, which includes siblings like "path2" for "path".
+            continue
+        stage_files[rel_path] = (int(row.size), str(row.md5))
+    return stage_files
+
+
+def _is_same_file(local_file_path: pathlib.Path, stage_file: Tuple[int, str]) -> bool:
+    size, md5 = stage_file
+    # Only compute the md5 digest when the sizes match.
+    return local_file_path.stat().st_size == size and _compute_file_md5(local_file_path) == md5
+
+
+def _run_stage_transfers(transfers: List[Tuple[str, Callable[[], int]]], max_workers: int, action: str) -> None:
+    """Run stage transfers in a thread pool, logging the time taken by each of them and the overall throughput.
+
+    Args:
+        transfers: Pairs of the name of the transfer and of a function running it and returning the number of bytes
+            transferred.
+        max_workers: The maximum number of transfers run at the same time.
+        action: The past participle of the transfer, used in the logs, e.g. "Uploaded".
+    """
+
+    def run_transfer(transfer: Tuple[str, Callable[[], int]]) -> int:
+        name, transfer_fn = transfer
+        start_time = time.perf_counter()
+        transferred_bytes = transfer_fn()
+        logger.debug(f"{action} {name}: {transferred_bytes} bytes in {time.perf_counter() - start_time:.3f}s.")
+        return transferred_bytes
+
+    start_time = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        total_bytes = sum(executor.map(run_transfer, transfers))
+    elapsed_time = time.perf_counter() - start_time
+    logger.info(
+        f"{action} {total_bytes} bytes with {len(transfers)} commands in {elapsed_time:.2f}s "
+        f"({total_bytes / max(elapsed_time, 1e-6) / 1024**2:.2f} MB/s)."
+    )
+
+
+def _put(file_operation: snowpark.FileOperation, local_file_name: str, stage_location: str) -> int:
+    put_results = file_operation.put(local_file_name, stage_location, auto_compress=False, overwrite=False)
+    return sum(put_result.source_size for put_result in put_results)
+
+
+def _get(file_operation: snowpark.FileOperation, stage_location: str, target_directory: str) -> int:
+    get_results = file_operation.get(stage_location, target_directory)
+    return sum(int(get_result.size) for get_result in get_results)
+
+
 def upload_directory_to_stage(
-    session: snowpark.Session, local_path: pathlib.Path, stage_path: pathlib.PurePosixPath
+    session: snowpark.Session,
+    local_path: pathlib.Path,
+    stage_path: pathlib.PurePosixPath,
+    max_workers: int = STAGE_TRANSFER_MAX_WORKERS,
 ) -> None:
     """Upload a local folder recursively to a stage and keep the structure.
 
+    Files already in the stage with the same size and md5 digest are skipped. The files of a directory are uploaded
+    with a single wildcard PUT when none of them is skipped, while the other files are uploaded one PUT each, with up
+    to max_workers PUTs running at the same time.
+
     Args:
         session: Snowpark Session.
         local_path: Local path to upload.
         stage_path: Base path in the stage.
+        max_workers: The maximum number of PUTs running at the same time.
     """
     file_operation = snowpark.FileOperation(session=session)
+    stage_files = _list_stage_files(session, stage_path)
 
+    transfers: List[Tuple[str, Callable[[], int]]] = []
     for root, _, filenames in os.walk(local_path):
         root_path = pathlib.Path(root)
+        rel_dir_path = pathlib.PurePosixPath(root_path.relative_to(local_path).as_posix())
+        stage_dir_path = str(stage_path / rel_dir_path)
+        upload_filenames = []
         for filename in filenames:
-            local_file_path = root_path / filename
-            stage_dir_path = (
-                stage_path / pathlib.PurePosixPath(local_file_path.relative_to(local_path).as_posix()).parent
-            )
-            file_operation.put(
-                str(local_file_path),
-                str(stage_dir_path),
-                auto_compress=False,
-                overwrite=False,
+            stage_file = stage_files.get(rel_dir_path / filename)
+            if stage_file is not None and _is_same_file(root_path / filename, stage_file):
+                logger.debug(f"Skipped uploading {root_path / filename}, which already exists in {stage_dir_path}.")
+            else:
+                upload_filenames.append(filename)
+
+        # A wildcard does not match hidden files.
+        if (
+            len(upload_filenames) > 1
+            and len(upload_filenames) == len(filenames)
+            and not any(filename.startswith(".") for filename in filenames)
+            and not _PUT_WILDCARD_SPECIAL_CHARS.intersection(root)
+        ):
+            local_file_name = str(root_path / "*")
+            transfers.append(
+                (local_file_name, functools.partial(_put, file_operation, local_file_name, stage_dir_path))
             )
+        else:
+            for filename in upload_filenames:
+                local_file_name = str(root_path / filename)
+                transfers.append(
+                    (local_file_name, functools.partial(_put, file_operation, local_file_name, stage_dir_path))
+                )
+
+    _run_stage_transfers(transfers, max_workers, action="Uploaded")
 
 
 def download_directory_from_stage(
-    session: snowpark.Session, stage_path: pathlib.PurePosixPath, local_path: pathlib.Path
+    session: snowpark.Session,
+    stage_path: pathlib.PurePosixPath,
+    local_path: pathlib.Path,
+    max_workers: int = STAGE_TRANSFER_MAX_WORKERS,
 ) -> None:
-    """Upload a folder in stage recursively to a folder in local and keep the structure.
+    """Download a folder in stage recursively to a folder in local and keep the structure.
+
+    Files already in the local folder with the same size and md5 digest are skipped. The other files are downloaded one
+    GET each, with up to max_workers GETs running at the same time.
 
     Args:
         session: Snowpark Session.
         stage_path: Stage path to download from.
         local_path: Local path as the base of destination.
+        max_workers: The maximum number of GETs running at the same time.
     """
-    file_operation = file_operation = snowpark.FileOperation(session=session)
-    file_list = [
-        pathlib.PurePosixPath(stage_path.parts[0], *pathlib.PurePosixPath(row.name).parts[1:])
-        for row in session.sql(f"ls {stage_path}").collect()
-    ]
-    for stage_file_path in file_list:
-        local_file_dir = local_path / stage_file_path.relative_to(stage_path).parent
-        local_file_dir.mkdir(parents=True, exist_ok=True)
-        file_operation.get(str(stage_file_path), str(local_file_dir))
+    file_operation = snowpark.FileOperation(session=session)
+
+    transfers: List[Tuple[str, Callable[[], int]]] = []
+    for rel_path, stage_file in _list_stage_files(session, stage_path).items():
+        local_file_path = local_path / rel_path
+        stage_file_path = str(stage_path / rel_path)
+        if local_file_path.exists() and _is_same_file(local_file_path, stage_file):
+            logger.debug(f"Skipped downloading {stage_file_path}, which already exists in {local_file_path.parent}.")
+            continue
+        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+        transfers.append(
+            (stage_file_path, functools.partial(_get, file_operation, stage_file_path, str(local_file_path.parent)))
+        )
+
+    _run_stage_transfers(transfers, max_workers, action="Downloaded")
@@ -1,13 +1,19 @@
+import hashlib
 import importlib
 import os
+import pathlib
 import shutil
 import sys
 import tempfile
 from datetime import datetime
+from typing import cast
+from unittest import mock
 
 from absl.testing import absltest
 
 from snowflake.ml._internal import file_utils
+from snowflake.ml.test_utils import mock_data_frame, mock_session
+from snowflake.snowpark import FileOperation, Row, Session
 
 PY_SRC = """\
 def get_name():
@@ -207,6 +213,66 @@ class FileUtilsTest(absltest.TestCase):
         self.assertTrue(file_utils._able_ascii_encode("abc"))
         self.assertFalse(file_utils._able_ascii_encode("❄️"))
 
+    def test_upload_directory_to_stage(self) -> None:
+        m_session = mock_session.MockSession(conn=None, test_case=self)
+        stage_path = pathlib.PurePosixPath('@"db"."schema"."stage"/model')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for rel_path in ["a/x.txt", "a/y.txt", "b/.hidden", "b/z.txt", "c.txt", "same.txt"]:
+                os.makedirs(os.path.dirname(os.path.join(tmpdir, rel_path)), exist_ok=True)
+                with open(os.path.join(tmpdir, rel_path), "w", encoding="utf-8") as f:
+                    f.write(rel_path)
+            m_session.add_mock_sql(
+                query=f"ls {stage_path}",
+                result=mock_data_frame.MockDataFrame(
+                    collect_result=[
+                        Row(name="stage/model/same.txt", size=8, md5=hashlib.md5(b"same.txt").hexdigest()),
+                        Row(name="stage/model2/c.txt", size=5, md5=hashlib.md5(b"c.txt").hexdigest()),
+                    ]
+                ),
+            )
+            with mock.patch.object(FileOperation, "put", return_value=[]) as mock_put:
+                file_utils.upload_directory_to_stage(
+                    cast(Session, m_session), local_path=pathlib.Path(tmpdir), stage_path=stage_path
+                )
+            # The files of "a" are uploaded with a wildcard, the hidden file of "b" prevents it, "same.txt" is skipped.
+            mock_put.assert_has_calls(
+                [
+                    mock.call(os.path.join(tmpdir, "a", "*"), f"{stage_path}/a", auto_compress=False, overwrite=False),
+                    mock.call(
+                        os.path.join(tmpdir, "b", ".hidden"), f"{stage_path}/b", auto_compress=False, overwrite=False
+                    ),
+                    mock.call(
+                        os.path.join(tmpdir, "b", "z.txt"), f"{stage_path}/b", auto_compress=False, overwrite=False
+                    ),
+                    mock.call(os.path.join(tmpdir, "c.txt"), str(stage_path), auto_compress=False, overwrite=False),
+                ],
+                any_order=True,
+            )
+            self.assertEqual(mock_put.call_count, 4)
+
+    def test_download_directory_from_stage(self) -> None:
+        m_session = mock_session.MockSession(conn=None, test_case=self)
+        stage_path = pathlib.PurePosixPath('@"db"."schema"."stage"/model')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "same.txt"), "w", encoding="utf-8") as f:
+                f.write("same.txt")
+            m_session.add_mock_sql(
+                query=f"ls {stage_path}",
+                result=mock_data_frame.MockDataFrame(
+                    collect_result=[
+                        Row(name="stage/model/a/x.txt", size=7, md5=hashlib.md5(b"a/x.txt").hexdigest()),
+                        Row(name="stage/model/same.txt", size=8, md5=hashlib.md5(b"same.txt").hexdigest()),
+                        Row(name="stage/model2/c.txt", size=5, md5=hashlib.md5(b"c.txt").hexdigest()),
+                    ]
+                ),
+            )
+            with mock.patch.object(FileOperation, "get", return_value=[]) as mock_get:
+                file_utils.download_directory_from_stage(
+                    cast(Session, m_session), stage_path=stage_path, local_path=pathlib.Path(tmpdir)
+                )
+            mock_get.assert_called_once_with(f"{stage_path}/a/x.txt", os.path.join(tmpdir, "a"))
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, "a")))
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -100,12 +100,12 @@ class ImageRegistryHttpClient:
         return self._retryable_http.get(login_url, headers={"Authorization": f"Basic {base64_encoded_token}"})
 
     @retry_on_error
-    def head(self, api_url: str, *, headers: Optional[Dict[str, str]] = None) -> requests.Response:
-        return self._retryable_http.head(api_url, headers=self._with_bearer_token_header(headers))
+    def head(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
+        return self._retryable_http.head(api_url, headers=self._with_bearer_token_header(headers), **kwargs)
 
     @retry_on_error
-    def get(self, api_url: str, *, headers: Optional[Dict[str, str]] = None) -> requests.Response:
-        return self._retryable_http.get(api_url, headers=self._with_bearer_token_header(headers))
+    def get(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
+        return self._retryable_http.get(api_url, headers=self._with_bearer_token_header(headers), **kwargs)
 
     @retry_on_error
     def put(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
@@ -16,7 +16,7 @@ from snowflake.ml._internal.utils import (
     import_utils,
     snowpark_dataframe_utils,
 )
-from snowflake.ml.fileset import sfcfs
+from snowflake.ml.fileset import local_cache, sfcfs
 from snowflake.snowpark import exceptions as snowpark_exceptions, functions
 
 # The max file size for data loading.
@@ -55,6 +55,8 @@ class FileSet:
         name: str,
         sf_connection: Optional[connection.SnowflakeConnection] = None,
         snowpark_session: Optional[snowpark.Session] = None,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = local_cache.DEFAULT_LOCAL_CACHE_SIZE,
     ) -> None:
         """Create a FileSet based on an existing stage directory.
 
@@ -66,6 +68,11 @@ class FileSet:
             target_stage_loc: A string of the Snowflake stage path where the FileSet will be stored.
                 It needs to be an absolute path with the form of "@{database}.{schema}.{stage}/{optional directory}/".
             name: The name of the FileSet. It is the name of the directory which holds result stage files.
+            local_cache_dir: Optional. A local directory to cache the stage files in once they are read. Iterating over
+                the FileSet again, e.g. in the next training epoch, reads the files from the local disk instead of
+                downloading them again.
+            local_cache_size: The maximum total size in bytes of the files cached in local_cache_dir. The least
+                recently used files are evicted first.
 
         Raises:
             SnowflakeMLException: An error occurred when not exactly one of sf_connection and snowpark_session is given.
@@ -116,6 +123,8 @@ class FileSet:
             snowpark_session=self._snowpark_session,
             cache_type="bytes",
             block_size=2 * TARGET_FILE_SIZE,
+            local_cache_dir=local_cache_dir,
+            local_cache_size=local_cache_size,
         )
         self._files: List[str] = []
         self._is_deleted = False
@@ -132,6 +141,8 @@ class FileSet:
         sf_connection: Optional[connection.SnowflakeConnection] = None,
         query: str = "",
         shuffle: bool = False,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = local_cache.DEFAULT_LOCAL_CACHE_SIZE,
     ) -> "FileSet":
         """Creates a FileSet object given a SQL query.
 
@@ -148,6 +159,8 @@ class FileSet:
             query: A string of Snowflake SQL query to be executed. Mutually exclusive to `snowpark_dataframe`. Must
                 also specify `sf_connection`.
             shuffle: A boolean represents whether the data should be shuffled globally. Default to be false.
+            local_cache_dir: Optional. A local directory to cache the stage files in once they are read.
+            local_cache_size: The maximum total size in bytes of the files cached in local_cache_dir.
 
         Returns:
             A FileSet object.
@@ -263,7 +276,13 @@ class FileSet:
             else:
                 raise fileset_errors.FileSetError(str(e))
 
-        return cls(target_stage_loc=target_stage_loc, name=name, snowpark_session=snowpark_session)
+        return cls(
+            target_stage_loc=target_stage_loc,
+            name=name,
+            snowpark_session=snowpark_session,
+            local_cache_dir=local_cache_dir,
+            local_cache_size=local_cache_size,
+        )
 
     @property
     def name(self) -> str:
@@ -330,11 +349,30 @@ class FileSet:
 
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
-        func_params_to_log=["batch_size", "shuffle", "drop_last_batch"],
+        func_params_to_log=[
+            "batch_size",
+            "shuffle",
+            "drop_last_batch",
+            "num_readers",
+            "prefetch_size",
+            "shuffle_buffer_size",
+            "shuffle_row_groups",
+        ],
     )
     @snowpark._internal.utils.private_preview(version="0.2.0")
     @_raise_if_deleted
-    def to_torch_datapipe(self, *, batch_size: int, shuffle: bool = False, drop_last_batch: bool = True) -> Any:
+    def to_torch_datapipe(
+        self,
+        *,
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last_batch: bool = True,
+        num_readers: int = 1,
+        prefetch_size: Optional[int] = None,
+        shuffle_buffer_size: Optional[int] = None,
+        shuffle_row_groups: bool = False,
+        seed: Optional[int] = None,
+    ) -> Any:
         """Transform the Snowflake data into a ready-to-use Pytorch datapipe.
 
         Return a Pytorch datapipe which iterates on rows of data.
@@ -346,6 +384,19 @@ class FileSet:
                 rows in each file will also be shuffled.
             drop_last_batch: Whether the last batch of data should be dropped. If set to be true,
                 then the last batch will get dropped if its size is smaller than the given batch_size.
+            num_readers: Number of threads that read and decode files concurrently. Reading several files at a time
+                helps when the training loop is bound by reads from the stage. The order of the data does not depend
+                on the number of readers.
+            prefetch_size: Optional. Maximum number of files read ahead of the training loop. Defaults to twice
+                num_readers. Only used when num_readers is larger than 1.
+            shuffle_buffer_size: Optional. If given and shuffle is True, rows are shuffled through a buffer of about
+                this many rows instead of within each file, so that rows of different files get mixed. It gives a
+                better randomization for data that is ordered, e.g. by time, at the cost of memory.
+            shuffle_row_groups: If True and shuffle is True, the row groups of all files are read in random order
+                instead of the files. Row groups are found from the parquet metadata, so the data is not loaded in
+                memory at once.
+            seed: Optional. The seed used to shuffle the data. Every epoch is shuffled differently, but the sequence of
+                epochs is reproducible.
 
         Returns:
             A Pytorch iterable datapipe that yield data.
@@ -368,15 +419,45 @@ class FileSet:
         self._fs.optimize_read(self._list_files())
 
         input_dp = IterableWrapper(self._list_files())
-        return torch_datapipe_module.ReadAndParseParquet(input_dp, self._fs, batch_size, shuffle, drop_last_batch)
+        return torch_datapipe_module.ReadAndParseParquet(
+            input_dp,
+            self._fs,
+            batch_size,
+            shuffle,
+            drop_last_batch,
+            num_readers=num_readers,
+            prefetch_size=prefetch_size,
+            shuffle_buffer_size=shuffle_buffer_size,
+            shuffle_row_groups=shuffle_row_groups,
+            seed=seed,
+        )
 
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
-        func_params_to_log=["batch_size", "shuffle", "drop_last_batch"],
+        func_params_to_log=[
+            "batch_size",
+            "shuffle",
+            "drop_last_batch",
+            "num_readers",
+            "prefetch_size",
+            "shuffle_buffer_size",
+            "shuffle_row_groups",
+        ],
     )
     @snowpark._internal.utils.private_preview(version="0.2.0")
     @_raise_if_deleted
-    def to_tf_dataset(self, *, batch_size: int, shuffle: bool = False, drop_last_batch: bool = True) -> Any:
+    def to_tf_dataset(
+        self,
+        *,
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last_batch: bool = True,
+        num_readers: int = 1,
+        prefetch_size: Optional[int] = None,
+        shuffle_buffer_size: Optional[int] = None,
+        shuffle_row_groups: bool = False,
+        seed: Optional[int] = None,
+    ) -> Any:
         """Transform the Snowflake data into a ready-to-use TensorFlow tf.data.Dataset.
 
         Args:
@@ -386,6 +467,19 @@ class FileSet:
                 rows in each file will also be shuffled.
             drop_last_batch: Whether the last batch of data should be dropped. If set to be true,
                 then the last batch will get dropped if its size is smaller than the given batch_size.
+            num_readers: Number of threads that read and decode files concurrently. Reading several files at a time
+                helps when the training loop is bound by reads from the stage. The order of the data does not depend
+                on the number of readers.
+            prefetch_size: Optional. Maximum number of files read ahead of the training loop. Defaults to twice
+                num_readers. Only used when num_readers is larger than 1.
+            shuffle_buffer_size: Optional. If given and shuffle is True, rows are shuffled through a buffer of about
+                this many rows instead of within each file, so that rows of different files get mixed. It gives a
+                better randomization for data that is ordered, e.g. by time, at the cost of memory.
+            shuffle_row_groups: If True and shuffle is True, the row groups of all files are read in random order
+                instead of the files. Row groups are found from the parquet metadata, so the data is not loaded in
+                memory at once.
+            seed: Optional. The seed used to shuffle the data. Every epoch is shuffled differently, but the sequence of
+                epochs is reproducible.
 
         Returns:
             A tf.data.Dataset that yields batched tf.Tensors.
@@ -407,7 +501,16 @@ class FileSet:
         self._fs.optimize_read(self._list_files())
 
         return tf_dataset_module.read_and_parse_parquet(
-            self._list_files(), self._fs, batch_size, shuffle, drop_last_batch
+            self._list_files(),
+            self._fs,
+            batch_size,
+            shuffle,
+            drop_last_batch,
+            num_readers=num_readers,
+            prefetch_size=prefetch_size,
+            shuffle_buffer_size=shuffle_buffer_size,
+            shuffle_row_groups=shuffle_row_groups,
+            seed=seed,
         )
 
     @telemetry.send_api_usage_telemetry(
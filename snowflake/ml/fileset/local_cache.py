@@ -0,0 +1,116 @@
+import collections
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable, Optional
+
+# The default upper bound of the total size of the files kept in a local cache, in bytes.
+DEFAULT_LOCAL_CACHE_SIZE = 10 * 1024**3
+
+
+class LocalFileCache:
+    """A size bounded cache of remote files in a local directory, evicting the least recently used files first.
+
+    Files are identified by a key that has to change whenever the content of the remote file changes, e.g. the path of
+    the file together with its md5. Files already present in the directory are picked up when the cache is created,
+    with their modification time as the last access time, so that a cache directory can be shared by several processes
+    or reused across runs.
+
+    Args:
+        cache_dir: The local directory holding the cached files. It is created if it does not exist.
+        max_size: The maximum total size of the cached files in bytes.
+
+    Raises:
+        ValueError: An error occurred when max_size is not positive.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_LOCAL_CACHE_SIZE) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}.")
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # Maps the cached file names to their sizes, from the least to the most recently used.
+        self._entries: "collections.OrderedDict[str, int]" = collections.OrderedDict()
+        self._total_size = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        existing_files = []
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                existing_files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, file_name, file_size in sorted(existing_files):
+            self._entries[file_name] = file_size
+            self._total_size += file_size
+        with self._lock:
+            self._evict()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total size of the cached files in bytes."""
+        return self._max_size
+
+    @property
+    def total_size(self) -> int:
+        """The total size of the cached files in bytes."""
+        return self._total_size
+
+    def get(self, key: str, fetch: Callable[[str], None]) -> Optional[str]:
+        """Get the local path of the file identified by the key, fetching it on a cache miss.
+
+        Args:
+            key: A string identifying the content of the remote file.
+            fetch: A function that writes the remote file to the local path it is given.
+
+        Returns:
+            The local path of the cached file, or None if the file does not fit in the cache. The file might get
+            evicted at any time after it is returned, so it should be opened right away. An opened file stays readable
+            after its eviction.
+        """
+        file_name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        local_path = os.path.join(self._cache_dir, file_name)
+        with self._lock:
+            if file_name in self._entries and os.path.exists(local_path):
+                self._entries.move_to_end(file_name)
+                os.utime(local_path)
+                logging.debug(f"Local cache hit for {key}.")
+                return local_path
+
+        # Fetch outside of the lock so that several files can be downloaded at the same time. The file is written
+        # under a hidden temporary name first so that readers never see a partially written file.
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".")
+        os.close(fd)
+        try:
+            fetch(tmp_path)
+            file_size = os.path.getsize(tmp_path)
+            if file_size > self._max_size:
+                logging.debug(f"{key} is larger than the local cache and will not be cached.")
+                return None
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with self._lock:
+            self._total_size -= self._entries.pop(file_name, 0)
+            self._entries[file_name] = file_size
+            self._total_size += file_size
+            self._evict(keep=file_name)
+        logging.debug(f"Local cache miss for {key}, fetched {file_size} bytes.")
+        return local_path
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Remove the least recently used files until the cache fits in max_size. Must be called with the lock held."""
+        for file_name in list(self._entries):
+            if self._total_size <= self._max_size:
+                break
+            if file_name == keep:
+                continue
+            self._total_size -= self._entries.pop(file_name)
+            try:
+                os.remove(os.path.join(self._cache_dir, file_name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,87 @@
+import os
+import tempfile
+from typing import Callable, List
+
+from absl.testing import absltest
+
+from snowflake.ml.fileset import local_cache
+
+
+class LocalFileCacheTest(absltest.TestCase):
+    """Testing LocalFileCache class."""
+
+    def setUp(self) -> None:
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._fetched: List[str] = []
+
+    def tearDown(self) -> None:
+        self._cache_dir.cleanup()
+
+    def _fetcher(self, key: str, size: int) -> Callable[[str], None]:
+        def fetch(local_path: str) -> None:
+            self._fetched.append(key)
+            with open(local_path, "wb") as f:
+                f.write(key.encode("utf-8")[:1] * size)
+
+        return fetch
+
+    def _read(self, local_path: str) -> bytes:
+        with open(local_path, "rb") as f:
+            return f.read()
+
+    def test_get(self) -> None:
+        """Test if a file is only fetched on the first get."""
+        cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=100)
+        path1 = cache.get("a", self._fetcher("a", 10))
+        path2 = cache.get("a", self._fetcher("a", 10))
+        assert path1 is not None
+        self.assertEqual(path1, path2)
+        self.assertEqual(self._read(path1), b"a" * 10)
+        self.assertEqual(self._fetched, ["a"])
+        self.assertEqual(cache.total_size, 10)
+
+    def test_lru_eviction(self) -> None:
+        """Test if the least recently used files are evicted when the cache is full."""
+        cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=25)
+        cache.get("a", self._fetcher("a", 10))
+        cache.get("b", self._fetcher("b", 10))
+        cache.get("a", self._fetcher("a", 10))
+        cache.get("c", self._fetcher("c", 10))
+        self.assertEqual(self._fetched, ["a", "b", "c"])
+        self.assertEqual(cache.total_size, 20)
+        self.assertLen(os.listdir(self._cache_dir.name), 2)
+
+        # "b" was evicted, "a" was not.
+        cache.get("a", self._fetcher("a", 10))
+        cache.get("b", self._fetcher("b", 10))
+        self.assertEqual(self._fetched, ["a", "b", "c", "b"])
+
+    def test_file_larger_than_cache(self) -> None:
+        """Test if a file larger than the cache is not cached and does not evict other files."""
+        cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=15)
+        cache.get("a", self._fetcher("a", 10))
+        self.assertIsNone(cache.get("b", self._fetcher("b", 20)))
+        self.assertEqual(cache.total_size, 10)
+        self.assertLen(os.listdir(self._cache_dir.name), 1)
+
+    def test_reuse_cache_dir(self) -> None:
+        """Test if files cached by another cache object in the same directory are reused."""
+        cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=100)
+        cache.get("a", self._fetcher("a", 10))
+        cache.get("b", self._fetcher("b", 10))
+
+        new_cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=100)
+        self.assertEqual(new_cache.total_size, 20)
+        new_cache.get("a", self._fetcher("a", 10))
+        self.assertEqual(self._fetched, ["a", "b"])
+
+        smaller_cache = local_cache.LocalFileCache(self._cache_dir.name, max_size=15)
+        self.assertEqual(smaller_cache.total_size, 10)
+
+    def test_negative_max_size(self) -> None:
+        with self.assertRaises(ValueError):
+            local_cache.LocalFileCache(self._cache_dir.name, max_size=0)
+
+
+if __name__ == "__main__":
+    absltest.main()
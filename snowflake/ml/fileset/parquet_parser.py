@@ -1,5 +1,7 @@
 import collections
-from typing import Any, Deque, Dict, Iterator, List
+import itertools
+from concurrent import futures
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
 import fsspec
 import numpy as np
@@ -7,8 +9,6 @@ import numpy.typing as npt
 import pyarrow as pa
 import pyarrow.dataset as ds
 
-_EMPTY_RECORD_BATCH = pa.RecordBatch.from_arrays([], [])
-
 # The row count for batches read from PyArrow Dataset. This number should be large enough so that
 # dataset.to_batches() would read in a very large portion of, if not entirely, a parquet file.
 _DEFAULT_DATASET_BATCH_SIZE = 1000000
@@ -46,6 +46,27 @@ class ParquetParser:
             the order of files, and then shuflle the order of rows in each file.
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
             get dropped if its size is smaller than the given batch_size.
+        num_readers: Number of threads that read and decode parquet files concurrently. Each file (dataset fragment) is
+            read by a single thread, and files are yielded in the same order regardless of the number of readers.
+        prefetch_size: Maximum number of files that are read ahead of the consumer. Defaults to twice num_readers.
+            Only used when num_readers is larger than 1.
+        reuse_buffers: Whether every batch is written into the same preallocated numpy arrays. This avoids allocating
+            new arrays for every batch, but the arrays of a batch are overwritten by the next batch, so they must be
+            consumed or copied before the iteration continues.
+        column_dtypes: Optional. A dict mapping column names to the numpy dtype their values are written as. By default
+            the dtype is inferred from the data of each batch. The values must be castable to the dtype within the same
+            kind, e.g. int64 to int32 or float32, but not float to int, and integer or boolean dtypes do not accept
+            nulls; a ValueError is raised otherwise.
+        shuffle_buffer_size: Optional. Only used when shuffle is true. If given, rows are shuffled through a buffer of
+            about this many rows instead of within each record batch, so that rows of neighbouring files and row groups
+            get mixed. Larger buffers randomize better at the cost of memory.
+        shuffle_row_groups: Only used when shuffle is true. Whether row groups, rather than files, are read in random
+            order. The row groups are found from the parquet metadata of the files, and only the row groups being read
+            are held in memory.
+        seed: Optional. The seed used to shuffle the data. Every iteration over the parser is shuffled differently, but
+            the sequence of iterations is reproducible. If not given, the global numpy random state is used.
+        epoch: The index of the first iteration over the parser, which is combined with seed to shuffle an iteration.
+            Only used when seed is given.
 
     Returns:
         A PyTorch iterable datapipe that yields batched numpy array in dict. The keys will be the column names in
@@ -59,13 +80,35 @@ class ParquetParser:
         batch_size: int,
         shuffle: bool = True,
         drop_last_batch: bool = True,
+        num_readers: int = 1,
+        prefetch_size: Optional[int] = None,
+        reuse_buffers: bool = False,
+        column_dtypes: Optional[Dict[str, npt.DTypeLike]] = None,
+        shuffle_buffer_size: Optional[int] = None,
+        shuffle_row_groups: bool = False,
+        seed: Optional[int] = None,
+        epoch: int = 0,
     ) -> None:
+        if num_readers < 1:
+            raise ValueError(f"num_readers must be a positive integer, got {num_readers}.")
+        if prefetch_size is not None and prefetch_size < 1:
+            raise ValueError(f"prefetch_size must be a positive integer, got {prefetch_size}.")
+        if shuffle_buffer_size is not None and shuffle_buffer_size < 1:
+            raise ValueError(f"shuffle_buffer_size must be a positive integer, got {shuffle_buffer_size}.")
         self._file_paths = file_paths
         self._fs = filesystem
         self._batch_size = batch_size
         self._dataset_batch_size = max(_DEFAULT_DATASET_BATCH_SIZE, self._batch_size)
         self._shuffle = shuffle
         self._drop_last_batch = drop_last_batch
+        self._num_readers = num_readers
+        self._prefetch_size = prefetch_size if prefetch_size is not None else 2 * num_readers
+        self._reuse_buffers = reuse_buffers
+        self._column_dtypes = column_dtypes
+        self._shuffle_buffer_size = shuffle_buffer_size
+        self._shuffle_row_groups = shuffle_row_groups
+        self._seed = seed
+        self._epochs = itertools.count(epoch)
 
     def __iter__(self) -> Iterator[Dict[str, npt.NDArray[Any]]]:
         """Iterate through PyArrow Dataset to generate batches whose length equals to expected batch size.
@@ -74,33 +117,120 @@ class ParquetParser:
         are not long enough to form a batch. These rows will be put into a temporary buffer and combine with the first
         few rows of the next file to generate a new batch.
 
+        All the state of an iteration is local to it, so that iterations over the same parser may overlap.
+
         Yields:
             A dict mapping column names to the corresponding data fetch from that column.
         """
-        self._rb_buffer = _RecordBatchesBuffer()
+        rb_buffer = _RecordBatchesBuffer()
+        batch_assembler = _BatchAssembler(self._reuse_buffers, self._column_dtypes)
+        rng = self._get_rng()
         files = list(self._file_paths)
         if self._shuffle:
-            np.random.shuffle(files)
+            rng.shuffle(files)
         pa_dataset: ds.Dataset = ds.dataset(files, format="parquet", filesystem=self._fs)
 
-        for rb in pa_dataset.to_batches(batch_size=self._dataset_batch_size):
-            if self._shuffle:
-                rb = rb.take(np.random.permutation(rb.num_rows))
-            self._rb_buffer.append(rb)
-            while self._rb_buffer.num_rows >= self._batch_size:
-                yield self._get_batches_from_buffer()
+        record_batches = self._read_record_batches(pa_dataset, rng)
+        if self._shuffle:
+            record_batches = self._shuffle_rows(record_batches, rng)
+        for rb in record_batches:
+            rb_buffer.append(rb)
+            while rb_buffer.num_rows >= self._batch_size:
+                yield self._get_batches_from_buffer(rb_buffer, batch_assembler)
+
+        if rb_buffer.num_rows and not self._drop_last_batch:
+            yield self._get_batches_from_buffer(rb_buffer, batch_assembler)
+
+    def _get_rng(self) -> Any:
+        """Get the random number generator of the current iteration: a numpy Generator or the numpy.random module."""
+        if self._seed is None:
+            return np.random
+        # Seeding with the epoch makes every iteration shuffle differently while keeping all of them reproducible.
+        return np.random.default_rng([self._seed, next(self._epochs)])
+
+    def _read_record_batches(self, pa_dataset: ds.Dataset, rng: Any) -> Iterator[pa.RecordBatch]:
+        """Read record batches of the dataset in fragment order, with up to num_readers fragments being read at a time.
+
+        Fragments are the files of the dataset, or their row groups in random order if shuffle_row_groups is set.
+
+        Args:
+            pa_dataset: The pyarrow dataset of the parquet files.
+            rng: The random number generator of the current iteration, used to order the row groups.
+
+        Yields:
+            The record batches of the dataset.
+        """
+        fragments: Iterator[ds.Fragment]
+        if self._shuffle and self._shuffle_row_groups:
+            row_groups = [row_group for f in pa_dataset.get_fragments() for row_group in f.split_by_row_group()]
+            fragments = iter([row_groups[i] for i in rng.permutation(len(row_groups))])
+        elif self._num_readers == 1:
+            yield from pa_dataset.to_batches(batch_size=self._dataset_batch_size)
+            return
+        else:
+            fragments = iter(pa_dataset.get_fragments())
+
+        def read_fragment(fragment: ds.Fragment) -> List[pa.RecordBatch]:
+            return list(fragment.to_batches(schema=pa_dataset.schema, batch_size=self._dataset_batch_size))
+
+        if self._num_readers == 1:
+            for fragment in fragments:
+                yield from read_fragment(fragment)
+            return
 
-        if self._rb_buffer.num_rows and not self._drop_last_batch:
-            yield self._get_batches_from_buffer()
+        with futures.ThreadPoolExecutor(max_workers=self._num_readers) as executor:
+            # Fragments are submitted ahead of the consumer but collected in submission order, so that the output does
+            # not depend on which reader finishes first. The queue is bounded to limit the memory held by decoded data.
+            pending: Deque[futures.Future[List[pa.RecordBatch]]] = collections.deque(
+                executor.submit(read_fragment, fragment)
+                for fragment in itertools.islice(fragments, self._prefetch_size)
+            )
+            try:
+                while pending:
+                    record_batches = pending.popleft().result()
+                    next_fragment = next(fragments, None)
+                    if next_fragment is not None:
+                        pending.append(executor.submit(read_fragment, next_fragment))
+                    yield from record_batches
+            finally:
+                # The consumer may stop early, in which case fragments that are not being read yet are dropped.
+                for future in pending:
+                    future.cancel()
 
-    def _get_batches_from_buffer(self) -> Dict[str, npt.NDArray[Any]]:
+    def _shuffle_rows(self, record_batches: Iterator[pa.RecordBatch], rng: Any) -> Iterator[pa.RecordBatch]:
+        """Shuffle the rows of the record batches, within each record batch or through the shuffle buffer."""
+        if self._shuffle_buffer_size is None:
+            for rb in record_batches:
+                yield rb.take(rng.permutation(rb.num_rows))
+            return
+
+        # Rows are collected until the buffer is full, then the buffer is shuffled and all but half of its rows are
+        # emitted. The retained rows get mixed with the next ones, so rows can travel across the whole buffer.
+        num_rows_to_keep = self._shuffle_buffer_size // 2
+        pool: List[pa.RecordBatch] = []
+        pool_num_rows = 0
+        for rb in record_batches:
+            pool.append(rb)
+            pool_num_rows += rb.num_rows
+            if pool_num_rows < self._shuffle_buffer_size:
+                continue
+            shuffled = pa.Table.from_batches(pool).take(rng.permutation(pool_num_rows))
+            yield from shuffled.slice(num_rows_to_keep).to_batches()
+            pool = shuffled.slice(0, num_rows_to_keep).to_batches()
+            pool_num_rows = num_rows_to_keep
+        if pool_num_rows:
+            yield from pa.Table.from_batches(pool).take(rng.permutation(pool_num_rows)).to_batches()
+
+    def _get_batches_from_buffer(
+        self, rb_buffer: _RecordBatchesBuffer, batch_assembler: "_BatchAssembler"
+    ) -> Dict[str, npt.NDArray[Any]]:
         """Generate new batches from the existing record batch buffer."""
         cnt_rbs_num_rows = 0
         candidates = []
 
         # Keep popping record batches in buffer until there are enough rows for a batch.
-        while self._rb_buffer.num_rows and cnt_rbs_num_rows < self._batch_size:
-            candidate = self._rb_buffer.popleft()
+        while rb_buffer.num_rows and cnt_rbs_num_rows < self._batch_size:
+            candidate = rb_buffer.popleft()
             cnt_rbs_num_rows += candidate.num_rows
             candidates.append(candidate)
 
@@ -112,29 +242,69 @@ class ParquetParser:
             to_merge = slice_target.slice(length=cut_off)
             left_over = slice_target.slice(offset=cut_off)
             candidates[-1] = to_merge
-            self._rb_buffer.appendleft(left_over)
-
-        res = _merge_record_batches(candidates)
-        return _record_batch_to_arrays(res)
-
-
-def _merge_record_batches(record_batches: List[pa.RecordBatch]) -> pa.RecordBatch:
-    """Merge a list of arrow RecordBatches into one. Similar to MergeTables."""
-    if not record_batches:
-        return _EMPTY_RECORD_BATCH
-    if len(record_batches) == 1:
-        return record_batches[0]
-    record_batches = list(filter(lambda rb: rb.num_rows > 0, record_batches))
-    one_chunk_table = pa.Table.from_batches(record_batches).combine_chunks()
-    batches = one_chunk_table.to_batches(max_chunksize=None)
-    return batches[0]
-
-
-def _record_batch_to_arrays(rb: pa.RecordBatch) -> Dict[str, npt.NDArray[Any]]:
-    """Transform the record batch to a (string, numpy array) dict."""
-    batch_dict = {}
-    for column, column_schema in zip(rb, rb.schema):
-        # zero_copy_only=False because of nans. Ideally nans should have been imputed in feature engineering.
-        array = column.to_numpy(zero_copy_only=False)
-        batch_dict[column_schema.name] = array
-    return batch_dict
+            rb_buffer.appendleft(left_over)
+
+        return batch_assembler.assemble(candidates)
+
+
+class _BatchAssembler:
+    """Assemble a list of record batches into a dict of numpy arrays, copying each value at most once.
+
+    Each column of each record batch is converted to numpy, which does not copy primitive columns without nulls, and
+    written into the output array of the column. A batch that consists of a single record batch is returned as is,
+    unless buffers are reused or the dtype of a column is pinned to another type.
+
+    Args:
+        reuse_buffers: Whether the output arrays are allocated once and reused for every batch.
+        column_dtypes: Optional. The dtypes of the output arrays, by column name. Values that cannot be cast within the
+            same kind, and nulls going into integer or boolean dtypes, raise a ValueError.
+    """
+
+    def __init__(self, reuse_buffers: bool = False, column_dtypes: Optional[Dict[str, npt.DTypeLike]] = None) -> None:
+        self._reuse_buffers = reuse_buffers
+        self._column_dtypes = {name: np.dtype(dtype) for name, dtype in (column_dtypes or {}).items()}
+        self._buffers: Dict[str, npt.NDArray[Any]] = {}
+
+    def assemble(self, record_batches: List[pa.RecordBatch]) -> Dict[str, npt.NDArray[Any]]:
+        record_batches = [rb for rb in record_batches if rb.num_rows > 0]
+        if not record_batches:
+            return {}
+        num_rows = sum(rb.num_rows for rb in record_batches)
+        batch_dict = {}
+        for i, name in enumerate(record_batches[0].schema.names):
+            # zero_copy_only=False because of nans. Ideally nans should have been imputed in feature engineering.
+            chunks = [rb.column(i).to_numpy(zero_copy_only=False) for rb in record_batches]
+            if name in self._column_dtypes:
+                dtype = self._column_dtypes[name]
+                self._check_cast(name, [rb.column(i) for rb in record_batches], chunks, dtype)
+            else:
+                dtype = np.result_type(*chunks)
+            if len(chunks) == 1 and not self._reuse_buffers and chunks[0].dtype == dtype:
+                batch_dict[name] = chunks[0]
+                continue
+            out = self._get_buffer(name, dtype, num_rows)
+            offset = 0
+            for chunk in chunks:
+                out[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+            batch_dict[name] = out
+        return batch_dict
+
+    @staticmethod
+    def _check_cast(name: str, columns: List[pa.Array], chunks: List[npt.NDArray[Any]], dtype: "np.dtype[Any]") -> None:
+        """Check that the values of a column can be written into an output array of the pinned dtype."""
+        if dtype.kind in "biu" and any(column.null_count > 0 for column in columns):
+            raise ValueError(f"Column {name} has nulls, which cannot be written as {dtype}.")
+        for chunk in chunks:
+            if not np.can_cast(chunk.dtype, dtype, "same_kind"):
+                raise ValueError(f"Column {name} of dtype {chunk.dtype} cannot be written as {dtype}.")
+
+    def _get_buffer(self, name: str, dtype: "np.dtype[Any]", num_rows: int) -> npt.NDArray[Any]:
+        """Get an output array with num_rows rows, reusing the array of the previous batch if possible."""
+        if not self._reuse_buffers:
+            return np.empty(num_rows, dtype=dtype)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or len(buffer) < num_rows:
+            buffer = np.empty(num_rows, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[:num_rows]
@@ -0,0 +1,138 @@
+# A benchmark of ParquetParser, comparing the _BatchAssembler, with and without reuse_buffers, with the way batches
+# were assembled before, which merged the record batches of every batch into one with combine_chunks and converted its
+# columns to numpy. It reports the throughput, the peak numpy memory traced by tracemalloc and the peak memory of the
+# Arrow memory pool while iterating over parquet files. Each case runs in a fresh process, so that peaks do not carry
+# over from one case to the next.
+#
+# Run it with, e.g.:
+#   python parquet_parser_benchmark.py --num_files=10 --rows_per_file=200003 --row_group_sizes=50000,1000
+
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+import pyarrow.parquet as pq
+from absl import app, flags
+from fsspec.implementations import local
+
+from snowflake.ml.fileset import parquet_parser
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_files", 10, "Number of parquet files.")
+flags.DEFINE_integer("rows_per_file", 200_003, "Number of rows of every file, chosen so that batches span files.")
+flags.DEFINE_list(
+    "row_group_sizes",
+    ["50000", "1000"],
+    "Numbers of rows of every row group, one case per number. Row groups smaller than batches make every batch merged.",
+)
+flags.DEFINE_integer("num_columns", 10, "Number of float64 columns.")
+flags.DEFINE_integer("batch_size", 4096, "Number of rows of every batch.")
+
+_CASES = ["combine_chunks", "assembler", "assembler_reuse_buffers"]
+
+
+class _CombineChunksAssembler:
+    """The way batches were assembled before _BatchAssembler."""
+
+    def __init__(self, reuse_buffers: bool = False, column_dtypes: Optional[Dict[str, npt.DTypeLike]] = None) -> None:
+        pass
+
+    def assemble(self, record_batches: List[pa.RecordBatch]) -> Dict[str, npt.NDArray[Any]]:
+        if not record_batches:
+            return {}
+        if len(record_batches) == 1:
+            rb = record_batches[0]
+        else:
+            record_batches = [rb for rb in record_batches if rb.num_rows > 0]
+            rb = pa.Table.from_batches(record_batches).combine_chunks().to_batches(max_chunksize=None)[0]
+        return {name: column.to_numpy(zero_copy_only=False) for name, column in zip(rb.schema.names, rb)}
+
+
+def _write_files(data_dir: str, row_group_size: int) -> List[str]:
+    rng = np.random.default_rng(0)
+    files = []
+    for i in range(FLAGS.num_files):
+        table = pa.table({f"C{j}": rng.random(FLAGS.rows_per_file) for j in range(FLAGS.num_columns)})
+        file_path = os.path.join(data_dir, f"data_{i}.parquet")
+        pq.write_table(table, file_path, row_group_size=row_group_size)
+        files.append(file_path)
+    return files
+
+
+def _run_case(case: str, files: List[str], batch_size: int) -> Tuple[float, int, float, float]:
+    """Iterate over the files with a ParquetParser.
+
+    The time is measured on a first iteration, and the peak numpy memory on a second one, since tracing allocations
+    slows the iteration down.
+
+    Args:
+        case: One of _CASES, the way batches are assembled.
+        files: Paths of the parquet files.
+        batch_size: Number of rows of every batch.
+
+    Returns:
+        The time in seconds, the number of rows, and the peak numpy and Arrow memory in MB.
+    """
+    parser = parquet_parser.ParquetParser(
+        files,
+        local.LocalFileSystem(),
+        batch_size,
+        shuffle=False,
+        reuse_buffers=case == "assembler_reuse_buffers",
+    )
+    num_rows = 0
+    with mock.patch.object(
+        parquet_parser,
+        "_BatchAssembler",
+        _CombineChunksAssembler if case == "combine_chunks" else parquet_parser._BatchAssembler,
+    ):
+        start = time.perf_counter()
+        for batch in parser:
+            num_rows += len(next(iter(batch.values())))
+        seconds = time.perf_counter() - start
+        arrow_peak = pa.default_memory_pool().max_memory()
+
+        tracemalloc.start()
+        for batch in parser:
+            pass
+        del batch
+        _, numpy_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return seconds, num_rows, numpy_peak / 2**20, arrow_peak / 2**20
+
+
+def _run_case_in_process(
+    queue: "multiprocessing.Queue[Tuple[float, int, float, float]]", case: str, files: List[str], batch_size: int
+) -> None:
+    queue.put(_run_case(case, files, batch_size))
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    context = multiprocessing.get_context("spawn")
+    print(f"{'row group':>10}{'case':>25}{'s':>8}{'Mrows/s':>9}{'numpy peak MB':>15}{'arrow peak MB':>15}")
+    for row_group_size in map(int, FLAGS.row_group_sizes):
+        with tempfile.TemporaryDirectory() as data_dir:
+            files = _write_files(data_dir, row_group_size)
+            for case in _CASES:
+                queue: "multiprocessing.Queue[Tuple[float, int, float, float]]" = context.Queue()
+                process = context.Process(target=_run_case_in_process, args=(queue, case, files, FLAGS.batch_size))
+                process.start()
+                seconds, num_rows, numpy_peak_mb, arrow_peak_mb = queue.get()
+                process.join()
+                print(
+                    f"{row_group_size:>10}{case:>25}{seconds:>8.2f}{num_rows / seconds / 1e6:>9.2f}"
+                    f"{numpy_peak_mb:>15.1f}{arrow_peak_mb:>15.1f}"
+                )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -1,4 +1,9 @@
+import tempfile
+from typing import Any, Dict, List
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from absl.testing import absltest
 from fsspec.implementations import local
 
@@ -87,6 +92,184 @@ class ParquetParserTest(absltest.TestCase):
             count += 1
         self.assertEqual(count, len(expected_res))
 
+    def test_parquet_parser_num_readers(self) -> None:
+        """Test if reading files with multiple threads yields the same result as reading them sequentially."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        fs = local.LocalFileSystem()
+        for shuffle in [False, True]:
+            for num_readers, prefetch_size in [(2, None), (3, 1), (8, 8)]:
+                np.random.seed(2)
+                expected_res = list(parquet_parser.ParquetParser(files, fs, 2, shuffle, drop_last_batch=False))
+                np.random.seed(2)
+                pq_parser = parquet_parser.ParquetParser(
+                    files,
+                    fs,
+                    2,
+                    shuffle,
+                    drop_last_batch=False,
+                    num_readers=num_readers,
+                    prefetch_size=prefetch_size,
+                )
+                res = list(pq_parser)
+                self.assertEqual(len(res), len(expected_res))
+                for batch, expected_batch in zip(res, expected_res):
+                    np.testing.assert_equal(batch, expected_batch)
+
+    def test_parquet_parser_num_readers_stop_early(self) -> None:
+        """Test if the consumer could stop before all the files are read."""
+        files = [self._file0.name, self._file1.name, self._file2.name] * 4
+        pq_parser = parquet_parser.ParquetParser(
+            files, local.LocalFileSystem(), 1, False, num_readers=2, prefetch_size=2
+        )
+        it = iter(pq_parser)
+        np.testing.assert_equal(
+            next(it), {"col1": np.array([0]), "col2": np.array([10]), "col3": np.array(["a"], dtype="object")}
+        )
+        it.close()  # type: ignore[attr-defined]
+
+    def test_parquet_parser_invalid_num_readers(self) -> None:
+        files = [self._file0.name]
+        with self.assertRaisesRegex(ValueError, "num_readers"):
+            parquet_parser.ParquetParser(files, local.LocalFileSystem(), 1, num_readers=0)
+        with self.assertRaisesRegex(ValueError, "prefetch_size"):
+            parquet_parser.ParquetParser(files, local.LocalFileSystem(), 1, num_readers=2, prefetch_size=0)
+
+    def test_parquet_parser_reuse_buffers(self) -> None:
+        """Test if reusing buffers yields the same result and writes every batch into the same arrays."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        fs = local.LocalFileSystem()
+        for batch_size in [1, 2, 3, 7]:
+            expected_res = list(parquet_parser.ParquetParser(files, fs, batch_size, False, drop_last_batch=False))
+            pq_parser = parquet_parser.ParquetParser(
+                files, fs, batch_size, False, drop_last_batch=False, reuse_buffers=True
+            )
+            res = []
+            col1_buffers = set()
+            for batch in pq_parser:
+                col1_buffers.add(batch["col1"].__array_interface__["data"][0])
+                res.append({k: v.copy() for k, v in batch.items()})
+            self.assertEqual(len(res), len(expected_res))
+            for batch, expected_batch in zip(res, expected_res):
+                np.testing.assert_equal(batch, expected_batch)
+            self.assertLen(col1_buffers, 1)
+
+    def test_parquet_parser_column_dtypes(self) -> None:
+        """Test if the values of a column could be written as the given dtype."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        pq_parser = parquet_parser.ParquetParser(
+            files,
+            local.LocalFileSystem(),
+            2,
+            False,
+            column_dtypes={"col1": np.int32, "col2": np.float32},
+        )
+        for batch in pq_parser:
+            self.assertEqual(batch["col1"].dtype, np.int32)
+            self.assertEqual(batch["col2"].dtype, np.float32)
+            self.assertEqual(batch["col3"].dtype, object)
+
+    def test_parquet_parser_column_dtypes_invalid_cast(self) -> None:
+        """Test that values which cannot be written as the given dtype raise instead of being truncated."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        pq_parser = parquet_parser.ParquetParser(
+            files, local.LocalFileSystem(), 2, False, column_dtypes={"col2": np.int32}
+        )
+        with self.assertRaisesRegex(ValueError, "col2"):
+            next(iter(pq_parser))
+
+        f = tempfile.NamedTemporaryFile()
+        pq.write_table(pa.table({"col1": pa.array([1, None, 3], type=pa.int64())}), f.name)
+        pq_parser = parquet_parser.ParquetParser(
+            [f.name], local.LocalFileSystem(), 3, False, column_dtypes={"col1": np.int64}
+        )
+        with self.assertRaisesRegex(ValueError, "nulls"):
+            next(iter(pq_parser))
+
+        # Nulls are written as nans into float dtypes.
+        pq_parser = parquet_parser.ParquetParser(
+            [f.name], local.LocalFileSystem(), 3, False, column_dtypes={"col1": np.float32}
+        )
+        np.testing.assert_equal(next(iter(pq_parser))["col1"], np.array([1, np.nan, 3], dtype=np.float32))
+
+    def _write_sorted_files(self) -> List[str]:
+        """Write 4 files of 100 sorted rows each, with 10 row groups per file."""
+        self._sorted_files = []
+        for i in range(4):
+            f = tempfile.NamedTemporaryFile()
+            pq.write_table(pa.table({"col1": np.arange(i * 100, (i + 1) * 100)}), f.name, row_group_size=10)
+            self._sorted_files.append(f)
+        return [f.name for f in self._sorted_files]
+
+    def _read_col1(self, pq_parser: parquet_parser.ParquetParser) -> List[Any]:
+        batches: List[Dict[str, Any]] = list(pq_parser)
+        rows: List[Any] = np.concatenate([batch["col1"] for batch in batches]).tolist()
+        return rows
+
+    def test_parquet_parser_shuffle_buffer(self) -> None:
+        """Test if rows are shuffled through the buffer, reproducibly with a seed and differently every epoch."""
+        files = self._write_sorted_files()
+        fs = local.LocalFileSystem()
+        pq_parser = parquet_parser.ParquetParser(
+            files, fs, 16, True, drop_last_batch=False, shuffle_buffer_size=150, seed=0
+        )
+        epoch0 = self._read_col1(pq_parser)
+        epoch1 = self._read_col1(pq_parser)
+        self.assertListEqual(sorted(epoch0), list(range(400)))
+        self.assertListEqual(sorted(epoch1), list(range(400)))
+        self.assertNotEqual(epoch0, epoch1)
+
+        # Rows of different files are mixed in the first batch.
+        self.assertGreater(len({row // 100 for row in epoch0[:16]}), 1)
+
+        same_seed_parser = parquet_parser.ParquetParser(
+            files, fs, 16, True, drop_last_batch=False, shuffle_buffer_size=150, seed=0
+        )
+        self.assertListEqual(self._read_col1(same_seed_parser), epoch0)
+        self.assertListEqual(self._read_col1(same_seed_parser), epoch1)
+
+    def test_parquet_parser_overlapping_iterations(self) -> None:
+        """Test if iterations over the same parser do not share state when they overlap."""
+        files = self._write_sorted_files()
+        fs = local.LocalFileSystem()
+        sequential_parser = parquet_parser.ParquetParser(
+            files, fs, 7, True, drop_last_batch=False, shuffle_buffer_size=50, seed=0
+        )
+        epoch0 = self._read_col1(sequential_parser)
+        epoch1 = self._read_col1(sequential_parser)
+
+        pq_parser = parquet_parser.ParquetParser(
+            files, fs, 7, True, drop_last_batch=False, shuffle_buffer_size=50, seed=0
+        )
+        rows0: List[Any] = []
+        rows1: List[Any] = []
+        for batch0, batch1 in zip(iter(pq_parser), iter(pq_parser)):
+            rows0.extend(batch0["col1"].tolist())
+            rows1.extend(batch1["col1"].tolist())
+        self.assertListEqual(rows0, epoch0)
+        self.assertListEqual(rows1, epoch1)
+
+    def test_parquet_parser_shuffle_row_groups(self) -> None:
+        """Test if row groups are read in random order regardless of the number of readers."""
+        files = self._write_sorted_files()
+        fs = local.LocalFileSystem()
+        res = []
+        for num_readers in [1, 3]:
+            pq_parser = parquet_parser.ParquetParser(
+                files, fs, 7, True, drop_last_batch=False, shuffle_row_groups=True, seed=1, num_readers=num_readers
+            )
+            res.append(self._read_col1(pq_parser))
+        self.assertListEqual(res[0], res[1])
+        self.assertListEqual(sorted(res[0]), list(range(400)))
+        # Each row group of 10 rows is read as a whole, but the row groups are not read in file order.
+        row_groups = [row // 10 for row in res[0][::10]]
+        self.assertNotEqual(row_groups, sorted(row_groups))
+        for i in range(0, 400, 10):
+            self.assertLen({row // 10 for row in res[0][i : i + 10]}, 1)
+
+    def test_parquet_parser_invalid_shuffle_buffer_size(self) -> None:
+        with self.assertRaisesRegex(ValueError, "shuffle_buffer_size"):
+            parquet_parser.ParquetParser([self._file0.name], local.LocalFileSystem(), 1, shuffle_buffer_size=0)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -70,6 +70,8 @@ class SFFileSystem(fsspec.AbstractFileSystem):
                 - skip_instance_cache: Int. Controls reuse of instances.
                 - cache_type, cache_options, block_size: Configure file buffering.
                 See more information of these options in https://filesystem-spec.readthedocs.io/en/latest/features.html
+                - local_cache_dir, local_cache_size: Cache the opened stage files in a local directory. See
+                    SFStageFileSystem for details.
 
         Raises:
             ValueError: An error occurred when not exactly one of sf_connection and snowpark_session is given.
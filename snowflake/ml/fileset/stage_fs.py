@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import fsspec
-from fsspec.implementations import http as httpfs
+from fsspec.implementations import http as httpfs, local as localfs
 
 from snowflake import snowpark
 from snowflake.connector import connection
@@ -16,6 +16,7 @@ from snowflake.ml._internal.exceptions import (
     fileset_error_messages,
     fileset_errors,
 )
+from snowflake.ml.fileset import local_cache
 from snowflake.snowpark import exceptions as snowpark_exceptions
 
 # The default length of how long a presigned url stays active in seconds.
@@ -25,6 +26,10 @@ _PRESIGNED_URL_LIFETIME_SEC = 14400
 # The threshold of when the presigned url should get refreshed before its expiration.
 _PRESIGNED_URL_HEADROOM_SEC = 3600
 
+# How long the md5 of a listed stage file is trusted to identify it in the local cache. It expires together with the
+# presigned urls, so that a file overwritten in the stage is downloaded again at the latest when its url is refreshed.
+_FILE_INFO_LIFETIME_SEC = _PRESIGNED_URL_LIFETIME_SEC - _PRESIGNED_URL_HEADROOM_SEC
+
 
 _PROJECT = "FileSet"
 
@@ -42,6 +47,20 @@ class _PresignedUrl:
         return not self.expire_at or time.time() > self.expire_at - headroom_sec
 
 
+@dataclass(frozen=True)
+class _FileInfo:
+    """The md5 and size of a stage file seen in a LIST result."""
+
+    __slots__ = ["md5", "size", "expire_at"]
+    md5: Optional[str]
+    size: int
+    expire_at: float
+
+    def is_expired(self) -> bool:
+        """Check if the file needs to be listed again before its md5 can be trusted."""
+        return time.time() > self.expire_at
+
+
 def _get_httpfs_kwargs(**kwargs: Any) -> Dict[str, Any]:
     """Extract kwargs that are meaningful to HTTPFileSystem."""
     httpfs_related_keys = [
@@ -83,6 +102,8 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
         stage: str,
         snowpark_session: Optional[snowpark.Session] = None,
         sf_connection: Optional[connection.SnowflakeConnection] = None,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = local_cache.DEFAULT_LOCAL_CACHE_SIZE,
         **kwargs: Any,
     ) -> None:
         """Initiate the file system with stage information and a snowflake connection.
@@ -93,6 +114,12 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
             stage: The name of the target stage.
             snowpark_session: A Snowpark session object. Mutually exclusive to `sf_connection`.
             sf_connection: A Snowflake python connection object. Mutually exclusive to `snowpark_session`.
+            local_cache_dir: Optional. A local directory to cache the opened stage files in. If given, a file is
+                downloaded once and later opens of the same file read it from the local disk, as long as its md5 in the
+                stage does not change. The md5 is listed again every 3 hours, together with the refresh of the presigned
+                urls, so a file overwritten in the stage may be read from the local disk until then. The least
+                recently used files are evicted first.
+            local_cache_size: The maximum total size in bytes of the files cached in local_cache_dir.
             **kwargs : Optional. Other parameters that can be passed on to fsspec. Currently supports:
                 - skip_instance_cache: Int. Controls reuse of instances.
                 - cache_type, cache_options, block_size: Configure file buffering.
@@ -115,6 +142,11 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
         self._schema = schema
         self._stage = stage
         self._url_cache: Dict[str, _PresignedUrl] = {}
+        # The md5 and size of the stage files seen in LIST results, used to identify files in the local cache.
+        self._file_info_cache: Dict[str, _FileInfo] = {}
+        self._local_cache = (
+            local_cache.LocalFileCache(local_cache_dir, local_cache_size) if local_cache_dir is not None else None
+        )
 
         httpfs_kwargs = _get_httpfs_kwargs(**kwargs)
         self._fs = httpfs.HTTPFileSystem(**httpfs_kwargs)
@@ -173,6 +205,10 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
                     original_exception=fileset_errors.FileSetError(str(e)),
                 )
         files = self._parse_list_result(objects, path)
+        expire_at = time.time() + _FILE_INFO_LIFETIME_SEC
+        for f in files:
+            if f["type"] == "file":
+                self._file_info_cache[f["name"]] = _FileInfo(f["md5"], f["size"], expire_at)
         if detail:
             return files
         else:
@@ -212,7 +248,8 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
     def _open(self, path: str, mode: str = "rb", **kwargs: Any) -> fsspec.spec.AbstractBufferedFile:
         """Override fsspec `_open` method. Open a file for reading.
 
-        The opened file will be readable for 4 hours. After that, you need to reopen the file.
+        The opened file will be readable for 4 hours. After that, you need to reopen the file. If the file system has a
+        local cache, the file is read from the local disk instead.
 
         Args:
             path: Path of file in Snowflake stage.
@@ -240,6 +277,10 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
             cached_presigned_url = self._url_cache[path]
         url = cached_presigned_url.url
         try:
+            if self._local_cache is not None:
+                local_path = self._get_local_cache_path(path, url)
+                if local_path is not None:
+                    return localfs.LocalFileOpener(local_path, mode)
             return self._fs._open(url, mode=mode, **kwargs)
         except FileNotFoundError:
             raise snowml_exceptions.SnowflakeMLException(
@@ -247,6 +288,37 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
                 original_exception=fileset_errors.StageFileNotFoundError(f"Stage file {path} doesn't exist."),
             )
 
+    def _get_local_cache_path(self, path: str, url: str) -> Optional[str]:
+        """Get the path of the stage file in the local cache, downloading it from the presigned url on a cache miss.
+
+        Files are identified by their stage path and md5, so that a stage file overwritten with new content is
+        downloaded again. The md5 is listed again once it is older than the presigned urls are used for, so that an
+        overwritten file is served from the cache for at most _FILE_INFO_LIFETIME_SEC seconds.
+
+        Args:
+            path: Path of the file relative to the stage.
+            url: Presigned url of the file.
+
+        Returns:
+            The path of the cached file on the local disk, or None if the file is larger than the cache.
+
+        Raises:
+            FileNotFoundError: The file is not in the stage.
+        """
+        assert self._local_cache is not None
+        file_info = self._file_info_cache.get(path)
+        if file_info is None or file_info.is_expired():
+            self._file_info_cache.pop(path, None)
+            self.ls(path)
+            file_info = self._file_info_cache.get(path)
+        if file_info is None:
+            raise FileNotFoundError(path)
+        if file_info.size > self._local_cache.max_size:
+            return None
+        return self._local_cache.get(
+            f"{self.stage_name}/{path}:{file_info.md5}", lambda local_path: self._fs.get_file(url, local_path)
+        )
+
     def _parse_list_result(
         self, list_result: List[Tuple[str, int, str, str]], search_path: str
     ) -> List[Dict[str, Any]]:
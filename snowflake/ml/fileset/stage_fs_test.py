@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Dict, List, cast
 
 import boto3
@@ -78,17 +79,17 @@ class SFStageFileSystemTest(absltest.TestCase):
         )
         return stagefs
 
-    def _mock_collect_res(self, prefix: str) -> mock_data_frame.MockDataFrame:
+    def _mock_collect_res(self, prefix: str, md5: str = "xx") -> mock_data_frame.MockDataFrame:
         res = []
         for file in self.file_list:
             if file.startswith(prefix):
-                res.append(snowpark.Row(name=f"{self.stage}/{file}", size=10, md5="xx", last_modified="00"))
+                res.append(snowpark.Row(name=f"{self.stage}/{file}", size=10, md5=md5, last_modified="00"))
         return mock_data_frame.MockDataFrame(collect_result=res)
 
-    def _add_mock_test_case(self, prefix: str) -> None:
+    def _add_mock_test_case(self, prefix: str, md5: str = "xx") -> None:
         self.session.add_mock_sql(
             query=f"LIST @{self.db}.{self.schema}.{self.stage}/{prefix}",
-            result=self._mock_collect_res(prefix),
+            result=self._mock_collect_res(prefix, md5),
         )
 
     def _mock_presigned_url_fetcher(self, files: str, lifetime: int = 0) -> List[snowpark.Row]:
@@ -229,6 +230,64 @@ class SFStageFileSystemTest(absltest.TestCase):
             self.assertEqual(fp.read(), self.content)
             self.mock_time.return_value = 1
 
+    def test_open_with_local_cache(self) -> None:
+        """Test if open() reads a file from the local cache after it has been downloaded once."""
+        with absltest.mock.patch.object(
+            stage_fs.SFStageFileSystem, "_fetch_presigned_urls", new=self._mock_presigned_url_fetcher
+        ), tempfile.TemporaryDirectory() as cache_dir:
+            stagefs = stage_fs.SFStageFileSystem(
+                db=self.db,
+                schema=self.schema,
+                stage=self.stage,
+                snowpark_session=cast(snowpark.Session, self.session),
+                local_cache_dir=cache_dir,
+            )
+            self._add_mock_test_case("")
+            stagefs.ls("")
+            with absltest.mock.patch.object(stagefs._fs, "get_file", wraps=stagefs._fs.get_file) as mock_get_file:
+                for _ in range(2):
+                    for file in [self.file1, self.file2]:
+                        with stagefs.open(file) as fp:
+                            self.assertEqual(fp.read(), self.content)
+                self.assertEqual(mock_get_file.call_count, 2)
+
+                # A file that was not listed before gets listed to find out its md5.
+                self._add_mock_test_case(f"{self.subdir}/{self.file3}")
+                with stagefs.open(f"{self.subdir}/{self.file3}") as fp:
+                    self.assertEqual(fp.read(), self.content)
+                self.assertEqual(mock_get_file.call_count, 3)
+            self.assertLen(os.listdir(cache_dir), 3)
+
+    def test_open_with_local_cache_relists_expired_md5(self) -> None:
+        """Test if open() lists a file again once its md5 expired, and downloads it again if it changed."""
+        with absltest.mock.patch.object(
+            stage_fs.SFStageFileSystem, "_fetch_presigned_urls", new=self._mock_presigned_url_fetcher
+        ), tempfile.TemporaryDirectory() as cache_dir:
+            stagefs = stage_fs.SFStageFileSystem(
+                db=self.db,
+                schema=self.schema,
+                stage=self.stage,
+                snowpark_session=cast(snowpark.Session, self.session),
+                local_cache_dir=cache_dir,
+            )
+            self._add_mock_test_case(self.file1)
+            with absltest.mock.patch.object(stagefs._fs, "get_file", wraps=stagefs._fs.get_file) as mock_get_file:
+                with stagefs.open(self.file1) as fp:
+                    self.assertEqual(fp.read(), self.content)
+                # The md5 is trusted until it expires.
+                self.mock_time.return_value = 1 + stage_fs._FILE_INFO_LIFETIME_SEC
+                with stagefs.open(self.file1) as fp:
+                    self.assertEqual(fp.read(), self.content)
+                self.assertEqual(mock_get_file.call_count, 1)
+
+                # The file was overwritten in the stage: it is listed again and downloaded again.
+                self.mock_time.return_value = 2 + stage_fs._FILE_INFO_LIFETIME_SEC
+                self._add_mock_test_case(self.file1, md5="yy")
+                with stagefs.open(self.file1) as fp:
+                    self.assertEqual(fp.read(), self.content)
+                self.assertEqual(mock_get_file.call_count, 2)
+            self.mock_time.return_value = 1
+
 
 if __name__ == "__main__":
     absltest.main()
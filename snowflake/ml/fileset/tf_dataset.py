@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, List, Optional
 
 import fsspec
 import numpy.typing as npt
@@ -19,6 +19,11 @@ def read_and_parse_parquet(
     batch_size: int,
     shuffle: bool,
     drop_last_batch: bool,
+    num_readers: int = 1,
+    prefetch_size: Optional[int] = None,
+    shuffle_buffer_size: Optional[int] = None,
+    shuffle_row_groups: bool = False,
+    seed: Optional[int] = None,
 ) -> tf.data.Dataset:
     """Creates a tf.data.Dataset that reads given parquet files into batched Tensors.
 
@@ -33,6 +38,14 @@ def read_and_parse_parquet(
             to shuffle the data this way than dataset.unbatch().shuffle().rebatch().
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
             get dropped if its size is smaller than the given batch_size.
+        num_readers: Number of threads that read and decode parquet files concurrently.
+        prefetch_size: Optional. Maximum number of files read ahead of the consumer. Defaults to twice num_readers.
+            Only used when num_readers is larger than 1.
+        shuffle_buffer_size: Optional. If given, rows are shuffled through a buffer of about this many rows instead of
+            within each record batch. Only used when shuffle is true.
+        shuffle_row_groups: Whether row groups, rather than files, are read in random order. Only used when shuffle is
+            true.
+        seed: Optional. The seed used to shuffle the data. Each iteration is shuffled differently but reproducibly.
 
     Returns:
         A tf.data.Dataset generates batched Tensors in a dict. The keys will be the column names in
@@ -59,8 +72,23 @@ def read_and_parse_parquet(
             original_exception=ValueError("At least one file is needed to create a TF dataset."),
         )
 
+    # The parser is shared by all iterations over the dataset so that a seeded shuffle differs between epochs. It keeps
+    # no per-iteration state, so iterations may overlap.
+    parser = parquet_parser.ParquetParser(
+        list(files),
+        filesystem,
+        batch_size,
+        shuffle,
+        drop_last_batch,
+        num_readers=num_readers,
+        prefetch_size=prefetch_size,
+        shuffle_buffer_size=shuffle_buffer_size,
+        shuffle_row_groups=shuffle_row_groups,
+        seed=seed,
+    )
+
     def generator() -> Generator[Dict[str, npt.NDArray[Any]], None, None]:
-        yield from parquet_parser.ParquetParser(list(files), filesystem, batch_size, shuffle, drop_last_batch)
+        yield from parser
 
     return tf.data.Dataset.from_generator(generator, output_signature=_derive_signature(files[0], filesystem))
 
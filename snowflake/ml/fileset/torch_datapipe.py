@@ -1,4 +1,5 @@
-from typing import Any, Dict, Iterator
+import itertools
+from typing import Any, Dict, Iterator, Optional
 
 import fsspec
 import numpy.typing as npt
@@ -19,6 +20,14 @@ class ReadAndParseParquet(IterDataPipe):
             the order of files, and then shuflle the order of rows in each file.
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
             get dropped if its size is smaller than the given batch_size.
+        num_readers: Number of threads that read and decode parquet files concurrently.
+        prefetch_size: Optional. Maximum number of files read ahead of the consumer. Defaults to twice num_readers.
+            Only used when num_readers is larger than 1.
+        shuffle_buffer_size: Optional. If given, rows are shuffled through a buffer of about this many rows instead of
+            within each record batch. Only used when shuffle is true.
+        shuffle_row_groups: Whether row groups, rather than files, are read in random order. Only used when shuffle is
+            true.
+        seed: Optional. The seed used to shuffle the data. Each iteration is shuffled differently but reproducibly.
 
     Returns:
         A PyTorch iterable datapipe that yields batched numpy array in dict. The keys will be the column names in
@@ -44,14 +53,38 @@ class ReadAndParseParquet(IterDataPipe):
         batch_size: int,
         shuffle: bool,
         drop_last_batch: bool,
+        num_readers: int = 1,
+        prefetch_size: Optional[int] = None,
+        shuffle_buffer_size: Optional[int] = None,
+        shuffle_row_groups: bool = False,
+        seed: Optional[int] = None,
     ) -> None:
         self._input_datapipe = input_datapipe
         self._fs = filesystem
         self._batch_size = batch_size
         self._shuffle = shuffle
         self._drop_last_batch = drop_last_batch
+        self._num_readers = num_readers
+        self._prefetch_size = prefetch_size
+        self._shuffle_buffer_size = shuffle_buffer_size
+        self._shuffle_row_groups = shuffle_row_groups
+        self._seed = seed
+        self._epochs = itertools.count()
 
     def __iter__(self) -> Iterator[Dict[str, npt.NDArray[Any]]]:
-        yield from parquet_parser.ParquetParser(
-            list(self._input_datapipe), self._fs, self._batch_size, self._shuffle, self._drop_last_batch
+        # Every iteration lists the input datapipe again and gets its own parser. Only the epoch is carried over, so
+        # that a seeded shuffle differs between epochs.
+        parser = parquet_parser.ParquetParser(
+            list(self._input_datapipe),
+            self._fs,
+            self._batch_size,
+            self._shuffle,
+            self._drop_last_batch,
+            num_readers=self._num_readers,
+            prefetch_size=self._prefetch_size,
+            shuffle_buffer_size=self._shuffle_buffer_size,
+            shuffle_row_groups=self._shuffle_row_groups,
+            seed=self._seed,
+            epoch=next(self._epochs),
         )
+        yield from parser
@@ -43,6 +43,28 @@ class TorchDataPipeTest(absltest.TestCase):
                 if col != "col3":
                     self.assertIsInstance(tensor, torch.Tensor)
 
+    def testDataPipeNumReaders(self) -> None:
+        files = IterableWrapper([self._file0.name, self._file1.name, self._file2.name])
+        expected = [
+            batch["col1"].tolist()
+            for batch in torch_datapipe.ReadAndParseParquet(
+                files, local.LocalFileSystem(), 2, shuffle=False, drop_last_batch=False
+            )
+        ]
+        dp = torch_datapipe.ReadAndParseParquet(
+            files, local.LocalFileSystem(), 2, shuffle=False, drop_last_batch=False, num_readers=2, prefetch_size=1
+        )
+        self.assertEqual([batch["col1"].tolist() for batch in dp], expected)
+
+    def testDataPipeListsInputEveryIteration(self) -> None:
+        file_names = [self._file0.name]
+        files = IterableWrapper(file_names)
+        dp = torch_datapipe.ReadAndParseParquet(files, local.LocalFileSystem(), 1, shuffle=False, drop_last_batch=False)
+        rows = [batch["col1"][0] for batch in dp]
+
+        file_names.append(self._file1.name)
+        self.assertGreater(len([batch["col1"][0] for batch in dp]), len(rows))
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -486,7 +486,9 @@ def predict(
     if not isinstance(X, SnowparkDataFrame):
         keep_order = True
         output_with_input_features = False
-        df = model_signature._convert_and_validate_local_data(X, sig.inputs)
+        df = model_signature._convert_and_validate_local_data(
+            X, sig.inputs, sample_rows=deployment["options"].get("validation_sample_rows", None)
+        )
         s_df = snowpark_handler.SnowparkDataFrameHandler.convert_from_df(session, df, keep_order=keep_order)
     else:
         keep_order = False
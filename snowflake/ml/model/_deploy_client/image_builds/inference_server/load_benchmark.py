@@ -0,0 +1,141 @@
+# A load test of the inference server, reporting the throughput and the latency of the prediction endpoint for each
+# payload format. The Starlette application is served in process through httpx, so the numbers include the parsing,
+# the prediction and the serialization of the requests, but not the network.
+#
+# Run it from this directory, e.g.:
+#   python load_benchmark.py --rows_per_request=1000 --num_requests=200 --concurrency=8
+# The server reads its settings from the environment as usual, e.g. _DYNAMIC_BATCH_MAX_ROWS.
+
+import io
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import anyio
+import httpx
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from absl import app, flags
+from sklearn import linear_model
+
+from snowflake.ml._internal import file_utils
+from snowflake.ml.model import custom_model
+from snowflake.ml.model._packager import model_packager
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("rows_per_request", 1000, "Number of rows in each prediction request.")
+flags.DEFINE_integer("num_requests", 200, "Number of prediction requests sent for each payload format.")
+flags.DEFINE_integer("concurrency", 8, "Number of prediction requests in flight at the same time.")
+flags.DEFINE_integer("num_features", 16, "Number of float features of the model.")
+
+_ROW_JSON_MEDIA_TYPE = "application/json"
+_COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.snowflake.columnar+json"
+_ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _save_model(zip_full_path: str, num_features: int) -> pd.DataFrame:
+    """Save a logistic regression model predicting probabilities, and return a sample of its input."""
+    rng = np.random.default_rng(0)
+    x = pd.DataFrame(rng.random((1000, num_features)), columns=[f"feature_{i}" for i in range(num_features)])
+    y = (x.sum(axis=1) > num_features / 2).astype(int)
+    estimator = linear_model.LogisticRegression().fit(x, y)
+
+    class LoadTestModel(custom_model.CustomModel):
+        @custom_model.inference_api
+        def predict(self, input: pd.DataFrame) -> pd.DataFrame:
+            return pd.DataFrame(estimator.predict_proba(input))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_packager.ModelPackager(tmpdir).save(
+            name="load_test_model",
+            model=LoadTestModel(custom_model.ModelContext()),
+            sample_input=x,
+        )
+        file_utils.make_archive(zip_full_path, tmpdir)
+    return x
+
+
+def _row_json_payload(df: pd.DataFrame) -> bytes:
+    return json.dumps({"data": [[i, row] for i, row in enumerate(df.to_dict(orient="records"))]}).encode()
+
+
+def _columnar_json_payload(df: pd.DataFrame) -> bytes:
+    return json.dumps({"data": df.to_dict(orient="list")}).encode()
+
+
+def _arrow_stream_payload(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+_PAYLOADS: Dict[str, Tuple[str, Callable[[pd.DataFrame], bytes]]] = {
+    "json": (_ROW_JSON_MEDIA_TYPE, _row_json_payload),
+    "columnar_json": (_COLUMNAR_JSON_MEDIA_TYPE, _columnar_json_payload),
+    "arrow": (_ARROW_STREAM_MEDIA_TYPE, _arrow_stream_payload),
+}
+
+
+async def _run_load(
+    client: httpx.AsyncClient, body: bytes, media_type: str, num_requests: int, concurrency: int
+) -> Tuple[float, List[float]]:
+    """Send the requests with the given concurrency, and return the wall time and the latency of every request."""
+    latencies: List[float] = []
+    remaining = iter(range(num_requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.post("/predict", content=body, headers={"Content-Type": media_type})
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as task_group:
+        for _ in range(concurrency):
+            task_group.start_soon(worker)
+    return time.perf_counter() - start, latencies
+
+
+async def _run_benchmark(sample_input: pd.DataFrame) -> None:
+    # The server starts loading the model from the environment as soon as it is imported.
+    import main as server
+
+    server._MODEL_LOADING_EVENT.wait()
+    input_df = sample_input.sample(n=FLAGS.rows_per_request, replace=True, random_state=0).reset_index(drop=True)
+
+    print(
+        f"rows_per_request={FLAGS.rows_per_request} num_requests={FLAGS.num_requests} "
+        f"concurrency={FLAGS.concurrency} num_features={FLAGS.num_features}"
+    )
+    print(f"{'payload':<14}{'request KiB':>12}{'rows/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+        for name, (media_type, to_payload) in _PAYLOADS.items():
+            body = to_payload(input_df)
+            # Warm up, so that the first requests do not pay for lazy imports.
+            await _run_load(client, body, media_type, FLAGS.concurrency, FLAGS.concurrency)
+            wall_time, latencies = await _run_load(client, body, media_type, FLAGS.num_requests, FLAGS.concurrency)
+            rows_per_sec = FLAGS.num_requests * FLAGS.rows_per_request / wall_time
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            print(f"{name:<14}{len(body) / 1024:>12.1f}{rows_per_sec:>12.0f}{p50:>10.1f}{p99:>10.1f}")
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zip_full_path = os.path.join(tmpdir, "model.zip")
+        sample_input = _save_model(zip_full_path, FLAGS.num_features)
+        os.environ["TARGET_METHOD"] = "predict"
+        os.environ["MODEL_ZIP_STAGE_PATH"] = zip_full_path
+        anyio.run(_run_benchmark, sample_input)
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -1,16 +1,32 @@
 import asyncio
+import bisect
+import contextlib
+import functools
 import http
+import json
 import logging
 import os
-import sys
+import shutil
 import tempfile
 import threading
 import time
 import traceback
 import zipfile
 from enum import Enum
-from typing import Dict, List, Optional, cast
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import numpy as np
 import pandas as pd
 from gunicorn import arbiter
 from starlette import applications, concurrency, requests, responses, routing
@@ -51,17 +67,294 @@ class CustomThread(threading.Thread):
             os._exit(arbiter.Arbiter.APP_LOAD_ERROR)
 
 
+class _LoadedModel(NamedTuple):
+    """A model loaded into memory together with its metadata and the directory its zip was extracted to.
+
+    All are replaced at once when the model is reloaded, so a request reading _LOADED_MODEL once always sees a model
+    and the signatures that belong to it.
+    """
+
+    model: Any
+    meta: Any
+    model_dir: str
+
+
 logger = logging.getLogger(__name__)
-_LOADED_MODEL = None
-_LOADED_META = None
-_MODEL_CODE_DIR = "code"
+_LOADED_MODEL: Optional[_LoadedModel] = None
+# Directory of the model served before the last reload, removed at the next reload.
+_RETIRED_MODEL_DIR: Optional[str] = None
 _MODEL_LOADING_STATE = _ModelLoadingState.LOADING
 _MODEL_LOADING_EVENT = threading.Event()
 _CONCURRENT_REQUESTS_MAX: Optional[int] = None
 _CONCURRENT_COUNTER = 0
 _CONCURRENT_COUNTER_LOCK = asyncio.Lock()
+_DYNAMIC_BATCH_MAX_ROWS: Optional[int] = None
+_DYNAMIC_BATCH_MAX_WAIT_MS: float = 5
+_DYNAMIC_BATCHERS: Dict[str, "_DynamicBatcher"] = {}
 TARGET_METHOD = None
 
+# Media types of the supported payload formats, negotiated through the Content-Type and Accept headers.
+# Row-oriented JSON is the format used by Snowflake service functions and the default when no header is given.
+_ROW_JSON_MEDIA_TYPE = "application/json"
+_COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.snowflake.columnar+json"
+_ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+_SUPPORTED_MEDIA_TYPES = (_ROW_JSON_MEDIA_TYPE, _COLUMNAR_JSON_MEDIA_TYPE, _ARROW_STREAM_MEDIA_TYPE)
+# Use _ID to keep the order of prediction result and associated features.
+_KEEP_ORDER_COL_NAME = "_ID"
+_METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    """Format the labels of a series, prefixed with the pid label of the worker.
+
+    Each Gunicorn worker keeps its own metrics, and a scrape is served by any of them. The pid label keeps the series of
+    the workers apart, so that the counters of one worker are not read as resets of the counters of another.
+
+    Args:
+        label_names: Names of the labels of the series.
+        label_values: Values of the labels of the series, in the same order as their names.
+
+    Returns:
+        The labels in the Prometheus text format, without the surrounding braces.
+    """
+    label_names = ("pid", *label_names)
+    label_values = (str(os.getpid()), *label_values)
+    escaped_values = [value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in label_values]
+    return ",".join(f'{name}="{value}"' for name, value in zip(label_names, escaped_values))
+
+
+class _Counter:
+    """A Prometheus counter, with one value per combination of label values."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self._name = name
+        self._documentation = documentation
+        self._label_names = label_names
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self._name} {self._documentation}", f"# TYPE {self._name} counter"]
+        for label_values, value in values:
+            lines.append(f"{self._name}{{{_format_labels(self._label_names, label_values)}}} {value}")
+        return lines
+
+
+class _Histogram:
+    """A Prometheus histogram with fixed buckets, with one series per combination of label values.
+
+    An observation only increments two numbers under a lock, so that metrics can be collected on every request.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]) -> None:
+        self._name = name
+        self._documentation = documentation
+        self._label_names = label_names
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        # Maps label values to the number of observations in each bucket, not cumulated, followed by their sum.
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self._buckets) + 2)
+            series[bisect.bisect_left(self._buckets, value)] += 1
+            series[-1] += value
+
+    @contextlib.contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        """Observe the time in seconds spent in the context."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *label_values)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            all_series = sorted((label_values, list(series)) for label_values, series in self._series.items())
+        lines = [f"# HELP {self._name} {self._documentation}", f"# TYPE {self._name} histogram"]
+        for label_values, series in all_series:
+            labels = _format_labels(self._label_names, label_values)
+            count = 0.0
+            for bucket, bucket_count in zip([*map(str, self._buckets), "+Inf"], series):
+                count += bucket_count
+                lines.append(f'{self._name}_bucket{{{labels},le="{bucket}"}} {count}')
+            lines.append(f"{self._name}_sum{{{labels}}} {series[-1]}")
+            lines.append(f"{self._name}_count{{{labels}}} {count}")
+        return lines
+
+
+# Upper bounds in seconds of the buckets of latency histograms, from 100 microseconds to 10 seconds.
+_LATENCY_BUCKETS_SEC = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_REQUEST_SECONDS = _Histogram(
+    "snowml_inference_request_duration_seconds",
+    "Time spent serving prediction requests, including waiting for the thread pool and the dynamic batcher.",
+    ("method",),
+    _LATENCY_BUCKETS_SEC,
+)
+_STAGE_SECONDS = _Histogram(
+    "snowml_inference_stage_duration_seconds",
+    "Time spent in each stage of prediction requests: parse, astype, model and serialize.",
+    ("method", "stage"),
+    _LATENCY_BUCKETS_SEC,
+)
+_REQUESTS_TOTAL = _Counter(
+    "snowml_inference_requests_total", "Number of prediction requests by response status code.", ("method", "code")
+)
+_REJECTED_REQUESTS_TOTAL = _Counter(
+    "snowml_inference_rejected_requests_total",
+    "Number of prediction requests rejected with status code 429 because of too many concurrent requests.",
+    ("method",),
+)
+_ROWS_TOTAL = _Counter("snowml_inference_rows_total", "Number of rows predicted.", ("method",))
+_MODEL_LOADS_TOTAL = _Counter("snowml_inference_model_loads_total", "Number of times the model was loaded.")
+_MODEL_LOAD_SECONDS: Optional[float] = None
+
+
+def _load_model(model_zip_stage_path: str) -> _LoadedModel:
+    """Extract the model zip and load the model into memory, recording the time spent in the metrics."""
+    global _MODEL_LOAD_SECONDS
+
+    start = time.perf_counter()
+    loaded_model = _load_model_from_zip(model_zip_stage_path)
+    _MODEL_LOAD_SECONDS = time.perf_counter() - start
+    _MODEL_LOADS_TOTAL.inc()
+    return loaded_model
+
+
+def _load_model_from_zip(model_zip_stage_path: str) -> _LoadedModel:
+    """Extract the model zip to a new directory and load the model from it.
+
+    The directory is kept for as long as the model is served, since the code of the model may import modules from it
+    lazily. Every load extracts to its own directory, so that a reloaded model never reads the files of the previous
+    one. The model packager adds the code directory of the model to sys.path while loading it.
+
+    Args:
+        model_zip_stage_path: Path to the model zip.
+
+    Returns:
+        The loaded model, its metadata and the directory it was extracted to.
+
+    Raises:
+        RuntimeError: Raised when there is no model zip at the given path.
+        Exception: Raised when the model fails to load. The extracted directory is removed first.
+    """
+    if not zipfile.is_zipfile(model_zip_stage_path):
+        raise RuntimeError(f"No model zip found at stage path: {model_zip_stage_path}")
+    extracted_dir = tempfile.mkdtemp(prefix="extracted_model_dir_")
+    logger.info(f"Extracting model zip from {model_zip_stage_path} to {extracted_dir}")
+    with zipfile.ZipFile(model_zip_stage_path, "r") as model_zip:
+        if len(model_zip.namelist()) > 1:
+            model_zip.extractall(extracted_dir)
+    logger.info(f"Loading model from {extracted_dir} into memory")
+
+    try:
+        model, meta = _load_model_from_dir(extracted_dir)
+    except Exception:
+        shutil.rmtree(extracted_dir, ignore_errors=True)
+        raise
+    return _LoadedModel(model, meta, extracted_dir)
+
+
+def _load_model_from_dir(extracted_dir: str) -> Tuple[Any, Any]:
+    from snowflake.ml.model import type_hints as model_types
+
+    # TODO (Server-side Model Rollout):
+    # Keep try block only
+    try:
+        from snowflake.ml.model._packager import model_packager
+
+        pk = model_packager.ModelPackager(extracted_dir)
+        pk.load(
+            as_custom_model=True,
+            meta_only=False,
+            options=model_types.ModelLoadOption({"use_gpu": cast(bool, os.environ.get("SNOWML_USE_GPU", False))}),
+        )
+        return pk.model, pk.meta
+    except ImportError as e:
+        if e.name and not e.name.startswith("snowflake.ml"):
+            raise e
+        # Legacy model support
+        from snowflake.ml.model import (  # type: ignore[attr-defined]
+            _model as model_api,
+        )
+
+        if hasattr(model_api, "_load_model_for_deploy"):
+            return cast(Tuple[Any, Any], model_api._load_model_for_deploy(extracted_dir))
+        return cast(
+            Tuple[Any, Any],
+            model_api._load(
+                local_dir_path=extracted_dir,
+                as_custom_model=True,
+                options=model_types.ModelLoadOption({"use_gpu": cast(bool, os.environ.get("SNOWML_USE_GPU", False))}),
+            ),
+        )
+
+
+def _get_model_zip_version(model_zip_stage_path: str) -> Tuple[int, int]:
+    stat = os.stat(model_zip_stage_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _reload_model_if_changed(model_zip_stage_path: str, version: Tuple[int, int]) -> Tuple[int, int]:
+    """Reload the model if the model zip is not at the given version anymore.
+
+    The new model is loaded next to the one being served, which is swapped out only once the load succeeded. Requests
+    already running keep using the model they started with. If the load fails, e.g. because the zip is still being
+    written, the current model keeps being served. The code of the model is reloaded as well: the model packager
+    re-imports the already imported modules of the code directory from the directory of the new model.
+
+    Args:
+        model_zip_stage_path: Path to the model zip.
+        version: Version of the model being served, as returned by _get_model_zip_version.
+
+    Returns:
+        The version of the model being served.
+    """
+    global _LOADED_MODEL
+    global _RETIRED_MODEL_DIR
+
+    try:
+        new_version = _get_model_zip_version(model_zip_stage_path)
+        if new_version == version:
+            return version
+        logger.info(f"Model zip at {model_zip_stage_path} changed, reloading model")
+        previous_model = _LOADED_MODEL
+        _LOADED_MODEL = _load_model(model_zip_stage_path)
+        logger.info("Successfully reloaded model into memory")
+        if previous_model is not None:
+            # Requests still running on the previous model may import from its directory, so it is only removed at
+            # the next reload.
+            if _RETIRED_MODEL_DIR is not None:
+                shutil.rmtree(_RETIRED_MODEL_DIR, ignore_errors=True)
+            _RETIRED_MODEL_DIR = previous_model.model_dir
+        return new_version
+    except Exception:
+        logger.error(f"Failed to reload model, keep serving the current one: {traceback.format_exc()}")
+        return version
+
+
+def _watch_model_zip(model_zip_stage_path: str, version: Tuple[int, int], interval_sec: float) -> None:
+    """Reload the model whenever the model zip changes from the given version.
+
+    Args:
+        model_zip_stage_path: Path to the model zip.
+        version: Version of the model being served, as returned by _get_model_zip_version.
+        interval_sec: Seconds to wait between two checks of the model zip.
+    """
+    while True:
+        time.sleep(interval_sec)
+        version = _reload_model_if_changed(model_zip_stage_path, version)
+
 
 def _run_setup() -> None:
     """Set up logging and load model into memory."""
@@ -73,10 +366,11 @@ def _run_setup() -> None:
     logger.info(f"ENV: {os.environ}")
 
     global _LOADED_MODEL
-    global _LOADED_META
     global _MODEL_LOADING_STATE
     global _MODEL_LOADING_EVENT
     global _CONCURRENT_REQUESTS_MAX
+    global _DYNAMIC_BATCH_MAX_ROWS
+    global _DYNAMIC_BATCH_MAX_WAIT_MS
     global TARGET_METHOD
 
     try:
@@ -89,56 +383,24 @@ def _run_setup() -> None:
 
         _CONCURRENT_REQUESTS_MAX = int(_concurrent_requests_max_env) if _concurrent_requests_max_env else None
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            if zipfile.is_zipfile(model_zip_stage_path):
-                extracted_dir = os.path.join(tmp_dir, "extracted_model_dir")
-                logger.info(f"Extracting model zip from {model_zip_stage_path} to {extracted_dir}")
-                with zipfile.ZipFile(model_zip_stage_path, "r") as model_zip:
-                    if len(model_zip.namelist()) > 1:
-                        model_zip.extractall(extracted_dir)
-            else:
-                raise RuntimeError(f"No model zip found at stage path: {model_zip_stage_path}")
-            logger.info(f"Loading model from {extracted_dir} into memory")
-
-            sys.path.insert(0, os.path.join(extracted_dir, _MODEL_CODE_DIR))
-            from snowflake.ml.model import type_hints as model_types
-
-            # TODO (Server-side Model Rollout):
-            # Keep try block only
-            try:
-                from snowflake.ml.model._packager import model_packager
-
-                pk = model_packager.ModelPackager(extracted_dir)
-                pk.load(
-                    as_custom_model=True,
-                    meta_only=False,
-                    options=model_types.ModelLoadOption(
-                        {"use_gpu": cast(bool, os.environ.get("SNOWML_USE_GPU", False))}
-                    ),
-                )
-                _LOADED_MODEL = pk.model
-                _LOADED_META = pk.meta
-            except ImportError as e:
-                if e.name and not e.name.startswith("snowflake.ml"):
-                    raise e
-                # Legacy model support
-                from snowflake.ml.model import (  # type: ignore[attr-defined]
-                    _model as model_api,
-                )
-
-                if hasattr(model_api, "_load_model_for_deploy"):
-                    _LOADED_MODEL, _LOADED_META = model_api._load_model_for_deploy(extracted_dir)
-                else:
-                    _LOADED_MODEL, meta_LOADED_META = model_api._load(
-                        local_dir_path=extracted_dir,
-                        as_custom_model=True,
-                        options=model_types.ModelLoadOption(
-                            {"use_gpu": cast(bool, os.environ.get("SNOWML_USE_GPU", False))}
-                        ),
-                    )
-            _MODEL_LOADING_STATE = _ModelLoadingState.SUCCEEDED
-            logger.info("Successfully loaded model into memory")
-            _MODEL_LOADING_EVENT.set()
+        _dynamic_batch_max_rows_env = os.getenv("_DYNAMIC_BATCH_MAX_ROWS", None)
+        _DYNAMIC_BATCH_MAX_ROWS = int(_dynamic_batch_max_rows_env) if _dynamic_batch_max_rows_env else None
+        _DYNAMIC_BATCH_MAX_WAIT_MS = float(os.getenv("_DYNAMIC_BATCH_MAX_WAIT_MS", _DYNAMIC_BATCH_MAX_WAIT_MS))
+
+        # Get the version before loading, so that a zip changing during the load is reloaded by the watcher.
+        model_zip_version = _get_model_zip_version(model_zip_stage_path)
+        _LOADED_MODEL = _load_model(model_zip_stage_path)
+        _MODEL_LOADING_STATE = _ModelLoadingState.SUCCEEDED
+        logger.info("Successfully loaded model into memory")
+        _MODEL_LOADING_EVENT.set()
+
+        _model_reload_interval_sec_env = os.getenv("_MODEL_RELOAD_INTERVAL_SEC", None)
+        if _model_reload_interval_sec_env:
+            threading.Thread(
+                target=_watch_model_zip,
+                args=(model_zip_stage_path, model_zip_version, float(_model_reload_interval_sec_env)),
+                daemon=True,
+            ).start()
     except Exception as e:
         _MODEL_LOADING_STATE = _ModelLoadingState.FAILED
         raise e
@@ -167,59 +429,326 @@ async def ready(request: requests.Request) -> responses.JSONResponse:
     return responses.JSONResponse({"status": "not ready"}, status_code=http.HTTPStatus.SERVICE_UNAVAILABLE)
 
 
-def _do_predict(input_json: Dict[str, List[List[object]]]) -> responses.JSONResponse:
+def _get_request_media_type(content_type: Optional[str]) -> Optional[str]:
+    """Get the payload format of a request from its Content-Type header, or None if the format is not supported."""
+    if not content_type:
+        return _ROW_JSON_MEDIA_TYPE
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type if media_type in _SUPPORTED_MEDIA_TYPES else None
+
+
+def _get_response_media_type(accept: Optional[str], request_media_type: str) -> Optional[str]:
+    """Get the payload format of a response from the Accept header of the request, or None if none is supported.
+
+    Responses use the format of the request unless the client asks for a specific supported format.
+
+    Args:
+        accept: The Accept header of the request, if any.
+        request_media_type: The payload format of the request.
+
+    Returns:
+        The first supported format listed in the Accept header, the format of the request if there is no Accept
+        header or if it accepts any format, or None otherwise.
+    """
+    if not accept:
+        return request_media_type
+    accepted_media_types = [media_range.split(";")[0].strip().lower() for media_range in accept.split(",")]
+    for media_type in accepted_media_types:
+        if media_type in _SUPPORTED_MEDIA_TYPES:
+            return media_type
+    if any(media_type in ("*/*", "application/*") for media_type in accepted_media_types):
+        return request_media_type
+    return None
+
+
+def _parse_input(body: bytes, media_type: str) -> pd.DataFrame:
+    """Parse the body of a request into a data frame of features.
+
+    Args:
+        body: The raw body of the request.
+        media_type: The payload format of the body, one of _SUPPORTED_MEDIA_TYPES.
+
+    Returns:
+        The input data frame, including the _ID column if given.
+    """
+    if media_type == _ARROW_STREAM_MEDIA_TYPE:
+        import pyarrow as pa
+
+        with pa.ipc.open_stream(body) as reader:
+            df = reader.read_pandas()
+        assert len(df) != 0, "empty data"
+        return df
+
+    input_json = json.loads(body)
+    assert "data" in input_json, "missing data field in the request input"
+    if media_type == _COLUMNAR_JSON_MEDIA_TYPE:
+        df = pd.DataFrame(input_json["data"])
+        assert len(df) != 0, "empty data"
+        return df
+
+    # The expression x[1:] is used to exclude the index of the data row.
+    input_data = [x[1] for x in input_json["data"]]
+    assert len(input_data) != 0 and not all(not row for row in input_data), "empty data"
+    return pd.json_normalize(input_data)
+
+
+def _convert_array_columns(predictions_df: pd.DataFrame, max_ndim: int = 0) -> pd.DataFrame:
+    """Convert the columns of numpy arrays of the output, which the model handlers keep as views into the output
+    tensors, into lists so that they can be serialized.
+
+    Args:
+        predictions_df: The output data frame.
+        max_ndim: The maximum number of dimensions of the arrays that are kept as they are.
+
+    Returns:
+        The output data frame, with lists in place of the numpy arrays.
+    """
+    converted_df = predictions_df
+    for col in predictions_df.columns:
+        if predictions_df[col].dtype != np.dtype("O") or len(predictions_df) == 0:
+            continue
+        first = predictions_df[col].iloc[0]
+        if isinstance(first, np.ndarray) and first.ndim > max_ndim:
+            if converted_df is predictions_df:
+                converted_df = predictions_df.copy()
+            converted_df[col] = predictions_df[col].map(np.ndarray.tolist)
+    return converted_df
+
+
+def _serialize_output(predictions_df: pd.DataFrame, media_type: str) -> responses.Response:
+    """Serialize the predictions into a response of the given payload format.
+
+    Args:
+        predictions_df: The output data frame, including the _ID column if given in the input.
+        media_type: The payload format of the response, one of _SUPPORTED_MEDIA_TYPES.
+
+    Returns:
+        The response to the request.
+    """
+    if media_type == _ARROW_STREAM_MEDIA_TYPE:
+        import pyarrow as pa
+
+        # Arrow takes one dimensional arrays as they are, as list values.
+        table = pa.Table.from_pandas(_convert_array_columns(predictions_df, max_ndim=1), preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return responses.Response(sink.getvalue().to_pybytes(), media_type=_ARROW_STREAM_MEDIA_TYPE)
+    predictions_df = _convert_array_columns(predictions_df)
+    if media_type == _COLUMNAR_JSON_MEDIA_TYPE:
+        return responses.JSONResponse(
+            {"data": predictions_df.to_dict(orient="list")}, media_type=_COLUMNAR_JSON_MEDIA_TYPE
+        )
+    return responses.JSONResponse(
+        {"data": [[i, row] for i, row in enumerate(predictions_df.to_dict(orient="records"))]}
+    )
+
+
+def _prepare_input(
+    loaded_model: _LoadedModel, method: str, body: bytes, request_media_type: str
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Parse the body of a request and cast it to the input signature of the method.
+
+    Args:
+        loaded_model: The model the request is served with.
+        method: The name of the method of the model.
+        body: The raw body of the request.
+        request_media_type: The payload format of the body, one of _SUPPORTED_MEDIA_TYPES.
+
+    Returns:
+        The whole input data frame, including the _ID column if given, and the features passed to the model.
+    """
     from snowflake.ml.model.model_signature import FeatureSpec
 
-    assert _LOADED_MODEL, "model is not loaded"
-    assert _LOADED_META, "model metadata is not loaded"
-    assert TARGET_METHOD, "Missing environment variable TARGET_METHOD"
+    features = cast(List[FeatureSpec], loaded_model.meta.signatures[method].inputs)
+    dtype_map = {feature.name: feature.as_dtype() for feature in features}
+    input_cols = [spec.name for spec in features]
+    with _STAGE_SECONDS.time(method, "parse"):
+        df = _parse_input(body, request_media_type)
+    with _STAGE_SECONDS.time(method, "astype"):
+        df = df.astype(dtype=dtype_map)
+    return df, df[input_cols]
+
+
+def _run_model(method: str, loaded_model: _LoadedModel, x: pd.DataFrame) -> pd.DataFrame:
+    """Call the method of the model and name the output columns after its signature."""
+    with _STAGE_SECONDS.time(method, "model"):
+        predictions_df = getattr(loaded_model.model, method)(x)
+    predictions_df.columns = [spec.name for spec in loaded_model.meta.signatures[method].outputs]
+    return cast(pd.DataFrame, predictions_df)
+
+
+def _prepare_output(
+    method: str, df: pd.DataFrame, predictions_df: pd.DataFrame, response_media_type: str
+) -> responses.Response:
+    """Attach the _ID column of the input to the predictions and serialize them."""
+    with _STAGE_SECONDS.time(method, "serialize"):
+        if _KEEP_ORDER_COL_NAME in df.columns:
+            predictions_df[_KEEP_ORDER_COL_NAME] = df[_KEEP_ORDER_COL_NAME]
+        resp = _serialize_output(predictions_df, response_media_type)
+    _ROWS_TOTAL.inc(method, amount=len(predictions_df))
+    return resp
+
+
+def _error_response(message: str, e: Exception) -> responses.JSONResponse:
+    error_message = f"{message}: {str(e)}\n{traceback.format_exc()}"
+    logger.error(f"Failed request with error: {error_message}")
+    return responses.JSONResponse({"error": error_message}, status_code=http.HTTPStatus.BAD_REQUEST)
+
 
+def _do_predict(
+    loaded_model: _LoadedModel, method: str, body: bytes, request_media_type: str, response_media_type: str
+) -> responses.Response:
     try:
-        features = cast(List[FeatureSpec], _LOADED_META.signatures[TARGET_METHOD].inputs)
-        dtype_map = {feature.name: feature.as_dtype() for feature in features}
-        input_cols = [spec.name for spec in features]
-        output_cols = [spec.name for spec in _LOADED_META.signatures[TARGET_METHOD].outputs]
-        assert "data" in input_json, "missing data field in the request input"
-        # The expression x[1:] is used to exclude the index of the data row.
-        input_data = [x[1] for x in input_json["data"]]
-        df = pd.json_normalize(input_data).astype(dtype=dtype_map)
-        x = df[input_cols]
-        assert len(input_data) != 0 and not all(not row for row in input_data), "empty data"
+        df, x = _prepare_input(loaded_model, method, body, request_media_type)
     except Exception as e:
-        error_message = f"Input data malformed: {str(e)}\n{traceback.format_exc()}"
-        logger.error(f"Failed request with error: {error_message}")
-        return responses.JSONResponse({"error": error_message}, status_code=http.HTTPStatus.BAD_REQUEST)
+        return _error_response("Input data malformed", e)
 
     try:
-        predictions_df = getattr(_LOADED_MODEL, TARGET_METHOD)(x)
-        predictions_df.columns = output_cols
-        # Use _ID to keep the order of prediction result and associated features.
-        _KEEP_ORDER_COL_NAME = "_ID"
-        if _KEEP_ORDER_COL_NAME in df.columns:
-            predictions_df[_KEEP_ORDER_COL_NAME] = df[_KEEP_ORDER_COL_NAME]
-        response = {"data": [[i, row] for i, row in enumerate(predictions_df.to_dict(orient="records"))]}
-        return responses.JSONResponse(response)
+        return _prepare_output(method, df, _run_model(method, loaded_model, x), response_media_type)
+    except Exception as e:
+        return _error_response("Prediction failed", e)
+
+
+def _get_dynamic_batcher(method: str) -> "_DynamicBatcher":
+    assert _DYNAMIC_BATCH_MAX_ROWS, "dynamic batching is not enabled"
+    if method not in _DYNAMIC_BATCHERS:
+        _DYNAMIC_BATCHERS[method] = _DynamicBatcher(
+            functools.partial(_run_model, method),
+            max_rows=_DYNAMIC_BATCH_MAX_ROWS,
+            max_wait_ms=_DYNAMIC_BATCH_MAX_WAIT_MS,
+        )
+    return _DYNAMIC_BATCHERS[method]
+
+
+async def _do_predict_batched(
+    loaded_model: _LoadedModel, method: str, body: bytes, request_media_type: str, response_media_type: str
+) -> responses.Response:
+    """Same as _do_predict, but the model is called by the dynamic batcher of the method together with other requests.
+
+    Args:
+        loaded_model: The model the request is served with.
+        method: The name of the method of the model.
+        body: The raw body of the request.
+        request_media_type: The payload format of the body, one of _SUPPORTED_MEDIA_TYPES.
+        response_media_type: The payload format of the response, one of _SUPPORTED_MEDIA_TYPES.
+
+    Returns:
+        The response with the predictions, or an error response if the input is malformed or the prediction failed.
+    """
+    try:
+        df, x = await concurrency.run_in_threadpool(_prepare_input, loaded_model, method, body, request_media_type)
     except Exception as e:
-        error_message = f"Prediction failed: {str(e)}\n{traceback.format_exc()}"
-        logger.error(f"Failed request with error: {error_message}")
-        return responses.JSONResponse({"error": error_message}, status_code=http.HTTPStatus.BAD_REQUEST)
+        return _error_response("Input data malformed", e)
 
+    try:
+        predictions_df = await _get_dynamic_batcher(method).predict(loaded_model, x)
+        return await concurrency.run_in_threadpool(_prepare_output, method, df, predictions_df, response_media_type)
+    except Exception as e:
+        return _error_response("Prediction failed", e)
+
+
+class _DynamicBatcher:
+    """Coalesce the inputs of concurrent requests into a single model call.
+
+    Inputs are queued, and a background task on the event loop takes the first queued input and keeps adding queued
+    inputs until the batch reaches max_rows rows or max_wait_ms milliseconds have passed. The concatenated batch is
+    run through the model in the thread pool and the predictions are split back to each request in order. Inputs
+    queued while the model is running are batched together in the next call. Each input comes with the model it was
+    prepared for, and inputs for different models, e.g. before and after a reload, are never batched together.
+
+    Args:
+        predict_fn: The function calling a model on a data frame, returning one output row per input row.
+        max_rows: The maximum number of rows of a batch. An input larger than that is run on its own.
+        max_wait_ms: The maximum time in milliseconds the first input of a batch waits for more inputs.
+    """
 
-async def predict(request: requests.Request) -> responses.JSONResponse:
+    def __init__(
+        self, predict_fn: Callable[[Any, pd.DataFrame], pd.DataFrame], max_rows: int, max_wait_ms: float
+    ) -> None:
+        self._predict_fn = predict_fn
+        self._max_rows = max_rows
+        self._max_wait_sec = max_wait_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: "asyncio.Queue[Tuple[Any, pd.DataFrame, asyncio.Future[pd.DataFrame]]]"
+        self._worker: "asyncio.Task[Any]"
+
+    async def predict(self, model: Any, x: pd.DataFrame) -> pd.DataFrame:
+        loop = asyncio.get_running_loop()
+        # The queue and the worker are bound to the event loop, so they are created by the first request on it.
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        future: "asyncio.Future[pd.DataFrame]" = loop.create_future()
+        await self._queue.put((model, x, future))
+        return await future
+
+    async def _run(self) -> None:
+        assert self._loop is not None
+        carry_over: Optional[Tuple[Any, pd.DataFrame, "asyncio.Future[pd.DataFrame]"]] = None
+        while True:
+            batch = [carry_over if carry_over is not None else await self._queue.get()]
+            carry_over = None
+            num_rows = len(batch[0][1])
+            deadline = self._loop.time() + self._max_wait_sec
+            while num_rows < self._max_rows:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item[0] is not batch[0][0] or num_rows + len(item[1]) > self._max_rows:
+                    carry_over = item
+                    break
+                batch.append(item)
+                num_rows += len(item[1])
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[Tuple[Any, pd.DataFrame, "asyncio.Future[pd.DataFrame]"]]) -> None:
+        try:
+            inputs = [x for _, x, _ in batch]
+            x = inputs[0] if len(inputs) == 1 else pd.concat(inputs, ignore_index=True)
+            predictions_df = await concurrency.run_in_threadpool(self._predict_fn, batch[0][0], x)
+            assert len(predictions_df) == len(x), "model output does not have the same number of rows as the input"
+            offset = 0
+            for _, x, future in batch:
+                if not future.done():
+                    future.set_result(predictions_df.iloc[offset : offset + len(x)].reset_index(drop=True))
+                offset += len(x)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def predict(request: requests.Request) -> responses.Response:
     """Endpoint to make predictions based on input data.
 
+    Requests to /predict are served by the method given by the TARGET_METHOD environment variable, and requests to
+    /predict/{method} by any method in the signatures of the model.
+
     Args:
-        request: The input data is expected to be in the following JSON format:
+        request: The format of the input data is given by the Content-Type header. By default, it is expected to be
+            row-oriented JSON, the format used by Snowflake service functions:
             {
                 "data": [
                     [0, {'_ID': 0, 'input_feature_0': 0.0, 'input_feature_1': 1.0}],
                     [1, {'_ID': 1, 'input_feature_0': 2.0, 'input_feature_1': 3.0}],
             }
             Each row is represented as a list, where the first element denotes the index of the row.
+            With Content-Type "application/vnd.snowflake.columnar+json", it is expected to be column-oriented JSON:
+            {
+                "data": {'_ID': [0, 1], 'input_feature_0': [0.0, 2.0], 'input_feature_1': [1.0, 3.0]}
+            }
+            With Content-Type "application/vnd.apache.arrow.stream", it is expected to be an Arrow IPC stream.
 
     Returns:
         Two possible responses:
-        For success, return a JSON response
+        For success, return the predictions in the format given by the Accept header, or by default in the format of
+            the request. For row-oriented JSON:
             {
                 "data": [
                     [0, {'_ID': 0, 'output': 1}],
@@ -228,18 +757,52 @@ async def predict(request: requests.Request) -> responses.JSONResponse:
             },
             The first element of each resulting list denotes the index of the row, and the rest of the elements
             represent the prediction results for that row.
+            For column-oriented JSON: {"data": {'_ID': [0, 1], 'output': [1, 2]}}
         For an error, return {"error": error_message, "status_code": http_response_status_code}.
     """
     _MODEL_LOADING_EVENT.wait()  # Ensure model is indeed loaded into memory
 
+    # Read the model once, so that the whole request is served by the same model even if it is reloaded meanwhile.
+    loaded_model = _LOADED_MODEL
+    assert loaded_model, "model is not loaded"
+    method = request.path_params.get("method", TARGET_METHOD)
+    if method not in loaded_model.meta.signatures:
+        # Not counted in the metrics, so that arbitrary paths do not create new series.
+        return responses.JSONResponse(
+            {"error": f"Unknown method {method}, expected one of {', '.join(loaded_model.meta.signatures)}"},
+            status_code=http.HTTPStatus.NOT_FOUND,
+        )
+
+    with _REQUEST_SECONDS.time(method):
+        resp = await _predict(request, loaded_model, method)
+    _REQUESTS_TOTAL.inc(method, str(resp.status_code))
+    return resp
+
+
+async def _predict(request: requests.Request, loaded_model: _LoadedModel, method: str) -> responses.Response:
     global _CONCURRENT_COUNTER
     global _CONCURRENT_COUNTER_LOCK
 
-    input_json = await request.json()
+    request_media_type = _get_request_media_type(request.headers.get("content-type"))
+    if request_media_type is None:
+        return responses.JSONResponse(
+            {"error": f"Unsupported Content-Type, expected one of {', '.join(_SUPPORTED_MEDIA_TYPES)}"},
+            status_code=http.HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+        )
+    response_media_type = _get_response_media_type(request.headers.get("accept"), request_media_type)
+    if response_media_type is None:
+        return responses.JSONResponse(
+            {"error": f"Not acceptable, expected one of {', '.join(_SUPPORTED_MEDIA_TYPES)}"},
+            status_code=http.HTTPStatus.NOT_ACCEPTABLE,
+        )
+
+    # The body is parsed in the thread pool, together with the prediction, to keep the event loop responsive.
+    body = await request.body()
 
     if _CONCURRENT_REQUESTS_MAX:
         async with _CONCURRENT_COUNTER_LOCK:
             if _CONCURRENT_COUNTER >= int(_CONCURRENT_REQUESTS_MAX):
+                _REJECTED_REQUESTS_TOTAL.inc(method)
                 return responses.JSONResponse(
                     {"error": "Too many requests"}, status_code=http.HTTPStatus.TOO_MANY_REQUESTS
                 )
@@ -247,7 +810,12 @@ async def predict(request: requests.Request) -> responses.JSONResponse:
     async with _CONCURRENT_COUNTER_LOCK:
         _CONCURRENT_COUNTER += 1
 
-    resp = await concurrency.run_in_threadpool(_do_predict, input_json)
+    if _DYNAMIC_BATCH_MAX_ROWS:
+        resp = await _do_predict_batched(loaded_model, method, body, request_media_type, response_media_type)
+    else:
+        resp = await concurrency.run_in_threadpool(
+            _do_predict, loaded_model, method, body, request_media_type, response_media_type
+        )
 
     async with _CONCURRENT_COUNTER_LOCK:
         _CONCURRENT_COUNTER -= 1
@@ -255,6 +823,41 @@ async def predict(request: requests.Request) -> responses.JSONResponse:
     return resp
 
 
+async def metrics(request: requests.Request) -> responses.Response:
+    """Endpoint exposing the metrics of the server in the Prometheus text format.
+
+    Each Gunicorn worker keeps its own metrics, so a scrape reports the metrics of the worker serving it, labeled with
+    its pid.
+
+    Args:
+        request: The HTTP request object.
+
+    Returns:
+        The metrics: latency histograms of the requests and of their stages, counters of the requests by status code,
+        of the rejected requests and of the predicted rows, the number of requests in flight, and the number of model
+        loads with the duration of the last one.
+    """
+    worker_labels = _format_labels((), ())
+    lines = [
+        *_REQUEST_SECONDS.collect(),
+        *_STAGE_SECONDS.collect(),
+        *_REQUESTS_TOTAL.collect(),
+        *_REJECTED_REQUESTS_TOTAL.collect(),
+        *_ROWS_TOTAL.collect(),
+        "# HELP snowml_inference_requests_in_flight Number of prediction requests being served.",
+        "# TYPE snowml_inference_requests_in_flight gauge",
+        f"snowml_inference_requests_in_flight{{{worker_labels}}} {_CONCURRENT_COUNTER}",
+        *_MODEL_LOADS_TOTAL.collect(),
+    ]
+    if _MODEL_LOAD_SECONDS is not None:
+        lines += [
+            "# HELP snowml_inference_model_load_duration_seconds Time spent on the last load of the model.",
+            "# TYPE snowml_inference_model_load_duration_seconds gauge",
+            f"snowml_inference_model_load_duration_seconds{{{worker_labels}}} {_MODEL_LOAD_SECONDS}",
+        ]
+    return responses.Response("\n".join(lines) + "\n", media_type=_METRICS_MEDIA_TYPE)
+
+
 def run_app() -> applications.Starlette:
     # TODO[shchen]: SNOW-893654. Before SnowService supports Startup probe, or extends support for Readiness probe
     # with configurable failureThreshold, we will have to load the model in a separate thread in order to prevent
@@ -265,6 +868,8 @@ def run_app() -> applications.Starlette:
     routes = [
         routing.Route("/health", endpoint=ready, methods=["GET"]),
         routing.Route("/predict", endpoint=predict, methods=["POST"]),
+        routing.Route("/predict/{method}", endpoint=predict, methods=["POST"]),
+        routing.Route("/metrics", endpoint=metrics, methods=["GET"]),
     ]
     return applications.Starlette(routes=routes)
 
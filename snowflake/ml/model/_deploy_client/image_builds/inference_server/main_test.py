@@ -1,8 +1,15 @@
+import asyncio
 import contextlib
 import http
+import importlib
+import json
 import os
+import sys
+from typing import Any, Dict, List, Optional, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import sklearn.datasets as datasets
 import sklearn.neighbors as neighbors
 from absl.testing import absltest
@@ -10,8 +17,9 @@ from absl.testing.absltest import mock
 from starlette import testclient
 
 from snowflake.ml._internal import file_utils
-from snowflake.ml.model import custom_model
+from snowflake.ml.model import custom_model, model_signature
 from snowflake.ml.model._packager import model_packager
+from snowflake.ml.model._packager.model_meta import model_meta
 
 
 class MainTest(absltest.TestCase):
@@ -23,11 +31,11 @@ class MainTest(absltest.TestCase):
         super().setUp()
         self.model_zip_path = self.setup_model()
 
-    def setup_model(self) -> str:
+    def setup_model(self, n_neighbors: int = 5, zip_full_path: Optional[str] = None) -> str:
         iris = datasets.load_iris(as_frame=True)
         x = iris.data
         y = iris.target
-        knn_model = neighbors.KNeighborsClassifier()
+        knn_model = neighbors.KNeighborsClassifier(n_neighbors=n_neighbors)
         knn_model.fit(x, y)
 
         class TestCustomModel(custom_model.CustomModel):
@@ -38,10 +46,14 @@ class MainTest(absltest.TestCase):
             def predict(self, input: pd.DataFrame) -> pd.DataFrame:
                 return pd.DataFrame(knn_model.predict(input))
 
+            @custom_model.inference_api
+            def predict_proba(self, input: pd.DataFrame) -> pd.DataFrame:
+                return pd.DataFrame(knn_model.predict_proba(input))
+
         model = TestCustomModel(custom_model.ModelContext())
         tmpdir = self.create_tempdir()
-        tmpdir_for_zip = self.create_tempdir()
-        zip_full_path = os.path.join(tmpdir_for_zip.full_path, "model.zip")
+        if zip_full_path is None:
+            zip_full_path = os.path.join(self.create_tempdir().full_path, "model.zip")
         model_packager.ModelPackager(tmpdir.full_path).save(
             name="test_model",
             model=model,
@@ -214,6 +226,323 @@ class MainTest(absltest.TestCase):
             self.assertEqual(response.status_code, http.HTTPStatus.BAD_REQUEST)
             self.assertRegex(response.text, "Input data malformed: could not convert string to float")
 
+    _COLUMNAR_DATA: Dict[str, List[float]] = {
+        "_ID": [0, 1],
+        "sepal length (cm)": [5.1, 4.7],
+        "sepal width (cm)": [3.5, 3.2],
+        "petal length (cm)": [4.2, 4.1],
+        "petal width (cm)": [1.3, 4.2],
+    }
+
+    def test_predict_endpoint_columnar_json(self) -> None:
+        with self.common_helper() as (main, client):
+            response = client.post(
+                "/predict",
+                content=json.dumps({"data": self._COLUMNAR_DATA}),
+                headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+            )
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(response.headers["content-type"], main._COLUMNAR_JSON_MEDIA_TYPE)
+            self.assertEqual(response.json(), {"data": {"output_feature_0": [1, 2], "_ID": [0, 1]}})
+
+            response = client.post(
+                "/predict",
+                content=json.dumps({"data": {}}),
+                headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+            )
+            self.assertEqual(response.status_code, http.HTTPStatus.BAD_REQUEST)
+            self.assertRegex(response.text, "Input data malformed")
+
+    def test_predict_endpoint_arrow_stream(self) -> None:
+        with self.common_helper() as (main, client):
+            table = pa.Table.from_pydict(self._COLUMNAR_DATA)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            response = client.post(
+                "/predict",
+                content=sink.getvalue().to_pybytes(),
+                headers={"Content-Type": main._ARROW_STREAM_MEDIA_TYPE},
+            )
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(response.headers["content-type"], main._ARROW_STREAM_MEDIA_TYPE)
+            with pa.ipc.open_stream(response.content) as reader:
+                result = reader.read_all().to_pydict()
+            self.assertEqual(result, {"output_feature_0": [1, 2], "_ID": [0, 1]})
+
+    def test_predict_endpoint_accept_header(self) -> None:
+        with self.common_helper() as (main, client):
+            data = {"data": [[i, {k: v[i] for k, v in self._COLUMNAR_DATA.items()}] for i in range(2)]}
+            response = client.post("/predict", json=data, headers={"Accept": main._COLUMNAR_JSON_MEDIA_TYPE})
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(response.json(), {"data": {"output_feature_0": [1, 2], "_ID": [0, 1]}})
+
+            response = client.post("/predict", json=data, headers={"Accept": "text/html, */*;q=0.8"})
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(
+                response.json(),
+                {"data": [[0, {"output_feature_0": 1, "_ID": 0}], [1, {"output_feature_0": 2, "_ID": 1}]]},
+            )
+
+            response = client.post("/predict", json=data, headers={"Accept": "text/html"})
+            self.assertEqual(response.status_code, http.HTTPStatus.NOT_ACCEPTABLE)
+
+    def test_predict_endpoint_unsupported_content_type(self) -> None:
+        with self.common_helper() as (_, client):
+            response = client.post("/predict", content=b"a,b", headers={"Content-Type": "text/csv"})
+            self.assertEqual(response.status_code, http.HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+
+    def test_predict_endpoint_with_method(self) -> None:
+        with self.common_helper() as (main, client):
+            response = client.post(
+                "/predict/predict_proba",
+                content=json.dumps({"data": self._COLUMNAR_DATA}),
+                headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+            )
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(
+                response.json(),
+                {
+                    "data": {
+                        "output_feature_0": [0.0, 0.0],
+                        "output_feature_1": [1.0, 0.0],
+                        "output_feature_2": [0.0, 1.0],
+                        "_ID": [0, 1],
+                    }
+                },
+            )
+
+            response = client.post(
+                "/predict/predict",
+                content=json.dumps({"data": self._COLUMNAR_DATA}),
+                headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+            )
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertEqual(response.json(), {"data": {"output_feature_0": [1, 2], "_ID": [0, 1]}})
+
+            response = client.post("/predict/fit", json={"data": [[0, {"_ID": 0}]]})
+            self.assertEqual(response.status_code, http.HTTPStatus.NOT_FOUND)
+            self.assertRegex(response.text, "Unknown method fit")
+
+    def test_reload_model_if_changed(self) -> None:
+        with self.common_helper() as (main, client):
+            with mock.patch("main._LOADED_MODEL", main._LOADED_MODEL):
+                loaded_model = main._LOADED_MODEL
+                version = main._get_model_zip_version(self.model_zip_path)
+                self.assertEqual(main._reload_model_if_changed(self.model_zip_path, version), version)
+                self.assertIs(main._LOADED_MODEL, loaded_model)
+
+                # A failed load keeps the current model.
+                with open(self.model_zip_path, "ab") as f:
+                    f.write(b"garbage")
+                with mock.patch("main._load_model", side_effect=RuntimeError("corrupted zip")):
+                    self.assertEqual(main._reload_model_if_changed(self.model_zip_path, version), version)
+                self.assertIs(main._LOADED_MODEL, loaded_model)
+
+                self.setup_model(n_neighbors=1, zip_full_path=self.model_zip_path)
+                new_version = main._reload_model_if_changed(self.model_zip_path, version)
+                self.assertNotEqual(new_version, version)
+                self.assertIsNot(main._LOADED_MODEL, loaded_model)
+
+                data = {"data": [[0, {k: v[0] for k, v in self._COLUMNAR_DATA.items()}]]}
+                response = client.post("/predict/predict_proba", json=data)
+                self.assertEqual(response.status_code, http.HTTPStatus.OK)
+                # With a single neighbor, the probabilities are either 0 or 1.
+                self.assertEqual(
+                    response.json(),
+                    {
+                        "data": [
+                            [0, {"output_feature_0": 0.0, "output_feature_1": 1.0, "output_feature_2": 0.0, "_ID": 0}]
+                        ]
+                    },
+                )
+
+    def setup_code_model(self, value: int, zip_full_path: str) -> None:
+        """Save a model whose output comes from a module of its code directory."""
+        code_dir = self.create_tempdir()
+        module_path = os.path.join(code_dir.full_path, "reload_test_module.py")
+        with open(module_path, "w") as f:
+            f.write(f"VALUE = {value}\n")
+        if "reload_test_module" not in sys.modules:
+            with mock.patch.object(sys, "path", [code_dir.full_path] + sys.path):
+                importlib.import_module("reload_test_module")
+        reload_test_module = sys.modules["reload_test_module"]
+
+        class CodeModel(custom_model.CustomModel):
+            @custom_model.inference_api
+            def predict(self, input: pd.DataFrame) -> pd.DataFrame:
+                return pd.DataFrame({"output": [reload_test_module.VALUE] * len(input)})
+
+        tmpdir = self.create_tempdir()
+        model_packager.ModelPackager(tmpdir.full_path).save(
+            name="test_model",
+            model=CodeModel(custom_model.ModelContext()),
+            signatures={
+                "predict": model_signature.ModelSignature(
+                    inputs=[model_signature.FeatureSpec(name="a", dtype=model_signature.DataType.DOUBLE)],
+                    outputs=[model_signature.FeatureSpec(name="output", dtype=model_signature.DataType.INT64)],
+                )
+            },
+            code_paths=[module_path],
+        )
+        file_utils.make_archive(zip_full_path, tmpdir.full_path)
+
+    def test_reload_model_code(self) -> None:
+        zip_path = os.path.join(self.create_tempdir().full_path, "model.zip")
+        input_df = pd.DataFrame({"a": [1.0]})
+        self.addCleanup(sys.modules.pop, "reload_test_module", None)
+        with self.common_helper() as (main, _):
+            with mock.patch("main._LOADED_MODEL", None), mock.patch("main._RETIRED_MODEL_DIR", None):
+                self.setup_code_model(1, zip_path)
+                version = main._get_model_zip_version(zip_path)
+                main._LOADED_MODEL = main._load_model(zip_path)
+                first_model = main._LOADED_MODEL
+                self.assertEqual(first_model.model.predict(input_df)["output"][0], 1)
+
+                self.setup_code_model(22, zip_path)
+                version = main._reload_model_if_changed(zip_path, version)
+                self.assertEqual(main._LOADED_MODEL.model.predict(input_df)["output"][0], 22)
+                # Requests still running on the previous model keep its code and its directory.
+                self.assertEqual(first_model.model.predict(input_df)["output"][0], 1)
+                self.assertTrue(os.path.isdir(first_model.model_dir))
+                self.assertNotIn(os.path.join(first_model.model_dir, model_meta.MODEL_CODE_DIR), sys.path)
+
+                self.setup_code_model(333, zip_path)
+                main._reload_model_if_changed(zip_path, version)
+                self.assertEqual(main._LOADED_MODEL.model.predict(input_df)["output"][0], 333)
+                self.assertFalse(os.path.exists(first_model.model_dir))
+
+    def test_metrics_endpoint(self) -> None:
+        with self.common_helper() as (main, client):
+            with mock.patch("main._REQUESTS_TOTAL", main._Counter("requests_total", "", ("method", "code"))):
+                response = client.post(
+                    "/predict",
+                    content=json.dumps({"data": self._COLUMNAR_DATA}),
+                    headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+                )
+                self.assertEqual(response.status_code, http.HTTPStatus.OK)
+                with mock.patch("main._CONCURRENT_REQUESTS_MAX", 1), mock.patch("main._CONCURRENT_COUNTER", 1):
+                    response = client.post("/predict/predict_proba", json={"data": [[0, {"_ID": 0}]]})
+                    self.assertEqual(response.status_code, http.HTTPStatus.TOO_MANY_REQUESTS)
+
+                response = client.get("/metrics")
+            self.assertEqual(response.status_code, http.HTTPStatus.OK)
+            self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+            lines = response.text.splitlines()
+            pid = f'pid="{os.getpid()}"'
+            self.assertIn(f'requests_total{{{pid},method="predict",code="200"}} 1', lines)
+            self.assertIn(f'requests_total{{{pid},method="predict_proba",code="429"}} 1', lines)
+            for stage in ["parse", "astype", "model", "serialize"]:
+                self.assertIn(
+                    f'snowml_inference_stage_duration_seconds_count{{{pid},method="predict",stage="{stage}"}}',
+                    response.text,
+                )
+            self.assertRegex(
+                response.text, f'snowml_inference_rejected_requests_total{{{pid},method="predict_proba"}} [1-9]'
+            )
+            self.assertRegex(response.text, f'snowml_inference_rows_total{{{pid},method="predict"}} [1-9]')
+            self.assertIn(f"snowml_inference_requests_in_flight{{{pid}}} 0", lines)
+            self.assertRegex(response.text, f"snowml_inference_model_load_duration_seconds{{{pid}}} [0-9.]+")
+
+    def test_histogram(self) -> None:
+        with self.common_helper() as (main, _):
+            histogram = main._Histogram("latency", "Latency.", ("method",), (0.1, 1))
+            for value in [0.05, 0.1, 0.5, 5]:
+                histogram.observe(value, "predict")
+            labels = f'pid="{os.getpid()}",method="predict"'
+            self.assertListEqual(
+                histogram.collect(),
+                [
+                    "# HELP latency Latency.",
+                    "# TYPE latency histogram",
+                    f'latency_bucket{{{labels},le="0.1"}} 2.0',
+                    f'latency_bucket{{{labels},le="1"}} 3.0',
+                    f'latency_bucket{{{labels},le="+Inf"}} 4.0',
+                    f"latency_sum{{{labels}}} 5.65",
+                    f"latency_count{{{labels}}} 4.0",
+                ],
+            )
+
+    def test_serialize_output_with_array_columns(self) -> None:
+        with self.common_helper() as (main, _):
+            arr = np.arange(8, dtype=np.float32).reshape((2, 2, 2))
+            predictions_df = pd.DataFrame({"vec": list(arr[:, 0]), "mat": list(arr), "num": [1, 2]})
+
+            response = main._serialize_output(predictions_df, main._COLUMNAR_JSON_MEDIA_TYPE)
+            self.assertEqual(
+                json.loads(response.body),
+                {
+                    "data": {
+                        "vec": [[0.0, 1.0], [4.0, 5.0]],
+                        "mat": [[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]]],
+                        "num": [1, 2],
+                    }
+                },
+            )
+
+            response = main._serialize_output(predictions_df, main._ARROW_STREAM_MEDIA_TYPE)
+            table = pa.ipc.open_stream(response.body).read_all()
+            self.assertEqual(table.column("vec").to_pylist(), [[0.0, 1.0], [4.0, 5.0]])
+            self.assertEqual(table.column("mat").to_pylist(), [[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]]])
+            # The data frame of the model is left untouched.
+            self.assertIsInstance(predictions_df["mat"][0], np.ndarray)
+
+    def test_predict_endpoint_with_dynamic_batching(self) -> None:
+        with self.common_helper() as (main, client):
+            with mock.patch("main._DYNAMIC_BATCH_MAX_ROWS", 10), mock.patch("main._DYNAMIC_BATCHERS", {}):
+                response = client.post(
+                    "/predict",
+                    content=json.dumps({"data": self._COLUMNAR_DATA}),
+                    headers={"Content-Type": main._COLUMNAR_JSON_MEDIA_TYPE},
+                )
+                self.assertEqual(response.status_code, http.HTTPStatus.OK)
+                self.assertEqual(response.json(), {"data": {"output_feature_0": [1, 2], "_ID": [0, 1]}})
+
+                response = client.post("/predict", json={"data": [[0], [1]]})
+                self.assertEqual(response.status_code, http.HTTPStatus.BAD_REQUEST)
+                self.assertRegex(response.text, "Input data malformed")
+
+    def test_dynamic_batcher(self) -> None:
+        with self.common_helper() as (main, _):
+            batch_sizes = []
+
+            def predict_fn(factor: int, x: pd.DataFrame) -> pd.DataFrame:
+                batch_sizes.append(len(x))
+                return pd.DataFrame({"output": x["input"] * factor})
+
+            batcher = main._DynamicBatcher(predict_fn, max_rows=5, max_wait_ms=100)
+
+            async def run(factors: List[int]) -> List[pd.DataFrame]:
+                inputs = [batcher.predict(factor, pd.DataFrame({"input": [i, i]})) for i, factor in enumerate(factors)]
+                return cast(List[pd.DataFrame], await asyncio.gather(*inputs))
+
+            results = asyncio.run(run([2, 2, 2, 2]))
+            # Inputs are batched up to 5 rows, without splitting an input across batches.
+            self.assertListEqual(batch_sizes, [4, 4])
+            for i, result in enumerate(results):
+                self.assertListEqual(result["output"].tolist(), [2 * i, 2 * i])
+
+            # Inputs for different models are not batched together.
+            batch_sizes.clear()
+            results = asyncio.run(run([2, 3]))
+            self.assertListEqual(batch_sizes, [2, 2])
+            self.assertListEqual(results[1]["output"].tolist(), [3, 3])
+
+    def test_dynamic_batcher_failure(self) -> None:
+        with self.common_helper() as (main, _):
+
+            def predict_fn(model: Any, x: pd.DataFrame) -> pd.DataFrame:
+                raise ValueError("model failed")
+
+            batcher = main._DynamicBatcher(predict_fn, max_rows=5, max_wait_ms=100)
+
+            async def run() -> List[Any]:
+                inputs = [batcher.predict(None, pd.DataFrame({"input": [i]})) for i in range(2)]
+                return cast(List[Any], await asyncio.gather(*inputs, return_exceptions=True))
+
+            for result in asyncio.run(run()):
+                self.assertIsInstance(result, ValueError)
+
 
 if __name__ == "__main__":
     absltest.main()
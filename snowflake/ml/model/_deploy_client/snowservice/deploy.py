@@ -523,6 +523,16 @@ class SnowServiceDeployment:
                     ):
                         container["env"]["_CONCURRENT_REQUESTS_MAX"] = 1
 
+                if self.options.dynamic_batch_max_rows:
+                    container = content_dict["spec"]["container"][0]
+                    container["env"]["_DYNAMIC_BATCH_MAX_ROWS"] = self.options.dynamic_batch_max_rows
+                    if self.options.dynamic_batch_max_wait_ms is not None:
+                        container["env"]["_DYNAMIC_BATCH_MAX_WAIT_MS"] = self.options.dynamic_batch_max_wait_ms
+
+                if self.options.model_reload_interval_sec:
+                    container = content_dict["spec"]["container"][0]
+                    container["env"]["_MODEL_RELOAD_INTERVAL_SEC"] = self.options.model_reload_interval_sec
+
                 yaml.dump(content_dict, spec_file)
                 logger.debug("Create service spec: \n, %s", content_dict)
 
@@ -27,6 +27,9 @@ class SnowServiceDeployOptions:
         model_in_image: Optional[bool] = False,
         debug_mode: Optional[bool] = False,
         enable_ingress: Optional[bool] = False,
+        dynamic_batch_max_rows: Optional[int] = None,
+        dynamic_batch_max_wait_ms: Optional[int] = None,
+        model_reload_interval_sec: Optional[int] = None,
     ) -> None:
         """Initialization
 
@@ -56,6 +59,17 @@ class SnowServiceDeployOptions:
             debug_mode: When set to True, deployment artifacts will be persisted in a local temp directory.
             enable_ingress: When set to True, will expose HTTP endpoint for access to the predict method of the created
                 service. Default to False.
+            dynamic_batch_max_rows: When set, the inference server coalesces concurrent requests into model calls of up
+                to this many rows. Default to None, which calls the model once per request.
+            dynamic_batch_max_wait_ms: The maximum time in milliseconds a request waits for other requests to be
+                batched with. Only used when dynamic_batch_max_rows is set. Default to 5 milliseconds.
+            model_reload_interval_sec: When set, the inference server checks the model zip on the stage every this many
+                seconds and loads it again, together with its code, when it changes, without restarting the service.
+                Default to None, which never reloads the model. Not supported with model_in_image, since the model is
+                then copied into the image rather than read from the stage.
+
+        Raises:
+            SnowflakeMLException: When model_reload_interval_sec is set together with model_in_image.
         """
 
         self.compute_pool = compute_pool
@@ -70,6 +84,18 @@ class SnowServiceDeployOptions:
         self.model_in_image = model_in_image
         self.debug_mode = debug_mode
         self.enable_ingress = enable_ingress
+        self.dynamic_batch_max_rows = dynamic_batch_max_rows
+        self.dynamic_batch_max_wait_ms = dynamic_batch_max_wait_ms
+        self.model_reload_interval_sec = model_reload_interval_sec
+
+        if self.model_in_image and self.model_reload_interval_sec is not None:
+            raise snowml_exceptions.SnowflakeMLException(
+                error_code=error_codes.INVALID_ARGUMENT,
+                original_exception=ValueError(
+                    "model_reload_interval_sec is not supported with model_in_image, since the model in the image"
+                    " never changes."
+                ),
+            )
 
         if self.num_workers is None and self.use_gpu:
             logger.info("num_workers has been defaulted to 1 when using GPU.")
@@ -221,6 +221,31 @@ class DeployTestCase(absltest.TestCase):
             )
         m_deployment_class.assert_not_called()
 
+    @mock.patch("snowflake.ml.model._deploy_client.snowservice.deploy.model_meta.ModelMetadata")  # type: ignore[misc]
+    @mock.patch("snowflake.ml.model._deploy_client.snowservice.deploy.SnowServiceDeployment")  # type: ignore[misc]
+    def test_deploy_with_model_reload_and_model_in_image(
+        self, m_deployment_class: mock.MagicMock, m_model_meta_class: mock.MagicMock
+    ) -> None:
+        m_model_meta = m_model_meta_class.return_value
+        with exception_utils.assert_snowml_exceptions(
+            self, expected_original_error_type=ValueError, expected_regex="model_reload_interval_sec"
+        ):
+            self.m_session.add_mock_sql(
+                query="ALTER SESSION SET PYTHON_CONNECTOR_QUERY_RESULT_FORMAT = 'arrow'",
+                result=mock_data_frame.MockDataFrame(collect_result=[]),
+            )
+            _deploy(
+                session=cast(session.Session, self.m_session),
+                service_func_name="mock_service_func",
+                model_id="mock_model_id",
+                model_meta=m_model_meta,
+                model_zip_stage_path="@mock_model_zip_stage_path/model.zip",
+                deployment_stage_path="@mock_model_deployment_stage_path",
+                target_method=constants.PREDICT,
+                **{**self.options, "model_in_image": True, "model_reload_interval_sec": 60},
+            )
+        m_deployment_class.assert_not_called()
+
     @mock.patch("snowflake.ml.model._deploy_client.snowservice.deploy.model_meta.ModelMetadata")  # type: ignore[misc]
     @mock.patch("snowflake.ml.model._deploy_client.snowservice.deploy.SnowServiceDeployment")  # type: ignore[misc]
     def test_deploy_with_over_requested_gpus(
@@ -173,6 +173,7 @@ class ImageRegistryClient:
         source_image_with_digest: str,
         dest_image_with_tag: str,
         arch: Optional[imagelib._Arch] = None,
+        max_workers: int = imagelib.DEFAULT_MAX_WORKERS,
     ) -> None:
         """Util function to copy image across registry. Currently supported pulling from public docker image repo to
         SPCS image registry.
@@ -181,6 +182,7 @@ class ImageRegistryClient:
             source_image_with_digest: source image with digest, e.g. gcr.io/kaniko-project/executor@sha256:b8c0977
             dest_image_with_tag: destination image with tag.
             arch: architecture of source image.
+            max_workers: the number of blobs copied at the same time.
 
         Returns:
             None
@@ -199,6 +201,10 @@ class ImageRegistryClient:
         )
         # TODO[shchen]: Remove the imagelib, instead rely on the copy image system function later.
         imagelib.copy_image(
-            src_image=src_image, dest_image=dest_image, arch=arch, retryable_http=self.image_registry_http_client
+            src_image=src_image,
+            dest_image=dest_image,
+            arch=arch,
+            retryable_http=self.image_registry_http_client,
+            max_workers=max_workers,
         )
         logger.info("Image copy completed successfully")
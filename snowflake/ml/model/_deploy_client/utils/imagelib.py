@@ -8,17 +8,18 @@ This library only supports a limited set of features:
 - Supports only pulling a single architecture from a multiarch image. Does not support pulling all architectures.
 - Supports only schemaVersion 2.
 - Streams images from source to destination without any intermediate disk storage in chunks.
-- Does not support copying in parallel.
+- Copies several blobs in parallel, but each blob is uploaded sequentially.
 
 It's recommended to use this library to copy previously tested images using sha256 to avoid surprises
 with respect to compatibility.
 """
 import dataclasses
 import hashlib
-import io
 import json
 import logging
+import time
 from collections import namedtuple
+from concurrent import futures
 from typing import Dict, List, Optional, Tuple
 
 import requests
@@ -50,6 +51,11 @@ _MANIFEST_SUPPORTED_KEYS = {"schemaVersion", "mediaType", "config", "layers"}
 # Architecture descriptor as a named tuple
 _Arch = namedtuple("_Arch", ["arch_name", "os"])
 
+# The default number of blobs transferred at the same time.
+DEFAULT_MAX_WORKERS = 4
+# The size of the pieces read from the source registry response.
+_READ_SIZE_BYTES = 64 * 1024
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,31 +143,89 @@ class Manifest:
         return json.dumps(self.manifest, indent=4)
 
 
+class _BlobStream:
+    """
+    Reads a blob from a streamed response in chunks of any size while computing its sha256 digest, so that only the
+    chunk being uploaded is held in memory.
+    """
+
+    def __init__(self, resp: requests.Response) -> None:
+        self._pieces = resp.iter_content(chunk_size=_READ_SIZE_BYTES)
+        self._buffer = bytearray()
+        self._digest = hashlib.sha256()
+        self.bytes_read = 0
+
+    def read(self, size: int) -> bytes:
+        """
+        Read the next size bytes of the blob, or less if the end of the blob is reached.
+        """
+        while len(self._buffer) < size:
+            piece = next(self._pieces, None)
+            if piece is None:
+                break
+            self._buffer += piece
+        # Copy the chunk out of the buffer through a view, as slicing the buffer would copy it twice.
+        with memoryview(self._buffer) as view:
+            chunk = bytes(view[:size])
+        del self._buffer[:size]
+        self._digest.update(chunk)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def verify(self, blob_digest: str, content_length: int) -> None:
+        """
+        Check that the whole blob has been read and that it matches its digest.
+        """
+        assert (
+            self.bytes_read == content_length
+        ), f"Blob {blob_digest} is truncated, read {self.bytes_read} of {content_length} bytes"
+        assert blob_digest.endswith(self._digest.hexdigest()), f"SHA256 digest of blob {blob_digest} does not match"
+
+
+def _with_digest(upload_url: str, blob_digest: str) -> str:
+    sep = "&" if "?" in upload_url else "?"
+    return f"{upload_url}{sep}digest={blob_digest}"
+
+
 @dataclasses.dataclass
 class BlobTransfer:
     """
-    Helper class to transfer a blob from one registry to another
-    in small chunks using in-memory buffering.
+    Helper class to transfer blobs from one registry to another, streaming each blob from the source registry into the
+    upload to the destination registry, and transferring several blobs in parallel.
+
+    Blobs up to monolithic_upload_max_bytes are uploaded with a single PUT request. Larger blobs are uploaded in
+    chunks, starting at chunk_size_bytes and doubling while a chunk takes less than chunk_target_seconds to upload, up
+    to max_chunk_size_bytes, so that fast connections need fewer requests while at most one chunk per worker is held in
+    memory.
     """
 
-    # Uploads in chunks of 1MB
+    # Uploads in chunks of 1MB to 32MB
     chunk_size_bytes = 1024 * 1024
+    max_chunk_size_bytes = 32 * 1024 * 1024
+    chunk_target_seconds = 2.0
+    monolithic_upload_max_bytes = 8 * 1024 * 1024
 
     src_image: ImageDescriptor
     dest_image: ImageDescriptor
     manifest: Manifest
     image_registry_http_client: image_registry_http_client.ImageRegistryHttpClient
+    max_workers: int = DEFAULT_MAX_WORKERS
 
     def upload_all_blobs(self) -> None:
         blob_digests = self.manifest.get_blob_digests()
         logger.debug(f"Found {len(blob_digests)} blobs for {self.src_image}")
 
-        for blob_digest in blob_digests:
-            logger.debug(f"Transferring blob {blob_digest} from {self.src_image} to {self.dest_image}")
-            if self._should_upload(blob_digest):
-                self._transfer(blob_digest)
-            else:
-                logger.debug(f"Blob {blob_digest} already exists in {self.dest_image}")
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Consume the results to raise the first error, if any.
+            for _ in executor.map(self._transfer_if_missing, blob_digests):
+                pass
+
+    def _transfer_if_missing(self, blob_digest: str) -> None:
+        logger.debug(f"Transferring blob {blob_digest} from {self.src_image} to {self.dest_image}")
+        if self._should_upload(blob_digest):
+            self._transfer(blob_digest)
+        else:
+            logger.debug(f"Blob {blob_digest} already exists in {self.dest_image}")
 
     def _should_upload(self, blob_digest: str) -> bool:
         """
@@ -170,18 +234,20 @@ class BlobTransfer:
         resp = self.image_registry_http_client.head(self.dest_image.blob_link(blob_digest), headers={})
         return resp.status_code != 200
 
-    def _fetch_blob(self, blob_digest: str) -> Tuple[io.BytesIO, int]:
+    def _fetch_blob(self, blob_digest: str) -> Tuple[requests.Response, int]:
         """
-        Fetch a stream to the blob from the source registry.
+        Fetch a stream to the blob from the source registry. The body of the response is not read yet.
         """
         src_blob_link = self.src_image.blob_link(blob_digest)
         headers = {_CONTENT_LENGTH_HEADER: "0"}
-        resp = self.image_registry_http_client.get(src_blob_link, headers=headers)
+        resp = self.image_registry_http_client.get(src_blob_link, headers=headers, stream=True)
 
+        if resp.status_code != 200 or _CONTENT_LENGTH_HEADER not in resp.headers:
+            resp.close()
         assert resp.status_code == 200, f"Blob GET failed with code {resp.status_code}"
         assert _CONTENT_LENGTH_HEADER in resp.headers, f"Blob does not contain {_CONTENT_LENGTH_HEADER}"
 
-        return io.BytesIO(resp.content), int(resp.headers[_CONTENT_LENGTH_HEADER])
+        return resp, int(resp.headers[_CONTENT_LENGTH_HEADER])
 
     def _get_upload_url(self) -> str:
         """
@@ -193,7 +259,7 @@ class BlobTransfer:
         ), f"Failed to get the upload URL to destination. Status {response.status_code}. {str(response.content)}"
         return str(response.headers[_LOCATION_HEADER])
 
-    def _upload_blob(self, blob_digest: str, blob_data: io.BytesIO, content_length: int) -> None:
+    def _upload_blob(self, blob_digest: str, blob_stream: _BlobStream, content_length: int) -> None:
         """
         Upload a blob to the destination registry.
         """
@@ -202,34 +268,55 @@ class BlobTransfer:
             _CONTENT_TYPE_HEADER: "application/octet-stream",
         }
 
+        # Use a single PUT request for small blobs
+        if content_length <= self.monolithic_upload_max_bytes:
+            data = blob_stream.read(content_length)
+            blob_stream.verify(blob_digest, content_length)
+            headers[_CONTENT_LENGTH_HEADER] = str(len(data))
+            resp = self.image_registry_http_client.put(
+                _with_digest(upload_url, blob_digest), headers=headers, data=data
+            )
+            assert resp.status_code == 201, f"Blob PUT failed with code {resp.status_code}"
+            return
+
         # Use chunked transfer
-        # This can be optimized to use a single PUT request for small blobs
         next_loc = upload_url
         start_byte = 0
+        chunk_size = self.chunk_size_bytes
         while start_byte < content_length:
-            chunk = blob_data.read(self.chunk_size_bytes)
+            chunk = blob_stream.read(min(chunk_size, content_length - start_byte))
             chunk_length = len(chunk)
+            assert chunk_length > 0, f"Blob {blob_digest} is truncated, read {start_byte} of {content_length} bytes"
             end_byte = start_byte + chunk_length - 1
 
             headers[_CONTENT_RANGE_HEADER] = f"{start_byte}-{end_byte}"
             headers[_CONTENT_LENGTH_HEADER] = str(chunk_length)
 
+            start_time = time.monotonic()
             resp = self.image_registry_http_client.patch(next_loc, headers=headers, data=chunk)
             assert resp.status_code == 202, f"Blob PATCH failed with code {resp.status_code}"
+            chunk_seconds = time.monotonic() - start_time
 
             next_loc = resp.headers[_LOCATION_HEADER]
             start_byte += chunk_length
 
+            if chunk_seconds < self.chunk_target_seconds:
+                chunk_size = min(chunk_size * 2, self.max_chunk_size_bytes)
+            elif chunk_seconds > 2 * self.chunk_target_seconds:
+                chunk_size = max(chunk_size // 2, self.chunk_size_bytes)
+
         # Finalize the upload
-        resp = self.image_registry_http_client.put(f"{next_loc}&digest={blob_digest}")
+        blob_stream.verify(blob_digest, content_length)
+        resp = self.image_registry_http_client.put(_with_digest(next_loc, blob_digest))
         assert resp.status_code == 201, f"Blob PUT failed with code {resp.status_code}"
 
     def _transfer(self, blob_digest: str) -> None:
         """
         Transfer a blob from the source registry to the destination registry.
         """
-        blob_data, content_length = self._fetch_blob(blob_digest)
-        self._upload_blob(blob_digest, blob_data, content_length)
+        resp, content_length = self._fetch_blob(blob_digest)
+        with resp:
+            self._upload_blob(blob_digest, _BlobStream(resp), content_length)
 
 
 def get_bytes_with_sha_verification(resp: requests.Response, sha256_digest: str) -> Tuple[bytes, str]:
@@ -339,6 +426,7 @@ def copy_image(
     dest_image: ImageDescriptor,
     arch: _Arch,
     retryable_http: image_registry_http_client.ImageRegistryHttpClient,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> None:
     logger.debug(f"Pulling image manifest for {src_image}")
 
@@ -347,7 +435,9 @@ def copy_image(
     logger.debug(f"Manifest pulled for {src_image} with digest {manifest.manifest_digest}")
 
     # 2: Retrieve all blob digests from manifest; fetch blob based on blob digest, then upload blob.
-    blob_transfer = BlobTransfer(src_image, dest_image, manifest, image_registry_http_client=retryable_http)
+    blob_transfer = BlobTransfer(
+        src_image, dest_image, manifest, image_registry_http_client=retryable_http, max_workers=max_workers
+    )
     blob_transfer.upload_all_blobs()
 
     # 3. Upload the manifest
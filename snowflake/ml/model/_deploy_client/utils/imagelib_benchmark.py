@@ -0,0 +1,93 @@
+# A benchmark of BlobTransfer, reporting the time and the peak memory used to copy the blobs of an image between two
+# in-memory registries. The peak RSS is measured in a fresh process for each case, above the memory used once the
+# source blobs are created, so that it is the memory held by the transfer itself.
+#
+# Run it with, e.g.:
+#   python imagelib_benchmark.py --layer_sizes_mb=16,128 --num_layers=4 --max_workers=1,4
+
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import List, Tuple
+
+from absl import app, flags
+
+from snowflake.ml.model._deploy_client.utils import imagelib, imagelib_test_util
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list("layer_sizes_mb", ["16", "128"], "Sizes in MB of the layers of the image, one case per size.")
+flags.DEFINE_integer("num_layers", 4, "Number of layers of the image.")
+flags.DEFINE_list("max_workers", ["1", "4"], "Numbers of blobs transferred in parallel, one case per number.")
+
+
+def _max_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _run_case(layer_size_mb: int, num_layers: int, max_workers: int) -> Tuple[float, float]:
+    """Copy an image in the current process, and return the copy time in seconds and the peak RSS in MB."""
+    config = b'{"architecture": "amd64"}'
+    layers = [os.urandom(layer_size_mb * 1024 * 1024) for _ in range(num_layers)]
+    src_blobs = {imagelib_test_util.digest(blob): blob for blob in [config, *layers]}
+    manifest = imagelib.Manifest(
+        json.dumps(
+            {
+                "schemaVersion": 2,
+                "mediaType": "application/vnd.docker.distribution.manifest.v2+json",
+                "config": {"digest": imagelib_test_util.digest(config)},
+                "layers": [{"digest": imagelib_test_util.digest(layer)} for layer in layers],
+            }
+        ).encode("utf-8"),
+        "sha256:manifest",
+    )
+    registry = imagelib_test_util.FakeRegistry(src_blobs, keep_blobs=False)
+    blob_transfer = imagelib.BlobTransfer(
+        imagelib.ImageDescriptor("src.io", "repo", digest="sha256:manifest"),
+        imagelib.ImageDescriptor("dest.io", "repo", tag="latest"),
+        manifest,
+        image_registry_http_client=registry,  # type: ignore[arg-type]
+        max_workers=max_workers,
+    )
+
+    baseline_rss_mb = _max_rss_mb()
+    start = time.perf_counter()
+    blob_transfer.upload_all_blobs()
+    copy_seconds = time.perf_counter() - start
+    assert set(registry.dest_blobs) == set(src_blobs)
+    return copy_seconds, _max_rss_mb() - baseline_rss_mb
+
+
+def _run_case_in_process(
+    queue: "multiprocessing.Queue[Tuple[float, float]]", layer_size_mb: int, num_layers: int, max_workers: int
+) -> None:
+    queue.put(_run_case(layer_size_mb, num_layers, max_workers))
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    context = multiprocessing.get_context("spawn")
+    print(f"{'layer MB':>9}{'layers':>8}{'workers':>9}{'copy s':>9}{'MB/s':>9}{'peak RSS MB':>13}")
+    for layer_size_mb in map(int, FLAGS.layer_sizes_mb):
+        for max_workers in map(int, FLAGS.max_workers):
+            queue: "multiprocessing.Queue[Tuple[float, float]]" = context.Queue()
+            process = context.Process(
+                target=_run_case_in_process, args=(queue, layer_size_mb, FLAGS.num_layers, max_workers)
+            )
+            process.start()
+            copy_seconds, peak_rss_mb = queue.get()
+            process.join()
+            throughput = layer_size_mb * FLAGS.num_layers / copy_seconds
+            print(
+                f"{layer_size_mb:>9}{FLAGS.num_layers:>8}{max_workers:>9}{copy_seconds:>9.2f}{throughput:>9.0f}"
+                f"{peak_rss_mb:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,75 @@
+import json
+
+from absl.testing import absltest
+
+from snowflake.ml.model._deploy_client.utils import imagelib, imagelib_test_util
+
+
+class ImageLibTest(absltest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.config = b'{"architecture": "amd64"}'
+        self.small_layer = b"small" * 10
+        self.large_layer = bytes(range(256)) * 4
+        self.src_blobs = {
+            imagelib_test_util.digest(blob): blob for blob in [self.config, self.small_layer, self.large_layer]
+        }
+        self.manifest = imagelib.Manifest(
+            json.dumps(
+                {
+                    "schemaVersion": 2,
+                    "mediaType": "application/vnd.docker.distribution.manifest.v2+json",
+                    "config": {"digest": imagelib_test_util.digest(self.config)},
+                    "layers": [
+                        {"digest": imagelib_test_util.digest(self.small_layer)},
+                        {"digest": imagelib_test_util.digest(self.large_layer)},
+                    ],
+                }
+            ).encode("utf-8"),
+            "sha256:manifest",
+        )
+        self.src_image = imagelib.ImageDescriptor("src.io", "repo", digest="sha256:manifest")
+        self.dest_image = imagelib.ImageDescriptor("dest.io", "repo", tag="latest")
+
+    def _blob_transfer(self, registry: imagelib_test_util.FakeRegistry, max_workers: int = 2) -> imagelib.BlobTransfer:
+        blob_transfer = imagelib.BlobTransfer(
+            self.src_image,
+            self.dest_image,
+            self.manifest,
+            image_registry_http_client=registry,  # type: ignore[arg-type]
+            max_workers=max_workers,
+        )
+        blob_transfer.chunk_size_bytes = 64
+        blob_transfer.max_chunk_size_bytes = 256
+        blob_transfer.monolithic_upload_max_bytes = 100
+        return blob_transfer
+
+    def test_upload_all_blobs(self) -> None:
+        registry = imagelib_test_util.FakeRegistry(self.src_blobs)
+        self._blob_transfer(registry).upload_all_blobs()
+
+        self.assertDictEqual(registry.dest_blobs, self.src_blobs)
+        # The config and the small layer are uploaded with a single PUT, the large layer in growing chunks.
+        self.assertEqual(registry.monolithic_puts, 2)
+        self.assertListEqual(registry.patch_sizes, [64, 128, 256, 256, 256, 64])
+
+    def test_upload_all_blobs_skip_existing(self) -> None:
+        registry = imagelib_test_util.FakeRegistry(
+            self.src_blobs, dest_blobs={imagelib_test_util.digest(self.large_layer): self.large_layer}
+        )
+        self._blob_transfer(registry, max_workers=1).upload_all_blobs()
+
+        self.assertDictEqual(registry.dest_blobs, self.src_blobs)
+        self.assertEqual(registry.monolithic_puts, 2)
+        self.assertEmpty(registry.patch_sizes)
+
+    def test_upload_all_blobs_digest_mismatch(self) -> None:
+        self.src_blobs[imagelib_test_util.digest(self.large_layer)] = self.large_layer[::-1]
+        registry = imagelib_test_util.FakeRegistry(self.src_blobs)
+        with self.assertRaisesRegex(AssertionError, "SHA256 digest of blob .* does not match"):
+            self._blob_transfer(registry).upload_all_blobs()
+        self.assertNotIn(imagelib_test_util.digest(self.large_layer), registry.dest_blobs)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,95 @@
+import hashlib
+import io
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+
+def digest(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def _response(status_code: int, headers: Optional[Dict[str, str]] = None, body: bytes = b"") -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+class _Upload:
+    """A blob being uploaded, hashed as it is received."""
+
+    def __init__(self, keep_data: bool) -> None:
+        self.sha256 = hashlib.sha256()
+        self.length = 0
+        self.data: Optional[bytearray] = bytearray() if keep_data else None
+
+    def append(self, data: bytes) -> None:
+        self.sha256.update(data)
+        self.length += len(data)
+        if self.data is not None:
+            self.data += data
+
+
+class FakeRegistry:
+    """An in-memory registry implementing the subset of the registry API used to copy blobs.
+
+    With keep_blobs set to False, uploaded blobs are only hashed and recorded in dest_blobs with empty content, so that
+    large copies do not hold the blobs in memory twice.
+    """
+
+    def __init__(
+        self, src_blobs: Dict[str, bytes], dest_blobs: Optional[Dict[str, bytes]] = None, keep_blobs: bool = True
+    ) -> None:
+        self.src_blobs = src_blobs
+        self.dest_blobs = dest_blobs or {}
+        self.patch_sizes: List[int] = []
+        self.monolithic_puts = 0
+        self._keep_blobs = keep_blobs
+        self._uploads: Dict[str, _Upload] = {}
+        self._lock = threading.Lock()
+
+    def head(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
+        return _response(200 if api_url.rsplit("/", 1)[1] in self.dest_blobs else 404)
+
+    def get(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
+        data = self.src_blobs[api_url.rsplit("/", 1)[1]]
+        return _response(200, {"content-length": str(len(data))}, data)
+
+    def post(self, api_url: str, *, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response:
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = _Upload(self._keep_blobs)
+        return _response(202, {"location": f"{api_url}{upload_id}?_state=0"})
+
+    def patch(
+        self, api_url: str, *, headers: Optional[Dict[str, str]] = None, data: bytes = b"", **kwargs: Any
+    ) -> requests.Response:
+        assert headers is not None
+        upload = self._uploads[urlparse(api_url).path.rsplit("/", 1)[1]]
+        start_byte, end_byte = map(int, headers["content-range"].split("-"))
+        assert start_byte == upload.length and end_byte == start_byte + len(data) - 1
+        upload.append(data)
+        with self._lock:
+            self.patch_sizes.append(len(data))
+        return _response(202, {"location": f"{api_url.split('?')[0]}?_state={upload.length}"})
+
+    def put(
+        self, api_url: str, *, headers: Optional[Dict[str, str]] = None, data: bytes = b"", **kwargs: Any
+    ) -> requests.Response:
+        parsed_url = urlparse(api_url)
+        upload = self._uploads.pop(parsed_url.path.rsplit("/", 1)[1])
+        if data:
+            assert upload.length == 0
+            with self._lock:
+                self.monolithic_puts += 1
+        upload.append(data)
+        blob_digest = parse_qs(parsed_url.query)["digest"][0]
+        if blob_digest != f"sha256:{upload.sha256.hexdigest()}":
+            return _response(400)
+        self.dest_blobs[blob_digest] = bytes(upload.data) if upload.data is not None else b""
+        return _response(201)
@@ -12,6 +12,7 @@ from types import TracebackType
 from typing import Optional, Type
 
 import anyio
+import numpy as np
 import pandas as pd
 from _snowflake import vectorized
 
@@ -86,6 +87,14 @@ input_cols = [feature.name for feature in features]
 dtype_map = {{feature.name: feature.as_dtype() for feature in features}}
 
 
+# Array outputs are kept as numpy arrays by the model and converted to lists only when they are returned from the UDF.
+def _to_serializable_records(df: pd.DataFrame) -> list:
+    for col in df.columns:
+        if len(df) > 0 and isinstance(df[col].iloc[0], np.ndarray):
+            df[col] = df[col].map(np.ndarray.tolist)
+    return df.to_dict("records")
+
+
 # Actual handler
 @vectorized(input=pd.DataFrame, max_batch_size=MAX_BATCH_SIZE)
 def infer(df: pd.DataFrame) -> dict:
@@ -95,5 +104,5 @@ def infer(df: pd.DataFrame) -> dict:
     if "{_KEEP_ORDER_COL_NAME}" in input_df.columns:
         predictions_df["{_KEEP_ORDER_COL_NAME}"] = input_df["{_KEEP_ORDER_COL_NAME}"]
 
-    return predictions_df.to_dict("records")
+    return _to_serializable_records(predictions_df)
 """
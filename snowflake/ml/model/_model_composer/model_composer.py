@@ -12,6 +12,7 @@ from snowflake.ml._internal import env as snowml_env, env_utils, file_utils
 from snowflake.ml.model import model_signature, type_hints as model_types
 from snowflake.ml.model._model_composer.model_manifest import model_manifest
 from snowflake.ml.model._packager import model_packager
+from snowflake.ml.model._packager.model_meta import model_meta
 from snowflake.snowpark import Session
 from snowflake.snowpark._internal import utils as snowpark_utils
 
@@ -32,6 +33,8 @@ class ModelComposer:
     """
 
     MODEL_FILE_REL_PATH = "model.zip"
+    # A copy of the files in the model zip needed to load the metadata, so that it can be loaded without the zip.
+    MODEL_META_DIR_REL_PATH = "model_meta"
 
     def __init__(self, session: Session, stage_path: str) -> None:
         self.session = session
@@ -112,6 +115,8 @@ class ModelComposer:
         assert self.packager.meta is not None
 
         file_utils.make_archive(self.model_local_path, str(self._packager_workspace_path))
+        with zipfile.ZipFile(self.model_local_path, mode="r") as zf:
+            _extract_model_meta_files(zf, self.workspace_path / ModelComposer.MODEL_META_DIR_REL_PATH)
 
         self.manifest.save(
             session=self.session,
@@ -126,8 +131,28 @@ class ModelComposer:
         self,
         *,
         meta_only: bool = False,
+        lazy: bool = False,
         options: Optional[model_types.ModelLoadOption] = None,
     ) -> None:
+        """Load the model from the stage.
+
+        Args:
+            meta_only: Flag to indicate that if only load metadata. The model zip is not downloaded if the copy of its
+                metadata files exists in the stage.
+            lazy: Flag to indicate that only the metadata files are extracted from the model zip and loaded now, while
+                the rest of the zip is extracted and the model is loaded on the first access of packager.model.
+            options: Model loading options.
+        """
+        if meta_only:
+            file_utils.download_directory_from_stage(
+                self.session,
+                stage_path=self.stage_path / ModelComposer.MODEL_META_DIR_REL_PATH,
+                local_path=self._packager_workspace_path,
+            )
+            if (self._packager_workspace_path / model_meta.MODEL_METADATA_FILE).exists():
+                self.packager.load(meta_only=True)
+                return
+
         file_utils.download_directory_from_stage(
             self.session, stage_path=self.stage_path, local_path=self.workspace_path
         )
@@ -136,6 +161,24 @@ class ModelComposer:
         model_zip_path = pathlib.Path(glob.glob(str(self.workspace_path / "*.zip"))[0])
         ModelComposer.MODEL_FILE_REL_PATH = str(model_zip_path.relative_to(self.workspace_path))
 
+        with zipfile.ZipFile(self.model_local_path, mode="r") as zf:
+            _extract_model_meta_files(zf, self._packager_workspace_path)
+        self.packager.load(meta_only=meta_only, options=options, lazy=lazy, prepare_model_dir=self._extract_model_zip)
+
+    def _extract_model_zip(self) -> None:
         with zipfile.ZipFile(self.model_local_path, mode="r", compression=zipfile.ZIP_DEFLATED) as zf:
             zf.extractall(path=self._packager_workspace_path)
-        self.packager.load(meta_only=meta_only, options=options)
+
+
+def _extract_model_meta_files(zf: zipfile.ZipFile, path: pathlib.Path) -> None:
+    """Extract the files needed to load the model metadata from a model zip, which are all the files but the model
+    blobs and the code. Only the entries of these files are read, thanks to the central directory of the zip.
+
+    Args:
+        zf: The model zip.
+        path: The directory to extract the files to.
+    """
+    skipped_dirs = {model_packager.ModelPackager.MODEL_BLOBS_DIR, model_meta.MODEL_CODE_DIR}
+    for name in zf.namelist():
+        if pathlib.PurePosixPath(name).parts[0] not in skipped_dirs:
+            zf.extract(name, path)
@@ -1,3 +1,7 @@
+import os
+import pathlib
+import shutil
+import tempfile
 from typing import cast
 from unittest import mock
 
@@ -6,15 +10,25 @@ import pandas as pd
 from absl.testing import absltest
 from sklearn import linear_model
 
-from snowflake.ml._internal import env_utils
+from snowflake.ml._internal import env_utils, file_utils
+from snowflake.ml.model import custom_model
 from snowflake.ml.model._model_composer import model_composer
 from snowflake.ml.modeling.linear_model import (  # type:ignore[attr-defined]
     LinearRegression,
 )
-from snowflake.ml.test_utils import mock_session
+from snowflake.ml.test_utils import mock_data_frame, mock_session
 from snowflake.snowpark import FileOperation, Session
 
 
+class DemoModel(custom_model.CustomModel):
+    def __init__(self, context: custom_model.ModelContext) -> None:
+        super().__init__(context)
+
+    @custom_model.inference_api
+    def predict(self, input: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"output": input["c1"]})
+
+
 class ModelInterfaceTest(absltest.TestCase):
     def test_save_interface(self) -> None:
         m_session = mock_session.MockSession(conn=None, test_case=self)
@@ -29,9 +43,10 @@ class ModelInterfaceTest(absltest.TestCase):
         mock_pk.meta.signatures = mock.MagicMock()
         m = model_composer.ModelComposer(session=c_session, stage_path=stage_path)
         m.packager = mock_pk
+        m_session.add_mock_sql(query=f"ls {stage_path}", result=mock_data_frame.MockDataFrame(collect_result=[]))
         with mock.patch.object(m.packager, "save") as mock_save:
             with mock.patch.object(m.manifest, "save") as mock_manifest_save:
-                with mock.patch.object(FileOperation, "put", return_value=None) as mock_put_stream:
+                with mock.patch.object(FileOperation, "put", return_value=[]) as mock_put_stream:
                     with mock.patch.object(
                         env_utils, "validate_requirements_in_snowflake_conda_channel", return_value=[""]
                     ):
@@ -44,9 +59,10 @@ class ModelInterfaceTest(absltest.TestCase):
 
         m = model_composer.ModelComposer(session=c_session, stage_path=stage_path)
         m.packager = mock_pk
+        m_session.add_mock_sql(query=f"ls {stage_path}", result=mock_data_frame.MockDataFrame(collect_result=[]))
         with mock.patch.object(m.packager, "save") as mock_save:
             with mock.patch.object(m.manifest, "save") as mock_manifest_save:
-                with mock.patch.object(FileOperation, "put", return_value=None) as mock_put_stream:
+                with mock.patch.object(FileOperation, "put", return_value=[]) as mock_put_stream:
                     with mock.patch.object(
                         env_utils, "validate_requirements_in_snowflake_conda_channel", return_value=[""]
                     ):
@@ -57,6 +73,62 @@ class ModelInterfaceTest(absltest.TestCase):
                         )
                 mock_put_stream.assert_called_once_with(mock.ANY, stage_path, auto_compress=False, overwrite=False)
 
+    def test_load_interface(self) -> None:
+        m_session = mock_session.MockSession(conn=None, test_case=self)
+        c_session = cast(Session, m_session)
+
+        stage_path = '@"db"."schema"."stage"'
+        d = pd.DataFrame([[1, 2, 3], [4, 2, 5]], columns=["c1", "c2", "c3"])
+
+        with tempfile.TemporaryDirectory() as stage_dir:
+            m = model_composer.ModelComposer(session=c_session, stage_path=stage_path)
+            with mock.patch.object(m.manifest, "save"):
+                with mock.patch.object(
+                    file_utils,
+                    "upload_directory_to_stage",
+                    side_effect=lambda session, local_path, stage_path: shutil.copytree(
+                        local_path, stage_dir, dirs_exist_ok=True
+                    ),
+                ):
+                    with mock.patch.object(
+                        env_utils, "validate_requirements_in_snowflake_conda_channel", return_value=[""]
+                    ):
+                        m.save(name="model1", model=DemoModel(custom_model.ModelContext()), sample_input=d)
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(stage_dir, model_composer.ModelComposer.MODEL_META_DIR_REL_PATH, "model.yaml")
+                )
+            )
+
+            def download_directory_from_stage(
+                session: Session, stage_path: pathlib.PurePosixPath, local_path: pathlib.Path
+            ) -> None:
+                shutil.copytree(
+                    os.path.join(stage_dir, stage_path.relative_to(pathlib.PurePosixPath(stage_path.parts[0]))),
+                    local_path,
+                    dirs_exist_ok=True,
+                )
+
+            with mock.patch.object(
+                file_utils, "download_directory_from_stage", side_effect=download_directory_from_stage
+            ) as mock_download:
+                m = model_composer.ModelComposer(session=c_session, stage_path=stage_path)
+                m.load(meta_only=True)
+                assert m.packager.meta
+                self.assertEqual(m.packager.meta.name, "model1")
+                self.assertIsNone(m.packager.model)
+                # Only the copy of the metadata files is downloaded.
+                mock_download.assert_called_once()
+                self.assertEqual(os.listdir(m.workspace_path), [])
+
+                m = model_composer.ModelComposer(session=c_session, stage_path=stage_path)
+                m.load(lazy=True)
+                assert m.packager.meta
+                self.assertEqual(m.packager.meta.name, "model1")
+                self.assertFalse(os.path.exists(os.path.join(m._packager_workspace_path, "models")))
+                assert isinstance(m.packager.model, DemoModel)
+                self.assertTrue(os.path.exists(os.path.join(m._packager_workspace_path, "models")))
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -186,7 +186,8 @@ class PyTorchHandler(_base.BaseModelHandler["torch.nn.Module"]):
                         res = [res]
 
                     return model_signature_utils.rename_pandas_df(
-                        data=pytorch_handler.SeqOfPyTorchTensorHandler.convert_to_df(res), features=signature.outputs
+                        data=pytorch_handler.SeqOfPyTorchTensorHandler.convert_to_df(res, ensure_serializable=False),
+                        features=signature.outputs,
                     )
 
                 return fn
@@ -187,9 +187,11 @@ class TensorFlowHandler(_base.BaseModelHandler["tensorflow.Module"]):
 
                     if isinstance(res, list) and len(res) > 0 and isinstance(res[0], np.ndarray):
                         # In case of running on CPU, it will return numpy array
-                        df = numpy_handler.SeqOfNumpyArrayHandler.convert_to_df(res)
+                        df = numpy_handler.SeqOfNumpyArrayHandler.convert_to_df(res, ensure_serializable=False)
                     else:
-                        df = tensorflow_handler.SeqOfTensorflowTensorHandler.convert_to_df(res)
+                        df = tensorflow_handler.SeqOfTensorflowTensorHandler.convert_to_df(
+                            res, ensure_serializable=False
+                        )
                     return model_signature_utils.rename_pandas_df(df, signature.outputs)
 
                 return fn
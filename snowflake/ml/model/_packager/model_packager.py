@@ -1,6 +1,7 @@
+import functools
 import os
 from types import ModuleType
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from absl import logging
 
@@ -21,7 +22,8 @@ class ModelPackager:
 
     Attributes:
         local_dir_path: A path to a local directory will files to dump and load.
-        model: The model object to be saved / loaded from file.
+        model: The model object to be saved / loaded from file. When loaded lazily, the model is loaded on the first
+            access of this attribute.
         meta: The model metadata (ModelMetadata object) to be saved / loaded from file.
             model and meta will be set once save / load method is called.
 
@@ -31,9 +33,22 @@ class ModelPackager:
 
     def __init__(self, local_dir_path: str) -> None:
         self.local_dir_path = os.path.normpath(local_dir_path)
-        self.model: Optional[model_types.SupportedModelType] = None
+        self._model: Optional[model_types.SupportedModelType] = None
+        self._pending_model_load: Optional[Callable[[], None]] = None
         self.meta: Optional[model_meta.ModelMetadata] = None
 
+    @property
+    def model(self) -> Optional[model_types.SupportedModelType]:
+        if self._pending_model_load is not None:
+            # Setting the loaded model clears the pending load, which is kept to be retried if loading fails.
+            self._pending_model_load()
+        return self._model
+
+    @model.setter
+    def model(self, model: Optional[model_types.SupportedModelType]) -> None:
+        self._pending_model_load = None
+        self._model = model
+
     def save(
         self,
         *,
@@ -109,6 +124,8 @@ class ModelPackager:
         meta_only: bool = False,
         as_custom_model: bool = False,
         options: Optional[model_types.ModelLoadOption] = None,
+        lazy: bool = False,
+        prepare_model_dir: Optional[Callable[[], None]] = None,
     ) -> None:
         """Load the model into memory from directory. Used internal only.
 
@@ -116,15 +133,46 @@ class ModelPackager:
             meta_only: Flag to indicate that if only load metadata.
             as_custom_model: When set to True, It will try to convert the model as custom model after load.
             options: Model loading options.
-
-        Raises:
-            SnowflakeMLException: Raised if model is not native format.
+            lazy: Flag to indicate that the metadata is loaded now while the model is loaded on the first access of
+                the model attribute.
+            prepare_model_dir: A function called right before the model is loaded, e.g. to extract the model blobs
+                into the directory when loaded lazily.
         """
 
         self.meta = model_meta.ModelMetadata.load(self.local_dir_path)
+        self._pending_model_load = None
         if meta_only:
             return
 
+        pending_model_load = functools.partial(
+            self._load_model, as_custom_model=as_custom_model, options=options, prepare_model_dir=prepare_model_dir
+        )
+        if lazy:
+            self._pending_model_load = pending_model_load
+        else:
+            pending_model_load()
+
+    def _load_model(
+        self,
+        *,
+        as_custom_model: bool,
+        options: Optional[model_types.ModelLoadOption],
+        prepare_model_dir: Optional[Callable[[], None]],
+    ) -> None:
+        """Load the model from directory after its metadata has been loaded.
+
+        Args:
+            as_custom_model: When set to True, It will try to convert the model as custom model after load.
+            options: Model loading options.
+            prepare_model_dir: A function called right before the model is loaded, if any.
+
+        Raises:
+            SnowflakeMLException: Raised if model is not native format.
+        """
+        assert self.meta is not None
+        if prepare_model_dir is not None:
+            prepare_model_dir()
+
         model_meta.load_code_path(self.local_dir_path)
 
         env_utils.validate_py_runtime_version(self.meta.env.python_version)
@@ -10,7 +10,7 @@ from snowflake.ml._internal.exceptions import (
     exceptions as snowml_exceptions,
 )
 from snowflake.ml.model import type_hints as model_types
-from snowflake.ml.model._signatures import base_handler, core
+from snowflake.ml.model._signatures import base_handler, core, utils
 
 
 class NumpyArrayHandler(base_handler.BaseDataHandler[model_types._SupportedNumpyArray]):
@@ -72,10 +72,9 @@ class NumpyArrayHandler(base_handler.BaseDataHandler[model_types._SupportedNumpy
         if len(data.shape) == 2:
             return pd.DataFrame(data)
         else:
-            n_rows = data.shape[0]
-            if ensure_serializable:
-                return pd.DataFrame(data={i: [data[k, i].tolist() for k in range(n_rows)] for i in range(n_cols)})
-            return pd.DataFrame(data={i: [list(data[k, i]) for k in range(n_rows)] for i in range(n_cols)})
+            return pd.DataFrame(
+                data={i: utils.convert_ndarray_to_column(data[:, i], ensure_serializable) for i in range(n_cols)}
+            )
 
 
 class SeqOfNumpyArrayHandler(base_handler.BaseDataHandler[Sequence[model_types._SupportedNumpyArray]]):
@@ -129,6 +128,6 @@ class SeqOfNumpyArrayHandler(base_handler.BaseDataHandler[Sequence[model_types._
     def convert_to_df(
         data: Sequence[model_types._SupportedNumpyArray], ensure_serializable: bool = True
     ) -> pd.DataFrame:
-        if ensure_serializable:
-            return pd.DataFrame(data={i: data_col.tolist() for i, data_col in enumerate(data)})
-        return pd.DataFrame(data={i: list(data_col) for i, data_col in enumerate(data)})
+        return pd.DataFrame(
+            data={i: utils.convert_ndarray_to_column(data_col, ensure_serializable) for i, data_col in enumerate(data)}
+        )
@@ -1,3 +1,4 @@
+import operator
 from typing import Literal, Sequence
 
 import numpy as np
@@ -62,7 +63,8 @@ class PandasDataFrameHandler(base_handler.BaseDataHandler[pd.DataFrame]):
         for df_col, df_col_dtype in zip(df_cols, df_col_dtypes):
             if df_col_dtype == np.dtype("O"):
                 # Check if all objects have the same type
-                if not all(isinstance(data_row, type(data[df_col].iloc[0])) for data_row in data[df_col]):
+                first_type = type(data[df_col].iloc[0])
+                if not all(issubclass(row_type, first_type) for row_type in set(map(type, data[df_col].to_numpy()))):
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
                         original_exception=ValueError(
@@ -71,27 +73,30 @@ class PandasDataFrameHandler(base_handler.BaseDataHandler[pd.DataFrame]):
                     )
 
                 if isinstance(data[df_col].iloc[0], list):
-                    arr = utils.convert_list_to_ndarray(data[df_col].iloc[0])
-                    arr_dtype = core.DataType.from_numpy_type(arr.dtype)
-
-                    converted_data_list = [utils.convert_list_to_ndarray(data_row) for data_row in data[df_col]]
-
-                    if not all(
-                        core.DataType.from_numpy_type(converted_data.dtype) == arr_dtype
-                        for converted_data in converted_data_list
-                    ):
-                        raise snowml_exceptions.SnowflakeMLException(
-                            error_code=error_codes.INVALID_DATA,
-                            original_exception=ValueError(
-                                "Data Validation Error: "
-                                + f"Inconsistent type of element in object found in column data {data[df_col]}."
-                            ),
-                        )
+                    # Rows only have to be converted one by one when they cannot be stacked, to find the invalid ones.
+                    if utils.stack_list_column(data[df_col]) is None:
+                        arr = utils.convert_list_to_ndarray(data[df_col].iloc[0])
+                        arr_dtype = core.DataType.from_numpy_type(arr.dtype)
+
+                        converted_data_list = [utils.convert_list_to_ndarray(data_row) for data_row in data[df_col]]
+
+                        if not all(
+                            core.DataType.from_numpy_type(converted_data.dtype) == arr_dtype
+                            for converted_data in converted_data_list
+                        ):
+                            raise snowml_exceptions.SnowflakeMLException(
+                                error_code=error_codes.INVALID_DATA,
+                                original_exception=ValueError(
+                                    "Data Validation Error: "
+                                    + f"Inconsistent type of element in object found in column data {data[df_col]}."
+                                ),
+                            )
 
                 elif isinstance(data[df_col].iloc[0], np.ndarray):
                     arr_dtype = core.DataType.from_numpy_type(data[df_col].iloc[0].dtype)
 
-                    if not all(core.DataType.from_numpy_type(data_row.dtype) == arr_dtype for data_row in data[df_col]):
+                    row_dtypes = set(map(operator.attrgetter("dtype"), data[df_col].to_numpy()))
+                    if not all(core.DataType.from_numpy_type(row_dtype) == arr_dtype for row_dtype in row_dtypes):
                         raise snowml_exceptions.SnowflakeMLException(
                             error_code=error_codes.INVALID_DATA,
                             original_exception=ValueError(
@@ -1,7 +1,6 @@
 from collections import abc
 from typing import TYPE_CHECKING, List, Literal, Optional, Sequence
 
-import numpy as np
 import pandas as pd
 from typing_extensions import TypeGuard
 
@@ -11,7 +10,7 @@ from snowflake.ml._internal.exceptions import (
     exceptions as snowml_exceptions,
 )
 from snowflake.ml.model import type_hints as model_types
-from snowflake.ml.model._signatures import base_handler, core
+from snowflake.ml.model._signatures import base_handler, core, utils
 
 if TYPE_CHECKING:
     import torch
@@ -80,12 +79,14 @@ class SeqOfPyTorchTensorHandler(base_handler.BaseDataHandler[Sequence["torch.Ten
 
     @staticmethod
     def convert_to_df(data: Sequence["torch.Tensor"], ensure_serializable: bool = True) -> pd.DataFrame:
-        # Use list(...) instead of .tolist() to ensure that
-        # the content is still numpy array so that the type could be preserved.
-        # But that would not serializable and cannot use as UDF input and output.
-        if ensure_serializable:
-            return pd.DataFrame({i: data_col.detach().to("cpu").numpy().tolist() for i, data_col in enumerate(data)})
-        return pd.DataFrame({i: list(data_col.detach().to("cpu").numpy()) for i, data_col in enumerate(data)})
+        # Without ensure_serializable, the content is still numpy array so that the type could be preserved and no data
+        # is copied. But that would not serializable and cannot use as UDF input and output.
+        return pd.DataFrame(
+            {
+                i: utils.convert_ndarray_to_column(data_col.detach().to("cpu").numpy(), ensure_serializable)
+                for i, data_col in enumerate(data)
+            }
+        )
 
     @staticmethod
     def convert_from_df(
@@ -102,6 +103,6 @@ class SeqOfPyTorchTensorHandler(base_handler.BaseDataHandler[Sequence["torch.Ten
                         original_exception=NotImplementedError("FeatureGroupSpec is not supported."),
                     )
                 assert isinstance(feature, core.FeatureSpec), "Invalid feature kind."
-                res.append(torch.from_numpy(np.stack(df[feature.name].to_numpy()).astype(feature._dtype._numpy_type)))
+                res.append(torch.from_numpy(utils.stack_column(df[feature.name]).astype(feature._dtype._numpy_type)))
             return res
-        return [torch.from_numpy(np.stack(df[col].to_numpy())) for col in df]
+        return [torch.from_numpy(utils.stack_column(df[col])) for col in df]
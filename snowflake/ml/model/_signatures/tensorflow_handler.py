@@ -1,7 +1,6 @@
 from collections import abc
 from typing import TYPE_CHECKING, List, Literal, Optional, Sequence, Union
 
-import numpy as np
 import pandas as pd
 from typing_extensions import TypeGuard
 
@@ -11,7 +10,7 @@ from snowflake.ml._internal.exceptions import (
     exceptions as snowml_exceptions,
 )
 from snowflake.ml.model import type_hints as model_types
-from snowflake.ml.model._signatures import base_handler, core
+from snowflake.ml.model._signatures import base_handler, core, utils
 
 if TYPE_CHECKING:
     import tensorflow
@@ -119,9 +118,12 @@ class SeqOfTensorflowTensorHandler(
     def convert_to_df(
         data: Sequence[Union["tensorflow.Tensor", "tensorflow.Variable"]], ensure_serializable: bool = True
     ) -> pd.DataFrame:
-        if ensure_serializable:
-            return pd.DataFrame({i: data_col.numpy().tolist() for i, data_col in enumerate(iterable=data)})
-        return pd.DataFrame({i: list(data_col.numpy()) for i, data_col in enumerate(iterable=data)})
+        return pd.DataFrame(
+            {
+                i: utils.convert_ndarray_to_column(data_col.numpy(), ensure_serializable)
+                for i, data_col in enumerate(iterable=data)
+            }
+        )
 
     @staticmethod
     def convert_from_df(
@@ -139,7 +141,7 @@ class SeqOfTensorflowTensorHandler(
                     )
                 assert isinstance(feature, core.FeatureSpec), "Invalid feature kind."
                 res.append(
-                    tf.convert_to_tensor(np.stack(df[feature.name].to_numpy()).astype(feature._dtype._numpy_type))
+                    tf.convert_to_tensor(utils.stack_column(df[feature.name]).astype(feature._dtype._numpy_type))
                 )
             return res
-        return [tf.convert_to_tensor(np.stack(df[col].to_numpy())) for col in df]
+        return [tf.convert_to_tensor(utils.stack_column(df[col])) for col in df]
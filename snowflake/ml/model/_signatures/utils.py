@@ -1,5 +1,6 @@
+import operator
 import warnings
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -48,6 +49,105 @@ def convert_list_to_ndarray(data: List[Any]) -> npt.NDArray[Any]:
     return arr
 
 
+def stack_list_column(data_col: pd.Series) -> Optional[npt.NDArray[Any]]:
+    """Stack a column of lists into a numpy array whose first axis is the rows, converting all rows at once.
+
+    The stacked array is only returned if converting each row with convert_list_to_ndarray would give arrays of the
+    same shape and data type, which is the case when all elements of all the lists are of exactly the same type.
+
+    Args:
+        data_col: A column whose elements are all lists.
+
+    Returns:
+        The stacked array, or None if the column cannot be stacked, e.g. when the lists are ragged, contain other types
+        than basic ones or mix types like int and float. Rows then have to be converted one by one to be checked.
+    """
+    try:
+        obj_arr = np.array(data_col.tolist(), dtype=object)
+    except ValueError:
+        return None
+    # Ragged lists are kept as objects in the first axes.
+    if obj_arr.ndim < 2 or obj_arr.size == 0:
+        return None
+    flat_arr = obj_arr.ravel()
+    element_types = set(map(type, flat_arr))
+    if len(element_types) != 1:
+        return None
+    try:
+        arr = np.array(flat_arr.tolist())
+    except ValueError:
+        return None
+    # Elements are sequences themselves if the lists are ragged in the last axes.
+    if arr.dtype == np.dtype("O") or arr.ndim != 1:
+        return None
+    # Python ints out of the range of the default int type are converted to other types depending on the other values.
+    if element_types == {int} and arr.dtype != np.array([0]).dtype:
+        return None
+    return arr.reshape(obj_arr.shape)
+
+
+def stack_ndarray_column(data_col: pd.Series) -> Optional[npt.NDArray[Any]]:
+    """Stack a column of numpy arrays into a numpy array whose first axis is the rows.
+
+    Args:
+        data_col: A column whose elements are all numpy arrays.
+
+    Returns:
+        The stacked array, or None if the arrays are not all of the same shape and data type.
+    """
+    values = data_col.to_numpy()
+    shapes = set(map(operator.attrgetter("shape"), values))
+    if len(shapes) != 1 or len(set(map(operator.attrgetter("dtype"), values))) != 1:
+        return None
+    shape: Tuple[int, ...] = shapes.pop()
+    if not shape:
+        return np.array(values.tolist())
+    # Much faster than np.stack, which adds an axis to every array first.
+    concatenated: npt.NDArray[Any] = np.concatenate(values)
+    return concatenated.reshape((len(values), *shape))
+
+
+def convert_ndarray_to_column(
+    data: npt.NDArray[Any], ensure_serializable: bool = True
+) -> Union[npt.NDArray[Any], List[Any]]:
+    """Convert a numpy array whose first axis is the rows into the values of a pandas column.
+
+    Args:
+        data: The numpy array.
+        ensure_serializable: Whether to convert the rows of arrays of more than one dimension into lists, which are
+            needed to send the data to Snowflake. Otherwise, every row is a view into the array, so that no data is
+            copied and the column can be stacked back into an array with stack_column. Defaults to True.
+
+    Returns:
+        The values of the column.
+    """
+    if ensure_serializable:
+        return cast(List[Any], data.tolist())
+    if data.ndim == 1:
+        return data
+    return list(data)
+
+
+def stack_column(data_col: pd.Series) -> npt.NDArray[Any]:
+    """Stack a column of scalars, or of numpy arrays or lists of the same shape, into a numpy array whose first axis is
+    the rows.
+
+    Args:
+        data_col: The column.
+
+    Returns:
+        The stacked array.
+    """
+    if data_col.dtype != np.dtype("O"):
+        values: npt.NDArray[Any] = data_col.to_numpy()
+        return values
+    if isinstance(data_col.iloc[0], np.ndarray):
+        stacked = stack_ndarray_column(data_col)
+        if stacked is not None:
+            return stacked
+    return np.stack(data_col.to_numpy())
+
+
 def rename_features(
     features: Sequence[core.BaseFeatureSpec], feature_names: Optional[List[str]] = None
 ) -> Sequence[core.BaseFeatureSpec]:
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from absl.testing import absltest
 
@@ -32,6 +33,54 @@ class ModelSignatureMiscTest(absltest.TestCase):
             fts = [core.FeatureSpec("a", core.DataType.INT64, shape=(2,))]
             utils.rename_features(fts, ["b", "c"])
 
+    def test_stack_list_column(self) -> None:
+        stacked = utils.stack_list_column(pd.Series([[1, 2], [3, 4], [5, 6]]))
+        assert stacked is not None
+        np.testing.assert_array_equal(stacked, np.array([[1, 2], [3, 4], [5, 6]]))
+
+        stacked = utils.stack_list_column(pd.Series([[["a"], ["b"]], [["c"], ["d"]]]))
+        assert stacked is not None
+        self.assertEqual(stacked.shape, (2, 2, 1))
+
+        # Ragged lists.
+        self.assertIsNone(utils.stack_list_column(pd.Series([[1, 2], [3]])))
+        self.assertIsNone(utils.stack_list_column(pd.Series([[[1, 2]], [[3]]])))
+        # Rows that would be converted to different data types one by one.
+        self.assertIsNone(utils.stack_list_column(pd.Series([[1, 2], [3.5, 4]])))
+        self.assertIsNone(utils.stack_list_column(pd.Series([[True, False], [1, 0]])))
+        self.assertIsNone(utils.stack_list_column(pd.Series([[2**64], [1]])))
+        # Unsupported elements.
+        self.assertIsNone(utils.stack_list_column(pd.Series([[None, 2], [3, 4]])))
+        self.assertIsNone(utils.stack_list_column(pd.Series([[], []])))
+
+    def test_stack_ndarray_column(self) -> None:
+        stacked = utils.stack_ndarray_column(pd.Series([np.array([1, 2]), np.array([3, 4])]))
+        assert stacked is not None
+        np.testing.assert_array_equal(stacked, np.array([[1, 2], [3, 4]]))
+
+        self.assertIsNone(utils.stack_ndarray_column(pd.Series([np.array([1, 2]), np.array([3])])))
+        self.assertIsNone(utils.stack_ndarray_column(pd.Series([np.array([1, 2]), np.array([3.0, 4.0])])))
+
+    def test_convert_ndarray_to_column(self) -> None:
+        arr = np.arange(6, dtype=np.float32).reshape((3, 2))
+        self.assertListEqual(utils.convert_ndarray_to_column(arr), [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]])
+
+        col = utils.convert_ndarray_to_column(arr, ensure_serializable=False)
+        self.assertLen(col, 3)
+        self.assertTrue(all(np.shares_memory(row, arr) for row in col))
+
+        arr_1d = np.arange(3, dtype=np.float32)
+        self.assertIs(utils.convert_ndarray_to_column(arr_1d, ensure_serializable=False), arr_1d)
+
+    def test_stack_column(self) -> None:
+        arr = np.arange(6, dtype=np.float32).reshape((3, 2))
+        stacked = utils.stack_column(pd.Series(utils.convert_ndarray_to_column(arr, ensure_serializable=False)))
+        np.testing.assert_array_equal(stacked, arr)
+        self.assertEqual(stacked.dtype, np.float32)
+
+        np.testing.assert_array_equal(utils.stack_column(pd.Series(arr.tolist())), arr)
+        np.testing.assert_array_equal(utils.stack_column(pd.Series([1.0, 2.0])), np.array([1.0, 2.0]))
+
     def testrename_pandas_df(self) -> None:
         fts = [
             core.FeatureSpec("input_feature_0", core.DataType.INT64),
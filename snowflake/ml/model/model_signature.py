@@ -152,12 +152,17 @@ def _validate_numpy_array(arr: model_types._SupportedNumpyArray, feature_type: c
         return np.can_cast(arr.dtype, feature_type._numpy_type, casting="no")
 
 
-def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureSpec]) -> None:
+def _validate_pandas_df(
+    data: pd.DataFrame, features: Sequence[core.BaseFeatureSpec], sample_rows: Optional[int] = None
+) -> None:
     """It validates pandas dataframe with provided features.
 
     Args:
         data: A pandas dataframe to be validated.
         features: A sequence of feature specifications and feature group specifications, where the dataframe should fit.
+        sample_rows: When set, columns of lists, arrays, strings or bytes are only validated on a random sample of this
+            many rows, which is faster but might miss invalid rows. Columns of scalars are always fully validated.
+            Defaults to None, which validates all rows.
 
     Raises:
         SnowflakeMLException: NotImplementedError: FeatureGroupSpec is not supported.
@@ -209,7 +214,10 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                     ),
                 )
         else:
-            if isinstance(data_col[0], list):
+            if sample_rows is not None and len(data_col) > sample_rows:
+                data_col = data_col.sample(n=sample_rows, random_state=0)
+
+            if isinstance(data_col.iloc[0], list):
                 if not ft_shape:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
@@ -219,9 +227,19 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                         ),
                     )
 
-                converted_data_list = [utils.convert_list_to_ndarray(data_row) for data_row in data_col]
+                # Rows are only converted one by one when they cannot be stacked into a single array.
+                stacked_data = utils.stack_list_column(data_col)
+                if stacked_data is not None:
+                    is_type_valid = _validate_numpy_array(stacked_data, ft_type)
+                    data_shapes = {stacked_data.shape[1:]}
+                else:
+                    converted_data_list = [utils.convert_list_to_ndarray(data_row) for data_row in data_col]
+                    is_type_valid = all(
+                        _validate_numpy_array(converted_data, ft_type) for converted_data in converted_data_list
+                    )
+                    data_shapes = set(map(np.shape, converted_data_list))
 
-                if not all(_validate_numpy_array(converted_data, ft_type) for converted_data in converted_data_list):
+                if not is_type_valid:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
                         original_exception=ValueError(
@@ -231,7 +249,7 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                     )
 
                 if ft_shape and ft_shape != (-1,):
-                    if not all(np.shape(converted_data) == ft_shape for converted_data in converted_data_list):
+                    if data_shapes != {ft_shape}:
                         raise snowml_exceptions.SnowflakeMLException(
                             error_code=error_codes.INVALID_DATA,
                             original_exception=ValueError(
@@ -240,7 +258,7 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                             ),
                         )
 
-            elif isinstance(data_col[0], np.ndarray):
+            elif isinstance(data_col.iloc[0], np.ndarray):
                 if not ft_shape:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
@@ -250,7 +268,15 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                         ),
                     )
 
-                if not all(_validate_numpy_array(data_row, ft_type) for data_row in data_col):
+                stacked_data = utils.stack_ndarray_column(data_col)
+                if stacked_data is not None:
+                    is_type_valid = _validate_numpy_array(stacked_data, ft_type)
+                    data_shapes = {stacked_data.shape[1:]}
+                else:
+                    is_type_valid = all(_validate_numpy_array(data_row, ft_type) for data_row in data_col)
+                    data_shapes = set(map(np.shape, data_col))
+
+                if not is_type_valid:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
                         original_exception=ValueError(
@@ -261,7 +287,7 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
 
                 ft_shape = feature._shape
                 if ft_shape and ft_shape != (-1,):
-                    if not all(np.shape(data_row) == ft_shape for data_row in data_col):
+                    if data_shapes != {ft_shape}:
                         ft_shape = (-1,)
                         raise snowml_exceptions.SnowflakeMLException(
                             error_code=error_codes.INVALID_DATA,
@@ -271,7 +297,7 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                             ),
                         )
 
-            elif isinstance(data_col[0], str):
+            elif isinstance(data_col.iloc[0], str):
                 if ft_shape is not None:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
@@ -290,7 +316,7 @@ def _validate_pandas_df(data: pd.DataFrame, features: Sequence[core.BaseFeatureS
                         ),
                     )
 
-            elif isinstance(data_col[0], bytes):
+            elif isinstance(data_col.iloc[0], bytes):
                 if ft_shape is not None:
                     raise snowml_exceptions.SnowflakeMLException(
                         error_code=error_codes.INVALID_DATA,
@@ -490,20 +516,24 @@ def _convert_local_data_to_df(data: model_types.SupportedLocalDataType) -> pd.Da
 
 
 def _convert_and_validate_local_data(
-    data: model_types.SupportedLocalDataType, features: Sequence[core.BaseFeatureSpec]
+    data: model_types.SupportedLocalDataType,
+    features: Sequence[core.BaseFeatureSpec],
+    sample_rows: Optional[int] = None,
 ) -> pd.DataFrame:
     """Validate the data with features in model signature and convert to DataFrame
 
     Args:
         features: A list of feature specs that the data should follow.
         data: The provided data.
+        sample_rows: When set, the number of rows of the sample used to validate columns of lists, arrays, strings or
+            bytes. Defaults to None, which validates all rows.
 
     Returns:
         The converted dataframe with renamed column index.
     """
     df = _convert_local_data_to_df(data)
     df = utils.rename_pandas_df(df, features)
-    _validate_pandas_df(df, features)
+    _validate_pandas_df(df, features, sample_rows=sample_rows)
     df = pandas_handler.PandasDataFrameHandler.convert_to_df(df, ensure_serializable=True)
 
     return df
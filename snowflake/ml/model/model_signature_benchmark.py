@@ -0,0 +1,64 @@
+# A benchmark of the validation of pandas DataFrames against a model signature, for a feature of shape (3,) given as a
+# column of lists or of numpy arrays. It compares the per-row validation, which every column was validated with before
+# columns were stacked into a single array, with the stacked validation of all rows and of a sample of rows.
+#
+# Run it with, e.g.:
+#   python model_signature_benchmark.py --num_rows=10000,100000,1000000,10000000 --sample_rows=10000
+
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+from absl import app, flags
+
+from snowflake.ml.model import model_signature
+from snowflake.ml.model._signatures import core, utils
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list("num_rows", ["10000", "100000", "1000000", "10000000"], "Numbers of rows, one case per number.")
+flags.DEFINE_integer("sample_rows", 10_000, "Number of rows of the sample validated by the sampled validation.")
+flags.DEFINE_integer("max_per_row_rows", 1_000_000, "Largest number of rows the per-row validation is run on.")
+
+
+def _validate_per_row(data: pd.DataFrame, feature: core.FeatureSpec) -> None:
+    data_col = data[feature.name]
+    if isinstance(data_col.iloc[0], list):
+        converted_data_list = [utils.convert_list_to_ndarray(data_row) for data_row in data_col]
+    else:
+        converted_data_list = list(data_col)
+    assert all(
+        model_signature._validate_numpy_array(converted_data, feature._dtype) for converted_data in converted_data_list
+    )
+    assert set(map(np.shape, converted_data_list)) == {feature._shape}
+
+
+def _time(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    feature = core.FeatureSpec("a", core.DataType.DOUBLE, shape=(3,))
+    print(f"{'column':>8}{'rows':>10}{'per row s':>11}{'stacked s':>11}{'sampled s':>11}")
+    for num_rows in map(int, FLAGS.num_rows):
+        values = np.random.default_rng(0).random((num_rows, 3))
+        for kind in ["lists", "arrays"]:
+            data = pd.DataFrame({"a": values.tolist() if kind == "lists" else list(values)})
+            per_row = (
+                f"{_time(lambda: _validate_per_row(data, feature)):>11.2f}"
+                if num_rows <= FLAGS.max_per_row_rows
+                else f"{'-':>11}"
+            )
+            stacked_seconds = _time(lambda: model_signature._validate_pandas_df(data, [feature]))
+            sampled_seconds = _time(
+                lambda: model_signature._validate_pandas_df(data, [feature], sample_rows=FLAGS.sample_rows)
+            )
+            print(f"{kind:>8}{num_rows:>10}{per_row}{stacked_seconds:>11.2f}{sampled_seconds:>11.2f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
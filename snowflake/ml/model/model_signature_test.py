@@ -430,6 +430,35 @@ class ModelSignatureMiscTest(absltest.TestCase):
         ):
             model_signature._validate_pandas_df(pd.DataFrame(data={"a": [np.array([1, 2])]}), fts)
 
+    def test_validate_pandas_df_with_sample_rows(self) -> None:
+        fts = [model_signature.FeatureSpec("a", model_signature.DataType.INT64, shape=(2,))]
+        data = pd.DataFrame({"a": [[1, 2]] * 99 + [[1, 2, 3]]})
+
+        with exception_utils.assert_snowml_exceptions(
+            self,
+            expected_original_error_type=ValueError,
+            expected_regex="Feature shape [\\(\\)0-9,\\s-]* is not met by all elements",
+        ):
+            model_signature._validate_pandas_df(data, fts)
+
+        with exception_utils.assert_snowml_exceptions(
+            self,
+            expected_original_error_type=ValueError,
+            expected_regex="Feature shape [\\(\\)0-9,\\s-]* is not met by all elements",
+        ):
+            model_signature._validate_pandas_df(data, fts, sample_rows=100)
+
+        # The invalid row is unlikely to be sampled.
+        model_signature._validate_pandas_df(data[1:], fts, sample_rows=10)
+        model_signature._validate_pandas_df(data[:99], fts, sample_rows=10)
+
+        with exception_utils.assert_snowml_exceptions(
+            self,
+            expected_original_error_type=ValueError,
+            expected_regex="Feature type [^\\s]* is not met by all elements",
+        ):
+            model_signature._validate_pandas_df(pd.DataFrame({"a": [[1.5, 2]] * 100}), fts, sample_rows=10)
+
     def test_validate_data_with_features(self) -> None:
         fts = [
             model_signature.FeatureSpec("input_feature_0", model_signature.DataType.INT64),
@@ -124,9 +124,14 @@ _ModelType = TypeVar("_ModelType", bound=SupportedModelType)
 
 
 class DeployOptions(TypedDict):
-    """Common Options for deploying to Snowflake."""
+    """Common Options for deploying to Snowflake.
 
-    ...
+    validation_sample_rows: When set, columns of lists, arrays, strings or bytes of the local data given to predict are
+        only validated against the signature on a random sample of this many rows, which is faster but might miss
+        invalid rows. Defaults to None, which validates all rows.
+    """
+
+    validation_sample_rows: NotRequired[int]
 
 
 class WarehouseDeployOptions(DeployOptions):
@@ -173,6 +178,13 @@ class SnowparkContainerServiceDeployOptions(DeployOptions):
     debug_mode: When set to True, deployment artifacts will be persisted in a local temp directory.
     enable_ingress: When set to True, will expose HTTP endpoint for access to the predict method of the created
         service.
+    dynamic_batch_max_rows: When set, the inference server coalesces concurrent requests into model calls of up to
+        this many rows. Default to None, which calls the model once per request.
+    dynamic_batch_max_wait_ms: The maximum time in milliseconds a request waits for other requests to be batched with.
+        Default to 5 milliseconds.
+    model_reload_interval_sec: When set, the inference server checks the model zip on the stage every this many seconds
+        and loads it again, together with its code, when it changes, without restarting the service. Default to None,
+        which never reloads. Not supported with model_in_image.
     """
 
     compute_pool: str
@@ -187,6 +199,9 @@ class SnowparkContainerServiceDeployOptions(DeployOptions):
     model_in_image: NotRequired[bool]
     debug_mode: NotRequired[bool]
     enable_ingress: NotRequired[bool]
+    dynamic_batch_max_rows: NotRequired[int]
+    dynamic_batch_max_wait_ms: NotRequired[int]
+    model_reload_interval_sec: NotRequired[int]
 
 
 class ModelMethodSaveOptions(TypedDict):
@@ -0,0 +1,63 @@
+# A benchmark of batch inference with several output columns, comparing the default mode, which packs every input and
+# output row into an OBJECT, with the columnar mode, which returns every output as a typed column of a vectorized UDTF.
+# It runs predict_proba of a logistic regression on generated data in the warehouse of the connection.
+#
+# Run it with, e.g.:
+#   python batch_inference_benchmark.py --num_rows=1000000,10000000 --num_features=16 --num_classes=4
+
+import time
+from typing import List
+
+from absl import app, flags
+
+from snowflake.ml.modeling._internal.snowpark_handlers import SnowparkHandlers
+from snowflake.ml.modeling.linear_model import LogisticRegression
+from snowflake.ml.utils.connection_params import SnowflakeLoginOptions
+from snowflake.snowpark import DataFrame, Session, functions as F
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list("num_rows", ["1000000", "10000000"], "Numbers of rows to predict, one case per number.")
+flags.DEFINE_integer("num_features", 16, "Number of float features.")
+flags.DEFINE_integer("num_classes", 4, "Number of classes, i.e. of output columns of predict_proba.")
+
+
+def _generate_data(session: Session, num_rows: int, num_features: int, num_classes: int) -> DataFrame:
+    features = [F.uniform(0.0, 1.0, F.random()).as_(f"F_{i}") for i in range(num_features)]
+    df: DataFrame = session.generator(*features, rowcount=num_rows).with_column("ID", F.seq8())
+    df = df.with_column("LABEL", F.floor(F.col("F_0") * num_classes).cast("INT"))
+    return df
+
+
+def _run_case(estimator: LogisticRegression, df: DataFrame, columnar: bool) -> float:
+    SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = columnar
+    output_df = estimator.predict_proba(df, output_cols_prefix="P_")
+    output_cols = [c for c in output_df.columns if c.startswith("P_")]
+    start = time.perf_counter()
+    # Aggregating every output column makes the warehouse compute all of them without transferring them.
+    output_df.select([F.sum(c) for c in output_cols]).collect()
+    return time.perf_counter() - start
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    session = Session.builder.configs(SnowflakeLoginOptions()).create()
+    feature_cols = [f"F_{i}" for i in range(FLAGS.num_features)]
+    train_df = _generate_data(session, 10_000, FLAGS.num_features, FLAGS.num_classes).cache_result()
+    estimator = LogisticRegression(input_cols=feature_cols, label_cols=["LABEL"]).fit(train_df)
+
+    print(f"{'rows':>10}{'object s':>10}{'columnar s':>12}{'speedup':>9}")
+    for num_rows in map(int, FLAGS.num_rows):
+        df = _generate_data(session, num_rows, FLAGS.num_features, FLAGS.num_classes).cache_result()
+        # Warm up, so that both modes run with their functions registered and the estimator staged.
+        _run_case(estimator, df.limit(1000), columnar=False)
+        _run_case(estimator, df.limit(1000), columnar=True)
+        object_seconds = _run_case(estimator, df, columnar=False)
+        columnar_seconds = _run_case(estimator, df, columnar=True)
+        speedup = object_seconds / columnar_seconds
+        print(f"{num_rows:>10}{object_seconds:>10.1f}{columnar_seconds:>12.1f}{speedup:>9.2f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    app.run(main)
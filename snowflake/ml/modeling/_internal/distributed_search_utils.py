@@ -0,0 +1,450 @@
+"""Helpers shared by the stored procedures and UDTFs of the distributed hyperparameter searches.
+
+The module is pickled by value into the stored procedures, so it may only import packages that are available in the
+Snowflake sandbox.
+"""
+import inspect
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import cloudpickle as cp
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from snowflake.ml._internal.utils import identifier
+from snowflake.ml._internal.utils.temp_file_utils import get_temp_file_path
+from snowflake.snowpark import Session, functions as F
+from snowflake.snowpark._internal.utils import (
+    TempObjectType,
+    random_name_for_temp_object,
+)
+from snowflake.snowpark.types import (
+    BinaryType,
+    DoubleType,
+    IntegerType,
+    LongType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+# Output of the search UDTFs: one row per (candidate, fold). Scores are packed into a float64 buffer, test scores
+# first followed by train scores, in the order of SCORER_NAMES. SCORER_NAMES is NULL when the scorer returns a single
+# value rather than a dict of named scores.
+FIT_AND_SCORE_SCHEMA = StructType(
+    [
+        StructField("FIT_TIME", DoubleType()),
+        StructField("SCORE_TIME", DoubleType()),
+        StructField("N_TEST_SAMPLES", LongType()),
+        StructField("FIT_ERROR", StringType()),
+        StructField("SCORER_NAMES", StringType()),
+        StructField("SCORES", BinaryType()),
+    ]
+)
+FIT_AND_SCORE_COLUMNS = FIT_AND_SCORE_SCHEMA.names
+
+FitAndScoreRow = Tuple[float, float, int, Optional[str], Optional[str], bytes]
+
+
+def read_staged_data(file_prefix: str) -> pd.DataFrame:
+    """Read the parquet files staged as imports of the current stored procedure or UDTF.
+
+    Files are sorted so that row positions agree between the stored procedure and every UDTF process. The data is
+    decoded into the memory of the calling process; use `write_shared_data` to share it with the UDTF processes.
+
+    Args:
+        file_prefix: Prefix of the staged data files in the import directory.
+
+    Returns:
+        The staged data, with column names converted to Snowflake identifiers.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    import_directory = sys._xoptions["snowflake_import_directory"]
+    data_files = sorted(filename for filename in os.listdir(import_directory) if filename.startswith(file_prefix))
+    table = pa.concat_tables(
+        [pq.read_table(os.path.join(import_directory, file_name), memory_map=True) for file_name in data_files]
+    )
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    df.columns = [identifier.get_inferred_name(col) for col in df.columns]
+    return df
+
+
+def write_shared_data(df: pd.DataFrame, path: str) -> None:
+    """Write the staged data as an uncompressed Arrow IPC file, to be read with `read_shared_fit_args`.
+
+    Args:
+        df: Staged data.
+        path: Local path of the file to write.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_shared_columns(table: Any, columns: List[str]) -> pd.DataFrame:
+    import pyarrow as pa
+
+    data = {}
+    for name in columns:
+        column = table.column(name)
+        if (
+            column.num_chunks == 1
+            and column.null_count == 0
+            and (pa.types.is_integer(column.type) or pa.types.is_floating(column.type))
+        ):
+            # Read-only view of the memory-mapped file.
+            data[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+        else:
+            data[name] = column.to_pandas()
+    return pd.DataFrame(data, copy=False)
+
+
+def read_shared_fit_args(
+    path: str,
+    estimator: Any,
+    input_cols: List[str],
+    label_cols: List[str],
+    sample_weight_col: Optional[str],
+) -> Tuple[pd.DataFrame, Optional[pd.Series], Dict[str, Any]]:
+    """Memory-map a file written by `write_shared_data` and split it like `get_fit_args`.
+
+    Numeric columns without nulls are zero-copy views of the mapped file, so every UDTF process on a node reads the
+    same page cache pages instead of decoding its own copy of the data. Other columns are decoded per process.
+
+    Args:
+        path: Local path of the file.
+        estimator: Base estimator of the search.
+        input_cols: Feature columns.
+        label_cols: Label columns, may be empty for unsupervised estimators.
+        sample_weight_col: Sample weight column. Only passed on if the estimator's fit accepts sample weights.
+
+    Returns:
+        Features, labels and fit params.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return _get_fit_args(
+        lambda columns: _read_shared_columns(table, columns), estimator, input_cols, label_cols, sample_weight_col
+    )
+
+
+def _get_fit_args(
+    select: Callable[[List[str]], pd.DataFrame],
+    estimator: Any,
+    input_cols: List[str],
+    label_cols: List[str],
+    sample_weight_col: Optional[str],
+) -> Tuple[pd.DataFrame, Optional[pd.Series], Dict[str, Any]]:
+    y = select(label_cols).squeeze(axis=1) if label_cols else None
+    fit_params = {}
+    if sample_weight_col is not None and "sample_weight" in inspect.signature(estimator.fit).parameters:
+        fit_params["sample_weight"] = select([sample_weight_col]).squeeze(axis=1)
+    return select(input_cols), y, fit_params
+
+
+def get_fit_args(
+    df: pd.DataFrame,
+    estimator: Any,
+    input_cols: List[str],
+    label_cols: List[str],
+    sample_weight_col: Optional[str],
+) -> Tuple[pd.DataFrame, Optional[pd.Series], Dict[str, Any]]:
+    """Split the staged data into the X, y and fit params passed to sklearn's fit-and-score of the base estimator.
+
+    Args:
+        df: Staged data.
+        estimator: Base estimator of the search.
+        input_cols: Feature columns.
+        label_cols: Label columns, may be empty for unsupervised estimators.
+        sample_weight_col: Sample weight column. Only passed on if the estimator's fit accepts sample weights.
+
+    Returns:
+        Features, labels and fit params.
+    """
+    return _get_fit_args(lambda columns: df[columns], estimator, input_cols, label_cols, sample_weight_col)
+
+
+def get_split_masks(cv: Any, X: pd.DataFrame, y: Optional[pd.Series]) -> npt.NDArray[np.bool_]:
+    """Encode the splits of a cross validator as boolean masks, to be staged for the UDTFs.
+
+    Args:
+        cv: Cross validator.
+        X: Features.
+        y: Labels.
+
+    Returns:
+        Masks of shape (2, n_splits, n_rows); index 0 holds the train masks and index 1 the test masks.
+    """
+    splits = list(cv.split(X, y))
+    split_masks = np.zeros((2, len(splits), len(X)), dtype=bool)
+    for split_idx, (train, test) in enumerate(splits):
+        split_masks[0, split_idx, train] = True
+        split_masks[1, split_idx, test] = True
+    return split_masks
+
+
+def masks_to_splits(split_masks: npt.NDArray[np.bool_]) -> List[Tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]]:
+    """Decode the masks of `get_split_masks` into (train, test) indices, sorted in ascending order.
+
+    Args:
+        split_masks: Masks of shape (2, n_splits, n_rows).
+
+    Returns:
+        One (train, test) pair of indices per split.
+    """
+    return [
+        (np.flatnonzero(train_mask), np.flatnonzero(test_mask))
+        for train_mask, test_mask in zip(split_masks[0], split_masks[1])
+    ]
+
+
+def stage_file(session: Session, stage_name: str, local_file_name: str) -> str:
+    """Upload a local file to the stage as is.
+
+    Args:
+        session: Snowpark session.
+        stage_name: Stage to upload to.
+        local_file_name: Local file to upload.
+
+    Returns:
+        Name of the file in the stage.
+    """
+    put_result = session.file.put(local_file_name, stage_name, auto_compress=False, overwrite=True)
+    return str(put_result[0].target)
+
+
+def stage_object(session: Session, stage_name: str, obj: Any) -> str:
+    """Pickle an object into the stage.
+
+    Args:
+        session: Snowpark session.
+        stage_name: Stage to upload to.
+        obj: Object to pickle.
+
+    Returns:
+        Name of the file in the stage.
+    """
+    local_file_name = get_temp_file_path()
+    with open(local_file_name, mode="w+b") as local_file_obj:
+        cp.dump(obj, local_file_obj)
+    return stage_file(session, stage_name, local_file_name)
+
+
+def load_staged_object(session: Session, stage_file_path: str) -> Any:
+    """Load an object pickled into the stage by `stage_object`.
+
+    Args:
+        session: Snowpark session.
+        stage_file_path: Path of the file in the stage.
+
+    Returns:
+        The unpickled object.
+    """
+    local_dir_name = get_temp_file_path()
+    session.file.get(stage_file_path, local_dir_name)
+    with open(os.path.join(local_dir_name, os.listdir(local_dir_name)[0]), mode="rb") as local_file_obj:
+        return cp.load(local_file_obj)
+
+
+def fit_and_score_in_udtf(
+    session: Session,
+    stage_name: str,
+    data_location: str,
+    cv: Any,
+    X: pd.DataFrame,
+    y: Optional[pd.Series],
+    base_estimator: Any,
+    candidate_params: List[Dict[str, Any]],
+    fit_and_score_kwargs: Dict[str, Any],
+    input_cols: List[str],
+    label_cols: List[str],
+    sample_weight_col: Optional[str],
+    packages: List[str],
+    statement_params: Optional[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Fit and score every (candidate, split) pair in a UDTF, one partition per pair.
+
+    Must be called from the stored procedure of a search. The splits are staged as masks, and each UDTF process loads
+    them and memory-maps the data staged by `write_shared_data` once, however many pairs it evaluates.
+
+    Args:
+        session: Snowpark session.
+        stage_name: Stage holding the data, where the masks are staged too.
+        data_location: Name of the staged file written by `write_shared_data`.
+        cv: Cross validator, only used through its `split` method.
+        X: Features the splits are computed on.
+        y: Labels the splits are computed on.
+        base_estimator: Base estimator of the search.
+        candidate_params: Parameters of the candidates to evaluate.
+        fit_and_score_kwargs: Keyword arguments passed on to sklearn's `_fit_and_score`.
+        input_cols: Feature columns.
+        label_cols: Label columns, may be empty for unsupervised estimators.
+        sample_weight_col: Sample weight column.
+        packages: Packages of the UDTF.
+        statement_params: Statement params of the UDTF registration.
+
+    Returns:
+        One `_fit_and_score` result per pair, ordered candidate-major as sklearn expects.
+    """
+    import cachetools
+    from sklearn.base import clone
+    from sklearn.model_selection._validation import _fit_and_score
+
+    split_masks = get_split_masks(cv, X, y)
+    n_splits = split_masks.shape[1]
+    n_candidates = len(candidate_params)
+    local_masks_file_name = get_temp_file_path()
+    with open(local_masks_file_name, mode="w+b") as local_masks_file_obj:
+        np.save(local_masks_file_obj, split_masks, allow_pickle=False)
+    masks_location = stage_file(session, stage_name, local_masks_file_name)
+
+    # Cached per process: every UDTF partition handled by the same worker process shares the data and the splits.
+    @cachetools.cached(cache={})
+    def _load_data_into_udf() -> Tuple[
+        pd.DataFrame,
+        Optional[pd.Series],
+        Dict[str, Any],
+        List[Tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]],
+    ]:
+        import_directory = sys._xoptions["snowflake_import_directory"]
+        X, y, fit_params = read_shared_fit_args(
+            os.path.join(import_directory, data_location), base_estimator, input_cols, label_cols, sample_weight_col
+        )
+        split_masks = np.load(os.path.join(import_directory, masks_location), mmap_mode="r", allow_pickle=False)
+        return X, y, fit_params, masks_to_splits(split_masks)
+
+    class SearchCV:
+        def __init__(self) -> None:
+            X, y, fit_params, splits = _load_data_into_udf()
+            self.X = X
+            self.y = y
+            self.fit_params = fit_params
+            self.splits = splits
+
+        def process(self, candidate_idx: int, split_idx: int) -> Iterator[FitAndScoreRow]:
+            train, test = self.splits[split_idx]
+            result = _fit_and_score(
+                clone(base_estimator),
+                self.X,
+                self.y,
+                train=train,
+                test=test,
+                parameters=candidate_params[candidate_idx],
+                fit_params=self.fit_params,
+                split_progress=(split_idx, n_splits),
+                candidate_progress=(candidate_idx, n_candidates),
+                **fit_and_score_kwargs,
+            )
+            yield fit_and_score_result_to_row(result)
+
+        def end_partition(self) -> None:
+            ...
+
+    udtf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
+    session.udtf.register(
+        SearchCV,
+        output_schema=FIT_AND_SCORE_SCHEMA,
+        input_types=[IntegerType(), IntegerType()],
+        name=udtf_name,
+        packages=packages,  # type: ignore[arg-type]
+        replace=True,
+        is_permanent=False,
+        imports=[f"@{stage_name}/{data_location}", f"@{stage_name}/{masks_location}"],
+        statement_params=statement_params,
+    )
+    search_udtf = F.table_function(udtf_name)
+
+    n_tasks = n_candidates * n_splits
+    tasks_df = session.create_dataframe(
+        pd.DataFrame(
+            {
+                "CANDIDATE_INDEX": np.repeat(np.arange(n_candidates), n_splits),
+                "SPLIT_INDEX": np.tile(np.arange(n_splits), n_candidates),
+                "TASK_INDEX": np.arange(n_tasks),
+            }
+        )
+    )
+    # One partition per (candidate, split) task, so that all tasks can run in parallel.
+    results = tasks_df.select(
+        F.cast(tasks_df["TASK_INDEX"], IntegerType()).as_("TASK_INDEX"),
+        search_udtf(tasks_df["CANDIDATE_INDEX"], tasks_df["SPLIT_INDEX"]).over(partition_by=tasks_df["TASK_INDEX"]),
+    )
+    return rows_to_fit_and_score_results(
+        results.sort(F.col("TASK_INDEX")).select(*FIT_AND_SCORE_COLUMNS).collect(),
+        fit_and_score_kwargs["return_train_score"],
+    )
+
+
+def fit_and_score_result_to_row(result: Dict[str, Any]) -> FitAndScoreRow:
+    """Encode the output of sklearn's `_fit_and_score` as a row of FIT_AND_SCORE_SCHEMA.
+
+    Args:
+        result: Output of `_fit_and_score` with times and number of test samples.
+
+    Returns:
+        The row to yield from the UDTF.
+    """
+    test_scores = result["test_scores"]
+    train_scores = result.get("train_scores")
+    scorer_names = None
+    if isinstance(test_scores, dict):
+        scorer_names = sorted(test_scores)
+        scores = [test_scores[name] for name in scorer_names]
+        if train_scores is not None:
+            scores += [train_scores[name] for name in scorer_names]
+    else:
+        scores = [test_scores] if train_scores is None else [test_scores, train_scores]
+    return (
+        float(result["fit_time"]),
+        float(result["score_time"]),
+        int(result["n_test_samples"]),
+        result["fit_error"],
+        json.dumps(scorer_names) if scorer_names is not None else None,
+        np.asarray(scores, dtype=np.float64).tobytes(),
+    )
+
+
+def rows_to_fit_and_score_results(rows: Sequence[Sequence[Any]], return_train_score: bool) -> List[Dict[str, Any]]:
+    """Decode rows of FIT_AND_SCORE_SCHEMA back into the format returned by sklearn's `_fit_and_score`.
+
+    Args:
+        rows: Rows with the columns of FIT_AND_SCORE_COLUMNS, in that order.
+        return_train_score: Whether the rows contain train scores.
+
+    Returns:
+        One `_fit_and_score` result per row, ready for `BaseSearchCV._format_results`.
+    """
+    results = []
+    for fit_time, score_time, n_test_samples, fit_error, scorer_names_json, scores_buffer in rows:
+        scores = np.frombuffer(bytes(scores_buffer), dtype=np.float64)
+        if return_train_score:
+            test_scores, train_scores = np.split(scores, 2)
+        else:
+            test_scores, train_scores = scores, None
+
+        result: Dict[str, Any] = {
+            "fit_time": fit_time,
+            "score_time": score_time,
+            "n_test_samples": n_test_samples,
+            "fit_error": fit_error,
+        }
+        if scorer_names_json is None:
+            result["test_scores"] = float(test_scores[0])
+            if train_scores is not None:
+                result["train_scores"] = float(train_scores[0])
+        else:
+            scorer_names = json.loads(scorer_names_json)
+            result["test_scores"] = dict(zip(scorer_names, test_scores.tolist()))
+            if train_scores is not None:
+                result["train_scores"] = dict(zip(scorer_names, train_scores.tolist()))
+        results.append(result)
+    return results
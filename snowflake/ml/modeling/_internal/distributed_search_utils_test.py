@@ -0,0 +1,181 @@
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from absl.testing import absltest, parameterized
+from sklearn import linear_model, metrics, model_selection
+
+from snowflake.ml.modeling._internal import distributed_search_utils
+
+
+class DistributedSearchUtilsTest(parameterized.TestCase):
+    @parameterized.parameters(  # type: ignore[misc]
+        {"test_scores": 0.5, "train_scores": None},
+        {"test_scores": np.nan, "train_scores": np.nan},
+        {"test_scores": {"f1": 0.25, "accuracy": 0.5}, "train_scores": None},
+        {"test_scores": {"f1": 0.25, "accuracy": 0.5}, "train_scores": {"f1": 0.75, "accuracy": 1.0}},
+    )
+    def test_fit_and_score_result_round_trip(self, test_scores: Any, train_scores: Any) -> None:
+        result: Dict[str, Any] = {
+            "fit_time": 1.5,
+            "score_time": 0.25,
+            "n_test_samples": 10,
+            "fit_error": None,
+            "test_scores": test_scores,
+        }
+        if train_scores is not None:
+            result["train_scores"] = train_scores
+
+        row = distributed_search_utils.fit_and_score_result_to_row(result)
+        self.assertLen(row, len(distributed_search_utils.FIT_AND_SCORE_COLUMNS))
+        (decoded,) = distributed_search_utils.rows_to_fit_and_score_results(
+            [row], return_train_score=train_scores is not None
+        )
+
+        self.assertEqual(decoded.keys(), result.keys())
+        for key, value in result.items():
+            if isinstance(value, float) and np.isnan(value):
+                self.assertTrue(np.isnan(decoded[key]))
+            else:
+                self.assertEqual(decoded[key], value)
+
+    def test_rows_to_fit_and_score_results_fit_error(self) -> None:
+        row = (0.1, 0.0, 10, "Traceback ...", None, bytearray(np.array([np.nan]).tobytes()))
+
+        (decoded,) = distributed_search_utils.rows_to_fit_and_score_results([row], return_train_score=False)
+
+        self.assertEqual(decoded["fit_error"], "Traceback ...")
+        self.assertTrue(np.isnan(decoded["test_scores"]))
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"cv": model_selection.KFold(n_splits=3)},
+        {"cv": model_selection.KFold(n_splits=4, shuffle=True, random_state=0)},
+        {"cv": model_selection.StratifiedKFold(n_splits=3, shuffle=True, random_state=0)},
+        {"cv": model_selection.ShuffleSplit(n_splits=5, train_size=0.5, test_size=0.2, random_state=0)},
+    )
+    def test_split_masks_match_cv_split(self, cv: Any) -> None:
+        X = pd.DataFrame({"A": np.arange(30.0), "B": np.arange(30.0) ** 2})
+        y = pd.Series(np.arange(30) % 3)
+
+        split_masks = distributed_search_utils.get_split_masks(cv, X, y)
+        splits = distributed_search_utils.masks_to_splits(split_masks)
+
+        self.assertEqual(split_masks.shape, (2, cv.get_n_splits(X, y), len(X)))
+        expected_splits = list(cv.split(X, y))
+        self.assertLen(splits, len(expected_splits))
+        for (train, test), (expected_train, expected_test) in zip(splits, expected_splits):
+            np.testing.assert_array_equal(train, np.sort(expected_train))
+            np.testing.assert_array_equal(test, np.sort(expected_test))
+
+    def test_read_shared_fit_args(self) -> None:
+        df = pd.DataFrame(
+            {
+                "A": np.arange(5.0),
+                "B": np.arange(5),
+                "C": ["a", "b", "c", "d", "e"],
+                "D": [1.0, None, 3.0, 4.0, 5.0],
+                "LABEL": np.arange(5) % 2,
+                "WEIGHT": np.ones(5),
+            }
+        )
+        estimator = linear_model.LogisticRegression()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.arrow")
+            distributed_search_utils.write_shared_data(df, path)
+            X, y, fit_params = distributed_search_utils.read_shared_fit_args(
+                path, estimator, ["A", "B", "C", "D"], ["LABEL"], "WEIGHT"
+            )
+            expected_X, expected_y, expected_fit_params = distributed_search_utils.get_fit_args(
+                df, estimator, ["A", "B", "C", "D"], ["LABEL"], "WEIGHT"
+            )
+
+            pd.testing.assert_frame_equal(X, expected_X)
+            pd.testing.assert_series_equal(y, expected_y)
+            self.assertEqual(fit_params.keys(), expected_fit_params.keys())
+            pd.testing.assert_series_equal(fit_params["sample_weight"], expected_fit_params["sample_weight"])
+            # Numeric columns without nulls are read-only views of the memory-mapped file.
+            self.assertFalse(X["A"].to_numpy().flags.writeable)
+            self.assertTrue(X["D"].to_numpy().flags.writeable)
+            del X, y, fit_params
+
+    def test_fit_and_score_in_udtf(self) -> None:
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame({"A": rng.rand(60), "B": rng.rand(60), "LABEL": rng.randint(0, 2, 60)})
+        X, y = df[["A", "B"]], df["LABEL"]
+        estimator = linear_model.LogisticRegression()
+        cv = model_selection.StratifiedKFold(n_splits=3)
+        candidate_params = [{"C": 0.1}, {"C": 1.0}, {"C": 10.0}]
+        fit_and_score_kwargs = dict(
+            scorer=metrics.check_scoring(estimator),
+            return_train_score=True,
+            return_n_test_samples=True,
+            return_times=True,
+            return_parameters=False,
+            error_score=np.nan,
+            verbose=0,
+        )
+
+        # Files put on the mocked stage land in the import directory of the mocked UDTF processes.
+        import_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, import_directory)
+        distributed_search_utils.write_shared_data(df, os.path.join(import_directory, "data.arrow"))
+
+        def file_put(local_file_name: str, stage_name: str, **kwargs: Any) -> List[Any]:
+            shutil.copy(local_file_name, import_directory)
+            return [mock.MagicMock(target=os.path.basename(local_file_name))]
+
+        mock_session = mock.MagicMock()
+        mock_session.file.put.side_effect = file_put
+        mock_tasks_df = mock_session.create_dataframe.return_value
+
+        def collect() -> List[distributed_search_utils.FitAndScoreRow]:
+            handler = mock_session.udtf.register.call_args[0][0]
+            tasks = mock_session.create_dataframe.call_args[0][0]
+            rows: List[distributed_search_utils.FitAndScoreRow] = []
+            for candidate_idx, split_idx in zip(tasks["CANDIDATE_INDEX"], tasks["SPLIT_INDEX"]):
+                rows.extend(handler().process(int(candidate_idx), int(split_idx)))
+            return rows
+
+        mock_tasks_df.select.return_value.sort.return_value.select.return_value.collect.side_effect = collect
+
+        with mock.patch.object(distributed_search_utils, "F") as mock_functions, mock.patch.dict(
+            sys._xoptions, {"snowflake_import_directory": import_directory}
+        ):
+            out = distributed_search_utils.fit_and_score_in_udtf(
+                mock_session,
+                "STAGE",
+                "data.arrow",
+                cv,
+                X,
+                y,
+                estimator,
+                candidate_params,
+                fit_and_score_kwargs,
+                ["A", "B"],
+                ["LABEL"],
+                None,
+                [],
+                None,
+            )
+
+        # Every (candidate, split) task is a partition of its own.
+        mock_functions.table_function.return_value.return_value.over.assert_called_once_with(
+            partition_by=mock_tasks_df.__getitem__.return_value
+        )
+        mock_tasks_df.__getitem__.assert_any_call("TASK_INDEX")
+        search = model_selection.GridSearchCV(estimator, {"C": [0.1, 1.0, 10.0]}, cv=cv, return_train_score=True).fit(
+            X, y
+        )
+        cv_results = search._format_results(candidate_params, 3, out)
+        np.testing.assert_allclose(cv_results["mean_test_score"], search.cv_results_["mean_test_score"])
+        np.testing.assert_allclose(cv_results["mean_train_score"], search.cv_results_["mean_train_score"])
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -2,6 +2,7 @@ from typing import List, Optional, Protocol, Union
 
 import pandas as pd
 from sklearn import model_selection
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 
 from snowflake.snowpark import DataFrame, Session
 
@@ -142,3 +143,16 @@ class CVHandlers(Protocol):
         sample_weight_col: Optional[str],
     ) -> Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV]:
         raise NotImplementedError
+
+    def fit_successive_halving_snowpark(
+        self,
+        dataset: DataFrame,
+        session: Session,
+        estimator: Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV],
+        dependencies: List[str],
+        udf_imports: List[str],
+        input_cols: List[str],
+        label_cols: List[str],
+        sample_weight_col: Optional[str],
+    ) -> Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV]:
+        raise NotImplementedError
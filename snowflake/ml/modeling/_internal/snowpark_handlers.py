@@ -1,18 +1,18 @@
+import hashlib
 import importlib
 import inspect
-import io
+import logging
 import os
 import posixpath
-import sys
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from uuid import uuid4
 
 import cloudpickle as cp
 import numpy as np
 import pandas as pd
 import sklearn
-from scipy.stats import rankdata
 from sklearn import model_selection
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 
 from snowflake.ml._internal import telemetry
 from snowflake.ml._internal.env_utils import SNOWML_SPROC_ENV
@@ -27,30 +27,49 @@ from snowflake.ml._internal.utils.temp_file_utils import (
     cleanup_temp_files,
     get_temp_file_path,
 )
-from snowflake.snowpark import (
-    DataFrame,
-    Session,
-    exceptions as snowpark_exceptions,
-    functions as F,
-)
+from snowflake.ml.modeling._internal import distributed_search_utils
+from snowflake.snowpark import DataFrame, Session, exceptions as snowpark_exceptions
+from snowflake.snowpark._internal.type_utils import type_string_to_type_object
 from snowflake.snowpark._internal.utils import (
     TempObjectType,
     random_name_for_temp_object,
 )
-from snowflake.snowpark.functions import col, pandas_udf, sproc, udtf
+from snowflake.snowpark.functions import pandas_udf, sproc, udtf
 from snowflake.snowpark.stored_procedure import StoredProcedure
 from snowflake.snowpark.types import (
-    IntegerType,
+    BooleanType,
+    DataType,
+    PandasDataFrame,
+    PandasDataFrameType,
     PandasSeries,
+    PandasSeriesType,
     StringType,
-    StructField,
-    StructType,
+    VariantType,
+    _NumericType,
 )
+from snowflake.snowpark.udf import UserDefinedFunction
 
 cp.register_pickle_by_value(inspect.getmodule(get_temp_file_path))
 cp.register_pickle_by_value(inspect.getmodule(identifier.get_inferred_name))
+cp.register_pickle_by_value(distributed_search_utils)
 
 _PROJECT = "ModelDevelopment"
+# Packages the distributed search stored procedures and UDTFs need on top of the estimator's dependencies.
+_SEARCH_PACKAGES = [
+    "snowflake-snowpark-python<2",
+    "fastparquet<2023.11",
+    "pyarrow<14",
+    "cachetools<5",
+]
+
+logger = logging.getLogger(__name__)
+
+_RegisteredT = TypeVar("_RegisteredT")
+
+# Input column types that can be passed to the columnar batch inference UDF as typed pandas columns.
+_COLUMNAR_INPUT_TYPES = (_NumericType, StringType, BooleanType)
+# Number of rows of the partitions the columnar batch inference UDTF is called on. Each partition is held in memory.
+_COLUMNAR_BATCH_INFERENCE_PARTITION_ROWS = 10_000
 
 
 class WrapperProvider:
@@ -60,7 +79,7 @@ class WrapperProvider:
 
     def get_fit_wrapper_function(
         self,
-    ) -> Callable[[Any, List[str], str, str, List[str], List[str], Optional[str], Dict[str, str]], str]:
+    ) -> Callable[[Any, List[str], str, str, List[str], List[str], Optional[str], Dict[str, str], Optional[int]], str]:
         imports = self.imports  # In order for the sproc to not resolve this reference in snowflake.ml
 
         def fit_wrapper_function(
@@ -72,24 +91,20 @@ class WrapperProvider:
             label_cols: List[str],
             sample_weight_col: Optional[str],
             statement_params: Dict[str, str],
+            partial_fit_batch_size: Optional[int],
         ) -> str:
             import inspect
             import os
+            import resource
+            from typing import Iterator
 
             import cloudpickle as cp
+            import numpy as np
             import pandas as pd
 
             for import_name in imports:
                 importlib.import_module(import_name)
 
-            # Execute snowpark queries and obtain the results as pandas dataframe
-            # NB: this implies that the result data must fit into memory.
-            for query in sql_queries[:-1]:
-                _ = session.sql(query).collect(statement_params=statement_params)
-            sp_df = session.sql(sql_queries[-1])
-            df: pd.DataFrame = sp_df.to_pandas(statement_params=statement_params)
-            df.columns = sp_df.columns
-
             local_transform_file_name = get_temp_file_path()
 
             session.file.get(stage_transform_file_name, local_transform_file_name, statement_params=statement_params)
@@ -100,16 +115,68 @@ class WrapperProvider:
             with open(local_transform_file_path, mode="r+b") as local_transform_file_obj:
                 estimator = cp.load(local_transform_file_obj)
 
-            argspec = inspect.getfullargspec(estimator.fit)
-            args = {"X": df[input_cols]}
-            if label_cols:
-                label_arg_name = "Y" if "Y" in argspec.args else "y"
-                args[label_arg_name] = df[label_cols].squeeze()
+            for query in sql_queries[:-1]:
+                _ = session.sql(query).collect(statement_params=statement_params)
+            sp_df = session.sql(sql_queries[-1])
 
-            if sample_weight_col is not None and "sample_weight" in argspec.args:
-                args["sample_weight"] = df[sample_weight_col].squeeze()
+            if partial_fit_batch_size is not None and hasattr(estimator, "partial_fit"):
+                # Stream the query result and fit the estimator incrementally, so that only one batch of
+                # partial_fit_batch_size rows is held in memory at a time.
+                def rebatch(batches: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+                    buffer: List[pd.DataFrame] = []
+                    buffer_len = 0
+                    for batch in batches:
+                        buffer.append(batch)
+                        buffer_len += len(batch)
+                        while buffer_len >= partial_fit_batch_size:
+                            merged = pd.concat(buffer, ignore_index=True) if len(buffer) > 1 else buffer[0]
+                            yield merged.iloc[:partial_fit_batch_size]
+                            rest = merged.iloc[partial_fit_batch_size:]
+                            buffer = [rest]
+                            buffer_len = len(rest)
+                    if buffer_len > 0:
+                        yield pd.concat(buffer, ignore_index=True)
+
+                # partial_fit is often wrapped by a decorator, and inspect.signature follows __wrapped__.
+                partial_fit_params = inspect.signature(estimator.partial_fit).parameters
+                classes = None
+                if label_cols and "classes" in partial_fit_params:
+                    # Classifiers need to know every class on the first partial_fit call. Each label column has its own
+                    # classes, passed as a list for multi-output estimators, e.g. MultiOutputClassifier.
+                    classes_df = sp_df.select(label_cols).distinct().to_pandas(statement_params=statement_params)
+                    classes = [np.unique(classes_df.iloc[:, i]) for i in range(len(label_cols))]
+                    if len(classes) == 1:
+                        classes = classes[0]
+
+                for batch_df in rebatch(sp_df.to_pandas_batches(statement_params=statement_params)):
+                    batch_df.columns = sp_df.columns
+                    args = {"X": batch_df[input_cols]}
+                    if label_cols:
+                        label_arg_name = "Y" if "Y" in partial_fit_params else "y"
+                        args[label_arg_name] = batch_df[label_cols].squeeze(axis=1)
+
+                    if sample_weight_col is not None and "sample_weight" in partial_fit_params:
+                        args["sample_weight"] = batch_df[sample_weight_col]
+
+                    if classes is not None:
+                        args["classes"] = classes
+                    estimator.partial_fit(**args)
+            else:
+                # Execute snowpark queries and obtain the results as pandas dataframe
+                # NB: this implies that the result data must fit into memory.
+                df: pd.DataFrame = sp_df.to_pandas(statement_params=statement_params)
+                df.columns = sp_df.columns
+
+                argspec = inspect.getfullargspec(estimator.fit)
+                args = {"X": df[input_cols]}
+                if label_cols:
+                    label_arg_name = "Y" if "Y" in argspec.args else "y"
+                    args[label_arg_name] = df[label_cols].squeeze()
+
+                if sample_weight_col is not None and "sample_weight" in argspec.args:
+                    args["sample_weight"] = df[sample_weight_col].squeeze()
 
-            estimator.fit(**args)
+                estimator.fit(**args)
 
             local_result_file_name = get_temp_file_path()
 
@@ -126,7 +193,9 @@ class WrapperProvider:
 
             # Note: you can add something like  + "|" + str(df) to the return string
             # to pass debug information to the caller.
-            return str(os.path.basename(local_result_file_name))
+            # The peak resident set size of the sproc process, in kilobytes, is passed back to report memory usage.
+            peak_memory_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return str(os.path.basename(local_result_file_name)) + "|" + str(peak_memory_kb)
 
         return fit_wrapper_function
 
@@ -201,7 +270,43 @@ def _get_rand_id() -> str:
     return str(uuid4()).replace("-", "_").upper()
 
 
+def _get_registration_key(func: Callable[..., Any], dependencies: List[str], imports: List[str], *extra: str) -> str:
+    """
+    Compute a content hash identifying a sproc, UDF or UDTF to be registered.
+
+    Two functions with the same serialized code and closure, dependencies and imports behave the same once registered,
+    so the registered function can be reused instead of registering and uploading it again. Functions should read large
+    objects such as estimators from a stage path passed as an argument rather than capture them, so that hashing them
+    stays cheap and the registered function is reused across objects.
+
+    Args:
+        func: Function to be registered. It is hashed through its cloudpickle serialization, which includes the
+            objects captured in its closure.
+        dependencies: Packages the function is registered with.
+        imports: Imports the function is registered with.
+        *extra: Any other registration option that changes the behavior of the registered function.
+
+    Returns:
+        Hex digest usable as a registry key.
+    """
+    digest = hashlib.sha256()
+    digest.update(cp.dumps(func))
+    for part in [*sorted(dependencies), "|", *sorted(imports), "|", *extra]:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 class SnowparkHandlers:
+    # Pass input columns to the batch inference UDF as typed pandas columns instead of packing every row into an
+    # OBJECT. Set to True by importing snowflake.ml.modeling.parameters.enable_columnar_batch_inference.
+    _ENABLE_COLUMNAR_BATCH_INFERENCE = False
+    # Fit estimators exposing partial_fit incrementally over batches of _PARTIAL_FIT_BATCH_SIZE rows streamed from the
+    # query result, with a single pass over the data, instead of loading the whole result in memory. Set to True by
+    # importing snowflake.ml.modeling.parameters.enable_partial_fit, whose set_batch_size sets the batch size.
+    _ENABLE_PARTIAL_FIT = False
+    _PARTIAL_FIT_BATCH_SIZE = 100_000
+
     def __init__(
         self, class_name: str, subproject: str, wrapper_provider: WrapperProvider, autogenerated: Optional[bool] = False
     ) -> None:
@@ -210,33 +315,71 @@ class SnowparkHandlers:
         self._wrapper_provider = wrapper_provider
         self._autogenerated = autogenerated
 
+    def _get_or_register_function(
+        self, session: Session, key: str, register_func: Callable[[], _RegisteredT]
+    ) -> _RegisteredT:
+        """Get a temporary sproc, UDF or UDTF registered in this session with the given key, or register it.
+
+        Args:
+            session: Snowpark session the function is registered in. Temporary functions only live as long as the
+                session, so the registry is attached to it.
+            key: Content hash of the function, see _get_registration_key.
+            register_func: Callable registering the function if there is no entry for the key.
+
+        Returns:
+            The registered sproc, UDF or UDTF.
+        """
+        # If the function already exists, don't register.
+        if not hasattr(session, "_SNOWML_REGISTERED_FUNCTIONS"):
+            session._SNOWML_REGISTERED_FUNCTIONS: Dict[str, Any] = {}  # type: ignore[attr-defined, misc]
+
+        registered_functions: Dict[str, Any] = session._SNOWML_REGISTERED_FUNCTIONS  # type: ignore[attr-defined]
+        if key not in registered_functions:
+            registered_functions[key] = register_func()
+
+        registered_function: _RegisteredT = registered_functions[key]
+        return registered_function
+
+    def _get_batch_inference_stage(self, session: Session) -> str:
+        """Get the temporary stage the estimators used by batch inference are uploaded to, or create it.
+
+        Args:
+            session: Snowpark session the stage is created in. Temporary stages only live as long as the session, so
+                the stage name is attached to it and the stage is dropped with it.
+
+        Returns:
+            The name of the stage.
+        """
+        if not hasattr(session, "_SNOWML_BATCH_INFERENCE_STAGE"):
+            new_stage_name = random_name_for_temp_object(TempObjectType.STAGE)
+            SqlResultValidator(
+                session=session, query=f"CREATE OR REPLACE TEMPORARY STAGE {new_stage_name};"
+            ).has_dimensions(expected_rows=1, expected_cols=1).validate()
+            session._SNOWML_BATCH_INFERENCE_STAGE: str = new_stage_name  # type: ignore[attr-defined, misc]
+
+        stage_name: str = session._SNOWML_BATCH_INFERENCE_STAGE  # type: ignore[attr-defined]
+        return stage_name
+
     def _get_fit_wrapper_sproc(
         self, dependencies: List[str], session: Session, statement_params: Dict[str, str]
     ) -> StoredProcedure:
-        # If the sproc already exists, don't register.
-        if not hasattr(session, "_FIT_WRAPPER_SPROCS"):
-            session._FIT_WRAPPER_SPROCS: Dict[str, StoredProcedure] = {}  # type: ignore[attr-defined, misc]
+        fit_wrapper_function = self._wrapper_provider.get_fit_wrapper_function()
+        fit_sproc_key = _get_registration_key(fit_wrapper_function, dependencies, self._wrapper_provider.imports)
 
-        fit_sproc_key = self._wrapper_provider.__class__.__name__
-        if fit_sproc_key in session._FIT_WRAPPER_SPROCS:  # type: ignore[attr-defined]
-            fit_sproc: StoredProcedure = session._FIT_WRAPPER_SPROCS[fit_sproc_key]  # type: ignore[attr-defined]
-            return fit_sproc
+        def register_fit_wrapper_sproc() -> StoredProcedure:
+            fit_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
 
-        fit_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
-
-        fit_wrapper_sproc = session.sproc.register(
-            func=self._wrapper_provider.get_fit_wrapper_function(),
-            is_permanent=False,
-            name=fit_sproc_name,
-            packages=dependencies,  # type: ignore[arg-type]
-            replace=True,
-            session=session,
-            statement_params=statement_params,
-        )
-
-        session._FIT_WRAPPER_SPROCS[fit_sproc_key] = fit_wrapper_sproc  # type: ignore[attr-defined]
+            return session.sproc.register(
+                func=fit_wrapper_function,
+                is_permanent=False,
+                name=fit_sproc_name,
+                packages=dependencies,  # type: ignore[arg-type]
+                replace=True,
+                session=session,
+                statement_params=statement_params,
+            )
 
-        return fit_wrapper_sproc
+        return self._get_or_register_function(session, fit_sproc_key, register_fit_wrapper_sproc)
 
     def fit_pandas(
         self,
@@ -341,6 +484,7 @@ class SnowparkHandlers:
                 label_cols,
                 sample_weight_col,
                 statement_params,
+                self._PARTIAL_FIT_BATCH_SIZE if self._ENABLE_PARTIAL_FIT else None,
             )
         except snowpark_exceptions.SnowparkClientException as e:
             if "fit() missing 1 required positional argument: 'y'" in str(e):
@@ -353,6 +497,7 @@ class SnowparkHandlers:
         if "|" in sproc_export_file_name:
             fields = sproc_export_file_name.strip().split("|")
             sproc_export_file_name = fields[0]
+            logger.info(f"Peak memory usage of the fit stored procedure: {int(fields[1]) // 1024} MB.")
 
         session.file.get(
             posixpath.join(stage_result_file_name, sproc_export_file_name),
@@ -381,10 +526,9 @@ class SnowparkHandlers:
         *args: Any,
         **kwargs: Any,
     ) -> DataFrame:
-        # Register vectorized UDF for batch inference
-        batch_inference_udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
         snowpark_cols = dataset.select(input_cols).columns
         dataset = snowpark_dataframe_utils.cast_snowpark_dataframe_column_types(dataset)
+        input_types = [field.datatype for field in dataset.select(input_cols).schema.fields]
 
         statement_params = telemetry.get_function_usage_statement_params(
             project=_PROJECT,
@@ -394,26 +538,43 @@ class SnowparkHandlers:
             custom_tags=dict([("autogen", True)]) if self._autogenerated else None,
         )
 
-        @pandas_udf(  # type: ignore[arg-type, misc]
-            is_permanent=False,
-            name=batch_inference_udf_name,
-            packages=dependencies,  # type: ignore[arg-type]
-            replace=True,
-            session=session,
+        # The estimator is staged and its path passed to the UDF as an argument, rather than captured in the UDF, so
+        # that the UDF only depends on the code, the dependencies and the inference options: it is registered once per
+        # session and reused across estimators.
+        estimator_stage_name = self._get_batch_inference_stage(session)
+        local_estimator_file_name = get_temp_file_path()
+        with open(local_estimator_file_name, mode="w+b") as local_estimator_file_obj:
+            cp.dump(estimator, local_estimator_file_obj)
+        session.file.put(
+            local_estimator_file_name,
+            f"@{estimator_stage_name}",
+            auto_compress=False,
+            overwrite=True,
             statement_params=statement_params,
         )
-        def vec_batch_infer(ds: PandasSeries[dict]) -> PandasSeries[dict]:  # type: ignore[type-arg]
-            import numpy as np
-            import pandas as pd
+        cleanup_temp_files([local_estimator_file_name])
+        stage_estimator_file_name = f"@{estimator_stage_name}/{os.path.basename(local_estimator_file_name)}"
+        # SnowflakeFile, which reads the staged estimator, comes with Snowpark.
+        udf_dependencies = ["snowflake-snowpark-python", *dependencies]
+
+        # The estimator last loaded by the current UDF process, by stage path. The UDF is reused across estimators, so
+        # only the latest one is kept to bound the memory of the process.
+        loaded_estimators: Dict[str, Any] = {}
 
-            input_df = pd.json_normalize(ds)
+        def _load_estimator(stage_file_name: str) -> Any:
+            if stage_file_name not in loaded_estimators:
+                from snowflake.snowpark.files import SnowflakeFile
 
-            # pd.json_normalize() doesn't remove quotes around quoted identifiers like snowpakr_df.to_pandas().
-            # But trained models have unquoted input column names saved in internal state if trained using snowpark_df
-            # or quoted input column names saved in internal state if trained using pandas_df.
-            # Model expects exact same columns names in the input df for predict call.
+                loaded_estimators.clear()
+
+                with SnowflakeFile.open(stage_file_name, "rb", require_scoped_url=False) as estimator_file:
+                    loaded_estimators[stage_file_name] = cp.load(estimator_file)
+            return loaded_estimators[stage_file_name]
+
+        def _infer(estimator: Any, input_df: pd.DataFrame) -> pd.DataFrame:
+            import numpy as np
+            import pandas as pd
 
-            input_df = input_df[input_cols]  # Select input columns with quoted column names.
             if hasattr(estimator, "feature_names_in_"):
                 missing_features = []
                 for i, f in enumerate(getattr(estimator, "feature_names_in_", {})):
@@ -470,7 +631,7 @@ class SnowparkHandlers:
             else:
                 transformed_pandas_df = pd.DataFrame(transformed_numpy_array, columns=expected_output_cols_list)
 
-            return transformed_pandas_df.to_dict("records")  # type: ignore[no-any-return]
+            return transformed_pandas_df
 
         batch_inference_table_name = f"SNOWML_BATCH_INFERENCE_INPUT_TABLE_{_get_rand_id()}"
 
@@ -480,25 +641,198 @@ class SnowparkHandlers:
         outer_select_list = pass_through_columns[:]
         inner_select_list = pass_through_columns[:]
 
-        outer_select_list.extend(
-            [
-                "{object_name}:{column_name}{udf_datatype} as {column_name}".format(
-                    object_name=batch_inference_udf_name,
-                    column_name=identifier.get_inferred_name(c),
+        columnar = self._ENABLE_COLUMNAR_BATCH_INFERENCE and all(
+            isinstance(input_type, _COLUMNAR_INPUT_TYPES) for input_type in input_types
+        )
+        output_type: Optional[DataType] = (
+            type_string_to_type_object(expected_output_cols_type) if expected_output_cols_type else None
+        )
+        pass_through_types = (
+            [field.datatype for field in dataset.select(pass_through_columns).schema.fields]
+            if pass_through_columns
+            else []
+        )
+
+        if columnar and len(expected_output_cols_list) == 1:
+            # Columnar mode: the UDF receives the input columns as typed pandas columns, and returns the typed output
+            # column directly, so no per-row object is built on either side.
+            return_type: DataType = output_type if output_type is not None else VariantType()
+
+            def vec_columnar_batch_infer(ds: pd.DataFrame) -> pd.Series:
+                # The first column is the stage path of the estimator, the same on every row.
+                return _infer(_load_estimator(ds.iloc[0, 0]), ds.iloc[:, 1:]).iloc[:, 0]
+
+            def register_vec_columnar_batch_infer() -> UserDefinedFunction:
+                # Register vectorized UDF for batch inference
+                return pandas_udf(  # type: ignore[return-value]
+                    vec_columnar_batch_infer,
+                    is_permanent=False,
+                    name=random_name_for_temp_object(TempObjectType.FUNCTION),
+                    packages=udf_dependencies,  # type: ignore[arg-type]
+                    replace=True,
+                    session=session,
+                    statement_params=statement_params,
+                    input_types=[PandasDataFrameType([StringType(), *input_types])],
+                    return_type=PandasSeriesType(return_type),
+                )
+
+            batch_inference_udf = self._get_or_register_function(
+                session,
+                _get_registration_key(
+                    vec_columnar_batch_infer, udf_dependencies, [], repr(input_types), repr(return_type)
+                ),
+                register_vec_columnar_batch_infer,
+            )
+            batch_inference_udf_name = batch_inference_udf.name
+
+            outer_select_list.append(
+                "{udf_name}{udf_datatype} as {column_name}".format(
+                    udf_name=batch_inference_udf_name,
+                    column_name=identifier.get_inferred_name(expected_output_cols_list[0]),
                     udf_datatype=(f"::{expected_output_cols_type}" if expected_output_cols_type else ""),
                 )
-                for c in expected_output_cols_list
-            ]
-        )
+            )
 
-        inner_select_list.extend(
-            [
-                "{udf_name}(object_construct_keep_null({input_cols_dict})) AS {udf_name}".format(
+            inner_select_list.append(
+                "{udf_name}('{estimator_file_name}', {input_cols}) AS {udf_name}".format(
                     udf_name=batch_inference_udf_name,
-                    input_cols_dict=", ".join([f"'{c}', {c}" for c in input_cols]),
+                    estimator_file_name=stage_estimator_file_name,
+                    input_cols=", ".join(input_cols),
                 )
+            )
+        elif (
+            columnar
+            and isinstance(output_type, _COLUMNAR_INPUT_TYPES)
+            and all(isinstance(pass_through_type, _COLUMNAR_INPUT_TYPES) for pass_through_type in pass_through_types)
+        ):
+            # Columnar mode with several outputs: a scalar UDF returns a single column, so a vectorized UDTF returns
+            # every output as a typed column of its own. It gets the rows in partitions of about
+            # _COLUMNAR_BATCH_INFERENCE_PARTITION_ROWS rows, and returns the pass through columns next to the outputs
+            # as its rows are not matched with the input rows.
+            output_names = [
+                *pass_through_columns,
+                *[identifier.get_inferred_name(c) for c in expected_output_cols_list],
             ]
-        )
+            output_schema = PandasDataFrameType(
+                [*pass_through_types, *[output_type] * len(expected_output_cols_list)], output_names
+            )
+            udtf_input_types = [StringType(), *input_types, *pass_through_types]
+            n_input_cols = len(input_cols)
+
+            class ColumnarBatchInfer:
+                def end_partition(self, ds: pd.DataFrame) -> pd.DataFrame:
+                    import pandas as pd
+
+                    # The first column is the stage path of the estimator, the same on every row.
+                    transformed_pandas_df = _infer(_load_estimator(ds.iloc[0, 0]), ds.iloc[:, 1 : 1 + n_input_cols])
+                    output_df = pd.concat(
+                        [ds.iloc[:, 1 + n_input_cols :].reset_index(drop=True), transformed_pandas_df], axis=1
+                    )
+                    output_df.columns = output_names
+                    return output_df
+
+            def register_columnar_batch_infer() -> Any:
+                return session.udtf.register(
+                    ColumnarBatchInfer,
+                    output_schema=output_schema,
+                    input_types=[PandasDataFrameType(udtf_input_types)],
+                    is_permanent=False,
+                    name=random_name_for_temp_object(TempObjectType.TABLE_FUNCTION),
+                    packages=udf_dependencies,  # type: ignore[arg-type]
+                    replace=True,
+                    statement_params=statement_params,
+                )
+
+            batch_inference_udtf = self._get_or_register_function(
+                session,
+                _get_registration_key(
+                    ColumnarBatchInfer, udf_dependencies, [], repr(udtf_input_types), repr(output_schema)
+                ),
+                register_columnar_batch_infer,
+            )
+            batch_inference_udtf_name = batch_inference_udtf.name
+            partition_col_name = f"SNOWML_BATCH_INFERENCE_PARTITION_{_get_rand_id()}"
+
+            # SEQ8 numbers the rows without ordering them, so that the partitions are built without a global sort.
+            sql = """WITH {input_table_name} AS ({query})
+                    SELECT
+                      {output_cols}
+                    FROM (
+                      SELECT *, FLOOR(SEQ8() / {partition_rows}) AS {partition_col_name}
+                      FROM {input_table_name}
+                    ),
+                    TABLE(
+                      {udtf_name}('{estimator_file_name}', {udtf_input_cols})
+                      OVER (PARTITION BY {partition_col_name})
+                    ) AS {udtf_name}
+               """.format(
+                input_table_name=batch_inference_table_name,
+                query=query_from_df,
+                output_cols=", ".join(f"{batch_inference_udtf_name}.{c}" for c in output_names),
+                partition_rows=_COLUMNAR_BATCH_INFERENCE_PARTITION_ROWS,
+                partition_col_name=partition_col_name,
+                udtf_name=batch_inference_udtf_name,
+                estimator_file_name=stage_estimator_file_name,
+                udtf_input_cols=", ".join([*input_cols, *pass_through_columns]),
+            )
+            return session.sql(sql)
+        else:
+
+            def vec_batch_infer(ds: PandasDataFrame[str, dict]) -> PandasSeries[dict]:  # type: ignore[type-arg]
+                import pandas as pd
+
+                # The first column is the stage path of the estimator, the same on every row.
+                estimator = _load_estimator(ds.iloc[0, 0])
+                input_df = pd.json_normalize(ds.iloc[:, 1])
+
+                # pd.json_normalize() doesn't remove quotes around quoted identifiers like snowpakr_df.to_pandas().
+                # But trained models have unquoted input column names saved in internal state if trained using
+                # snowpark_df or quoted input column names saved in internal state if trained using pandas_df.
+                # Model expects exact same columns names in the input df for predict call.
+
+                input_df = input_df[input_cols]  # Select input columns with quoted column names.
+                return _infer(estimator, input_df).to_dict("records")  # type: ignore[no-any-return]
+
+            def register_vec_batch_infer() -> UserDefinedFunction:
+                # Register vectorized UDF for batch inference
+                return pandas_udf(  # type: ignore[return-value]
+                    vec_batch_infer,
+                    is_permanent=False,
+                    name=random_name_for_temp_object(TempObjectType.FUNCTION),
+                    packages=udf_dependencies,  # type: ignore[arg-type]
+                    replace=True,
+                    session=session,
+                    statement_params=statement_params,
+                )
+
+            batch_inference_udf = self._get_or_register_function(
+                session, _get_registration_key(vec_batch_infer, udf_dependencies, []), register_vec_batch_infer
+            )
+            batch_inference_udf_name = batch_inference_udf.name
+
+            outer_select_list.extend(
+                [
+                    "{object_name}:{column_name}{udf_datatype} as {column_name}".format(
+                        object_name=batch_inference_udf_name,
+                        column_name=identifier.get_inferred_name(c),
+                        udf_datatype=(f"::{expected_output_cols_type}" if expected_output_cols_type else ""),
+                    )
+                    for c in expected_output_cols_list
+                ]
+            )
+
+            inner_select_list.extend(
+                [
+                    (
+                        "{udf_name}('{estimator_file_name}', object_construct_keep_null({input_cols_dict}))"
+                        " AS {udf_name}"
+                    ).format(
+                        udf_name=batch_inference_udf_name,
+                        estimator_file_name=stage_estimator_file_name,
+                        input_cols_dict=", ".join([f"'{c}', {c}" for c in input_cols]),
+                    )
+                ]
+            )
 
         sql = """WITH {input_table_name} AS ({query})
                     SELECT
@@ -591,7 +925,6 @@ class SnowparkHandlers:
 
         # Use posixpath to construct stage paths
         stage_score_file_name = posixpath.join(score_stage_name, os.path.basename(local_score_file_name))
-        score_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
         statement_params = telemetry.get_function_usage_statement_params(
             project=_PROJECT,
             subproject=self._subproject,
@@ -610,16 +943,7 @@ class SnowparkHandlers:
             statement_params=statement_params,
         )
 
-        @sproc(  # type: ignore[misc]
-            is_permanent=False,
-            name=score_sproc_name,
-            packages=dependencies,  # type: ignore[arg-type]
-            replace=True,
-            session=session,
-            statement_params=statement_params,
-            anonymous=True,
-        )
-        def score_wrapper_sproc(
+        def score_wrapper_function(
             session: Session,
             sql_queries: List[str],
             stage_score_file_name: str,
@@ -667,6 +991,24 @@ class SnowparkHandlers:
             result: float = estimator.score(**args)
             return result
 
+        def register_score_wrapper_sproc() -> StoredProcedure:
+            return sproc(  # type: ignore[return-value]
+                score_wrapper_function,
+                is_permanent=False,
+                name=random_name_for_temp_object(TempObjectType.PROCEDURE),
+                packages=dependencies,  # type: ignore[arg-type]
+                replace=True,
+                session=session,
+                statement_params=statement_params,
+                anonymous=True,
+            )
+
+        score_wrapper_sproc = self._get_or_register_function(
+            session,
+            _get_registration_key(score_wrapper_function, dependencies, score_sproc_imports),
+            register_score_wrapper_sproc,
+        )
+
         # Call score sproc
         statement_params = telemetry.get_function_usage_statement_params(
             project=_PROJECT,
@@ -691,25 +1033,19 @@ class SnowparkHandlers:
 
         return score
 
-    def fit_search_snowpark(
-        self,
-        param_grid: Union[model_selection.ParameterGrid, model_selection.ParameterSampler],
-        dataset: DataFrame,
-        session: Session,
-        estimator: Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV],
-        dependencies: List[str],
-        udf_imports: List[str],
-        input_cols: List[str],
-        label_cols: List[str],
-        sample_weight_col: Optional[str],
-    ) -> Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV]:
-        from itertools import product
+    def _stage_search_inputs(
+        self, session: Session, dataset: DataFrame, search_state: Any
+    ) -> Tuple[str, List[str], str]:
+        """Create a temp stage holding the dataset and the pickled search state for a distributed search.
 
-        import cachetools
-        from sklearn.base import clone, is_classifier
-        from sklearn.calibration import check_cv
+        Args:
+            session: Snowpark session.
+            dataset: Training dataset.
+            search_state: Object to pickle for the stored procedure.
 
-        # Create one stage for data and for estimators.
+        Returns:
+            The stage name, the imports of the stored procedure and the staged path of the search state.
+        """
         temp_stage_name = random_name_for_temp_object(TempObjectType.STAGE)
         temp_stage_creation_query = f"CREATE OR REPLACE TEMP STAGE {temp_stage_name};"
         session.sql(temp_stage_creation_query).collect()
@@ -722,60 +1058,47 @@ class SnowparkHandlers:
         )
         imports = [f"@{row.name}" for row in session.sql(f"LIST @{temp_stage_name}").collect()]
 
-        # Store GridSearchCV's refit variable. If user set it as False, we don't need to refit it again
-        original_refit = estimator.refit
+        # Put the serialized search state on stage.
+        search_state_location = distributed_search_utils.stage_object(session, temp_stage_name, search_state)
+        return temp_stage_name, imports, posixpath.join(temp_stage_name, search_state_location)
 
-        # Create a temp file and dump the estimator to that file.
-        estimator_file_name = get_temp_file_path()
-        params_to_evaluate = []
-        for param_to_eval in list(param_grid):
-            for k, v in param_to_eval.items():
-                param_to_eval[k] = [v]
-            params_to_evaluate.append([param_to_eval])
-
-        with open(estimator_file_name, mode="w+b") as local_estimator_file_obj:
-            # Set GridSearchCV refit as False and fit it again after retrieving the best param
-            estimator.refit = False
-            cp.dump(dict(estimator=estimator, param_grid=params_to_evaluate), local_estimator_file_obj)
-        stage_estimator_file_name = posixpath.join(temp_stage_name, os.path.basename(estimator_file_name))
-        sproc_statement_params = telemetry.get_function_usage_statement_params(
+    def _get_search_statement_params(self, frame: Any, api_call: Callable[..., Any]) -> Dict[str, Any]:
+        return telemetry.get_function_usage_statement_params(
             project=_PROJECT,
             subproject=self._subproject,
-            function_name=telemetry.get_statement_params_full_func_name(
-                inspect.currentframe(), self.__class__.__name__
-            ),
-            api_calls=[sproc],
-            custom_tags=dict([("autogen", True)]) if self._autogenerated else None,
-        )
-        udtf_statement_params = telemetry.get_function_usage_statement_params(
-            project=_PROJECT,
-            subproject=self._subproject,
-            function_name=telemetry.get_statement_params_full_func_name(
-                inspect.currentframe(), self.__class__.__name__
-            ),
-            api_calls=[udtf],
+            function_name=telemetry.get_statement_params_full_func_name(frame, self.__class__.__name__),
+            api_calls=[api_call],
             custom_tags=dict([("autogen", True)]) if self._autogenerated else None,
         )
 
-        # Put locally serialized estimator on stage.
-        put_result = session.file.put(
-            estimator_file_name,
-            temp_stage_name,
-            auto_compress=False,
-            overwrite=True,
+    def fit_search_snowpark(
+        self,
+        param_grid: Union[model_selection.ParameterGrid, model_selection.ParameterSampler],
+        dataset: DataFrame,
+        session: Session,
+        estimator: Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV],
+        dependencies: List[str],
+        udf_imports: List[str],
+        input_cols: List[str],
+        label_cols: List[str],
+        sample_weight_col: Optional[str],
+    ) -> Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV]:
+        from sklearn.base import clone, is_classifier
+        from sklearn.calibration import check_cv
+
+        # Store GridSearchCV's refit variable. If user set it as False, we don't need to refit it again
+        original_refit = estimator.refit
+        candidate_params = list(param_grid)
+        # Set GridSearchCV refit as False and fit it again after retrieving the best param
+        estimator.refit = False
+        temp_stage_name, imports, stage_estimator_file_name = self._stage_search_inputs(
+            session, dataset, dict(estimator=estimator, candidate_params=candidate_params)
         )
-        estimator_location = put_result[0].target
-        imports.append(f"@{temp_stage_name}/{estimator_location}")
+        sproc_statement_params = self._get_search_statement_params(inspect.currentframe(), sproc)
+        udtf_statement_params = self._get_search_statement_params(inspect.currentframe(), udtf)
 
         search_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
-        random_udtf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
-
-        required_deps = dependencies + [
-            "snowflake-snowpark-python<2",
-            "fastparquet<2023.11",
-            "pyarrow<14",
-            "cachetools<5",
-        ]
+        required_deps = dependencies + _SEARCH_PACKAGES
 
         @sproc(  # type: ignore[misc]
             is_permanent=False,
@@ -794,248 +1117,39 @@ class SnowparkHandlers:
             input_cols: List[str],
             label_cols: List[str],
         ) -> str:
-            import os
             import time
-            from typing import Iterator
 
-            import cloudpickle as cp
-            import pandas as pd
-            import pyarrow.parquet as pq
             from sklearn.metrics import check_scoring
             from sklearn.metrics._scorer import _check_multimetric_scoring
+            from sklearn.model_selection._validation import (
+                _insert_error_scores,
+                _warn_or_raise_about_fit_failures,
+            )
 
             for import_name in udf_imports:
                 importlib.import_module(import_name)
 
-            data_files = [
-                filename
-                for filename in os.listdir(sys._xoptions["snowflake_import_directory"])
-                if filename.startswith(temp_stage_name)
-            ]
-            partial_df = [
-                pq.read_table(os.path.join(sys._xoptions["snowflake_import_directory"], file_name)).to_pandas()
-                for file_name in data_files
-            ]
-            df = pd.concat(partial_df, ignore_index=True)
-            df.columns = [identifier.get_inferred_name(col) for col in df.columns]
-
-            X = df[input_cols]
-            y = df[label_cols].squeeze()
-
-            local_estimator_file_name = get_temp_file_path()
-            session.file.get(stage_estimator_file_name, local_estimator_file_name)
-
-            local_estimator_file_path = os.path.join(
-                local_estimator_file_name, os.listdir(local_estimator_file_name)[0]
-            )
-            with open(local_estimator_file_path, mode="r+b") as local_estimator_file_obj:
-                estimator = cp.load(local_estimator_file_obj)["estimator"]
+            df = distributed_search_utils.read_staged_data(temp_stage_name)
 
-            cv_orig = check_cv(estimator.cv, y, classifier=is_classifier(estimator.estimator))
-            indices = [test for _, test in cv_orig.split(X, y)]
-            local_indices_file_name = get_temp_file_path()
-            with open(local_indices_file_name, mode="w+b") as local_indices_file_obj:
-                cp.dump(indices, local_indices_file_obj)
-
-            # Put locally serialized indices on stage.
-            put_result = session.file.put(
-                local_indices_file_name,
-                temp_stage_name,
-                auto_compress=False,
-                overwrite=True,
-            )
-            indices_location = put_result[0].target
-            imports.append(f"@{temp_stage_name}/{indices_location}")
-            indices_len = len(indices)
+            estimator_objects = distributed_search_utils.load_staged_object(session, stage_estimator_file_name)
+            estimator = estimator_objects["estimator"]
+            candidate_params = estimator_objects["candidate_params"]
 
             assert estimator is not None
 
-            @cachetools.cached(cache={})
-            def _load_data_into_udf() -> Tuple[
-                Dict[str, pd.DataFrame],
-                Union[model_selection.GridSearchCV, model_selection.RandomizedSearchCV],
-                pd.DataFrame,
-                int,
-                List[Dict[str, Any]],
-            ]:
-                import pyarrow.parquet as pq
-
-                data_files = [
-                    filename
-                    for filename in os.listdir(sys._xoptions["snowflake_import_directory"])
-                    if filename.startswith(temp_stage_name)
-                ]
-                partial_df = [
-                    pq.read_table(os.path.join(sys._xoptions["snowflake_import_directory"], file_name)).to_pandas()
-                    for file_name in data_files
-                ]
-                df = pd.concat(partial_df, ignore_index=True)
-                df.columns = [identifier.get_inferred_name(col) for col in df.columns]
-
-                # load estimator
-                local_estimator_file_path = os.path.join(
-                    sys._xoptions["snowflake_import_directory"], f"{estimator_location}"
-                )
-                with open(local_estimator_file_path, mode="rb") as local_estimator_file_obj:
-                    estimator_objects = cp.load(local_estimator_file_obj)
-                    estimator = estimator_objects["estimator"]
-                    params_to_evaluate = estimator_objects["param_grid"]
-
-                # load indices
-                local_indices_file_path = os.path.join(
-                    sys._xoptions["snowflake_import_directory"], f"{indices_location}"
-                )
-                with open(local_indices_file_path, mode="rb") as local_indices_file_obj:
-                    indices = cp.load(local_indices_file_obj)
-
-                argspec = inspect.getfullargspec(estimator.fit)
-                args = {"X": df[input_cols]}
-
-                if label_cols:
-                    label_arg_name = "Y" if "Y" in argspec.args else "y"
-                    args[label_arg_name] = df[label_cols].squeeze()
-
-                if sample_weight_col is not None and "sample_weight" in argspec.args:
-                    args["sample_weight"] = df[sample_weight_col].squeeze()
-                return args, estimator, indices, len(df), params_to_evaluate
-
-            class SearchCV:
-                def __init__(self) -> None:
-                    args, estimator, indices, data_length, params_to_evaluate = _load_data_into_udf()
-                    self.args = args
-                    self.estimator = estimator
-                    self.indices = indices
-                    self.data_length = data_length
-                    self.params_to_evaluate = params_to_evaluate
-
-                def process(self, params_idx: int, idx: int) -> Iterator[Tuple[str]]:
-                    if hasattr(estimator, "param_grid"):
-                        self.estimator.param_grid = self.params_to_evaluate[params_idx]
-                    else:
-                        self.estimator.param_distributions = self.params_to_evaluate[params_idx]
-                    full_indices = np.array([i for i in range(self.data_length)])
-                    test_indice = self.indices[idx]
-                    train_indice = np.setdiff1d(full_indices, test_indice)
-                    self.estimator.cv = [(train_indice, test_indice)]
-                    self.estimator.fit(**self.args)
-                    binary_cv_results = None
-                    with io.BytesIO() as f:
-                        cp.dump(self.estimator.cv_results_, f)
-                        f.seek(0)
-                        binary_cv_results = f.getvalue().hex()
-                    yield (binary_cv_results,)
-
-                def end_partition(self) -> None:
-                    ...
-
-            session.udtf.register(
-                SearchCV,
-                output_schema=StructType([StructField("CV_RESULTS", StringType())]),
-                input_types=[IntegerType(), IntegerType()],
-                name=random_udtf_name,
-                packages=required_deps,  # type: ignore[arg-type]
-                replace=True,
-                is_permanent=False,
-                imports=imports,  # type: ignore[arg-type]
-                statement_params=udtf_statement_params,
-            )
-
-            HP_TUNING = F.table_function(random_udtf_name)
-
-            idx_length = int(indices_len)
-            params_length = len(param_grid)
-            idxs = [i for i in range(idx_length)]
-            param_indices, training_indices = [], []
-            for param_idx, cv_idx in product([param_index for param_index in range(params_length)], idxs):
-                param_indices.append(param_idx)
-                training_indices.append(cv_idx)
-
-            pd_df = pd.DataFrame(
-                {
-                    "PARAMS": param_indices,
-                    "TRAIN_IND": training_indices,
-                    "PARAM_INDEX": [i for i in range(idx_length * params_length)],
-                }
-            )
-            df = session.create_dataframe(pd_df)
-            results = df.select(
-                F.cast(df["PARAM_INDEX"], IntegerType()).as_("PARAM_INDEX"),
-                (HP_TUNING(df["PARAMS"], df["TRAIN_IND"]).over(partition_by=df["PARAM_INDEX"])),
+            base_estimator = clone(estimator.estimator)
+            X, y, fit_params = distributed_search_utils.get_fit_args(
+                df, base_estimator, input_cols, label_cols, sample_weight_col
             )
 
-            # cv_result maintains the original order
-            multimetric = False
-            cv_results_ = dict()
-            scorers = set()
-            for i, val in enumerate(results.select("CV_RESULTS").sort(col("PARAM_INDEX")).collect()):
-                # retrieved string had one more double quote in the front and end of the string.
-                # use [1:-1] to remove the extra double quotes
-                hex_str = bytes.fromhex(val[0])
-                with io.BytesIO(hex_str) as f_reload:
-                    each_cv_result = cp.load(f_reload)
-                    for k, v in each_cv_result.items():
-                        cur_cv = i % idx_length
-                        key = k
-                        if "split0_test_" in k:
-                            # For multi-metric evaluation, the scores for all the scorers are available in the
-                            # cv_results_ dict at the keys ending with that scorer’s name ('_<scorer_name>')
-                            # instead of '_score'.
-                            scorers.add(k[len("split0_test_") :])
-                            key = k.replace("split0_test", f"split{cur_cv}_test")
-                        elif k.startswith("param"):
-                            if cur_cv != 0:
-                                key = False
-                        if key:
-                            if key not in cv_results_:
-                                cv_results_[key] = v
-                            else:
-                                cv_results_[key] = np.concatenate([cv_results_[key], v])
-
-            multimetric = len(scorers) > 1
-            # Use numpy to re-calculate all the information in cv_results_ again
-            # Generally speaking, reshape all the results into the (scorers+2, idx_length, params_length) shape,
-            # and average them by the idx_length;
-            # idx_length is the number of cv folds; params_length is the number of parameter combinations
-            scores = [
-                np.reshape(
-                    np.concatenate([cv_results_[f"split{cur_cv}_test_{score}"] for cur_cv in range(idx_length)]),
-                    (idx_length, -1),
-                )
-                for score in scorers
-            ]
-
-            fit_score_test_matrix = np.stack(
-                [
-                    np.reshape(cv_results_["mean_fit_time"], (idx_length, -1)),
-                    np.reshape(cv_results_["mean_score_time"], (idx_length, -1)),
-                ]
-                + scores
-            )
-
-            mean_fit_score_test_matrix = np.mean(fit_score_test_matrix, axis=1)
-            std_fit_score_test_matrix = np.std(fit_score_test_matrix, axis=1)
-            cv_results_["std_fit_time"] = std_fit_score_test_matrix[0]
-            cv_results_["mean_fit_time"] = mean_fit_score_test_matrix[0]
-            cv_results_["std_score_time"] = std_fit_score_test_matrix[1]
-            cv_results_["mean_score_time"] = mean_fit_score_test_matrix[1]
-            for idx, score in enumerate(scorers):
-                cv_results_[f"std_test_{score}"] = std_fit_score_test_matrix[idx + 2]
-                cv_results_[f"mean_test_{score}"] = mean_fit_score_test_matrix[idx + 2]
-                # re-compute the ranking again with mean_test_<score>.
-                cv_results_[f"rank_test_{score}"] = rankdata(-cv_results_[f"mean_test_{score}"], method="min")
-                # The best param is the highest ranking (which is 1) and we choose the first time ranking 1 appeared.
-                # If all scores are `nan`, `rankdata` will also produce an array of `nan` values.
-                # In that case, default to first index.
-                best_param_index = (
-                    np.where(cv_results_[f"rank_test_{score}"] == 1)[0][0]
-                    if not np.isnan(cv_results_[f"rank_test_{score}"]).all()
-                    else 0
-                )
+            cv_orig = check_cv(estimator.cv, y, classifier=is_classifier(estimator.estimator))
+            n_splits = cv_orig.get_n_splits(X, y)
 
-            estimator.cv_results_ = cv_results_
-            estimator.multimetric_ = multimetric
+            # Stage the data once more as an Arrow file, which the UDTF processes memory-map and share.
+            local_data_file_name = get_temp_file_path()
+            distributed_search_utils.write_shared_data(df, local_data_file_name)
+            data_location = distributed_search_utils.stage_file(session, temp_stage_name, local_data_file_name)
 
-            # Reconstruct the sklearn estimator.
             refit_metric = "score"
             if callable(estimator.scoring):
                 scorers = estimator.scoring
@@ -1046,10 +1160,45 @@ class SnowparkHandlers:
                 estimator._check_refit_for_multimetric(scorers)
                 refit_metric = original_refit
 
-            estimator.scorer_ = scorers
+            fit_and_score_kwargs = dict(
+                scorer=scorers,
+                return_train_score=estimator.return_train_score,
+                return_n_test_samples=True,
+                return_times=True,
+                return_parameters=False,
+                error_score=estimator.error_score,
+                verbose=estimator.verbose,
+            )
+
+            out = distributed_search_utils.fit_and_score_in_udtf(
+                session,
+                temp_stage_name,
+                data_location,
+                cv_orig,
+                X,
+                y,
+                base_estimator,
+                candidate_params,
+                fit_and_score_kwargs,
+                input_cols,
+                label_cols,
+                sample_weight_col,
+                required_deps,
+                udtf_statement_params,
+            )
+            _warn_or_raise_about_fit_failures(out, estimator.error_score)
+            # For callable scoring, the return type is only known after calling it. If it returned a dictionary,
+            # the error scores of failed fits can now be inserted with the correct keys.
+            if callable(estimator.scoring):
+                _insert_error_scores(out, estimator.error_score)
 
-            # check refit_metric now for a callabe scorer that is multimetric
+            # cv_results_ is aggregated by sklearn, vectorized over the (candidate, fold) matrix.
+            cv_results_ = estimator._format_results(candidate_params, n_splits, out)
+            estimator.multimetric_ = isinstance(out[0]["test_scores"], dict)
+
+            # check refit_metric now for a callable scorer that is multimetric
             if callable(estimator.scoring) and estimator.multimetric_:
+                estimator._check_refit_for_multimetric(out[0]["test_scores"])
                 refit_metric = original_refit
 
             # For multi-metric evaluation, store the best_index_, best_params_ and
@@ -1061,48 +1210,35 @@ class SnowparkHandlers:
                     # With a non-custom callable, we can select the best score
                     # based on the best index
                     estimator.best_score_ = cv_results_[f"mean_test_{refit_metric}"][estimator.best_index_]
-                estimator.best_params_ = cv_results_["params"][best_param_index]
+                estimator.best_params_ = cv_results_["params"][estimator.best_index_]
 
+            estimator.refit = original_refit
             if original_refit:
-                estimator.best_estimator_ = clone(estimator.estimator).set_params(
+                estimator.best_estimator_ = clone(base_estimator).set_params(
                     **clone(estimator.best_params_, safe=False)
                 )
 
                 # Let the sproc use all cores to refit.
                 estimator.n_jobs = -1 if not estimator.n_jobs else estimator.n_jobs
 
-                # process the input as args
-                argspec = inspect.getfullargspec(estimator.fit)
-                args = {"X": X}
-                if label_cols:
-                    label_arg_name = "Y" if "Y" in argspec.args else "y"
-                    args[label_arg_name] = y
-                if sample_weight_col is not None and "sample_weight" in argspec.args:
-                    args["sample_weight"] = df[sample_weight_col].squeeze()
-                estimator.refit = original_refit
                 refit_start_time = time.time()
-                estimator.best_estimator_.fit(**args)
+                if y is not None:
+                    estimator.best_estimator_.fit(X, y, **fit_params)
+                else:
+                    estimator.best_estimator_.fit(X, **fit_params)
                 refit_end_time = time.time()
                 estimator.refit_time_ = refit_end_time - refit_start_time
 
                 if hasattr(estimator.best_estimator_, "feature_names_in_"):
                     estimator.feature_names_in_ = estimator.best_estimator_.feature_names_in_
 
-            local_result_file_name = get_temp_file_path()
-
-            with open(local_result_file_name, mode="w+b") as local_result_file_obj:
-                cp.dump(estimator, local_result_file_obj)
-
-            session.file.put(
-                local_result_file_name,
-                temp_stage_name,
-                auto_compress=False,
-                overwrite=True,
-            )
+            estimator.scorer_ = scorers
+            estimator.cv_results_ = cv_results_
+            estimator.n_splits_ = n_splits
 
             # Note: you can add something like  + "|" + str(df) to the return string
             # to pass debug information to the caller.
-            return str(os.path.basename(local_result_file_name))
+            return distributed_search_utils.stage_object(session, temp_stage_name, estimator)
 
         sproc_export_file_name = _distributed_search(
             session,
@@ -1111,16 +1247,184 @@ class SnowparkHandlers:
             input_cols,
             label_cols,
         )
+        return distributed_search_utils.load_staged_object(
+            session, posixpath.join(temp_stage_name, sproc_export_file_name)
+        )
 
-        local_estimator_path = get_temp_file_path()
-        session.file.get(
-            posixpath.join(temp_stage_name, sproc_export_file_name),
-            local_estimator_path,
+    def fit_successive_halving_snowpark(
+        self,
+        dataset: DataFrame,
+        session: Session,
+        estimator: Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV],
+        dependencies: List[str],
+        udf_imports: List[str],
+        input_cols: List[str],
+        label_cols: List[str],
+        sample_weight_col: Optional[str],
+    ) -> Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV]:
+        """Run a successive halving search with every round evaluated by a distributed UDTF.
+
+        The stored procedure drives sklearn's own halving schedule. Each round stages the (subsampled) cross validation
+        splits, evaluates every (candidate, fold) pair of the round in its own UDTF partition, and hands the scores back
+        to sklearn, which keeps the best candidates for the next round.
+
+        Args:
+            dataset: Training dataset.
+            session: Snowpark session.
+            estimator: Unfitted halving search estimator.
+            dependencies: Packages the stored procedure and the UDTFs are registered with.
+            udf_imports: Modules imported by the stored procedure before loading the estimator.
+            input_cols: Input columns of the dataset.
+            label_cols: Label columns of the dataset.
+            sample_weight_col: Sample weight column of the dataset, if any.
+
+        Returns:
+            The fitted halving search estimator.
+        """
+        from collections import defaultdict
+
+        from sklearn.base import clone, is_classifier
+        from sklearn.model_selection import check_cv
+
+        temp_stage_name, imports, stage_estimator_file_name = self._stage_search_inputs(session, dataset, estimator)
+        sproc_statement_params = self._get_search_statement_params(inspect.currentframe(), sproc)
+        udtf_statement_params = self._get_search_statement_params(inspect.currentframe(), udtf)
+
+        search_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
+        required_deps = dependencies + _SEARCH_PACKAGES
+
+        @sproc(  # type: ignore[misc]
+            is_permanent=False,
+            name=search_sproc_name,
+            packages=required_deps,  # type: ignore[arg-type]
+            replace=True,
+            session=session,
+            anonymous=True,
+            imports=imports,  # type: ignore[arg-type]
+            statement_params=sproc_statement_params,
         )
+        def _distributed_halving_search(
+            session: Session,
+            imports: List[str],
+            stage_estimator_file_name: str,
+            input_cols: List[str],
+            label_cols: List[str],
+        ) -> str:
+            import time
 
-        with open(os.path.join(local_estimator_path, sproc_export_file_name), mode="r+b") as result_file_obj:
-            fit_estimator = cp.load(result_file_obj)
+            from sklearn.metrics import check_scoring
+            from sklearn.model_selection._validation import (
+                _insert_error_scores,
+                _warn_or_raise_about_fit_failures,
+            )
 
-        cleanup_temp_files([local_estimator_path])
+            for import_name in udf_imports:
+                importlib.import_module(import_name)
 
-        return fit_estimator
+            estimator = distributed_search_utils.load_staged_object(session, stage_estimator_file_name)
+
+            assert estimator is not None
+
+            df = distributed_search_utils.read_staged_data(temp_stage_name)
+            base_estimator = clone(estimator.estimator)
+            X, y, fit_params = distributed_search_utils.get_fit_args(
+                df, base_estimator, input_cols, label_cols, sample_weight_col
+            )
+
+            local_data_file_name = get_temp_file_path()
+            distributed_search_utils.write_shared_data(df, local_data_file_name)
+            data_location = distributed_search_utils.stage_file(session, temp_stage_name, local_data_file_name)
+
+            # Mirror the state that sklearn's successive halving fit() sets up before running the search.
+            estimator._checked_cv_orig = check_cv(estimator.cv, y, classifier=is_classifier(estimator.estimator))
+            estimator._check_input_parameters(X=X, y=y, groups=None)
+            estimator._n_samples_orig = len(X)
+            n_splits = estimator._checked_cv_orig.get_n_splits(X, y)
+            scorer = check_scoring(estimator.estimator, estimator.scoring)
+            fit_and_score_kwargs = dict(
+                scorer=scorer,
+                return_train_score=estimator.return_train_score,
+                return_n_test_samples=True,
+                return_times=True,
+                return_parameters=False,
+                error_score=estimator.error_score,
+                verbose=estimator.verbose,
+            )
+
+            all_candidate_params: List[Dict[str, Any]] = []
+            all_out: List[Dict[str, Any]] = []
+            all_more_results: Dict[str, List[Any]] = defaultdict(list)
+            results: Dict[str, Any] = {}
+
+            def evaluate_candidates(
+                candidate_params: List[Dict[str, Any]], cv: Any, more_results: Dict[str, List[Any]]
+            ) -> Dict[str, Any]:
+                # A UDTF is registered per round, since the subsampled splits of a round are only known once the
+                # previous round has finished.
+                candidate_params = list(candidate_params)
+                out = distributed_search_utils.fit_and_score_in_udtf(
+                    session,
+                    temp_stage_name,
+                    data_location,
+                    cv,
+                    X,
+                    y,
+                    base_estimator,
+                    candidate_params,
+                    fit_and_score_kwargs,
+                    input_cols,
+                    label_cols,
+                    sample_weight_col,
+                    required_deps,
+                    udtf_statement_params,
+                )
+
+                _warn_or_raise_about_fit_failures(out, estimator.error_score)
+                if callable(estimator.scoring):
+                    _insert_error_scores(out, estimator.error_score)
+
+                all_candidate_params.extend(candidate_params)
+                all_out.extend(out)
+                for key, value in more_results.items():
+                    all_more_results[key].extend(value)
+
+                nonlocal results
+                results = estimator._format_results(all_candidate_params, n_splits, all_out, all_more_results)
+                return results
+
+            # sklearn computes the resource schedule, subsamples the splits and prunes the candidates between rounds.
+            estimator._run_search(evaluate_candidates)
+
+            estimator.multimetric_ = False
+            estimator.best_index_ = estimator._select_best_index(estimator.refit, "score", results)
+            estimator.best_score_ = results["mean_test_score"][estimator.best_index_]
+            estimator.best_params_ = results["params"][estimator.best_index_]
+
+            if estimator.refit:
+                estimator.best_estimator_ = clone(clone(base_estimator).set_params(**estimator.best_params_))
+                refit_start_time = time.time()
+                if y is not None:
+                    estimator.best_estimator_.fit(X, y, **fit_params)
+                else:
+                    estimator.best_estimator_.fit(X, **fit_params)
+                estimator.refit_time_ = time.time() - refit_start_time
+
+                if hasattr(estimator.best_estimator_, "feature_names_in_"):
+                    estimator.feature_names_in_ = estimator.best_estimator_.feature_names_in_
+
+            estimator.scorer_ = scorer
+            estimator.cv_results_ = results
+            estimator.n_splits_ = n_splits
+
+            return distributed_search_utils.stage_object(session, temp_stage_name, estimator)
+
+        sproc_export_file_name = _distributed_halving_search(
+            session,
+            imports,
+            stage_estimator_file_name,
+            input_cols,
+            label_cols,
+        )
+        return distributed_search_utils.load_staged_object(
+            session, posixpath.join(temp_stage_name, sproc_export_file_name)
+        )
@@ -1,14 +1,31 @@
-from typing import Any
+import os
+import posixpath
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, Iterator, List, Sequence
 from unittest import mock
 
+import cloudpickle as cp
+import numpy as np
+import pandas as pd
 from absl.testing import absltest, parameterized
+from sklearn.datasets import make_classification
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.linear_model import LinearRegression, LogisticRegression, SGDClassifier
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV, ParameterGrid
+from sklearn.multioutput import MultiOutputClassifier
 
 from snowflake.ml.modeling._internal.snowpark_handlers import (
     LightGBMWrapperProvider,
     SklearnModelSelectionWrapperProvider,
     SklearnWrapperProvider,
+    SnowparkHandlers,
     XGBoostWrapperProvider,
+    _get_registration_key,
 )
+from snowflake.snowpark import DataFrame, Session, functions as F, types as T
+from snowflake.snowpark._internal.utils import TempObjectType
 
 
 class SnowparkHandlersUnitTest(parameterized.TestCase):
@@ -62,6 +79,526 @@ class SnowparkHandlersUnitTest(parameterized.TestCase):
             provider = LightGBMWrapperProvider()
             self.assertEqual(provider.imports, ["lightgbm"])
 
+    def test_get_registration_key(self) -> None:
+        provider = SklearnWrapperProvider()
+        key = _get_registration_key(provider.get_fit_wrapper_function(), provider.dependencies, provider.imports)
+
+        self.assertEqual(
+            key,
+            _get_registration_key(
+                SklearnWrapperProvider().get_fit_wrapper_function(), provider.dependencies, provider.imports
+            ),
+        )
+        self.assertEqual(
+            key,
+            _get_registration_key(
+                provider.get_fit_wrapper_function(), list(reversed(provider.dependencies)), provider.imports
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            _get_registration_key(provider.get_fit_wrapper_function(), provider.dependencies[:-1], provider.imports),
+        )
+        self.assertNotEqual(
+            key,
+            _get_registration_key(XGBoostWrapperProvider().get_fit_wrapper_function(), provider.dependencies, []),
+        )
+        self.assertNotEqual(
+            key,
+            _get_registration_key(
+                provider.get_fit_wrapper_function(), provider.dependencies, provider.imports, "extra"
+            ),
+        )
+
+
+class FitWrapperFunctionTest(parameterized.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = self.create_tempdir().full_path
+        rng = np.random.default_rng(0)
+        self._input_pd = pd.DataFrame(
+            {
+                "A": rng.normal(size=1000),
+                "B": rng.normal(size=1000),
+                "LABEL": rng.integers(0, 3, size=1000),
+                "LABEL_2": rng.integers(5, 7, size=1000),
+            }
+        )
+        self._result_dir = os.path.join(self._tmp_dir, "result")
+
+    def _call_fit_wrapper(
+        self, estimator: object, partial_fit_batch_size: Any, chunk_size: int, label_cols: Sequence[str] = ("LABEL",)
+    ) -> Any:
+        estimator_file = os.path.join(self._tmp_dir, "estimator")
+        with open(estimator_file, mode="w+b") as f:
+            cp.dump(estimator, f)
+
+        def file_get(stage_path: str, local_path: str, **kwargs: Any) -> None:
+            os.makedirs(local_path)
+            os.link(estimator_file, os.path.join(local_path, "estimator"))
+
+        def file_put(local_path: str, stage_path: str, **kwargs: Any) -> None:
+            os.makedirs(self._result_dir)
+            os.link(local_path, os.path.join(self._result_dir, "result"))
+
+        def to_pandas_batches(**kwargs: Any) -> Iterator[pd.DataFrame]:
+            for start in range(0, len(self._input_pd), chunk_size):
+                yield self._input_pd.iloc[start : start + chunk_size].reset_index(drop=True)
+
+        mock_session = mock.MagicMock(spec=Session)
+        mock_session.file = mock.MagicMock()
+        mock_session.file.get.side_effect = file_get
+        mock_session.file.put.side_effect = file_put
+        mock_sp_df = mock_session.sql.return_value
+        mock_sp_df.columns = list(self._input_pd.columns)
+        mock_sp_df.to_pandas.return_value = self._input_pd.copy()
+        mock_sp_df.to_pandas_batches.side_effect = to_pandas_batches
+        mock_sp_df.select.return_value.distinct.return_value.to_pandas.return_value = self._input_pd[
+            list(label_cols)
+        ].drop_duplicates()
+
+        with mock.patch(
+            "snowflake.ml.modeling._internal.snowpark_handlers.get_temp_file_path",
+            side_effect=lambda: tempfile.mktemp(dir=self._tmp_dir),
+        ):
+            fit_wrapper_function = SklearnWrapperProvider().get_fit_wrapper_function()
+            res = fit_wrapper_function(
+                mock_session,
+                ["SELECT * FROM T"],
+                "@STAGE/estimator",
+                "@STAGE",
+                ["A", "B"],
+                list(label_cols),
+                None,
+                {},
+                partial_fit_batch_size,
+            )
+
+        file_name, peak_memory_kb = res.split("|")
+        self.assertGreater(int(peak_memory_kb), 0)
+        with open(os.path.join(self._result_dir, "result"), mode="rb") as result_file:
+            return cp.load(result_file), mock_sp_df
+
+    def test_fit(self) -> None:
+        fit_estimator, mock_sp_df = self._call_fit_wrapper(SGDClassifier(random_state=0), None, 300)
+
+        mock_sp_df.to_pandas_batches.assert_not_called()
+        expected = SGDClassifier(random_state=0).fit(self._input_pd[["A", "B"]], self._input_pd["LABEL"])
+        np.testing.assert_allclose(fit_estimator.coef_, expected.coef_)
+
+    def test_partial_fit(self) -> None:
+        fit_estimator, mock_sp_df = self._call_fit_wrapper(SGDClassifier(random_state=0), 250, 300)
+
+        mock_sp_df.to_pandas.assert_not_called()
+        expected = SGDClassifier(random_state=0)
+        for start in range(0, len(self._input_pd), 250):
+            batch = self._input_pd.iloc[start : start + 250]
+            expected.partial_fit(batch[["A", "B"]], batch["LABEL"], classes=np.array([0, 1, 2]))
+        np.testing.assert_allclose(fit_estimator.coef_, expected.coef_)
+
+    def test_partial_fit_multiple_outputs(self) -> None:
+        fit_estimator, _ = self._call_fit_wrapper(
+            MultiOutputClassifier(SGDClassifier(random_state=0)), 250, 300, ("LABEL", "LABEL_2")
+        )
+
+        expected = MultiOutputClassifier(SGDClassifier(random_state=0))
+        for start in range(0, len(self._input_pd), 250):
+            batch = self._input_pd.iloc[start : start + 250]
+            expected.partial_fit(
+                batch[["A", "B"]], batch[["LABEL", "LABEL_2"]], classes=[np.array([0, 1, 2]), np.array([5, 6])]
+            )
+        for fit_sub_estimator, expected_sub_estimator in zip(fit_estimator.estimators_, expected.estimators_):
+            np.testing.assert_array_equal(fit_sub_estimator.classes_, expected_sub_estimator.classes_)
+            np.testing.assert_allclose(fit_sub_estimator.coef_, expected_sub_estimator.coef_)
+
+    def test_partial_fit_not_supported(self) -> None:
+        fit_estimator, mock_sp_df = self._call_fit_wrapper(LogisticRegression(), 250, 300)
+
+        mock_sp_df.to_pandas_batches.assert_not_called()
+        expected = LogisticRegression().fit(self._input_pd[["A", "B"]], self._input_pd["LABEL"])
+        np.testing.assert_allclose(fit_estimator.coef_, expected.coef_)
+
+
+class SnowparkHandlersBatchInferenceTest(parameterized.TestCase):
+    def setUp(self) -> None:
+        self._handlers = SnowparkHandlers(
+            class_name="test", subproject="subproject", wrapper_provider=SklearnWrapperProvider()
+        )
+        self._input_cols = ["A", "B"]
+        self._input_pd = pd.DataFrame({"A": [1.0, 2.0, 3.0, 4.0], "B": [0.5, 0.1, 0.9, 0.3]})
+
+        self._mock_session = mock.MagicMock(spec=Session)
+        self._mock_session.udf = mock.MagicMock()
+        self._mock_session.file = mock.MagicMock()
+        self._mock_session.file.put.side_effect = self._file_put
+        self._staged_files: Dict[str, str] = {}
+        self._mock_dataset = mock.MagicMock(spec=DataFrame)
+        self._mock_dataset.select.return_value.columns = self._input_cols
+        self._mock_dataset.select.return_value.schema = T.StructType(
+            [T.StructField(c, T.DoubleType()) for c in self._input_cols]
+        )
+        self._mock_dataset.queries = {"queries": ["SELECT A, B, ID FROM T"]}
+
+        patcher = mock.patch(
+            "snowflake.ml.modeling._internal.snowpark_handlers.snowpark_dataframe_utils"
+            ".cast_snowpark_dataframe_column_types",
+            side_effect=lambda df: df,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("snowflake.ml.modeling._internal.snowpark_handlers.SqlResultValidator")
+        self._mock_sql_result_validator = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch(
+            "snowflake.snowpark.files.SnowflakeFile.open",
+            side_effect=lambda stage_path, mode, **kwargs: open(self._staged_files[stage_path], mode),
+        )
+        self._mock_snowflake_file_open = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = False
+
+    def _file_put(self, local_path: str, stage_location: str, **kwargs: Any) -> None:
+        staged_file = os.path.join(self.create_tempdir().full_path, os.path.basename(local_path))
+        shutil.copy(local_path, staged_file)
+        self._staged_files[f"{stage_location}/{os.path.basename(local_path)}"] = staged_file
+
+    def _batch_inference(
+        self, estimator: object, inference_method: str, output_cols: List[str], output_type: str
+    ) -> Any:
+        self._handlers.batch_inference(
+            self._mock_dataset,
+            self._mock_session,
+            estimator,
+            ["numpy", "scikit-learn"],
+            inference_method,
+            self._input_cols,
+            ["ID"],
+            output_cols,
+            output_type,
+        )
+        register_call = self._mock_session.udf.register.call_args
+        sql = self._mock_session.sql.call_args[0][0]
+        return register_call, sql
+
+    def _last_staged_file(self) -> str:
+        return list(self._staged_files)[-1]
+
+    def test_batch_inference_object(self) -> None:
+        estimator = LinearRegression().fit(self._input_pd, [1.0, 2.0, 3.0, 4.0])
+
+        register_call, sql = self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+
+        stage_path = self._last_staged_file()
+        self.assertIn(f"('{stage_path}', object_construct_keep_null('A', A, 'B', B))", sql)
+        self.assertIn(":OUTPUT::FLOAT as OUTPUT", sql)
+
+        udf_func = register_call[0][0]
+        res = udf_func(pd.DataFrame({0: stage_path, 1: self._input_pd.to_dict("records")}))
+        np.testing.assert_allclose([r["OUTPUT"] for r in res], estimator.predict(self._input_pd))
+
+    def test_batch_inference_columnar_single_output(self) -> None:
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        estimator = LinearRegression().fit(self._input_pd, [1.0, 2.0, 3.0, 4.0])
+
+        register_call, sql = self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+
+        stage_path = self._last_staged_file()
+        self.assertNotIn("object_construct_keep_null", sql)
+        self.assertIn(f"('{stage_path}', A, B) AS", sql)
+        self.assertIn("::FLOAT as OUTPUT", sql)
+        self.assertEqual(
+            register_call[1]["input_types"],
+            [T.PandasDataFrameType([T.StringType(), T.DoubleType(), T.DoubleType()])],
+        )
+        self.assertEqual(register_call[1]["return_type"], T.PandasSeriesType(T.FloatType()))
+
+        udf_func = register_call[0][0]
+        res = udf_func(pd.DataFrame([[stage_path, *row] for row in self._input_pd.to_numpy().tolist()]))
+        self.assertIsInstance(res, pd.Series)
+        np.testing.assert_allclose(res.to_numpy(), estimator.predict(self._input_pd))
+
+    def test_batch_inference_columnar_multiple_outputs(self) -> None:
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        schemas = {
+            "A": T.StructField("A", T.DoubleType()),
+            "B": T.StructField("B", T.DoubleType()),
+            "ID": T.StructField("ID", T.LongType()),
+        }
+        self._mock_dataset.select.side_effect = lambda cols: mock.MagicMock(
+            columns=cols, schema=T.StructType([schemas[c] for c in cols])
+        )
+        estimator = LogisticRegression().fit(self._input_pd, [0, 1, 0, 1])
+
+        self._handlers.batch_inference(
+            self._mock_dataset,
+            self._mock_session,
+            estimator,
+            ["numpy", "scikit-learn"],
+            "predict_proba",
+            self._input_cols,
+            ["ID"],
+            ["P_0", "P_1"],
+            "FLOAT",
+        )
+
+        # Every output is a typed column of a vectorized UDTF, instead of an element of an array.
+        self._mock_session.udf.register.assert_not_called()
+        register_call = self._mock_session.udtf.register.call_args
+        self.assertEqual(
+            register_call[1]["input_types"],
+            [T.PandasDataFrameType([T.StringType(), T.DoubleType(), T.DoubleType(), T.LongType()])],
+        )
+        self.assertEqual(
+            register_call[1]["output_schema"],
+            T.PandasDataFrameType([T.LongType(), T.FloatType(), T.FloatType()], ["ID", "P_0", "P_1"]),
+        )
+        udtf_name = self._mock_session.udtf.register.return_value.name
+        stage_path = self._last_staged_file()
+        sql = self._mock_session.sql.call_args[0][0]
+        self.assertIn(f"{udtf_name}.ID, {udtf_name}.P_0, {udtf_name}.P_1", sql)
+        self.assertIn(f"{udtf_name}('{stage_path}', A, B, ID)", sql)
+        self.assertIn("OVER (PARTITION BY SNOWML_BATCH_INFERENCE_PARTITION_", sql)
+        self.assertNotIn("object_construct_keep_null", sql)
+
+        handler = register_call[0][0]()
+        ids = [10, 11, 12, 13]
+        # Partitions do not start at index 0.
+        partition = pd.DataFrame(
+            [[stage_path, *row, i] for row, i in zip(self._input_pd.to_numpy().tolist(), ids)], index=[4, 5, 6, 7]
+        )
+        res = handler.end_partition(partition)
+        self.assertListEqual(list(res.columns), ["ID", "P_0", "P_1"])
+        self.assertListEqual(res["ID"].tolist(), ids)
+        np.testing.assert_allclose(res[["P_0", "P_1"]].to_numpy(), estimator.predict_proba(self._input_pd))
+
+    def test_batch_inference_columnar_multiple_array_outputs(self) -> None:
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        estimator = LogisticRegression().fit(self._input_pd, [0, 1, 0, 1])
+
+        _, sql = self._batch_inference(estimator, "predict_proba", ["P_0", "P_1"], "ARRAY")
+
+        # Outputs that are not scalars are returned through an OBJECT per row.
+        self._mock_session.udtf.register.assert_not_called()
+        self.assertIn("object_construct_keep_null('A', A, 'B', B)", sql)
+
+    def test_batch_inference_reuses_registered_udf(self) -> None:
+        estimator = LinearRegression().fit(self._input_pd, [1.0, 2.0, 3.0, 4.0])
+
+        self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+        self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+        self.assertEqual(self._mock_session.udf.register.call_count, 1)
+
+        # The estimator is passed to the UDF by stage path, so other estimators reuse the same UDF.
+        other_estimator = LinearRegression().fit(self._input_pd, [4.0, 3.0, 2.0, 1.0])
+        register_call, sql = self._batch_inference(other_estimator, "predict", ["OUTPUT"], "FLOAT")
+        self.assertEqual(self._mock_session.udf.register.call_count, 1)
+        stage_path = self._last_staged_file()
+        self.assertIn(f"('{stage_path}', ", sql)
+        res = register_call[0][0](pd.DataFrame({0: stage_path, 1: self._input_pd.to_dict("records")}))
+        np.testing.assert_allclose([r["OUTPUT"] for r in res], other_estimator.predict(self._input_pd))
+
+        self._batch_inference(estimator, "predict", ["OTHER_OUTPUT"], "FLOAT")
+        self.assertEqual(self._mock_session.udf.register.call_count, 2)
+
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+        self.assertEqual(self._mock_session.udf.register.call_count, 3)
+
+    def test_batch_inference_reuses_stage(self) -> None:
+        estimator = LinearRegression().fit(self._input_pd, [1.0, 2.0, 3.0, 4.0])
+        other_estimator = LinearRegression().fit(self._input_pd, [4.0, 3.0, 2.0, 1.0])
+
+        register_call, _ = self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+        stage_path = self._last_staged_file()
+        self._batch_inference(other_estimator, "predict", ["OUTPUT"], "FLOAT")
+        other_stage_path = self._last_staged_file()
+
+        self._mock_sql_result_validator.assert_called_once()
+        self.assertNotEqual(stage_path, other_stage_path)
+        self.assertEqual(posixpath.dirname(stage_path), posixpath.dirname(other_stage_path))
+
+        # Only the latest estimator is kept by the UDF, so switching back to the first one loads it again.
+        udf_func = register_call[0][0]
+        for path, expected_estimator in [
+            (stage_path, estimator),
+            (stage_path, estimator),
+            (other_stage_path, other_estimator),
+            (stage_path, estimator),
+        ]:
+            res = udf_func(pd.DataFrame({0: path, 1: self._input_pd.to_dict("records")}))
+            np.testing.assert_allclose([r["OUTPUT"] for r in res], expected_estimator.predict(self._input_pd))
+        self.assertEqual(self._mock_snowflake_file_open.call_count, 3)
+
+    def test_batch_inference_columnar_fallback(self) -> None:
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        self._mock_dataset.select.return_value.schema = T.StructType(
+            [T.StructField("A", T.DoubleType()), T.StructField("B", T.VariantType())]
+        )
+        estimator = LinearRegression().fit(self._input_pd, [1.0, 2.0, 3.0, 4.0])
+
+        _, sql = self._batch_inference(estimator, "predict", ["OUTPUT"], "FLOAT")
+
+        self.assertIn("object_construct_keep_null('A', A, 'B', B)", sql)
+
+
+class _FakeTasksDataFrame:
+    """Stands in for the tasks dataframe of a search and evaluates the registered UDTF locally.
+
+    The first two columns of the tasks are the UDTF arguments, the first one is also the partition column, and the
+    third one is the task index used to order the results.
+    """
+
+    def __init__(self, tasks_pd: pd.DataFrame, get_handler: Any) -> None:
+        self._tasks_pd = tasks_pd
+        self._get_handler = get_handler
+
+    def __getitem__(self, name: str) -> Any:
+        return F.col(name)
+
+    def select(self, *args: Any) -> Any:
+        partition_col, arg_col, task_col = self._tasks_pd.columns
+        handler_class = self._get_handler()
+        rows = []
+        for _, partition in self._tasks_pd.groupby(partition_col, sort=False):
+            handler = handler_class()
+            for task in partition.itertuples(index=False):
+                for output in handler.process(getattr(task, partition_col), getattr(task, arg_col)):
+                    rows.append((getattr(task, task_col), output))
+        rows.sort(key=lambda row: row[0])
+        result = mock.MagicMock()
+        result.sort.return_value.select.return_value.collect.return_value = [output for _, output in rows]
+        return result
+
+
+class DistributedSearchTest(parameterized.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = self.create_tempdir().full_path
+        self._import_dir = self.create_tempdir().full_path
+        X, y = make_classification(n_samples=400, n_features=4, random_state=0)
+        self._input_pd = pd.DataFrame(X, columns=["A", "B", "C", "D"])
+        self._input_pd["LABEL"] = y
+        self._registered_handlers: List[Any] = []
+
+    def _run_search(self, method: str, **kwargs: Any) -> Any:
+        def copy_into_location(*args: Any, **kwargs: Any) -> None:
+            # Write the data as two files to exercise the concatenation.
+            for i, start in enumerate(range(0, len(self._input_pd), 250)):
+                self._input_pd.iloc[start : start + 250].to_parquet(
+                    os.path.join(self._import_dir, f"TMP_STAGE_0_0_{i}.parquet")
+                )
+
+        def file_put(local_path: str, stage_path: str, **kwargs: Any) -> Any:
+            shutil.copy(local_path, self._import_dir)
+            return [mock.MagicMock(target=os.path.basename(local_path))]
+
+        def file_get(stage_path: str, local_path: str, **kwargs: Any) -> None:
+            os.makedirs(local_path)
+            shutil.copy(os.path.join(self._import_dir, os.path.basename(stage_path)), local_path)
+
+        def sproc(**kwargs: Any) -> Any:
+            return lambda func: func
+
+        mock_session = mock.MagicMock(spec=Session)
+        mock_session.file = mock.MagicMock()
+        mock_session.file.put.side_effect = file_put
+        mock_session.file.get.side_effect = file_get
+        mock_session.udtf = mock.MagicMock()
+        mock_session.udtf.register.side_effect = lambda handler, **kwargs: self._registered_handlers.append(handler)
+        mock_session.create_dataframe.side_effect = lambda tasks_pd: _FakeTasksDataFrame(
+            tasks_pd, lambda: self._registered_handlers[-1]
+        )
+        mock_dataset = mock.MagicMock(spec=DataFrame)
+        mock_dataset.write.copy_into_location.side_effect = copy_into_location
+
+        handlers = SnowparkHandlers(
+            class_name="test", subproject="subproject", wrapper_provider=SklearnModelSelectionWrapperProvider()
+        )
+        module = "snowflake.ml.modeling._internal.snowpark_handlers"
+        with mock.patch(f"{module}.sproc", new=sproc), mock.patch(
+            f"{module}.snowpark_dataframe_utils.cast_snowpark_dataframe", side_effect=lambda df: df
+        ), mock.patch(
+            f"{module}.random_name_for_temp_object",
+            side_effect=lambda object_type: "TMP_STAGE" if object_type == TempObjectType.STAGE else "TMP_OBJECT",
+        ), mock.patch(
+            f"{module}.get_temp_file_path", side_effect=lambda: tempfile.mktemp(dir=self._tmp_dir)
+        ), mock.patch.dict(
+            sys._xoptions, {"snowflake_import_directory": self._import_dir}
+        ):
+            return getattr(handlers, method)(
+                dataset=mock_dataset,
+                session=mock_session,
+                dependencies=["numpy", "scikit-learn"],
+                udf_imports=["sklearn"],
+                input_cols=["A", "B", "C", "D"],
+                label_cols=["LABEL"],
+                sample_weight_col=None,
+                **kwargs,
+            )
+
+    def _assert_cv_results_equal(self, actual: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        self.assertEqual(actual.keys(), expected.keys())
+        for key, value in expected.items():
+            if key == "params":
+                self.assertEqual(actual[key], value)
+            elif key.startswith("param_"):
+                self.assertEqual(actual[key].tolist(), value.tolist())
+            elif "time" not in key:
+                np.testing.assert_allclose(actual[key], value, rtol=1e-6, err_msg=key)
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"kwargs": {}},
+        {"kwargs": {"scoring": ["accuracy", "f1"], "refit": "f1", "return_train_score": True}},
+        {"kwargs": {"refit": False}},
+    )
+    def test_fit_search_snowpark(self, kwargs: Dict[str, Any]) -> None:
+        def make_search() -> GridSearchCV:
+            return GridSearchCV(
+                LogisticRegression(),
+                param_grid={"C": [0.001, 0.1, 10.0], "fit_intercept": [True, False]},
+                cv=3,
+                **kwargs,
+            )
+
+        search = self._run_search(
+            "fit_search_snowpark", param_grid=ParameterGrid(make_search().param_grid), estimator=make_search()
+        )
+        expected = make_search().fit(self._input_pd[["A", "B", "C", "D"]], self._input_pd["LABEL"])
+
+        self.assertLen(self._registered_handlers, 1)
+        self._assert_cv_results_equal(search.cv_results_, expected.cv_results_)
+        self.assertEqual(search.multimetric_, expected.multimetric_)
+        self.assertEqual(search.refit, expected.refit)
+        if expected.refit:
+            self.assertEqual(search.best_index_, expected.best_index_)
+            self.assertEqual(search.best_params_, expected.best_params_)
+            self.assertAlmostEqual(search.best_score_, expected.best_score_)
+            np.testing.assert_allclose(search.best_estimator_.coef_, expected.best_estimator_.coef_)
+        else:
+            self.assertFalse(hasattr(search, "best_estimator_"))
+
+    def test_fit_successive_halving_snowpark(self) -> None:
+        def make_search() -> HalvingGridSearchCV:
+            return HalvingGridSearchCV(
+                LogisticRegression(),
+                param_grid={"C": [0.001, 0.01, 0.1, 1.0, 10.0, 100.0]},
+                factor=2,
+                random_state=0,
+            )
+
+        search = self._run_search("fit_successive_halving_snowpark", estimator=make_search())
+        expected = make_search().fit(self._input_pd[["A", "B", "C", "D"]], self._input_pd["LABEL"])
+
+        # One UDTF per round, and every round evaluates fewer candidates on more samples.
+        self.assertLen(self._registered_handlers, expected.n_iterations_)
+        self.assertEqual(search.n_candidates_, expected.n_candidates_)
+        self.assertEqual(search.n_resources_, expected.n_resources_)
+        self._assert_cv_results_equal(search.cv_results_, expected.cv_results_)
+        self.assertEqual(search.best_index_, expected.best_index_)
+        self.assertEqual(search.best_params_, expected.best_params_)
+        self.assertAlmostEqual(search.best_score_, expected.best_score_)
+        np.testing.assert_allclose(search.best_estimator_.coef_, expected.best_estimator_.coef_)
+
 
 if __name__ == "__main__":
     absltest.main()
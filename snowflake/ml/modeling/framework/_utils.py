@@ -3,7 +3,7 @@
 import inspect
 import warnings
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
 import sklearn
@@ -22,6 +22,10 @@ from snowflake.snowpark._internal import utils
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
+# maximum number of categories of a column for encoders to encode the column with an inline CASE expression
+# instead of a join with its fitted states
+INLINE_ENCODING_MAX_CATEGORIES = 64
+
 # numeric states to the corresponding Snowpark functions
 NUMERIC_STATE_TO_FUNC_DICT = {
     "count": F.count,
@@ -233,6 +237,33 @@ def _handle_str_bool_type() -> np.vectorize:
     return np.vectorize(str_to_bool)
 
 
+def encode_categories_inline(column: snowpark.Column, encodings: Iterable[Tuple[Any, Any]]) -> snowpark.Column:
+    """
+    Encode the categories of a column with a CASE expression. Null categories match null values,
+    and unknown categories are encoded as null.
+
+    Args:
+        column: Column to encode.
+        encodings: Pairs of fitted category and its encoded value.
+
+    Returns:
+        Encoded column.
+    """
+    encoded_column: Optional[snowpark.CaseExpr] = None
+    for category, encoded_value in encodings:
+        if isinstance(category, np.generic):
+            category = category.item()
+        if isinstance(category, float) and np.isnan(category):
+            category = None
+        condition = column.equal_null(F.lit(category))
+        encoded_column = (
+            F.when(condition, encoded_value)
+            if encoded_column is None
+            else encoded_column.when(condition, encoded_value)
+        )
+    return encoded_column if encoded_column is not None else F.lit(None)
+
+
 def to_native_format(obj: Any) -> Any:
     if "XGB" in obj.__class__.__name__:
         return obj.to_xgboost()
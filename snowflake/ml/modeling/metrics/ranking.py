@@ -1,8 +1,9 @@
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cloudpickle
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import sklearn
 from packaging import version
 from sklearn import metrics
@@ -11,12 +12,24 @@ from snowflake import snowpark
 from snowflake.ml._internal import telemetry
 from snowflake.ml._internal.utils import result
 from snowflake.ml.modeling.metrics import metrics_utils
-from snowflake.snowpark import functions as F
+from snowflake.snowpark import functions as F, types as T
 from snowflake.snowpark._internal import utils as snowpark_utils
 
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
 
+_METHODS = ("sproc", "exact", "approx")
+_SCORE = "SCORE"
+_MAX_SCORE = "MAX_SCORE"
+_TP = "TP"
+_FP = "FP"
+_BIN = "BIN"
+# Limits of the approximate method: the number of passes refining the bins before falling back to the exact method,
+# the number of bins refined per pass and the number of bins a range of scores is split into.
+_APPROX_MAX_PASSES = 4
+_APPROX_MAX_REFINED_BINS = 256
+_APPROX_MAX_BINS = 2**16
+
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
 def precision_recall_curve(
@@ -26,6 +39,8 @@ def precision_recall_curve(
     probas_pred_col_name: str,
     pos_label: Optional[Union[str, int]] = None,
     sample_weight_col_name: Optional[str] = None,
+    method: str = "sproc",
+    tolerance: float = 1e-3,
 ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
     """
     Compute precision-recall pairs for different probability thresholds.
@@ -61,6 +76,20 @@ def precision_recall_curve(
             When ``pos_label=None``, if y_true is in {-1, 1} or {0, 1},
             ``pos_label`` is set to 1, otherwise an error will be raised.
         sample_weight_col_name: Column name representing sample weights.
+        method: {'sproc', 'exact', 'approx'}, default='sproc'
+            How to compute the precision-recall pairs.
+            ``'sproc'``
+                Fetch the columns into a stored procedure and compute it with scikit-learn.
+            ``'exact'``
+                Sum the sample weights of each label per distinct score in SQL, and only fetch
+                one row per distinct score.
+            ``'approx'``
+                Sum the sample weights of each label per bin of scores of equal width
+                (``WIDTH_BUCKET``) in SQL, refining the bins until the error they cause on the
+                ROC AUC is at most ``tolerance``.
+                The returned points are exact points of the curve, at the lowest score of each bin.
+            The SQL methods only support binary labels and ignore the rows with a NULL score.
+        tolerance: Bound on the ROC AUC error with ``method='approx'``, default=1e-3.
 
     Returns:
         Tuple containing following items
@@ -74,6 +103,21 @@ def precision_recall_curve(
                 Increasing thresholds on the decision function used to compute
                 precision and recall.
     """
+    if method != "sproc":
+        y_true, probas_pred, sample_weight = _get_curve_samples(
+            df=df,
+            y_true_col_name=y_true_col_name,
+            y_score_col_name=probas_pred_col_name,
+            pos_label=pos_label,
+            sample_weight_col_name=sample_weight_col_name,
+            method=method,
+            tolerance=tolerance,
+        )
+        precision, recall, thresholds = metrics.precision_recall_curve(
+            y_true, probas_pred, pos_label=1, sample_weight=sample_weight
+        )
+        return precision, recall, thresholds
+
     session = df._session
     assert session is not None
     sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
@@ -133,6 +177,8 @@ def roc_auc_score(
     max_fpr: Optional[float] = None,
     multi_class: str = "raise",
     labels: Optional[npt.ArrayLike] = None,
+    method: str = "sproc",
+    tolerance: float = 1e-3,
 ) -> Union[float, npt.NDArray[np.float_]]:
     """
     Compute Area Under the Receiver Operating Characteristic Curve (ROC AUC)
@@ -211,10 +257,49 @@ def roc_auc_score(
         labels: Only used for multiclass targets. List of labels that index the
             classes in ``y_score``. If ``None``, the numerical or lexicographical
             order of the labels in ``y_true`` is used.
+        method: {'sproc', 'exact', 'approx'}, default='sproc'
+            How to compute the score.
+            ``'sproc'``
+                Fetch the columns into a stored procedure and compute it with scikit-learn.
+            ``'exact'``
+                Sum the sample weights of each label per distinct score in SQL, and only fetch
+                one row per distinct score.
+            ``'approx'``
+                Sum the sample weights of each label per bin of scores of equal width
+                (``WIDTH_BUCKET``) in SQL, refining the bins until the error they cause on the
+                ROC AUC is at most ``tolerance``.
+            The SQL methods only support binary labels and ignore the rows with a NULL score.
+        tolerance: Bound on the ROC AUC error with ``method='approx'``, default=1e-3.
 
     Returns:
         Area Under the Curve score.
+
+    Raises:
+        ValueError: A SQL method is used with several columns of labels or scores, or ``y_true`` does not contain
+            exactly two classes.
     """
+    if method != "sproc":
+        _validate_method(method, tolerance)
+        y_true_cols = metrics_utils.flatten_cols([y_true_col_names])
+        y_score_cols = metrics_utils.flatten_cols([y_score_col_names])
+        if len(y_true_cols) != 1 or len(y_score_cols) != 1:
+            raise ValueError(f"method={method!r} only supports a single column of labels and of scores.")
+        statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+
+        # As in scikit-learn, the greater label is the positive class in the binary case.
+        label_values = _get_label_values(df, y_true_cols[0], statement_params)
+        if len(label_values) > 2:
+            raise ValueError(f"method={method!r} only supports binary y_true.")
+        if len(label_values) < 2:
+            raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+        label_df = _get_label_df(df, y_true_cols[0], y_score_cols[0], max(label_values), sample_weight_col_name)
+
+        if method == "exact" and max_fpr is None:
+            return _get_exact_roc_auc_score(label_df, statement_params)
+        y_true, y_score, sample_weight = _counts_to_samples(_get_counts(label_df, method, tolerance, statement_params))
+        auc: float = metrics.roc_auc_score(y_true, y_score, sample_weight=sample_weight, max_fpr=max_fpr)
+        return auc
+
     session = df._session
     assert session is not None
     sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
@@ -262,8 +347,8 @@ def roc_auc_score(
         return result_module.serialize(session, auc)  # type: ignore[no-any-return]
 
     result_object = result.deserialize(session, roc_auc_score_anon_sproc(session))
-    auc: Union[float, npt.NDArray[np.float_]] = result_object
-    return auc
+    res: Union[float, npt.NDArray[np.float_]] = result_object
+    return res
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -275,6 +360,8 @@ def roc_curve(
     pos_label: Optional[Union[str, int]] = None,
     sample_weight_col_name: Optional[str] = None,
     drop_intermediate: bool = True,
+    method: str = "sproc",
+    tolerance: float = 1e-3,
 ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
     """
     Compute Receiver operating characteristic (ROC).
@@ -297,6 +384,20 @@ def roc_curve(
         drop_intermediate: Whether to drop some suboptimal thresholds which would
             not appear on a plotted ROC curve. This is useful in order to create
             lighter ROC curves.
+        method: {'sproc', 'exact', 'approx'}, default='sproc'
+            How to compute the curve.
+            ``'sproc'``
+                Fetch the columns into a stored procedure and compute it with scikit-learn.
+            ``'exact'``
+                Sum the sample weights of each label per distinct score in SQL, and only fetch
+                one row per distinct score.
+            ``'approx'``
+                Sum the sample weights of each label per bin of scores of equal width
+                (``WIDTH_BUCKET``) in SQL, refining the bins until the error they cause on the
+                ROC AUC is at most ``tolerance``.
+                The returned points are exact points of the curve, at the lowest score of each bin.
+            The SQL methods only support binary labels and ignore the rows with a NULL score.
+        tolerance: Bound on the ROC AUC error with ``method='approx'``, default=1e-3.
 
     Returns:
         Tuple containing following items
@@ -311,6 +412,21 @@ def roc_curve(
                 fpr and tpr. `thresholds[0]` represents no instances being predicted
                 and is arbitrarily set to `max(y_score) + 1`.
     """
+    if method != "sproc":
+        y_true, y_score, sample_weight = _get_curve_samples(
+            df=df,
+            y_true_col_name=y_true_col_name,
+            y_score_col_name=y_score_col_name,
+            pos_label=pos_label,
+            sample_weight_col_name=sample_weight_col_name,
+            method=method,
+            tolerance=tolerance,
+        )
+        fpr, tpr, thresholds = metrics.roc_curve(
+            y_true, y_score, pos_label=1, sample_weight=sample_weight, drop_intermediate=drop_intermediate
+        )
+        return fpr, tpr, thresholds
+
     session = df._session
     assert session is not None
     sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
@@ -360,3 +476,250 @@ def roc_curve(
     res: Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]] = result_object
 
     return res
+
+
+def _validate_method(method: str, tolerance: float) -> None:
+    if method not in _METHODS:
+        raise ValueError(f"method has to be one of {_METHODS}")
+    if not 0 < tolerance < 1:
+        raise ValueError(f"tolerance has to be in (0, 1), got {tolerance}.")
+
+
+def _get_label_values(df: snowpark.DataFrame, y_true_col_name: str, statement_params: Dict[str, str]) -> List[Any]:
+    """Get up to three distinct labels, which are enough to tell binary labels apart.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing true labels.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        List of distinct labels.
+
+    Raises:
+        ValueError: The labels contain NULL.
+    """
+    rows = df.select(y_true_col_name).distinct().limit(3).collect(statement_params=statement_params)
+    label_values = [row[0] for row in rows]
+    if None in label_values:
+        raise ValueError("Input y_true contains NULL.")
+    return label_values
+
+
+def _get_label_df(
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_score_col_name: str,
+    pos_label: Any,
+    sample_weight_col_name: Optional[str],
+) -> snowpark.DataFrame:
+    """Get the score and the sample weight of each row as a positive and as a negative sample.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing true labels.
+        y_score_col_name: Column name representing target scores.
+        pos_label: The label of the positive class.
+        sample_weight_col_name: Column name representing sample weights.
+
+    Returns:
+        Dataframe with the columns [SCORE, TP, FP], without NULL scores.
+    """
+    weight = F.col(sample_weight_col_name) if sample_weight_col_name else F.lit(1)
+    is_positive = F.col(y_true_col_name) == F.lit(pos_label)
+    label_df: snowpark.DataFrame = df.filter(F.col(y_score_col_name).is_not_null()).select(
+        F.col(y_score_col_name).cast(T.DoubleType()).alias(_SCORE),
+        F.iff(is_positive, weight, F.lit(0)).cast(T.DoubleType()).alias(_TP),
+        F.iff(is_positive, F.lit(0), weight).cast(T.DoubleType()).alias(_FP),
+    )
+    return label_df
+
+
+def _get_exact_counts(label_df: snowpark.DataFrame, statement_params: Dict[str, str]) -> pd.DataFrame:
+    counts_df = label_df.group_by(_SCORE).agg(F.sum(_TP).alias(_TP), F.sum(_FP).alias(_FP))
+    counts: pd.DataFrame = counts_df.to_pandas(statement_params=statement_params).astype(np.float64)
+    return counts
+
+
+def _get_bin_counts(
+    label_df: snowpark.DataFrame,
+    score_ranges: List[Tuple[float, float, int]],
+    statement_params: Dict[str, str],
+) -> pd.DataFrame:
+    """Sum the sample weights of each label per bin of scores of equal width in one aggregate query.
+
+    Args:
+        label_df: Dataframe with the columns [SCORE, TP, FP].
+        score_ranges: Disjoint ranges of scores given as (lowest score, highest score, number of bins).
+            The rows out of the ranges are ignored.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Dataframe with the lowest and highest score of each non-empty bin and the sums of the sample weights.
+        Columns: [SCORE, MAX_SCORE, TP, FP].
+    """
+    score = F.col(_SCORE)
+    bins: Optional[snowpark.CaseExpr] = None
+    offset = 0
+    for low, high, n_bins in score_ranges:
+        # WIDTH_BUCKET puts the highest score into the extra bin n_bins + 1.
+        bucket = F.call_function("width_bucket", score, F.lit(low), F.lit(high), F.lit(n_bins)) + F.lit(offset)
+        in_range = score.between(low, high)
+        bins = F.when(in_range, bucket) if bins is None else bins.when(in_range, bucket)
+        offset += n_bins + 2
+    assert bins is not None
+    bin_df = label_df.select(bins.alias(_BIN), _SCORE, _TP, _FP).filter(F.col(_BIN).is_not_null())
+    counts_df = bin_df.group_by(_BIN).agg(
+        F.min(_SCORE).alias(_SCORE),
+        F.max(_SCORE).alias(_MAX_SCORE),
+        F.sum(_TP).alias(_TP),
+        F.sum(_FP).alias(_FP),
+    )
+    counts: pd.DataFrame = (
+        counts_df.select(_SCORE, _MAX_SCORE, _TP, _FP).to_pandas(statement_params=statement_params).astype(np.float64)
+    )
+    return counts
+
+
+def _get_approx_counts(
+    label_df: snowpark.DataFrame, tolerance: float, statement_params: Dict[str, str]
+) -> pd.DataFrame:
+    """Sum the sample weights of each label per bin of scores, with bins fine enough for the ROC AUC to be within
+    tolerance.
+
+    The lowest score of each bin is a threshold of the exact curve, so the curve from the bins only misses the points
+    within bins. Within a bin holding a fraction tp of the positive weight and fp of the negative weight, the exact
+    curve stays in a tp x fp rectangle, so the AUC error is at most the sum of tp * fp / 2 over the bins with several
+    scores. The bins with the largest errors are split until that bound is within tolerance.
+
+    Args:
+        label_df: Dataframe with the columns [SCORE, TP, FP].
+        tolerance: Bound on the ROC AUC error.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Dataframe with the columns [SCORE, TP, FP], and possibly other columns.
+    """
+    low, high = label_df.agg(F.min(_SCORE), F.max(_SCORE)).collect(statement_params=statement_params)[0]
+    if low is None or low == high:
+        return _get_exact_counts(label_df, statement_params)
+
+    max_bins = int(min(np.ceil(1 / tolerance), _APPROX_MAX_BINS))
+    counts = _get_bin_counts(label_df, [(low, high, max_bins)], statement_params)
+    total_weight = counts[_TP].sum() * counts[_FP].sum()
+    if total_weight == 0:
+        return counts
+
+    for n_pass in range(_APPROX_MAX_PASSES + 1):
+        errors = np.where(counts[_SCORE] < counts[_MAX_SCORE], counts[_TP] * counts[_FP], 0) / (2 * total_weight)
+        if errors.sum() <= tolerance:
+            return counts
+        if n_pass == _APPROX_MAX_PASSES:
+            break
+
+        # Split the bins with the largest errors until the others are within half the tolerance. Only non-empty bins
+        # are fetched, so splitting them finely costs little where the scores are sparse.
+        order = np.argsort(-errors)
+        remaining_errors = errors.sum() - np.cumsum(errors[order])
+        n_split = min(int(np.argmax(remaining_errors <= tolerance / 2)) + 1, _APPROX_MAX_REFINED_BINS)
+        split = order[:n_split]
+        score_ranges = [(float(counts[_SCORE].iloc[i]), float(counts[_MAX_SCORE].iloc[i]), max_bins) for i in split]
+        counts = pd.concat(
+            [counts.drop(index=counts.index[split]), _get_bin_counts(label_df, score_ranges, statement_params)],
+            ignore_index=True,
+        )
+
+    return _get_exact_counts(label_df, statement_params)
+
+
+def _get_counts(
+    label_df: snowpark.DataFrame, method: str, tolerance: float, statement_params: Dict[str, str]
+) -> pd.DataFrame:
+    if method == "approx":
+        return _get_approx_counts(label_df, tolerance, statement_params)
+    return _get_exact_counts(label_df, statement_params)
+
+
+def _counts_to_samples(
+    counts: pd.DataFrame,
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Turn the sums of the sample weights into weighted samples for scikit-learn, with 1 as the positive label.
+
+    Args:
+        counts: Dataframe with the columns [SCORE, TP, FP].
+
+    Returns:
+        Tuple of the labels, the scores and the sample weights.
+    """
+    scores = counts[_SCORE].to_numpy()
+    y_true = np.concatenate([np.ones(len(scores)), np.zeros(len(scores))])
+    y_score = np.concatenate([scores, scores])
+    sample_weight = np.concatenate([counts[_TP].to_numpy(), counts[_FP].to_numpy()])
+    return y_true, y_score, sample_weight
+
+
+def _get_curve_samples(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_score_col_name: str,
+    pos_label: Optional[Union[str, int]],
+    sample_weight_col_name: Optional[str],
+    method: str,
+    tolerance: float,
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Get the weighted samples for a curve of binary labels computed with a SQL method.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing true binary labels.
+        y_score_col_name: Column name representing target scores.
+        pos_label: The label of the positive class.
+        sample_weight_col_name: Column name representing sample weights.
+        method: The SQL method, 'exact' or 'approx'.
+        tolerance: Bound on the ROC AUC error with ``method='approx'``.
+
+    Returns:
+        Tuple of the labels, the scores and the sample weights, with 1 as the positive label.
+
+    Raises:
+        ValueError: ``y_true`` is not binary while ``pos_label`` is not given.
+    """
+    _validate_method(method, tolerance)
+    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+
+    if pos_label is None:
+        label_values = _get_label_values(df, y_true_col_name, statement_params)
+        if len(label_values) > 2:
+            raise ValueError("multiclass format is not supported")
+        if not (set(label_values) <= {0, 1} or set(label_values) <= {-1, 1}):
+            raise ValueError(
+                f"y_true takes value in {label_values} and pos_label is not specified: either make y_true take value "
+                "in {0, 1} or {-1, 1} or pass pos_label explicitly."
+            )
+        # Keep the type of the labels, e.g. boolean ones.
+        pos_label = next((label for label in label_values if label == 1), 1)
+
+    label_df = _get_label_df(df, y_true_col_name, y_score_col_name, pos_label, sample_weight_col_name)
+    return _counts_to_samples(_get_counts(label_df, method, tolerance, statement_params))
+
+
+def _get_exact_roc_auc_score(label_df: snowpark.DataFrame, statement_params: Dict[str, str]) -> float:
+    """Compute the ROC AUC in SQL as the weighted fraction of pairs of a positive and a negative sample that are
+    ranked correctly, counting ties as half.
+
+    Args:
+        label_df: Dataframe with the columns [SCORE, TP, FP].
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        The ROC AUC.
+    """
+    counts_df = label_df.group_by(_SCORE).agg(F.sum(_TP).alias(_TP), F.sum(_FP).alias(_FP))
+    window = snowpark.Window.order_by(F.col(_SCORE).desc()).rows_between(
+        snowpark.Window.UNBOUNDED_PRECEDING, snowpark.Window.CURRENT_ROW
+    )
+    # The positive weight above each score, plus half the one at the score.
+    pairs = F.col(_FP) * (F.sum(_TP).over(window) - F.col(_TP) / 2)
+    auc_df = counts_df.select(pairs.alias("PAIRS"), _TP, _FP).agg(F.sum("PAIRS") / (F.sum(_TP) * F.sum(_FP)))
+    return float(auc_df.collect(statement_params=statement_params)[0][0])
@@ -1,19 +1,15 @@
 import inspect
-from typing import List, Optional, Union
+import warnings
+from typing import List, Optional, Tuple, Union
 
-import cloudpickle
 import numpy as np
 import numpy.typing as npt
-import sklearn
-from packaging import version
-from sklearn import metrics
+from sklearn import exceptions
 
-import snowflake.snowpark._internal.utils as snowpark_utils
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
-from snowflake.ml._internal.utils import result
 from snowflake.ml.modeling.metrics import metrics_utils
-from snowflake.snowpark import functions as F
+from snowflake.snowpark import functions as F, types as T
 
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
@@ -60,53 +56,14 @@ def d2_absolute_error_score(
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
 
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-
-    pickled_snowflake_result = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    return _d2_pinball_score(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        alpha=0.5,
+        multioutput=multioutput,
     )
-    def d2_absolute_error_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        sp_df = session.sql(queries[-1])
-        df = sp_df.to_pandas(statement_params=statement_params)
-        df.columns = sp_df.columns
-
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.d2_absolute_error_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-        )
-        result_module = cloudpickle.loads(pickled_snowflake_result)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, d2_absolute_error_score_anon_sproc(session))
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -151,55 +108,14 @@ def d2_pinball_score(
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
 
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    return _d2_pinball_score(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        alpha=alpha,
+        multioutput=multioutput,
     )
-    def d2_pinball_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        sp_df = session.sql(queries[-1])
-        df = sp_df.to_pandas(statement_params=statement_params)
-        df.columns = sp_df.columns
-
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.d2_pinball_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            alpha=alpha,
-            multioutput=multioutput,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, d2_pinball_score_anon_sproc(session))
-
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -260,54 +176,44 @@ def explained_variance_score(
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
 
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
     statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+    y_true = y_true_col_names if isinstance(y_true_col_names, list) else [y_true_col_names]
+    y_pred = y_pred_col_names if isinstance(y_pred_col_names, list) else [y_pred_col_names]
+    num_outputs = len(y_true)
+    _validate_multioutput(
+        multioutput,
+        num_outputs,
+        allowed_str_vals=(_MULTIOUTPUT_RAW_VALUES, _MULTIOUTPUT_UNIFORM_AVG, "variance_weighted"),
+    )
 
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    y_true_cols = [df[col].cast(T.DoubleType()) for col in y_true]
+    diff_cols = [y_true_cols[i] - df[y_pred[i]].cast(T.DoubleType()) for i in range(num_outputs)]
+    weight_col = df[sample_weight_col_name].cast(T.DoubleType()) if sample_weight_col_name else None
+
+    # The variances are computed around the averages joined to every row, rather than as E[X^2] - E[X]^2, which loses
+    # precision.
+    df_avg = df.select(
+        *[_weighted_average(diff_cols[i], weight_col).alias(f"DIFF_AVG{i}") for i in range(num_outputs)],
+        *[_weighted_average(y_true_cols[i], weight_col).alias(f"Y_TRUE_AVG{i}") for i in range(num_outputs)],
     )
-    def explained_variance_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        sp_df = session.sql(queries[-1])
-        df = sp_df.to_pandas(statement_params=statement_params)
-        df.columns = sp_df.columns
-
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.explained_variance_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-            force_finite=force_finite,
+    row = (
+        df.join(df_avg)
+        .select(
+            *[_weighted_average((diff_cols[i] - df_avg[f"DIFF_AVG{i}"]) ** 2, weight_col) for i in range(num_outputs)],
+            *[
+                _weighted_average((y_true_cols[i] - df_avg[f"Y_TRUE_AVG{i}"]) ** 2, weight_col)
+                for i in range(num_outputs)
+            ],
         )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
+        .collect(statement_params=statement_params)[0]
+    )
 
-    result_object = result.deserialize(session, explained_variance_score_anon_sproc(session))
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
+    return _assemble_output_scores(
+        numerator=np.array(row[:num_outputs], dtype=np.float64),
+        denominator=np.array(row[num_outputs:], dtype=np.float64),
+        multioutput=multioutput,
+        force_finite=force_finite,
+    )
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -564,18 +470,22 @@ def r2_score(*, df: snowpark.DataFrame, y_true_col_name: str, y_pred_col_name: s
     return float(df_r_square.collect(statement_params=statement_params)[0][0])
 
 
-def _validate_multioutput(multioutput: Union[str, npt.ArrayLike], num_outputs: int) -> None:
-    """Validates multioutput parameter for MAPE calculation.
+def _validate_multioutput(
+    multioutput: Union[str, npt.ArrayLike],
+    num_outputs: int,
+    allowed_str_vals: Tuple[str, ...] = (_MULTIOUTPUT_RAW_VALUES, _MULTIOUTPUT_UNIFORM_AVG),
+) -> None:
+    """Validates multioutput parameter.
 
     Args:
         multioutput: Parameter specifying how to deal with multiple outputs.
         num_outputs: Integer representing number of outputs.
+        allowed_str_vals: The allowed string values of multioutput.
 
     Raises:
         ValueError: multioutput parameter is invalid.
 
     """
-    allowed_str_vals = ("raw_values", "uniform_average")
     if isinstance(multioutput, str):
         if multioutput not in allowed_str_vals:
             raise ValueError(
@@ -589,3 +499,149 @@ def _validate_multioutput(multioutput: Union[str, npt.ArrayLike], num_outputs: i
             raise ValueError(
                 f"There must be equally many custom weights ({len(multioutput_np)}) as outputs ({num_outputs})."
             )
+
+
+def _d2_pinball_score(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_names: Union[str, List[str]],
+    y_pred_col_names: Union[str, List[str]],
+    sample_weight_col_name: Optional[str],
+    alpha: float,
+    multioutput: Union[str, npt.ArrayLike],
+) -> Union[float, npt.NDArray[np.float_]]:
+    """:math:`D^2` score with a pinball deviance, computed in a single query.
+
+    As in scikit-learn, the constant baseline is the alpha-quantile of each y_true column: interpolated with
+    PERCENTILE_CONT without sample weights, and the lowest value reaching the alpha fraction of the total weight with
+    sample weights.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_names: Column name(s) representing actual values.
+        y_pred_col_names: Column name(s) representing predicted values.
+        sample_weight_col_name: Column name representing sample weights.
+        alpha: Slope of the pinball deviance.
+        multioutput: Defines aggregating of multiple output values.
+
+    Returns:
+        The :math:`D^2` score, or ndarray of scores if `multioutput='raw_values'`.
+    """
+    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+    y_true = y_true_col_names if isinstance(y_true_col_names, list) else [y_true_col_names]
+    y_pred = y_pred_col_names if isinstance(y_pred_col_names, list) else [y_pred_col_names]
+    num_outputs = len(y_true)
+    _validate_multioutput(multioutput, num_outputs)
+
+    y_true_cols = [df[col].cast(T.DoubleType()) for col in y_true]
+    weight_col = df[sample_weight_col_name].cast(T.DoubleType()) if sample_weight_col_name else None
+
+    if weight_col is None:
+        df_quantile = df.select(
+            *[F.percentile_cont(alpha).within_group(y_true_cols[i]).alias(f"QUANTILE{i}") for i in range(num_outputs)]
+        )
+    else:
+        cumulative_window = snowpark.Window.rows_between(
+            snowpark.Window.UNBOUNDED_PRECEDING, snowpark.Window.CURRENT_ROW
+        )
+        df_cumulative = df.select(
+            *[y_true_cols[i].alias(f"Y_TRUE{i}") for i in range(num_outputs)],
+            *[
+                F.sum(weight_col).over(cumulative_window.order_by(y_true_cols[i])).alias(f"CUMULATIVE_WEIGHT{i}")
+                for i in range(num_outputs)
+            ],
+            F.sum(weight_col).over().alias("TOTAL_WEIGHT"),
+        )
+        # A positive cumulative weight is required as well, so that leading zero weights are skipped when alpha is 0.
+        # The highest value is the fallback when rounding keeps the cumulative weight below the target.
+        df_quantile = df_cumulative.select(
+            *[
+                F.coalesce(
+                    F.min(
+                        F.when(
+                            (F.col(f"CUMULATIVE_WEIGHT{i}") >= F.col("TOTAL_WEIGHT") * alpha)
+                            & (F.col(f"CUMULATIVE_WEIGHT{i}") > 0),
+                            F.col(f"Y_TRUE{i}"),
+                        )
+                    ),
+                    F.max(f"Y_TRUE{i}"),
+                ).alias(f"QUANTILE{i}")
+                for i in range(num_outputs)
+            ]
+        )
+
+    row = (
+        df.join(df_quantile)
+        .select(
+            F.count(F.lit(1)),
+            *[
+                _weighted_average(_pinball_loss(y_true_cols[i], df[y_pred[i]].cast(T.DoubleType()), alpha), weight_col)
+                for i in range(num_outputs)
+            ],
+            *[
+                _weighted_average(_pinball_loss(y_true_cols[i], df_quantile[f"QUANTILE{i}"], alpha), weight_col)
+                for i in range(num_outputs)
+            ],
+        )
+        .collect(statement_params=statement_params)[0]
+    )
+
+    if row[0] < 2:
+        warnings.warn("D^2 score is not well-defined with less than two samples.", exceptions.UndefinedMetricWarning)
+        return float("nan")
+
+    return _assemble_output_scores(
+        numerator=np.array(row[1 : num_outputs + 1], dtype=np.float64),
+        denominator=np.array(row[num_outputs + 1 :], dtype=np.float64),
+        multioutput=multioutput,
+        force_finite=True,
+    )
+
+
+def _pinball_loss(y_true_col: snowpark.Column, y_pred_col: snowpark.Column, alpha: float) -> snowpark.Column:
+    diff = y_true_col - y_pred_col
+    return F.iff(diff >= 0, diff * alpha, diff * (alpha - 1))
+
+
+def _weighted_average(col: snowpark.Column, weight_col: Optional[snowpark.Column]) -> snowpark.Column:
+    if weight_col is None:
+        return F.avg(col)
+    return F.sum(col * weight_col) / F.sum(weight_col)
+
+
+def _assemble_output_scores(
+    *,
+    numerator: npt.NDArray[np.float_],
+    denominator: npt.NDArray[np.float_],
+    multioutput: Union[str, npt.ArrayLike],
+    force_finite: bool,
+) -> Union[float, npt.NDArray[np.float_]]:
+    """Assembles the scores `1 - numerator / denominator` of the outputs as scikit-learn does.
+
+    Args:
+        numerator: Deviance of the predictions of each output.
+        denominator: Deviance of the constant baseline of each output.
+        multioutput: Parameter specifying how to deal with multiple outputs.
+        force_finite: Whether to replace the scores of constant outputs by 1.0 if the predictions are perfect and
+            0.0 otherwise, instead of ``NaN`` and ``-Inf``.
+
+    Returns:
+        The scores, or their average unless `multioutput='raw_values'`.
+    """
+    nonzero_denominator = denominator != 0
+    if force_finite:
+        nonzero_numerator = numerator != 0
+        output_scores = np.ones(len(numerator))
+        valid_score = nonzero_denominator & nonzero_numerator
+        output_scores[valid_score] = 1 - (numerator[valid_score] / denominator[valid_score])
+        output_scores[nonzero_numerator & ~nonzero_denominator] = 0.0
+    else:
+        output_scores = 1 - (numerator / denominator)
+
+    if isinstance(multioutput, str):
+        if multioutput == _MULTIOUTPUT_RAW_VALUES:
+            return output_scores
+        if multioutput == "variance_weighted" and np.any(nonzero_denominator):
+            return float(np.average(output_scores, weights=denominator))
+        return float(np.average(output_scores))
+    return float(np.average(output_scores, weights=multioutput))
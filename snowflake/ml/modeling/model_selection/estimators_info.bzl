@@ -1,4 +1,6 @@
 estimator_info_list = [
     struct(class_name = "GridSearchCV", normalized_class_name = "grid_search_cv"),
+    struct(class_name = "HalvingGridSearchCV", normalized_class_name = "halving_grid_search_cv"),
+    struct(class_name = "HalvingRandomSearchCV", normalized_class_name = "halving_random_search_cv"),
     struct(class_name = "RandomizedSearchCV", normalized_class_name = "randomized_search_cv"),
 ]
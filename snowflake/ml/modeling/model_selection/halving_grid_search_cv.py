@@ -0,0 +1,852 @@
+#
+# This code is auto-generated using the sklearn_wrapper_template.py_template template.
+# Do not modify the auto-generated code(except automatic reformatting by precommit hooks).
+#
+from typing import Dict, Iterable, List, Optional, Set, Union
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+import sklearn.model_selection
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.utils.metaestimators import available_if
+
+from snowflake.ml._internal import telemetry
+from snowflake.ml._internal.exceptions import error_codes, exceptions
+from snowflake.ml._internal.utils import identifier, pkg_version_utils
+from snowflake.ml.model._signatures import utils as model_signature_utils
+from snowflake.ml.model.model_signature import (
+    BaseFeatureSpec,
+    DataType,
+    FeatureSpec,
+    ModelSignature,
+    _infer_signature,
+)
+from snowflake.ml.modeling._internal.estimator_protocols import CVHandlers
+from snowflake.ml.modeling._internal.estimator_utils import (
+    gather_dependencies,
+    is_single_node,
+    original_estimator_has_callable,
+    transform_snowml_obj_to_sklearn_obj,
+    validate_sklearn_args,
+)
+from snowflake.ml.modeling._internal.snowpark_handlers import (
+    SklearnModelSelectionWrapperProvider,
+    SnowparkHandlers as HandlersImpl,
+)
+from snowflake.ml.modeling.framework.base import BaseTransformer
+from snowflake.snowpark import DataFrame
+from snowflake.snowpark._internal.type_utils import convert_sp_to_sf_type
+
+_PROJECT = "ModelDevelopment"
+# Derive subproject from module name by removing "sklearn"
+# and converting module name from underscore to CamelCase
+# e.g. sklearn.linear_model -> LinearModel.
+_SUBPROJECT = "ModelSelection"
+DEFAULT_UDTF_NJOBS = 3
+
+
+class HalvingGridSearchCV(BaseTransformer):
+    r"""Search over specified parameter values with successive halving
+    For more details on this class, see [sklearn.model_selection.HalvingGridSearchCV]
+    (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html)
+
+    Parameters
+    ----------
+    estimator : estimator object
+        This is assumed to implement the scikit-learn estimator interface.
+        Either estimator needs to provide a ``score`` function,
+        or ``scoring`` must be passed.
+
+    param_grid : dict or list of dictionaries
+        Dictionary with parameters names (`str`) as keys and lists of
+        parameter settings to try as values, or a list of such
+        dictionaries, in which case the grids spanned by each dictionary
+        in the list are explored. This enables searching over any sequence
+        of parameter settings.
+
+    factor : int or float, default=3
+        The 'halving' parameter, which determines the proportion of candidates
+        that are selected for each subsequent iteration. For example,
+        ``factor=3`` means that only one third of the candidates are selected.
+
+    resource : ``'n_samples'`` or str, default='n_samples'
+        Defines the resource that increases with each iteration. By default,
+        the resource is the number of samples. It can also be set to any
+        parameter of the base estimator that accepts positive integer
+        values, e.g. 'n_iterations' or 'n_estimators' for a gradient
+        boosting estimator. In this case ``max_resources`` cannot be 'auto'
+        and must be set explicitly.
+
+    max_resources : int, default='auto'
+        The maximum amount of resource that any candidate is allowed to use
+        for a given iteration. By default, this is set to ``n_samples`` when
+        ``resource='n_samples'`` (default), else an error is raised.
+
+    min_resources : {'exhaust', 'smallest'} or int, default='exhaust'
+        The minimum amount of resource that any candidate is allowed to use
+        for a given iteration. Equivalently, this defines the amount of
+        resources `r0` that are allocated for each candidate at the first
+        iteration.
+
+        - 'smallest' is a heuristic that sets `r0` to a small value:
+
+            - ``n_splits * 2`` when ``resource='n_samples'`` for a regression
+              problem
+            - ``n_classes * n_splits * 2`` when ``resource='n_samples'`` for a
+              classification problem
+            - ``1`` when ``resource != 'n_samples'``
+
+        - 'exhaust' will set `r0` such that the **last** iteration uses as
+          much resources as possible.
+
+    aggressive_elimination : bool, default=False
+        This is only relevant in cases where there isn't enough resources to
+        reduce the remaining candidates to at most `factor` after the last
+        iteration. If ``True``, then the search process will 'replay' the
+        first iteration for as long as needed until the number of candidates
+        is small enough. This is ``False`` by default, which means that the
+        last iteration may evaluate more than ``factor`` candidates.
+
+    cv : int, cross-validation generator or iterable, default=5
+        Determines the cross-validation splitting strategy.
+        Possible inputs for cv are:
+
+        - integer, to specify the number of folds in a `(Stratified)KFold`,
+        - :term:`CV splitter`,
+        - An iterable yielding (train, test) splits as arrays of indices.
+
+        For integer/None inputs, if the estimator is a classifier and ``y`` is
+        either binary or multiclass, :class:`StratifiedKFold` is used. In all
+        other cases, :class:`KFold` is used. These splitters are instantiated
+        with `shuffle=False` so the splits will be the same across calls.
+
+    scoring : str, callable, or None, default=None
+        A single string (see :ref:`scoring_parameter`) or a callable
+        (see :ref:`scoring`) to evaluate the predictions on the test set.
+        If None, the estimator's score method is used.
+
+    refit : bool, default=True
+        If True, refit an estimator using the best found parameters on the
+        whole dataset.
+
+        The refitted estimator is made available at the ``best_estimator_``
+        attribute and permits using ``predict`` directly on this
+        ``HalvingGridSearchCV`` instance.
+
+    error_score : 'raise' or numeric
+        Value to assign to the score if an error occurs in estimator fitting.
+        If set to 'raise', the error is raised. If a numeric value is given,
+        FitFailedWarning is raised. This parameter does not affect the refit
+        step, which will always raise the error. Default is ``np.nan``.
+
+    return_train_score : bool, default=True
+        If ``False``, the ``cv_results_`` attribute will not include training
+        scores.
+        Computing training scores is used to get insights on how different
+        parameter settings impact the overfitting/underfitting trade-off.
+        However computing the scores on the training set can be computationally
+        expensive and is not strictly required to select the parameters that
+        yield the best generalization performance.
+
+    random_state : int, RandomState instance or None, default=None
+        Pseudo random number generator state used for subsampling the dataset
+        when `resources != 'n_samples'`. Ignored otherwise.
+        Pass an int for reproducible output across multiple function calls.
+        See :term:`Glossary <random_state>`.
+
+    n_jobs : int or None, default=None
+        Number of jobs to run in parallel.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+        for more details.
+
+    verbose : int
+        Controls the verbosity: the higher, the more messages.
+
+    input_cols : Optional[Union[str, List[str]]]
+        A string or list of strings representing column names that contain features.
+        If this parameter is not specified, all columns in the input DataFrame except
+        the columns specified by label_cols and sample-weight_col parameters are
+        considered input columns.
+
+    label_cols : Optional[Union[str, List[str]]]
+        A string or list of strings representing column names that contain labels.
+        This is a required param for estimators, as there is no way to infer these
+        columns. If this parameter is not specified, then object is fitted without
+        labels(Like a transformer).
+
+    output_cols: Optional[Union[str, List[str]]]
+        A string or list of strings representing column names that will store the
+        output of predict and transform operations. The length of output_cols mus
+        match the expected number of output columns from the specific estimator or
+        transformer class used.
+        If this parameter is not specified, output column names are derived by
+        adding an OUTPUT_ prefix to the label column names. These inferred output
+        column names work for estimator's predict() method, but output_cols must
+        be set explicitly for transformers.
+
+    passthrough_cols: A string or a list of strings indicating column names to be excluded from any
+        operations (such as train, transform, or inference). These specified column(s)
+        will remain untouched throughout the process. This option is helpful in scenarios
+        requiring automatic input_cols inference, but need to avoid using specific
+        columns, like index columns, during training or inference.
+
+    sample_weight_col: Optional[str]
+        A string representing the column name containing the examples’ weights.
+        This argument is only required when working with weighted datasets.
+
+    drop_input_cols: Optional[bool], default=False
+        If set, the response of predict(), transform() methods will not contain input columns.
+    """
+    _ENABLE_DISTRIBUTED = True
+
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        *,
+        estimator,
+        param_grid,
+        factor=3,
+        resource="n_samples",
+        max_resources="auto",
+        min_resources="exhaust",
+        aggressive_elimination=False,
+        cv=5,
+        scoring=None,
+        refit=True,
+        error_score=np.nan,
+        return_train_score=True,
+        random_state=None,
+        n_jobs=None,
+        verbose=0,
+        input_cols: Optional[Union[str, Iterable[str]]] = None,
+        output_cols: Optional[Union[str, Iterable[str]]] = None,
+        label_cols: Optional[Union[str, Iterable[str]]] = None,
+        passthrough_cols: Optional[Union[str, Iterable[str]]] = None,
+        drop_input_cols: Optional[bool] = False,
+        sample_weight_col: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        deps: Set[str] = set(SklearnModelSelectionWrapperProvider().dependencies)
+        deps = deps | gather_dependencies(estimator)
+        self._deps = list(deps)
+        estimator = transform_snowml_obj_to_sklearn_obj(estimator)
+        init_args = {
+            "estimator": (estimator, None, True),
+            "param_grid": (param_grid, None, True),
+            "factor": (factor, 3, False),
+            "resource": (resource, "n_samples", False),
+            "max_resources": (max_resources, "auto", False),
+            "min_resources": (min_resources, "exhaust", False),
+            "aggressive_elimination": (aggressive_elimination, False, False),
+            "cv": (cv, 5, False),
+            "scoring": (scoring, None, False),
+            "refit": (refit, True, False),
+            "error_score": (error_score, np.nan, False),
+            "return_train_score": (return_train_score, True, False),
+            "random_state": (random_state, None, False),
+            "n_jobs": (n_jobs, None, False),
+            "verbose": (verbose, 0, False),
+        }
+        cleaned_up_init_args = validate_sklearn_args(args=init_args, klass=sklearn.model_selection.HalvingGridSearchCV)
+        self._sklearn_object = sklearn.model_selection.HalvingGridSearchCV(
+            **cleaned_up_init_args,
+        )
+        self._model_signature_dict: Optional[Dict[str, ModelSignature]] = None
+        self.set_input_cols(input_cols)
+        self.set_output_cols(output_cols)
+        self.set_label_cols(label_cols)
+        self.set_drop_input_cols(drop_input_cols)
+        self.set_sample_weight_col(sample_weight_col)
+        self.set_passthrough_cols(passthrough_cols)
+        self._handlers: CVHandlers = HandlersImpl(
+            class_name=self.__class__.__name__,
+            subproject=_SUBPROJECT,
+            wrapper_provider=SklearnModelSelectionWrapperProvider(),
+        )
+
+    def _get_rand_id(self) -> str:
+        """
+        Generate random id to be used in sproc and stage names.
+
+        Returns:
+            Random id string usable in sproc, table, and stage names.
+        """
+        return str(uuid4()).replace("-", "_").upper()
+
+    def _get_active_columns(self) -> List[str]:
+        """ "Get the list of columns that are relevant to the transformer."""
+        selected_cols = (
+            self.input_cols + self.label_cols + ([self.sample_weight_col] if self.sample_weight_col is not None else [])
+        )
+        return selected_cols
+
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def fit(self, dataset: Union[DataFrame, pd.DataFrame]) -> "HalvingGridSearchCV":
+        """Run fit with all sets of parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.fit]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.fit)
+
+
+        Raises:
+            TypeError: Supported dataset types: snowpark.DataFrame, pandas.DataFrame.
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+
+        Returns:
+            self
+        """
+        self._infer_input_output_cols(dataset)
+        if isinstance(dataset, pd.DataFrame):
+            self._estimator = self._handlers.fit_pandas(
+                dataset, self._sklearn_object, self.input_cols, self.label_cols, self.sample_weight_col
+            )
+        elif isinstance(dataset, DataFrame):
+            self._fit_snowpark(dataset)
+        else:
+            raise TypeError(
+                f"Unexpected dataset type: {type(dataset)}."
+                "Supported dataset types: snowpark.DataFrame, pandas.DataFrame."
+            )
+        self._is_fitted = True
+        self._get_model_signatures(dataset)
+        return self
+
+    def _fit_snowpark(self, dataset: DataFrame) -> None:
+        session = dataset._session
+        assert session is not None  # keep mypy happy
+        # Validate that key package version in user workspace are supported in snowflake conda channel
+        # If customer doesn't have package in conda channel, replace the ones have the closest versions
+        self._deps = pkg_version_utils.get_valid_pkg_versions_supported_in_snowflake_conda_channel(
+            pkg_versions=self._get_dependencies(), session=session, subproject=_SUBPROJECT
+        )
+
+        selected_cols = self._get_active_columns()
+        if len(selected_cols) > 0:
+            dataset = dataset.select(selected_cols)
+
+        assert self._sklearn_object is not None
+        is_distributed = not is_single_node(session) and self._ENABLE_DISTRIBUTED is True
+        if is_distributed:
+            # Set the default value of the `n_jobs` attribute for the estimator.
+            # If minus one is set, it will not be abided by in the UDTF, so we set that to the default value as well.
+            if hasattr(self._sklearn_object.estimator, "n_jobs") and self._sklearn_object.estimator.n_jobs in [
+                None,
+                -1,
+            ]:
+                self._sklearn_object.estimator.n_jobs = DEFAULT_UDTF_NJOBS
+            self._sklearn_object = self._handlers.fit_successive_halving_snowpark(
+                dataset=dataset,
+                session=session,
+                estimator=self._sklearn_object,
+                dependencies=self._get_dependencies(),
+                udf_imports=["sklearn"],
+                input_cols=self.input_cols,
+                label_cols=self.label_cols,
+                sample_weight_col=self.sample_weight_col,
+            )
+        else:
+            # Fall back with stored procedure implementation
+            # set the parallel factor to default to minus one, to fully accelerate the cores in single node
+            if self._sklearn_object.n_jobs is None:
+                self._sklearn_object.n_jobs = -1
+
+            self._sklearn_object = self._handlers.fit_snowpark(
+                dataset,
+                session,
+                self._sklearn_object,
+                ["snowflake-snowpark-python"] + self._get_dependencies(),
+                self.input_cols,
+                self.label_cols,
+                self.sample_weight_col,
+            )
+
+    def _get_pass_through_columns(self, dataset: DataFrame) -> List[str]:
+        if self._drop_input_cols:
+            return []
+        else:
+            return list(set(dataset.columns) - set(self.output_cols))
+
+    def _batch_inference(
+        self,
+        dataset: DataFrame,
+        inference_method: str,
+        expected_output_cols_list: List[str],
+        expected_output_cols_type: str = "",
+    ) -> DataFrame:
+        """Util method to create UDF and run batch inference."""
+        if not self._is_fitted:
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.METHOD_NOT_ALLOWED,
+                original_exception=RuntimeError(
+                    f"Estimator {self.__class__.__name__} not fitted before calling {inference_method} method."
+                ),
+            )
+
+        session = dataset._session
+        if session is None:
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.NOT_FOUND,
+                original_exception=ValueError("Session must not specified for snowpark dataset."),
+            )
+        # Validate that key package version in user workspace are supported in snowflake conda channel
+        pkg_version_utils.get_valid_pkg_versions_supported_in_snowflake_conda_channel(
+            pkg_versions=self._get_dependencies(), session=session, subproject=_SUBPROJECT
+        )
+
+        return self._handlers.batch_inference(
+            dataset,
+            session,
+            self._sklearn_object,
+            self._get_dependencies(),
+            inference_method,
+            self.input_cols,
+            self._get_pass_through_columns(dataset),
+            expected_output_cols_list,
+            expected_output_cols_type,
+        )
+
+    def _sklearn_inference(
+        self, dataset: pd.DataFrame, inference_method: str, expected_output_cols_list: List[str]
+    ) -> pd.DataFrame:
+        output_cols = expected_output_cols_list.copy()
+
+        # Model expects exact same columns names in the input df for predict call.
+        # Given the scenario that user use snowpark DataFrame in fit call, but pandas DataFrame in predict call
+        # input cols need to match unquoted / quoted
+        input_cols = self.input_cols
+        unquoted_input_cols = identifier.get_unescaped_names(self.input_cols)
+        quoted_input_cols = identifier.get_inferred_names(unquoted_input_cols)
+
+        estimator = self._sklearn_object
+
+        assert estimator is not None
+        features_required_by_estimator = (
+            estimator.feature_names_in_ if hasattr(estimator, "feature_names_in_") else unquoted_input_cols
+        )
+        missing_features = []
+        features_in_dataset = set(dataset.columns)
+        columns_to_select = []
+        for i, f in enumerate(features_required_by_estimator):
+            if (
+                i >= len(input_cols)
+                or (input_cols[i] != f and unquoted_input_cols[i] != f and quoted_input_cols[i] != f)
+                or (
+                    input_cols[i] not in features_in_dataset
+                    and unquoted_input_cols[i] not in features_in_dataset
+                    and quoted_input_cols[i] not in features_in_dataset
+                )
+            ):
+                missing_features.append(f)
+            elif input_cols[i] in features_in_dataset:
+                columns_to_select.append(input_cols[i])
+            elif unquoted_input_cols[i] in features_in_dataset:
+                columns_to_select.append(unquoted_input_cols[i])
+            else:
+                columns_to_select.append(quoted_input_cols[i])
+
+        if len(missing_features) > 0:
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.NOT_FOUND,
+                original_exception=ValueError(
+                    "The feature names should match with those that were passed during fit.\n"
+                    f"Features seen during fit call but not present in the input: {missing_features}\n"
+                    f"Features in the input dataframe : {input_cols}\n"
+                ),
+            )
+        input_df = dataset[columns_to_select]
+        input_df.columns = features_required_by_estimator
+
+        transformed_numpy_array = getattr(estimator, inference_method)(input_df)
+
+        if (
+            isinstance(transformed_numpy_array, list)
+            and len(transformed_numpy_array) > 0
+            and isinstance(transformed_numpy_array[0], np.ndarray)
+        ):
+            # In case of multioutput estimators, predict_proba(), decision_function(), etc., functions return
+            # a list of ndarrays. We need to concatenate them.
+
+            # First compute output column names
+            if len(output_cols) == len(transformed_numpy_array):
+                actual_output_cols = []
+                for idx, np_arr in enumerate(transformed_numpy_array):
+                    for i in range(1 if len(np_arr.shape) <= 1 else np_arr.shape[1]):
+                        actual_output_cols.append(f"{output_cols[idx]}_{i}")
+                output_cols = actual_output_cols
+
+            # Concatenate np arrays
+            transformed_numpy_array = np.concatenate(transformed_numpy_array, axis=1)
+
+        if len(transformed_numpy_array.shape) == 3:
+            # VotingClassifier will return results of shape (n_classifiers, n_samples, n_classes)
+            # when voting = "soft" and flatten_transform = False. We can't handle unflatten transforms,
+            # so we ignore flatten_transform flag and flatten the results.
+            transformed_numpy_array = np.hstack(transformed_numpy_array)
+
+        if len(transformed_numpy_array.shape) == 1:
+            transformed_numpy_array = np.reshape(transformed_numpy_array, (-1, 1))
+
+        shape = transformed_numpy_array.shape
+        if shape[1] != len(output_cols):
+            if len(output_cols) != 1:
+                raise exceptions.SnowflakeMLException(
+                    error_code=error_codes.INVALID_ARGUMENT,
+                    original_exception=TypeError(
+                        "expected_output_cols_list must be same length as transformed array or " "should be of length 1"
+                    ),
+                )
+            actual_output_cols = []
+            for i in range(shape[1]):
+                actual_output_cols.append(f"{output_cols[0]}_{i}")
+            output_cols = actual_output_cols
+
+        if self._drop_input_cols:
+            dataset = pd.DataFrame(data=transformed_numpy_array, columns=output_cols)
+        else:
+            dataset = dataset.copy()
+            dataset[output_cols] = transformed_numpy_array
+        return dataset
+
+    @available_if(original_estimator_has_callable("predict"))  # type: ignore[misc]
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    @telemetry.add_stmt_params_to_df(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def predict(self, dataset: Union[DataFrame, pd.DataFrame]) -> Union[DataFrame, pd.DataFrame]:
+        """Call predict on the estimator with the best found parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.predict]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.predict)
+
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+
+        Returns:
+            Transformed dataset.
+        """
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, DataFrame):
+            expected_type_inferred = ""
+            # infer the datatype from label columns
+            if "predict" in self.model_signatures:
+                expected_type_inferred = convert_sp_to_sf_type(
+                    self.model_signatures["predict"].outputs[0].as_snowpark_type()
+                )
+
+            output_df = self._batch_inference(
+                dataset=dataset,
+                inference_method="predict",
+                expected_output_cols_list=self.output_cols,
+                expected_output_cols_type=expected_type_inferred,
+            )
+        elif isinstance(dataset, pd.DataFrame):
+            output_df = self._sklearn_inference(
+                dataset=dataset,
+                inference_method="predict",
+                expected_output_cols_list=self.output_cols,
+            )
+
+        return output_df
+
+    @available_if(original_estimator_has_callable("transform"))  # type: ignore[misc]
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    @telemetry.add_stmt_params_to_df(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def transform(self, dataset: Union[DataFrame, pd.DataFrame]) -> Union[DataFrame, pd.DataFrame]:
+        """Call transform on the estimator with the best found parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.transform]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.transform)
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+
+        Returns:
+            Transformed dataset.
+        """
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, DataFrame):
+            output_df = self._batch_inference(
+                dataset=dataset,
+                inference_method="transform",
+                expected_output_cols_list=self.output_cols,
+            )
+        elif isinstance(dataset, pd.DataFrame):
+            output_df = self._sklearn_inference(
+                dataset=dataset,
+                inference_method="transform",
+                expected_output_cols_list=self.output_cols,
+            )
+
+        return output_df
+
+    def _get_output_column_names(self, output_cols_prefix: str) -> List[str]:
+        """Returns the list of output columns for predict_proba(), decision_function(), etc.. functions.
+        Returns a list with output_cols_prefix as the only element if the estimator is not a classifier.
+
+        Args:
+            output_cols_prefix (str): prefix according to the function
+
+        Returns:
+            List[str]: output cols with prefix
+        """
+        if getattr(self._sklearn_object, "classes_", None) is None:
+            return [output_cols_prefix]
+
+        assert self._sklearn_object is not None  # keep mypy happy
+        classes = self._sklearn_object.classes_
+        if isinstance(classes, np.ndarray):
+            return [f"{output_cols_prefix}{c}" for c in classes.tolist()]
+        elif isinstance(classes, list) and len(classes) > 0 and isinstance(classes[0], np.ndarray):
+            # If the estimator is a multioutput estimator, classes_ will be a list of ndarrays.
+            output_cols = []
+            for i, cl in enumerate(classes):
+                # For binary classification, there is only one output column for each class
+                # ndarray as the two classes are complementary.
+                if len(cl) == 2:
+                    output_cols.append(f"{output_cols_prefix}_{i}_{cl[0]}")
+                else:
+                    output_cols.extend([f"{output_cols_prefix}_{i}_{c}" for c in cl.tolist()])
+            return output_cols
+        return []
+
+    @available_if(original_estimator_has_callable("predict_proba"))  # type: ignore[misc]
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    @telemetry.add_stmt_params_to_df(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def predict_proba(
+        self, dataset: Union[DataFrame, pd.DataFrame], output_cols_prefix: str = "predict_proba_"
+    ) -> Union[DataFrame, pd.DataFrame]:
+        """Call predict_proba on the estimator with the best found parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.predict_proba]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.predict_proba)
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+            output_cols_prefix: Prefix for the response columns
+
+        Returns:
+            Output dataset with probability of the sample for each class in the model.
+        """
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, DataFrame):
+            output_df = self._batch_inference(
+                dataset=dataset,
+                inference_method="predict_proba",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+                expected_output_cols_type="float",
+            )
+        elif isinstance(dataset, pd.DataFrame):
+            output_df = self._sklearn_inference(
+                dataset=dataset,
+                inference_method="predict_proba",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+            )
+
+        return output_df
+
+    @available_if(original_estimator_has_callable("predict_log_proba"))  # type: ignore[misc]
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    @telemetry.add_stmt_params_to_df(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def predict_log_proba(
+        self, dataset: Union[DataFrame, pd.DataFrame], output_cols_prefix: str = "predict_log_proba_"
+    ) -> Union[DataFrame, pd.DataFrame]:
+        """Call predict_proba on the estimator with the best found parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.predict_proba]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.predict_proba)
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+            output_cols_prefix: str
+                Prefix for the response columns
+
+        Returns:
+            Output dataset with log probability of the sample for each class in the model.
+        """
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, DataFrame):
+            output_df = self._batch_inference(
+                dataset=dataset,
+                inference_method="predict_log_proba",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+                expected_output_cols_type="float",
+            )
+        elif isinstance(dataset, pd.DataFrame):
+            output_df = self._sklearn_inference(
+                dataset=dataset,
+                inference_method="predict_log_proba",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+            )
+
+        return output_df
+
+    @available_if(original_estimator_has_callable("decision_function"))  # type: ignore[misc]
+    @telemetry.send_api_usage_telemetry(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    @telemetry.add_stmt_params_to_df(
+        project=_PROJECT,
+        subproject=_SUBPROJECT,
+    )
+    def decision_function(
+        self, dataset: Union[DataFrame, pd.DataFrame], output_cols_prefix: str = "decision_function_"
+    ) -> Union[DataFrame, pd.DataFrame]:
+        """Call decision_function on the estimator with the best found parameters
+        For more details on this function, see [sklearn.model_selection.HalvingGridSearchCV.decision_function]
+        (https://scikit-learn.org/stable/modules/generated/sklearn.model_selection.HalvingGridSearchCV.html#sklearn.model_selection.HalvingGridSearchCV.decision_function)
+
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+            output_cols_prefix: str
+                Prefix for the response columns
+
+        Returns:
+            Output dataset with results of the decision function for the samples in input dataset.
+        """
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, DataFrame):
+            output_df = self._batch_inference(
+                dataset=dataset,
+                inference_method="decision_function",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+                expected_output_cols_type="float",
+            )
+        elif isinstance(dataset, pd.DataFrame):
+            output_df = self._sklearn_inference(
+                dataset=dataset,
+                inference_method="decision_function",
+                expected_output_cols_list=self._get_output_column_names(output_cols_prefix),
+            )
+
+        return output_df
+
+    @available_if(original_estimator_has_callable("score"))  # type: ignore[misc]
+    def score(self, dataset: Union[DataFrame, pd.DataFrame]) -> float:
+        """
+        Args:
+            dataset: Union[snowflake.snowpark.DataFrame, pandas.DataFrame]
+                Snowpark or Pandas DataFrame.
+
+        Returns:
+            Score.
+        """
+        self._infer_input_output_cols(dataset)
+        super()._check_dataset_type(dataset)
+        if isinstance(dataset, pd.DataFrame):
+            output_score = self._handlers.score_pandas(
+                dataset, self._sklearn_object, self.input_cols, self.label_cols, self.sample_weight_col
+            )
+        elif isinstance(dataset, DataFrame):
+            output_score = self._score_snowpark(dataset)
+        return output_score
+
+    def _score_snowpark(self, dataset: DataFrame) -> float:
+        # Specify input columns so column pruning will be enforced
+        selected_cols = self._get_active_columns()
+        if len(selected_cols) > 0:
+            dataset = dataset.select(selected_cols)
+
+        session = dataset._session
+        assert session is not None  # keep mypy happy
+
+        score = self._handlers.score_snowpark(
+            dataset,
+            session,
+            self._sklearn_object,
+            ["snowflake-snowpark-python"] + self._get_dependencies(),
+            ["sklearn"],
+            identifier.get_unescaped_names(self.input_cols),
+            identifier.get_unescaped_names(self.label_cols),
+            identifier.get_unescaped_names(self.sample_weight_col),
+        )
+
+        return score
+
+    def _get_model_signatures(self, dataset: Union[DataFrame, pd.DataFrame]) -> None:
+        self._model_signature_dict = dict()
+
+        PROB_FUNCTIONS = ["predict_log_proba", "predict_proba", "decision_function"]
+
+        inputs = list(_infer_signature(dataset[self.input_cols], "input"))
+        outputs: List[BaseFeatureSpec] = []
+        if hasattr(self, "predict"):
+            # keep mypy happy
+            assert self._sklearn_object is not None and hasattr(self._sklearn_object, "_estimator_type")
+            # For classifier, the type of predict is the same as the type of label
+            if self._sklearn_object._estimator_type == "classifier":
+                # label columns is the desired type for output
+                outputs = _infer_signature(dataset[self.label_cols], "output")
+                # rename the output columns
+                outputs = model_signature_utils.rename_features(outputs, self.output_cols)
+                self._model_signature_dict["predict"] = ModelSignature(
+                    inputs, ([] if self._drop_input_cols else inputs) + outputs
+                )
+            # For regressor, the type of predict is float64
+            elif self._sklearn_object._estimator_type == "regressor":
+                outputs = [FeatureSpec(dtype=DataType.DOUBLE, name=c) for c in self.output_cols]
+                self._model_signature_dict["predict"] = ModelSignature(
+                    inputs, ([] if self._drop_input_cols else inputs) + outputs
+                )
+        for prob_func in PROB_FUNCTIONS:
+            if hasattr(self, prob_func):
+                output_cols_prefix: str = f"{prob_func}_"
+                output_column_names = self._get_output_column_names(output_cols_prefix)
+                outputs = [FeatureSpec(dtype=DataType.DOUBLE, name=c) for c in output_column_names]
+                self._model_signature_dict[prob_func] = ModelSignature(
+                    inputs, ([] if self._drop_input_cols else inputs) + outputs
+                )
+
+    @property
+    def model_signatures(self) -> Dict[str, ModelSignature]:
+        """Returns model signature of current class.
+
+        Raises:
+            SnowflakeMLException: If estimator is not fitted, then model signature cannot be inferred
+
+        Returns:
+            Dict[str, ModelSignature]: each method and its input output signature
+        """
+        if self._model_signature_dict is None:
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.INVALID_ATTRIBUTE,
+                original_exception=RuntimeError("Estimator not fitted before accessing property model_signatures!"),
+            )
+        return self._model_signature_dict
+
+    def to_sklearn(self) -> sklearn.model_selection.HalvingGridSearchCV:
+        assert self._sklearn_object is not None
+        return self._sklearn_object
+
+    def _get_dependencies(self) -> List[str]:
+        return self._deps
@@ -1,8 +1,16 @@
-"""Disables the distributed implementation of Grid Search and Randomized Search CV"""
+"""Disables the distributed implementation of Grid Search, Randomized Search and Successive Halving Search CV"""
 from snowflake.ml.modeling.model_selection.grid_search_cv import GridSearchCV
+from snowflake.ml.modeling.model_selection.halving_grid_search_cv import (
+    HalvingGridSearchCV,
+)
+from snowflake.ml.modeling.model_selection.halving_random_search_cv import (
+    HalvingRandomSearchCV,
+)
 from snowflake.ml.modeling.model_selection.randomized_search_cv import (
     RandomizedSearchCV,
 )
 
 GridSearchCV._ENABLE_DISTRIBUTED = False
 RandomizedSearchCV._ENABLE_DISTRIBUTED = False
+HalvingGridSearchCV._ENABLE_DISTRIBUTED = False
+HalvingRandomSearchCV._ENABLE_DISTRIBUTED = False
@@ -1,12 +1,20 @@
+import importlib
 from typing import List, Optional, Union
 from unittest import mock
 
 import pandas as pd
 from absl.testing import absltest
 from sklearn import model_selection
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 from snowflake.ml.modeling.xgboost.xgb_classifier import XGBClassifier
 
 from snowflake.ml.modeling.model_selection.grid_search_cv import GridSearchCV
+from snowflake.ml.modeling.model_selection.halving_grid_search_cv import (
+    HalvingGridSearchCV,
+)
+from snowflake.ml.modeling.model_selection.halving_random_search_cv import (
+    HalvingRandomSearchCV,
+)
 from snowflake.ml.modeling.model_selection.randomized_search_cv import (
     RandomizedSearchCV,
 )
@@ -91,6 +99,21 @@ class MockHandlers:
         response_obj.function = "FIT_SEARCH"
         return response_obj
 
+    def fit_successive_halving_snowpark(
+        self,
+        dataset: DataFrame,
+        session: Session,
+        estimator: Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV],
+        dependencies: List[str],
+        udf_imports: List[str],
+        input_cols: List[str],
+        label_cols: List[str],
+        sample_weight_col: Optional[str],
+    ) -> Union[model_selection.HalvingGridSearchCV, model_selection.HalvingRandomSearchCV]:
+        response_obj = mock.Mock(spec=model_selection.HalvingGridSearchCV)
+        response_obj.function = "FIT_SUCCESSIVE_HALVING"
+        return response_obj
+
 
 class DisableDistributedHPOTest(absltest.TestCase):
     @mock.patch(
@@ -139,6 +162,58 @@ class DisableDistributedHPOTest(absltest.TestCase):
         self.assertTrue(grid_search_cv._sklearn_object.function, "FIT_SNOWPARK")
         self.assertEqual(randomized_search_cv._sklearn_object.function, "FIT_SNOWPARK")
 
+    @mock.patch(
+        "snowflake.ml.modeling.model_selection.halving_random_search_cv.pkg_version_utils"
+        ".get_valid_pkg_versions_supported_in_snowflake_conda_channel"
+    )
+    @mock.patch(
+        "snowflake.ml.modeling.model_selection.halving_grid_search_cv.pkg_version_utils"
+        ".get_valid_pkg_versions_supported_in_snowflake_conda_channel"
+    )
+    @mock.patch("snowflake.ml.modeling.model_selection.halving_random_search_cv.is_single_node")
+    @mock.patch("snowflake.ml.modeling.model_selection.halving_grid_search_cv.is_single_node")
+    def test_disable_distributed_successive_halving(
+        self,
+        grid_is_single_node_mock: mock.Mock,
+        random_is_single_node_mock: mock.Mock,
+        grid_pkg_version_mock: mock.Mock,
+        random_pkg_version_mock: mock.Mock,
+    ) -> None:
+        grid_is_single_node_mock.return_value = False
+        random_is_single_node_mock.return_value = False
+        grid_pkg_version_mock.return_value = []
+        random_pkg_version_mock.return_value = []
+        mock_session = mock.MagicMock(spec=Session)
+        mock_dataframe = mock.MagicMock(spec=DataFrame)
+        mock_dataframe._session = mock_session
+
+        def fit_searches() -> List[str]:
+            estimator = XGBClassifier()
+            searches: List[Union[HalvingGridSearchCV, HalvingRandomSearchCV]] = [
+                HalvingGridSearchCV(estimator=estimator, param_grid=dict(fake=[1, 2])),
+                HalvingRandomSearchCV(estimator=estimator, param_distributions=dict(fake=[1, 2])),
+            ]
+            functions: List[str] = []
+            for search in searches:
+                search._handlers = MockHandlers()
+                search._fit_snowpark(mock_dataframe)
+                assert search._sklearn_object is not None
+                functions.append(search._sklearn_object.function)
+            return functions
+
+        HalvingGridSearchCV._ENABLE_DISTRIBUTED = True
+        HalvingRandomSearchCV._ENABLE_DISTRIBUTED = True
+        self.assertEqual(fit_searches(), ["FIT_SUCCESSIVE_HALVING", "FIT_SUCCESSIVE_HALVING"])
+
+        # Disable distributed HPO. Reload in case another test already imported the module.
+        from snowflake.ml.modeling.parameters import disable_distributed_hpo
+
+        importlib.reload(disable_distributed_hpo)
+
+        self.assertFalse(HalvingGridSearchCV._ENABLE_DISTRIBUTED)
+        self.assertFalse(HalvingRandomSearchCV._ENABLE_DISTRIBUTED)
+        self.assertEqual(fit_searches(), ["FIT_SNOWPARK", "FIT_SNOWPARK"])
+
 
 if __name__ == "__main__":
     absltest.main()
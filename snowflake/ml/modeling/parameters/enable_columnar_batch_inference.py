@@ -0,0 +1,4 @@
+"""Enables the columnar batch inference path, which passes input columns to the inference UDF as typed columns"""
+from snowflake.ml.modeling._internal.snowpark_handlers import SnowparkHandlers
+
+SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
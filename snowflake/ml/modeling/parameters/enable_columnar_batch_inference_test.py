@@ -0,0 +1,16 @@
+from absl.testing import absltest
+
+from snowflake.ml.modeling._internal.snowpark_handlers import SnowparkHandlers
+
+
+class EnableColumnarBatchInferenceTest(absltest.TestCase):
+    def test_enable_columnar_batch_inference(self) -> None:
+        self.assertFalse(SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE)
+
+        import snowflake.ml.modeling.parameters.enable_columnar_batch_inference  # noqa: F401
+
+        self.assertTrue(SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,27 @@
+"""Enables incremental fitting with partial_fit over batches streamed from the training data, when supported.
+
+Estimators exposing partial_fit are then fitted with a single pass of partial_fit over the training data, i.e. one
+epoch, in batches of 100,000 rows by default. This differs from fit, which may iterate over the data until convergence
+(e.g. up to max_iter epochs for SGDClassifier). Call set_batch_size to change the number of rows of the batches.
+"""
+from snowflake.ml._internal.exceptions import error_codes, exceptions
+from snowflake.ml.modeling._internal.snowpark_handlers import SnowparkHandlers
+
+SnowparkHandlers._ENABLE_PARTIAL_FIT = True
+
+
+def set_batch_size(batch_size: int) -> None:
+    """Set the number of rows passed to each partial_fit call.
+
+    Args:
+        batch_size: Number of rows of each batch. Larger batches take more memory in the fit stored procedure.
+
+    Raises:
+        SnowflakeMLException: When batch_size is not a positive integer.
+    """
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise exceptions.SnowflakeMLException(
+            error_code=error_codes.INVALID_ARGUMENT,
+            original_exception=ValueError(f"batch_size must be a positive integer, got {batch_size}."),
+        )
+    SnowparkHandlers._PARTIAL_FIT_BATCH_SIZE = batch_size
@@ -0,0 +1,30 @@
+from absl.testing import absltest
+
+from snowflake.ml._internal.exceptions import exceptions
+from snowflake.ml.modeling._internal.snowpark_handlers import SnowparkHandlers
+
+
+class EnablePartialFitTest(absltest.TestCase):
+    def test_enable_partial_fit(self) -> None:
+        self.assertFalse(SnowparkHandlers._ENABLE_PARTIAL_FIT)
+
+        import snowflake.ml.modeling.parameters.enable_partial_fit  # noqa: F401
+
+        self.assertTrue(SnowparkHandlers._ENABLE_PARTIAL_FIT)
+
+    def test_set_batch_size(self) -> None:
+        from snowflake.ml.modeling.parameters import enable_partial_fit
+
+        default_batch_size = SnowparkHandlers._PARTIAL_FIT_BATCH_SIZE
+        self.addCleanup(setattr, SnowparkHandlers, "_PARTIAL_FIT_BATCH_SIZE", default_batch_size)
+        enable_partial_fit.set_batch_size(1000)
+        self.assertEqual(SnowparkHandlers._PARTIAL_FIT_BATCH_SIZE, 1000)
+
+        for batch_size in [0, -1, 1.5]:
+            with self.assertRaises(exceptions.SnowflakeMLException):
+                enable_partial_fit.set_batch_size(batch_size)  # type: ignore[arg-type]
+        self.assertEqual(SnowparkHandlers._PARTIAL_FIT_BATCH_SIZE, 1000)
+
+
+if __name__ == "__main__":
+    absltest.main()
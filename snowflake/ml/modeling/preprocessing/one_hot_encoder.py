@@ -399,30 +399,7 @@ class OneHotEncoder(base.BaseTransformer):
                 and unknown categories exist in dataset.
         """
         # states of categories found in dataset
-        found_state_df: Optional[snowpark.DataFrame] = None
-        for input_col in self.input_cols:
-            state_columns = [
-                F.lit(input_col).alias(_COLUMN_NAME),
-                F.col(input_col).cast(T.StringType()).alias(_CATEGORY),
-                F.iff(
-                    # null or nan values
-                    F.col(input_col).is_null() | (F.col(input_col).cast(T.StringType()).equal_nan()),
-                    # count null and nan values
-                    F.sum(
-                        F.iff(
-                            F.col(input_col).is_null() | (F.col(input_col).cast(T.StringType()).equal_nan()),
-                            1,
-                            0,
-                        )
-                    ).over(snowpark.Window.partition_by(input_col)),
-                    # count values that are not null or nan
-                    F.count(input_col).over(snowpark.Window.partition_by(input_col)),
-                ).alias(_COUNT),
-            ]
-            temp_df = dataset.select(state_columns).distinct()
-            found_state_df = found_state_df.union_by_name(temp_df) if found_state_df is not None else temp_df
-
-        assert found_state_df is not None
+        found_state_df = self._get_found_category_count_state_df(dataset)
         if self.categories != "auto":
             state_data = []
             assert isinstance(self.categories, dict)
@@ -471,6 +448,54 @@ class OneHotEncoder(base.BaseTransformer):
 
         return found_state_df
 
+    def _get_found_category_count_state_df(self, dataset: snowpark.DataFrame) -> snowpark.DataFrame:
+        """
+        Get the categories and category counts of all input columns in dataset with a single scan.
+
+        The input columns are unpivoted to (COLUMN_NAME, CATEGORY) rows and counted by one GROUP BY.
+        UNPIVOT drops null values, so the categories are encoded to non-null strings before unpivoting
+        and decoded afterwards: null as an empty string, any other category prefixed with a character.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            State dataframe with columns [COLUMN_NAME, CATEGORY, COUNT].
+        """
+        # Unpivoted columns are named by position, since UNPIVOT returns names without the identifier quotes.
+        encoded_cols = [f"_ENCODED_{idx}" for idx in range(len(self.input_cols))]
+        # UNPIVOT requires all columns to have the same type, including the string length.
+        encoded_df = dataset.select(
+            [
+                F.iff(
+                    F.col(input_col).is_null(),
+                    F.lit(""),
+                    F.concat(F.lit("_"), F.col(input_col).cast(T.StringType())),
+                )
+                .cast(T.StringType())
+                .alias(encoded_col)
+                for input_col, encoded_col in zip(self.input_cols, encoded_cols)
+            ]
+        )
+        column_name = F.when(F.col(_COLUMN_NAME) == encoded_cols[0], F.lit(self.input_cols[0]))
+        for input_col, encoded_col in zip(self.input_cols[1:], encoded_cols[1:]):
+            column_name = column_name.when(F.col(_COLUMN_NAME) == encoded_col, F.lit(input_col))
+        state_df: snowpark.DataFrame = (
+            encoded_df.unpivot(_CATEGORY, _COLUMN_NAME, encoded_cols)
+            .group_by(_COLUMN_NAME, _CATEGORY)
+            .agg(F.count(F.lit(1)).alias(_COUNT))
+            .select(
+                column_name.alias(_COLUMN_NAME),
+                F.iff(
+                    F.col(_CATEGORY) == "",
+                    F.lit(None),
+                    F.substr(F.col(_CATEGORY), 2, F.length(F.col(_CATEGORY))),
+                ).alias(_CATEGORY),
+                F.col(_COUNT),
+            )
+        )
+        return state_df
+
     def _get_state_object_pandas_df(self) -> pd.DataFrame:
         """
         Convert `self._state_pandas` to a state object pandas dataframe where states
@@ -746,19 +771,59 @@ class OneHotEncoder(base.BaseTransformer):
         # TODO: [SNOW-730357] Support NUMBER as the key of Snowflake OBJECT for OneHotEncoder sparse output
         state_pandas[_ENCODED_VALUE] = state_pandas.apply(lambda x: map_encoded_value(x), axis=1)
 
-        # columns: COLUMN_NAME, CATEGORY, COUNT, FITTED_CATEGORY, ENCODING, N_FEATURES_OUT, ENCODED_VALUE
-        assert dataset._session is not None
-        state_df = dataset._session.create_dataframe(state_pandas)
-
+        inline_input_cols = self._get_inline_encoded_input_cols()
         suffix = "_" + uuid.uuid4().hex.upper()
         transformed_dataset = dataset
         original_dataset_cols = transformed_dataset.columns[:]
         all_output_cols = []
         suffixed_input_cols = []
         joined_input_cols = []
+        inline_cols = []
+        inline_columns = []
         for idx, input_col in enumerate(self.input_cols):
             output_col = self.output_cols[idx]
             all_output_cols += [output_col]
+
+            # handle identical input & output cols
+            if input_col == output_col:
+                col = identifier.concat_names([input_col, suffix])
+                suffixed_input_cols.append(col)
+                joined_input_cols.append(col)
+            else:
+                joined_input_cols.append(input_col)
+
+            if input_col in inline_input_cols:
+                if input_col == output_col:
+                    inline_cols.append(col)
+                    inline_columns.append(F.col(input_col))
+                input_col_state_pandas = state_pandas.loc[state_pandas[_COLUMN_NAME] == input_col]
+                encoded_values = [
+                    F.object_construct(
+                        F.lit(str(encoding)), F.lit(1), F.lit("array_length"), F.lit(int(n_features_out))
+                    )
+                    for encoding, n_features_out in zip(
+                        input_col_state_pandas[_ENCODING], input_col_state_pandas[_N_FEATURES_OUT]
+                    )
+                ]
+                inline_cols.append(output_col)
+                inline_columns.append(
+                    _utils.encode_categories_inline(
+                        F.col(input_col), zip(input_col_state_pandas[_CATEGORY], encoded_values)
+                    )
+                )
+        # encode the columns with few categories in a single projection
+        if inline_cols:
+            transformed_dataset = transformed_dataset.with_columns(inline_cols, inline_columns)
+
+        if len(inline_input_cols) < len(self.input_cols):
+            # columns: COLUMN_NAME, CATEGORY, COUNT, FITTED_CATEGORY, ENCODING, N_FEATURES_OUT, ENCODED_VALUE
+            assert dataset._session is not None
+            state_df = dataset._session.create_dataframe(state_pandas)
+
+        for idx, input_col in enumerate(self.input_cols):
+            if input_col in inline_input_cols:
+                continue
+            output_col = self.output_cols[idx]
             input_col_state_df = state_df.filter(F.col(_COLUMN_NAME) == input_col)[
                 [_CATEGORY, _ENCODED_VALUE]
             ].with_column_renamed(_ENCODED_VALUE, output_col)
@@ -771,14 +836,6 @@ class OneHotEncoder(base.BaseTransformer):
                 lsuffix=suffix,
             ).drop(_CATEGORY)
 
-            # handle identical input & output cols
-            if input_col == output_col:
-                col = identifier.concat_names([input_col, suffix])
-                suffixed_input_cols.append(col)
-                joined_input_cols.append(col)
-            else:
-                joined_input_cols.append(input_col)
-
         if not self._inferred_output_cols:
             self._inferred_output_cols = transformed_dataset[all_output_cols].columns
 
@@ -813,7 +870,9 @@ class OneHotEncoder(base.BaseTransformer):
 
         state_pandas[_ENCODED_VALUE] = state_pandas.apply(lambda x: map_encoded_value(x), axis=1)
 
-        for input_col in self.input_cols:
+        inline_input_cols = self._get_inline_encoded_input_cols()
+        joined_input_cols = [input_col for input_col in self.input_cols if input_col not in inline_input_cols]
+        for input_col in joined_input_cols:
             # split encoded values to columns
             input_col_state_pandas = state_pandas.loc[state_pandas[_COLUMN_NAME] == input_col][
                 [_COLUMN_NAME, _CATEGORY, _ENCODED_VALUE]
@@ -827,18 +886,45 @@ class OneHotEncoder(base.BaseTransformer):
             # merge split encoding columns to the state pandas
             state_pandas = state_pandas.merge(split_pandas, on=[_COLUMN_NAME, _CATEGORY], how="left")
 
-        # columns: COLUMN_NAME, CATEGORY, COUNT, FITTED_CATEGORY, ENCODING, N_FEATURES_OUT, ENCODED_VALUE, OUTPUT_CATs
-        assert dataset._session is not None
-        state_df = dataset._session.create_dataframe(state_pandas)
-
         transformed_dataset = dataset
         original_dataset_columns = transformed_dataset.columns[:]
         all_output_cols = []
         for input_col in self.input_cols:
+            all_output_cols += [
+                identifier.quote_name_without_upper_casing(col) for col in self._dense_output_cols_mappings[input_col]
+            ]
+
+        if inline_input_cols:
+            # encode the columns with few categories in two projections: one for the encodings
+            # and one for the output columns split from them
+            suffix = "_" + uuid.uuid4().hex.upper()
+            encoding_cols = [
+                identifier.concat_names([_ENCODING, suffix, str(idx)]) for idx in range(len(inline_input_cols))
+            ]
+            transformed_dataset = transformed_dataset.with_columns(
+                encoding_cols, [self._get_inline_encoding_column(input_col) for input_col in inline_input_cols]
+            )
+            inline_cols = []
+            inline_columns = []
+            for input_col, encoding_col in zip(inline_input_cols, encoding_cols):
+                for encoding, col in enumerate(self._dense_output_cols_mappings[input_col]):
+                    inline_cols.append(identifier.quote_name_without_upper_casing(col))
+                    # unknown values are left null as the ones missing from the join
+                    inline_columns.append(
+                        F.when(F.col(encoding_col) == encoding, 1).when(F.col(encoding_col).is_not_null(), 0)
+                    )
+            transformed_dataset = transformed_dataset.with_columns(inline_cols, inline_columns).drop(encoding_cols)
+
+        if joined_input_cols:
+            # columns: COLUMN_NAME, CATEGORY, COUNT, FITTED_CATEGORY, ENCODING, N_FEATURES_OUT, ENCODED_VALUE,
+            # OUTPUT_CATs
+            assert dataset._session is not None
+            state_df = dataset._session.create_dataframe(state_pandas)
+
+        for input_col in joined_input_cols:
             output_cols = [
                 identifier.quote_name_without_upper_casing(col) for col in self._dense_output_cols_mappings[input_col]
             ]
-            all_output_cols += output_cols
             input_col_state_df = state_df.filter(F.col(_COLUMN_NAME) == input_col)[output_cols + [_CATEGORY]]
 
             # index values through a left join over the dataset and its states
@@ -856,6 +942,38 @@ class OneHotEncoder(base.BaseTransformer):
         transformed_dataset = transformed_dataset[all_output_cols + original_dataset_columns]
         return transformed_dataset
 
+    def _get_inline_encoded_input_cols(self) -> List[str]:
+        """
+        Get the input columns with few enough categories to be encoded by inline CASE expressions
+        instead of joins with their states, which keeps the query plan flat for wide datasets.
+
+        Returns:
+            Input columns encoded inline.
+        """
+        n_categories = self._state_pandas[_COLUMN_NAME].value_counts()
+        return [
+            input_col
+            for input_col in self.input_cols
+            if n_categories.get(input_col, 0) <= _utils.INLINE_ENCODING_MAX_CATEGORIES
+        ]
+
+    def _get_inline_encoding_column(self, input_col: str) -> snowpark.Column:
+        """
+        Get the integer encoding of an input column as an inline CASE expression, which is null
+        for unknown values.
+
+        Args:
+            input_col: Input column.
+
+        Returns:
+            Encoding column.
+        """
+        input_col_state_pandas = self._state_pandas.loc[self._state_pandas[_COLUMN_NAME] == input_col]
+        return _utils.encode_categories_inline(
+            F.col(input_col),
+            zip(input_col_state_pandas[_CATEGORY], input_col_state_pandas[_ENCODING].map(int)),
+        )
+
     def _transform_snowpark_sparse_udf(self, dataset: snowpark.DataFrame) -> snowpark.DataFrame:
         """
         Transform Snowpark dataframe using one-hot encoding when
@@ -466,30 +466,49 @@ class OrdinalEncoder(base.BaseTransformer):
             Output dataset.
         """
         passthrough_columns = [c for c in dataset.columns if c not in self.output_cols]
-        assert dataset._session is not None
-        state_df = (
-            dataset._session.table(self._vocab_table_name)
-            if _utils.table_exists(
-                dataset._session,
-                self._vocab_table_name,
-                telemetry.get_statement_params(base.PROJECT, base.SUBPROJECT, self.__class__.__name__),
-            )
-            else dataset._session.create_dataframe(self._state_pandas)
-        )
+        transformed_dataset = dataset
 
-        # replace NULL with nan
-        null_category_state_df = state_df.filter(F.col(_CATEGORY).is_null()).with_column(
-            _INDEX, F.lit(self.encoded_missing_value)
-        )
-        state_df = state_df.filter(F.col(_CATEGORY).is_not_null()).union_by_name(null_category_state_df)
+        # encode the columns with few categories in a single projection instead of joins
+        n_categories = self._state_pandas[_COLUMN_NAME].value_counts()
+        inline_input_cols = []
+        inline_output_cols = []
+        joined_input_cols = []
+        joined_output_cols = []
+        for input_col, output_col in zip(self.input_cols, self.output_cols):
+            if n_categories.get(input_col, 0) <= _utils.INLINE_ENCODING_MAX_CATEGORIES:
+                inline_input_cols.append(input_col)
+                inline_output_cols.append(output_col)
+            else:
+                joined_input_cols.append(input_col)
+                joined_output_cols.append(output_col)
+        if inline_input_cols:
+            transformed_dataset = transformed_dataset.with_columns(
+                inline_output_cols, [self._get_inline_index_column(input_col) for input_col in inline_input_cols]
+            )
 
         suffix = "_" + uuid.uuid4().hex.upper()
-        transformed_dataset = dataset
+        if joined_input_cols:
+            assert dataset._session is not None
+            state_df = (
+                dataset._session.table(self._vocab_table_name)
+                if _utils.table_exists(
+                    dataset._session,
+                    self._vocab_table_name,
+                    telemetry.get_statement_params(base.PROJECT, base.SUBPROJECT, self.__class__.__name__),
+                )
+                else dataset._session.create_dataframe(self._state_pandas)
+            )
 
-        for batch_start in range(0, len(self.input_cols), _COLUMN_BATCH_SIZE):
-            batch_end = min(batch_start + _COLUMN_BATCH_SIZE, len(self.input_cols))
-            batch_input_cols = self.input_cols[batch_start:batch_end]
-            batch_output_cols = self.output_cols[batch_start:batch_end]
+            # replace NULL with nan
+            null_category_state_df = state_df.filter(F.col(_CATEGORY).is_null()).with_column(
+                _INDEX, F.lit(self.encoded_missing_value)
+            )
+            state_df = state_df.filter(F.col(_CATEGORY).is_not_null()).union_by_name(null_category_state_df)
+
+        for batch_start in range(0, len(joined_input_cols), _COLUMN_BATCH_SIZE):
+            batch_end = min(batch_start + _COLUMN_BATCH_SIZE, len(joined_input_cols))
+            batch_input_cols = joined_input_cols[batch_start:batch_end]
+            batch_output_cols = joined_output_cols[batch_start:batch_end]
 
             for input_col, output_col in zip(batch_input_cols, batch_output_cols):
                 input_col_state_df = state_df.filter(F.col(_COLUMN_NAME) == input_col)[
@@ -529,6 +548,26 @@ class OrdinalEncoder(base.BaseTransformer):
         transformed_dataset = transformed_dataset[self.output_cols + passthrough_columns]
         return transformed_dataset
 
+    def _get_inline_index_column(self, input_col: str) -> snowpark.Column:
+        """
+        Get the ordinal codes of an input column as an inline CASE expression, which is null
+        for unknown values.
+
+        Args:
+            input_col: Input column.
+
+        Returns:
+            Ordinal code column.
+        """
+        input_col_state_pandas = self._state_pandas.loc[self._state_pandas[_COLUMN_NAME] == input_col]
+        indices = [
+            F.lit(self.encoded_missing_value) if pd.isnull(category) else F.lit(float(index))
+            for category, index in zip(input_col_state_pandas[_CATEGORY], input_col_state_pandas[_INDEX])
+        ]
+        return _utils.encode_categories_inline(
+            F.col(input_col).cast(T.StringType()), zip(input_col_state_pandas[_CATEGORY], indices)
+        ).cast(T.FloatType())
+
     def _create_unfitted_sklearn_object(self) -> preprocessing.OrdinalEncoder:
         sklearn_args = self.get_sklearn_args(
             default_sklearn_obj=preprocessing.OrdinalEncoder(),
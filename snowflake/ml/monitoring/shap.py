@@ -1,10 +1,12 @@
 import logging
-from typing import Any, Iterable
+from typing import Any, Dict, Iterable, Optional
 
 import numpy as np
+import pandas as pd
 
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
+from snowflake.ml._internal.utils import identifier
 from snowflake.snowpark import functions, types
 
 _PROJECT = "MLOps"
@@ -19,6 +21,8 @@ class ShapExplainer:
     See shap's github page:
     (https://github.com/shap/shap).
 
+    The rows are explained in batches by a vectorized UDF, which creates the shap explainer once per process.
+
     Ex:
         from snowflake.ml.modeling.metrics.monitor import ShapExplainer
         from sklearn.ensemble import RandomForestClassifier
@@ -35,7 +39,15 @@ class ShapExplainer:
 
     """
 
-    def __init__(self, session: snowpark.Session, clf: Any, sample_training_data: Iterable[Any]) -> None:
+    def __init__(
+        self,
+        session: snowpark.Session,
+        clf: Any,
+        sample_training_data: Iterable[Any],
+        *,
+        algorithm: str = "auto",
+        max_background_samples: Optional[int] = 100,
+    ) -> None:
         """Constructor of ShapExplainer.
         It internal constructs shap.Explainer.
 
@@ -47,7 +59,13 @@ class ShapExplainer:
                 some Models require you pass in clf.predict
             sample_training_data: the list or numpyArray you usually input to model.fit(X, y), the X part;
                 it doesn't have to be the exact same X, but must have the same column Count;
-                if it's to big, shap algo underlying will down sample.
+                it is used as the background data of the explainer.
+            algorithm: the shap algorithm, "kernel" for shap.KernelExplainer, which requires a prediction function as
+                clf, or any algorithm of shap.Explainer, e.g. "auto", "tree", "permutation" or "exact". "tree" requires
+                the model itself as clf. Defaults to "auto".
+            max_background_samples: the maximum number of rows of sample_training_data used as background data, which
+                are sampled at random when there are more. The cost of explaining every row grows with it for most
+                algorithms. None to use all rows. Defaults to 100.
         """
         try:
             import shap
@@ -55,14 +73,40 @@ class ShapExplainer:
             logger.error("To use this API, please install `shap` package in your environment.")
             return
 
-        session.add_packages("numpy", "shap", "pandas")
+        background_data = np.asarray(sample_training_data)
+        if max_background_samples is not None and len(background_data) > max_background_samples:
+            background_data = shap.utils.sample(background_data, max_background_samples, random_state=0)
 
-        def get_shap(input: list) -> list:  # type: ignore[type-arg]
-            shap_explainer = shap.Explainer(clf, sample_training_data)
-            shap_values = shap_explainer(np.array([input]))
-            return shap_values.values.tolist()  # type: ignore[no-any-return]
+        # Defined here rather than at module level to be pickled by value into the UDF.
+        def create_explainer() -> Any:
+            import shap
 
-        self._shap_udf = session.udf.register(get_shap, input_types=[types.ArrayType()], return_type=types.ArrayType())
+            # shap.Explainer does not offer the kernel algorithm.
+            if algorithm == "kernel":
+                return shap.KernelExplainer(clf, background_data)
+            return shap.Explainer(clf, background_data, algorithm=algorithm)
+
+        # Explain one row locally to check the arguments and to get the shape of the shap values, which have one more
+        # dimension for models with several outputs.
+        probe_values = create_explainer()(background_data[:1]).values
+        self._value_type: types.DataType = types.DoubleType() if probe_values.ndim == 2 else types.ArrayType()
+
+        explainer_cache: Dict[str, Any] = {}
+
+        def get_shap(df: pd.DataFrame) -> pd.Series:
+            # The cache is unpickled once per process, so the explainer is created on the first batch only.
+            if "explainer" not in explainer_cache:
+                explainer_cache["explainer"] = create_explainer()
+            shap_values = explainer_cache["explainer"](df.to_numpy()).values
+            return pd.Series(shap_values.tolist())
+
+        n_features = background_data.shape[1]
+        self._shap_udf = session.udf.register(
+            get_shap,
+            input_types=[types.PandasDataFrameType([types.DoubleType()] * n_features)],
+            return_type=types.PandasSeriesType(types.ArrayType()),
+            packages=["numpy", "shap", "pandas"],
+        )
 
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
@@ -73,14 +117,19 @@ class ShapExplainer:
         """Will invoke server udf to compute shap.
 
         Args:
-            input_df: A snowpark DataFrame representing the input. This API internally "array_construct" all columns
+            input_df: A snowpark DataFrame representing the input, with one numeric column per feature.
 
         Returns:
-            The result Dataframe
+            The result Dataframe, with one SHAP_<column> column of shap values per input column. The shap values are
+            doubles, or arrays of doubles with one value per output for models with several outputs.
 
         """
-        return input_df.select(functions.array_construct(*(input_df.columns)).alias("INPUT")).select(
-            self._shap_udf("INPUT").alias("SHAP")
+        shap_values = self._shap_udf(*(functions.col(col).cast(types.DoubleType()) for col in input_df.columns))
+        return input_df.select(shap_values.alias("SHAP")).select(
+            *(
+                functions.col("SHAP")[i].cast(self._value_type).alias(identifier.concat_names(["SHAP_", col]))
+                for i, col in enumerate(input_df.columns)
+            )
         )
 
     @telemetry.send_api_usage_telemetry(
@@ -92,7 +141,7 @@ class ShapExplainer:
         """Will invoke server udf to compute shap.
 
         Args:
-            input_df: A snowpark DataFrame representing the input. This API internally "array_construct" all columns
+            input_df: A snowpark DataFrame representing the input, with one numeric column per feature.
 
         Returns:
             The result Dataframe
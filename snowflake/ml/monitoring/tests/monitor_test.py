@@ -150,8 +150,8 @@ class MonitorTest(absltest.TestCase):
         shapdf2 = sf_explainer.get_shap(inputDf)
         shapdf2_1 = sf_explainer(inputDf)
         assert shapdf2_1 is not None
-        v2 = shapdf2.collect()[0].as_dict(True)["SHAP"]
-        v2 = v2.replace("\n", "").strip("[] ").split(",")
+        v2 = shapdf2.collect()[0].as_dict(True)
+        self.assertListEqual(list(v2.keys()), ["SHAP_COL1", "SHAP_COL2", "SHAP_COL3", "SHAP_COL4", "SHAP_COL5"])
 
         shap_explainer1 = shap.Explainer(clf.predict, X_train)
         shap_values1 = shap_explainer1(test_sample)
@@ -173,8 +173,8 @@ class MonitorTest(absltest.TestCase):
 
         assert abs(float(v1[0]) - shap_values1.values[0][0]) <= 1e-5
         assert abs(float(v1[1]) - shap_values1.values[0][1]) <= 1e-5
-        assert abs(float(v2[0]) - shap_values1.values[0][0]) <= 1e-5
-        assert abs(float(v2[1]) - shap_values1.values[0][1]) <= 1e-5
+        assert abs(v2["SHAP_COL1"] - shap_values1.values[0][0]) <= 1e-5
+        assert abs(v2["SHAP_COL2"] - shap_values1.values[0][1]) <= 1e-5
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+from typing import Any
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import shap
+from absl.testing import absltest, parameterized
+from sklearn.ensemble import RandomForestRegressor
+
+from snowflake import snowpark
+from snowflake.ml.monitoring.shap import ShapExplainer
+from snowflake.snowpark import types
+
+
+class ShapExplainerTest(parameterized.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self._X = rng.normal(size=(200, 4))
+        self._y = self._X @ np.array([1.0, -2.0, 0.5, 0.0])
+        self._session = mock.MagicMock(spec=snowpark.Session)
+        self._session.udf = mock.MagicMock()
+
+    def _get_register_call(self) -> Any:
+        self._session.udf.register.assert_called_once()
+        return self._session.udf.register.call_args
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"n_outputs": 1, "value_type": types.DoubleType()},
+        {"n_outputs": 2, "value_type": types.ArrayType()},
+    )
+    def test_get_shap_udf(self, n_outputs: int, value_type: types.DataType) -> None:
+        y = self._y if n_outputs == 1 else np.column_stack([self._y, -self._y])
+        clf = RandomForestRegressor(n_estimators=5, max_depth=3, random_state=0).fit(self._X, y)
+
+        explainer = ShapExplainer(self._session, clf, self._X, algorithm="tree", max_background_samples=50)
+        self.assertEqual(explainer._value_type, value_type)
+
+        register_call = self._get_register_call()
+        self.assertEqual(register_call[1]["input_types"], [types.PandasDataFrameType([types.DoubleType()] * 4)])
+        self.assertEqual(register_call[1]["return_type"], types.PandasSeriesType(types.ArrayType()))
+
+        get_shap = register_call[0][0]
+        batch = pd.DataFrame(self._X[:10])
+        shap_values = get_shap(batch)
+        self.assertIsInstance(shap_values, pd.Series)
+        self.assertLen(shap_values, 10)
+
+        background_data = shap.utils.sample(self._X, 50, random_state=0)
+        expected = shap.Explainer(clf, background_data, algorithm="tree")(self._X[:10]).values
+        np.testing.assert_allclose(np.array(shap_values.tolist()), expected)
+
+    def test_get_shap_udf_creates_explainer_once(self) -> None:
+        clf = RandomForestRegressor(n_estimators=5, max_depth=3, random_state=0).fit(self._X, self._y)
+
+        with mock.patch("shap.Explainer", wraps=shap.Explainer) as mock_explainer:
+            ShapExplainer(self._session, clf, self._X, algorithm="tree")
+            # The explainer of the constructor only probes the shape of the shap values.
+            self.assertEqual(mock_explainer.call_count, 1)
+
+            get_shap = self._get_register_call()[0][0]
+            get_shap(pd.DataFrame(self._X[:5]))
+            get_shap(pd.DataFrame(self._X[5:10]))
+            self.assertEqual(mock_explainer.call_count, 2)
+
+    def test_get_shap_udf_kernel(self) -> None:
+        clf = RandomForestRegressor(n_estimators=5, max_depth=3, random_state=0).fit(self._X, self._y)
+
+        explainer = ShapExplainer(self._session, clf.predict, self._X[:20], algorithm="kernel")
+        self.assertEqual(explainer._value_type, types.DoubleType())
+
+        get_shap = self._get_register_call()[0][0]
+        shap_values = np.array(get_shap(pd.DataFrame(self._X[:3])).tolist())
+        self.assertEqual(shap_values.shape, (3, 4))
+        # The shap values of a row add up to its prediction minus the mean prediction on the background data.
+        np.testing.assert_allclose(
+            shap_values.sum(axis=1), clf.predict(self._X[:3]) - clf.predict(self._X[:20]).mean(), rtol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -1,13 +1,21 @@
 import collections
 import json
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from pandas import arrays as pandas_arrays
 from pandas.core.arrays import sparse as pandas_sparse
+from scipy import sparse
 
 from snowflake.snowpark import DataFrame
 
+# Matches the keys, the values and the end of a sparse object with numeric values, e.g. '{"3": 1, "array_length": 5}'.
+_SPARSE_TOKEN_PATTERN = r'[^\s"{},:]+|}'
+_ARRAY_LENGTH_KEY = "array_length"
+
 
 def _pandas_to_sparse_pandas(pandas_df: pd.DataFrame, sparse_cols: List[str]) -> Optional[pd.DataFrame]:
     """Convert the pandas df into pandas df with multiple SparseArray columns."""
@@ -87,3 +95,115 @@ def to_pandas_with_sparse(df: DataFrame, sparse_cols: List[str]) -> pd.DataFrame
     """
     pandas_dfs = [_pandas_to_sparse_pandas(pandas_df_batch, sparse_cols) for pandas_df_batch in df.to_pandas_batches()]
     return pd.concat(pandas_dfs)
+
+
+class _SparseColumnParts:
+    """Coordinates and values of a sparse column accumulated over batches."""
+
+    def __init__(self) -> None:
+        self.array_length: Optional[int] = None
+        self.rows: List[npt.NDArray[np.int64]] = []
+        self.cols: List[npt.NDArray[np.int64]] = []
+        self.vals: List[npt.NDArray[np.generic]] = []
+
+    def add_batch(self, sparse_values: pd.Series, row_offset: int) -> None:
+        """Parse the sparse objects of a batch, which are JSON strings or None, without decoding them one by one.
+
+        Args:
+            sparse_values: Sparse objects of the batch.
+            row_offset: Row number of the first row of the batch.
+
+        Raises:
+            ValueError: If the sparse objects are malformed, miss or mismatch their array_length, or contain keys that
+                are not integers in the range of array_length or values that are not numbers.
+        """
+        # Positions of the objects in the batch.
+        object_rows = np.flatnonzero(sparse_values.notna().to_numpy())
+        if not len(object_rows):
+            return
+        # The objects are tokenized into their keys and values, which alternate, and their ends.
+        tokens = np.array(
+            re.findall(_SPARSE_TOKEN_PATTERN, "".join(sparse_values.iloc[object_rows].tolist())), dtype=object
+        )
+        is_end = tokens == "}"
+        # Ordinal of the object of every token.
+        token_objects = (np.cumsum(is_end) - is_end)[~is_end]
+        if is_end.sum() != len(object_rows) or (np.bincount(token_objects, minlength=len(object_rows)) % 2).any():
+            raise ValueError("invalid sparse object")
+        entry_objects = token_objects[::2]
+        keys, vals = tokens[~is_end][::2], tokens[~is_end][1::2]
+
+        is_array_length = keys == _ARRAY_LENGTH_KEY
+        if (np.bincount(entry_objects[is_array_length], minlength=len(object_rows)) != 1).any():
+            raise ValueError("missing array_length")
+        array_lengths = set(vals[is_array_length].astype(np.int64).tolist())
+        if self.array_length is not None:
+            array_lengths.add(self.array_length)
+        if len(array_lengths) > 1:
+            raise ValueError("array_length mismatch")
+        self.array_length = array_lengths.pop()
+
+        keys, vals, entry_objects = keys[~is_array_length], vals[~is_array_length], entry_objects[~is_array_length]
+        try:
+            cols = keys.astype(np.int64)
+        except ValueError:
+            raise ValueError("index is not an integer")
+        if (cols < 0).any() or (cols >= self.array_length).any():
+            raise ValueError("index out of the range of array_length")
+
+        self.rows.append(object_rows[entry_objects] + row_offset)
+        self.cols.append(cols)
+        try:
+            self.vals.append(vals.astype(np.int64))
+        except ValueError:
+            # Raises ValueError for values that are not numbers.
+            self.vals.append(vals.astype(np.float64))
+
+
+def to_csr_matrix(df: DataFrame, sparse_cols: List[str]) -> Tuple[sparse.csr_matrix, List[str]]:
+    """Load the sparse columns of a Snowpark df, represented in JSON strings, into a scipy CSR matrix.
+
+    The df is streamed batch by batch and the sparse objects are parsed in a vectorized way, so that the memory and
+    time taken only grow with the number of stored values instead of the number of rows times the array_length. The
+    sparse columns are stacked horizontally in the matrix, in the order of `sparse_cols`, and named as the columns of
+    `to_pandas_with_sparse`. For the input in the example of `to_pandas_with_sparse`,
+    `to_csr_matrix(df, ['COL2'])` returns the matrix of the 'COL2_0', 'COL2_1', 'COL2_2' and 'COL2_3' columns, and
+    these names.
+
+    Args:
+        df: A Snowpark data frame contains column(s) of sparse data represented as JSON strings with numeric values.
+            An example of such JSON strings: '{"3": 1, "4": 2, "array_length": 5}'. This can come from transformation
+            results of `OneHotEncoder`.
+        sparse_cols: names of sparse data columns.
+
+    Returns:
+        A tuple of the CSR matrix of the sparse data columns and the names of its columns.
+    """
+    parts: Dict[str, _SparseColumnParts] = {col_name: _SparseColumnParts() for col_name in sparse_cols}
+    num_rows = 0
+    for pandas_df_batch in df.select(sparse_cols).to_pandas_batches():
+        for col_name in sparse_cols:
+            parts[col_name].add_batch(pandas_df_batch[col_name], num_rows)
+        num_rows += len(pandas_df_batch)
+
+    rows, cols, vals = [], [], []
+    column_names: List[str] = []
+    for col_name in sparse_cols:
+        col_parts = parts[col_name]
+        rows += col_parts.rows
+        cols += [col + len(column_names) for col in col_parts.cols]
+        vals += col_parts.vals
+        # For now use sequential number as suffix for column name
+        column_names += [col_name + "_" + str(col_i) for col_i in range(col_parts.array_length or 0)]
+
+    coo = sparse.coo_matrix(
+        (
+            np.concatenate(vals) if vals else np.empty(0),
+            (
+                np.concatenate(rows) if rows else np.empty(0, dtype=np.int64),
+                np.concatenate(cols) if cols else np.empty(0, dtype=np.int64),
+            ),
+        ),
+        shape=(num_rows, len(column_names)),
+    )
+    return coo.tocsr(), column_names
@@ -1,9 +1,14 @@
+from typing import List
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 from absl.testing import absltest
 from pandas.api import types as pandas_types
+from scipy import sparse as scipy_sparse
 
 from snowflake.ml.utils import sparse
+from snowflake.snowpark import DataFrame
 
 
 class SparseTest(absltest.TestCase):
@@ -118,6 +123,76 @@ class SparseTest(absltest.TestCase):
         with self.assertRaises(ValueError):
             sparse._pandas_to_sparse_pandas(df, ["sparse1"])
 
+    @staticmethod
+    def _mock_df(pandas_df_batches: List[pd.DataFrame]) -> mock.MagicMock:
+        df = mock.MagicMock(spec=DataFrame)
+        df.select.return_value.to_pandas_batches.return_value = iter(pandas_df_batches)
+        return df
+
+    def test_to_csr_matrix(self) -> None:
+        batches = [
+            pd.DataFrame(
+                {
+                    "sparse1": ['{\n  "3": 1,\n  "array_length": 4\n}', '{"0": 2, "1": 3, "array_length": 4}'],
+                    "sparse2": [None, None],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "sparse1": [None, '{"3": 1, "array_length": 4}'],
+                    "sparse2": ['{"1": 0.5, "array_length": 2}', '{"array_length": 2}'],
+                }
+            ),
+        ]
+        df = self._mock_df(batches)
+        matrix, column_names = sparse.to_csr_matrix(df, ["sparse1", "sparse2"])
+
+        df.select.assert_called_once_with(["sparse1", "sparse2"])
+        self.assertListEqual(
+            column_names, ["sparse1_0", "sparse1_1", "sparse1_2", "sparse1_3", "sparse2_0", "sparse2_1"]
+        )
+        self.assertIsInstance(matrix, scipy_sparse.csr_matrix)
+        np.testing.assert_allclose(
+            matrix.toarray(),
+            np.array(
+                [
+                    [0, 0, 0, 1, 0, 0],
+                    [2, 3, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0, 0.5],
+                    [0, 0, 0, 1, 0, 0],
+                ]
+            ),
+        )
+        # Same values as the SparseArray columns loaded by `to_pandas_with_sparse`.
+        df_sparse = pd.concat([sparse._pandas_to_sparse_pandas(batch, ["sparse1", "sparse2"]) for batch in batches])
+        np.testing.assert_allclose(matrix.toarray(), df_sparse[column_names].fillna(0).to_numpy(dtype=np.float64))
+
+    def test_to_csr_matrix_empty(self) -> None:
+        matrix, column_names = sparse.to_csr_matrix(self._mock_df([pd.DataFrame({"sparse1": [None]})]), ["sparse1"])
+        self.assertEqual(matrix.shape, (1, 0))
+        self.assertEmpty(column_names)
+
+    def test_to_csr_matrix_invalid(self) -> None:
+        for batches in [
+            # array_length mismatch within and across batches
+            [pd.DataFrame({"sparse1": ['{"3": 1, "array_length": 5}', '{"0": 2, "array_length": 4}']})],
+            [
+                pd.DataFrame({"sparse1": ['{"3": 1, "array_length": 5}']}),
+                pd.DataFrame({"sparse1": ['{"array_length": 4}']}),
+            ],
+            # missing array_length
+            [pd.DataFrame({"sparse1": ['{"3": 1}', '{"0": 2, "1": 3, "array_length": 4}']})],
+            # index greater than or equal to array_length, or negative
+            [pd.DataFrame({"sparse1": ['{"0": 2, "4": 3, "array_length": 4}']})],
+            [pd.DataFrame({"sparse1": ['{"-1": 2, "array_length": 4}']})],
+            # none-integer key
+            [pd.DataFrame({"sparse1": ['{"3x": 2, "array_length": 4}']})],
+            # none-numeric value
+            [pd.DataFrame({"sparse1": ['{"3": "a", "array_length": 4}']})],
+        ]:
+            with self.assertRaises(ValueError):
+                sparse.to_csr_matrix(self._mock_df(batches), ["sparse1"])
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -75,8 +75,8 @@ class SnowparkHandlersTest(common_test_base.CommonTestBase):
             X=input_df_pandas[input_cols], y=input_df_pandas[label_cols].squeeze()
         )
 
-        # Confirm that sproc was stored in session._FIT_WRAPPER_SPROCS for reuse.
-        assert "SklearnWrapperProvider" in self.session._FIT_WRAPPER_SPROCS
+        # Confirm that sproc was stored in session._SNOWML_REGISTERED_FUNCTIONS for reuse.
+        self.assertLen(self.session._SNOWML_REGISTERED_FUNCTIONS, 1)
 
         fit_estimator = self._handlers.fit_snowpark(
             dataset=input_df,
@@ -88,6 +88,7 @@ class SnowparkHandlersTest(common_test_base.CommonTestBase):
             sample_weight_col=None,
         )
         np.testing.assert_allclose(fit_estimator.coef_, pandas_fit_estimator.coef_)
+        self.assertLen(self.session._SNOWML_REGISTERED_FUNCTIONS, 1)
 
     @common_test_base.CommonTestBase.sproc_test()
     def test_batch_inference(self) -> None:
@@ -116,6 +117,37 @@ class SnowparkHandlersTest(common_test_base.CommonTestBase):
 
         np.testing.assert_allclose(sklearn_numpy_arr, sf_numpy_arr, rtol=1.0e-1, atol=1.0e-2)
 
+    @common_test_base.CommonTestBase.sproc_test()
+    def test_batch_inference_columnar(self) -> None:
+        sklearn_estimator = SkLinearRegression()
+        input_df_pandas, input_cols, label_cols = self._get_test_dataset()
+        input_df = self.session.create_dataframe(input_df_pandas)
+
+        fit_estimator = sklearn_estimator.fit(X=input_df_pandas[input_cols], y=input_df_pandas[label_cols].squeeze())
+
+        output_cols = ["OUTPUT_" + c for c in label_cols]
+
+        SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = True
+        try:
+            predictions = self._handlers.batch_inference(
+                dataset=input_df,
+                session=self.session,
+                estimator=fit_estimator,
+                dependencies=["snowflake-snowpark-python", "numpy", "scikit-learn", "cloudpickle"],
+                inference_method="predict",
+                input_cols=input_cols,
+                pass_through_columns=list(set(input_df.columns) - set(output_cols)),
+                expected_output_cols_list=output_cols,
+                expected_output_cols_type="FLOAT",
+            )
+        finally:
+            SnowparkHandlers._ENABLE_COLUMNAR_BATCH_INFERENCE = False
+
+        sklearn_numpy_arr = fit_estimator.predict(input_df_pandas[input_cols])
+        sf_numpy_arr = predictions.to_pandas().sort_values(by="INDEX")[output_cols].to_numpy().flatten()
+
+        np.testing.assert_allclose(sklearn_numpy_arr, sf_numpy_arr, rtol=1.0e-5, atol=1.0e-5)
+
     @common_test_base.CommonTestBase.sproc_test()
     def test_score_snowpark(self) -> None:
         sklearn_estimator = SkLinearRegression()
@@ -1,5 +1,4 @@
 from typing import Any, Dict
-from unittest import mock
 
 import numpy as np
 from absl.testing import parameterized
@@ -151,20 +150,29 @@ class D2PinballScoreTest(parameterized.TestCase):
         )
         self.assertAlmostEqual(sklearn_loss, actual_loss)
 
-    @mock.patch("snowflake.ml.modeling.metrics.regression.result._RESULT_SIZE_THRESHOLD", 0)
-    def test_metric_size_threshold(self) -> None:
-        pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"alpha": [0, 0.1, 0.5, 0.99, 1]}},
+    )
+    def test_alpha_sample_weight(self, params: Dict[str, Any]) -> None:
+        pandas_df, input_df = utils.get_df(self._session, _MULTICLASS_DATA, _SF_SCHEMA)
 
-        actual_loss = snowml_metrics.d2_pinball_score(
-            df=input_df,
-            y_true_col_names=_Y_TRUE_COLS,
-            y_pred_col_names=_Y_PRED_COLS,
-        )
-        sklearn_loss = sklearn_metrics.d2_pinball_score(
-            pandas_df[_Y_TRUE_COLS],
-            pandas_df[_Y_PRED_COLS],
-        )
-        self.assertAlmostEqual(sklearn_loss, actual_loss)
+        for alpha in params["alpha"]:
+            actual_loss = snowml_metrics.d2_pinball_score(
+                df=input_df,
+                y_true_col_names=_Y_TRUE_COLS,
+                y_pred_col_names=_Y_PRED_COLS,
+                sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+                alpha=alpha,
+                multioutput="raw_values",
+            )
+            sklearn_loss = sklearn_metrics.d2_pinball_score(
+                pandas_df[_Y_TRUE_COLS],
+                pandas_df[_Y_PRED_COLS],
+                sample_weight=pandas_df[_SAMPLE_WEIGHT_COL],
+                alpha=alpha,
+                multioutput="raw_values",
+            )
+            np.testing.assert_allclose(actual_loss, sklearn_loss)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,4 @@
 from typing import Any, Dict
-from unittest import mock
 
 import numpy as np
 from absl.testing import parameterized
@@ -118,21 +117,6 @@ class MeanAbsoluteErrorTest(parameterized.TestCase):
         )
         self.assertAlmostEqual(sklearn_loss, actual_loss)
 
-    @mock.patch("snowflake.ml.modeling.metrics.regression.result._RESULT_SIZE_THRESHOLD", 0)
-    def test_metric_size_threshold(self) -> None:
-        pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
-
-        actual_loss = snowml_metrics.mean_absolute_error(
-            df=input_df,
-            y_true_col_names=_Y_TRUE_COLS,
-            y_pred_col_names=_Y_PRED_COLS,
-        )
-        sklearn_loss = sklearn_metrics.mean_absolute_error(
-            pandas_df[_Y_TRUE_COLS],
-            pandas_df[_Y_PRED_COLS],
-        )
-        self.assertAlmostEqual(sklearn_loss, actual_loss)
-
 
 if __name__ == "__main__":
     main()
@@ -79,6 +79,49 @@ class PrecisionRecallCurveTest(parameterized.TestCase):
             np.testing.assert_allclose(actual_recall, sklearn_recall)
             np.testing.assert_allclose(actual_thresholds, sklearn_thresholds)
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL], "pos_label": [None, 0]}},
+    )
+    def test_sql_methods(self, params: Dict[str, Any]) -> None:
+        pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            for pos_label in params["pos_label"]:
+                sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+                sklearn_precision, sklearn_recall, sklearn_thresholds = sklearn_metrics.precision_recall_curve(
+                    pandas_df[_Y_TRUE_COL],
+                    pandas_df[_PROBAS_PRED_COL],
+                    pos_label=pos_label,
+                    sample_weight=sample_weight,
+                )
+
+                actual_precision, actual_recall, actual_thresholds = snowml_metrics.precision_recall_curve(
+                    df=input_df,
+                    y_true_col_name=_Y_TRUE_COL,
+                    probas_pred_col_name=_PROBAS_PRED_COL,
+                    pos_label=pos_label,
+                    sample_weight_col_name=sample_weight_col_name,
+                    method="exact",
+                )
+                np.testing.assert_allclose(actual_precision, sklearn_precision)
+                np.testing.assert_allclose(actual_recall, sklearn_recall)
+                np.testing.assert_allclose(actual_thresholds, sklearn_thresholds)
+
+                # The approximate curve is made of points of the exact one.
+                actual_precision, actual_recall, actual_thresholds = snowml_metrics.precision_recall_curve(
+                    df=input_df,
+                    y_true_col_name=_Y_TRUE_COL,
+                    probas_pred_col_name=_PROBAS_PRED_COL,
+                    pos_label=pos_label,
+                    sample_weight_col_name=sample_weight_col_name,
+                    method="approx",
+                    tolerance=0.05,
+                )
+                indices = np.searchsorted(sklearn_thresholds, actual_thresholds)
+                np.testing.assert_allclose(actual_thresholds, sklearn_thresholds[indices])
+                np.testing.assert_allclose(actual_precision[:-1], sklearn_precision[indices])
+                np.testing.assert_allclose(actual_recall[:-1], sklearn_recall[indices])
+
     @mock.patch("snowflake.ml.modeling.metrics.ranking.result._RESULT_SIZE_THRESHOLD", 0)
     def test_metric_size_threshold(self) -> None:
         pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
@@ -156,6 +156,72 @@ class RocAucScoreTest(parameterized.TestCase):
             )
             self.assertAlmostEqual(sklearn_auc, actual_auc)
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL], "max_fpr": [None, 0.5]}},
+    )
+    def test_sql_methods(self, params: Dict[str, Any]) -> None:
+        pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+            for max_fpr in params["max_fpr"]:
+                actual_auc = snowml_metrics.roc_auc_score(
+                    df=input_df,
+                    y_true_col_names=_BINARY_Y_TRUE_COL,
+                    y_score_col_names=_BINARY_Y_SCORE_COL,
+                    sample_weight_col_name=sample_weight_col_name,
+                    max_fpr=max_fpr,
+                    method="exact",
+                )
+                sklearn_auc = sklearn_metrics.roc_auc_score(
+                    pandas_df[_BINARY_Y_TRUE_COL],
+                    pandas_df[_BINARY_Y_SCORE_COL],
+                    sample_weight=sample_weight,
+                    max_fpr=max_fpr,
+                )
+                self.assertAlmostEqual(sklearn_auc, actual_auc)
+
+            sklearn_auc = sklearn_metrics.roc_auc_score(
+                pandas_df[_BINARY_Y_TRUE_COL],
+                pandas_df[_BINARY_Y_SCORE_COL],
+                sample_weight=sample_weight,
+            )
+            for tolerance in [0.05, 1e-4]:
+                actual_auc = snowml_metrics.roc_auc_score(
+                    df=input_df,
+                    y_true_col_names=_BINARY_Y_TRUE_COL,
+                    y_score_col_names=_BINARY_Y_SCORE_COL,
+                    sample_weight_col_name=sample_weight_col_name,
+                    method="approx",
+                    tolerance=tolerance,
+                )
+                self.assertAlmostEqual(sklearn_auc, actual_auc, delta=tolerance)
+
+    def test_sql_methods_invalid(self) -> None:
+        _, input_df = utils.get_df(self._session, _MULTICLASS_DATA, _SF_SCHEMA)
+
+        with self.assertRaisesRegex(ValueError, "only supports binary y_true"):
+            snowml_metrics.roc_auc_score(
+                df=input_df,
+                y_true_col_names=_MULTICLASS_Y_TRUE_COL,
+                y_score_col_names=_MULTICLASS_Y_SCORE_COLS[0],
+                method="exact",
+            )
+        with self.assertRaisesRegex(ValueError, "only supports a single column"):
+            snowml_metrics.roc_auc_score(
+                df=input_df,
+                y_true_col_names=_MULTICLASS_Y_TRUE_COL,
+                y_score_col_names=_MULTICLASS_Y_SCORE_COLS,
+                method="approx",
+            )
+        with self.assertRaisesRegex(ValueError, "method has to be one of"):
+            snowml_metrics.roc_auc_score(
+                df=input_df,
+                y_true_col_names=_MULTICLASS_Y_TRUE_COL,
+                y_score_col_names=_MULTICLASS_Y_SCORE_COLS[0],
+                method="sort",
+            )
+
     @parameterized.parameters(  # type: ignore[misc]
         {"params": {"multi_class": ["ovr", "ovo"]}},
     )
@@ -113,6 +113,61 @@ class RocCurveTest(parameterized.TestCase):
                 np.array((sklearn_fpr, sklearn_tpr, sklearn_thresholds)),
             )
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL], "drop_intermediate": [True, False]}},
+    )
+    def test_sql_methods(self, params: Dict[str, Any]) -> None:
+        pandas_df, input_df = utils.get_df(self._session, _BINARY_DATA, _SF_SCHEMA)
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            for drop_intermediate in params["drop_intermediate"]:
+                sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+                sklearn_fpr, sklearn_tpr, sklearn_thresholds = sklearn_metrics.roc_curve(
+                    pandas_df[_Y_TRUE_COL],
+                    pandas_df[_Y_SCORE_COL],
+                    sample_weight=sample_weight,
+                    drop_intermediate=drop_intermediate,
+                )
+
+                actual_fpr, actual_tpr, actual_thresholds = snowml_metrics.roc_curve(
+                    df=input_df,
+                    y_true_col_name=_Y_TRUE_COL,
+                    y_score_col_name=_Y_SCORE_COL,
+                    sample_weight_col_name=sample_weight_col_name,
+                    drop_intermediate=drop_intermediate,
+                    method="exact",
+                )
+                np.testing.assert_allclose(
+                    np.array((actual_fpr, actual_tpr, actual_thresholds)),
+                    np.array((sklearn_fpr, sklearn_tpr, sklearn_thresholds)),
+                )
+
+                actual_fpr, actual_tpr, _ = snowml_metrics.roc_curve(
+                    df=input_df,
+                    y_true_col_name=_Y_TRUE_COL,
+                    y_score_col_name=_Y_SCORE_COL,
+                    sample_weight_col_name=sample_weight_col_name,
+                    drop_intermediate=drop_intermediate,
+                    method="approx",
+                    tolerance=0.05,
+                )
+                self.assertAlmostEqual(
+                    sklearn_metrics.auc(sklearn_fpr, sklearn_tpr),
+                    sklearn_metrics.auc(actual_fpr, actual_tpr),
+                    delta=0.05,
+                )
+
+    def test_sql_methods_multiclass(self) -> None:
+        _, input_df = utils.get_df(self._session, _MULTICLASS_DATA, _SF_SCHEMA)
+
+        with self.assertRaisesRegex(ValueError, "multiclass format is not supported"):
+            snowml_metrics.roc_curve(
+                df=input_df,
+                y_true_col_name=_Y_TRUE_COL,
+                y_score_col_name=_Y_SCORE_COL,
+                method="exact",
+            )
+
     def test_multi_query_df(self) -> None:
         """Test ROC curve for DataFrames that require multiple queries to reconstruct."""
         stage = "temp"
@@ -214,6 +214,27 @@ class GridSearchCVTest(parameterized.TestCase):
                 actual_pandas_result.flatten(), sklearn_decision_function.flatten(), rtol=1.0e-1, atol=1.0e-2
             )
 
+    @mock.patch("snowflake.ml.modeling.model_selection.grid_search_cv.is_single_node")
+    def test_fit_distributed_without_sql_simplifier(self, mock_is_single_node) -> None:
+        mock_is_single_node.return_value = False
+        # Without the simplifier, every projection is a subquery of its own and only exposes the selected columns.
+        self._session.sql_simplifier_enabled = False
+        params = {"kernel": ("linear", "rbf"), "C": [1, 10, 80]}
+
+        sklearn_reg = SkGridSearchCV(estimator=SkSVC(random_state=0), param_grid=params, cv=3)
+        reg = GridSearchCV(estimator=SVC(random_state=0), param_grid=params, cv=3)
+        reg.set_input_cols(self._input_cols)
+        reg.set_output_cols(["OUTPUT_" + c for c in self._label_col])
+        reg.set_label_cols(self._label_col)
+
+        reg.fit(self._input_df)
+        sklearn_reg.fit(X=self._input_df_pandas[self._input_cols], y=self._input_df_pandas[self._label_col].squeeze())
+        sk_obj = reg.to_sklearn()
+
+        np.testing.assert_allclose(sk_obj.best_score_, sklearn_reg.best_score_)
+        self.assertEqual(sk_obj.best_index_, sklearn_reg.best_index_)
+        self._compare_cv_results(sk_obj.cv_results_, sklearn_reg.cv_results_)
+
     @mock.patch("snowflake.ml.modeling.model_selection.grid_search_cv.is_single_node")
     def test_transform(self, mock_is_single_node) -> None:
         mock_is_single_node.return_value = False
@@ -0,0 +1,141 @@
+from typing import List, Tuple
+from unittest import mock
+
+import inflection
+import numpy as np
+import pandas as pd
+from absl.testing import absltest, parameterized
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier as SkRandomForestClassifier
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    HalvingGridSearchCV as SkHalvingGridSearchCV,
+    HalvingRandomSearchCV as SkHalvingRandomSearchCV,
+)
+from sklearn.svm import SVC as SkSVC
+
+from snowflake.ml.modeling.ensemble import RandomForestClassifier
+from snowflake.ml.modeling.model_selection import (
+    HalvingGridSearchCV,
+    HalvingRandomSearchCV,
+)
+from snowflake.ml.modeling.svm import SVC
+from snowflake.ml.utils.connection_params import SnowflakeLoginOptions
+from snowflake.snowpark import Session
+
+
+def _load_iris_data() -> Tuple[pd.DataFrame, List[str], List[str]]:
+    input_df_pandas = load_iris(as_frame=True).frame
+    input_df_pandas.columns = [inflection.parameterize(c, "_").upper() for c in input_df_pandas.columns]
+    input_df_pandas["INDEX"] = input_df_pandas.reset_index().index
+
+    input_cols = [c for c in input_df_pandas.columns if not c.startswith("TARGET")]
+    label_col = [c for c in input_df_pandas.columns if c.startswith("TARGET")]
+
+    return input_df_pandas, input_cols, label_col
+
+
+class HalvingSearchCVTest(parameterized.TestCase):
+    def setUp(self):
+        """Creates Snowpark and Snowflake environments for testing."""
+        self._session = Session.builder.configs(SnowflakeLoginOptions()).create()
+
+        pd_data, input_col, label_col = _load_iris_data()
+        self._input_df_pandas = pd_data
+        self._input_cols = input_col
+        self._label_col = label_col
+        self._input_df = self._session.create_dataframe(self._input_df_pandas)
+
+    def tearDown(self):
+        self._session.close()
+
+    @parameterized.parameters(
+        {
+            "is_single_node": True,
+            "skmodel": SkRandomForestClassifier,
+            "model": RandomForestClassifier,
+            "params": {"max_depth": [2, 3, 8], "min_samples_split": [2, 5]},
+            "kwargs": dict(resource="n_estimators", max_resources=60),
+            "estimator_kwargs": dict(random_state=0),
+        },
+        {
+            "is_single_node": False,
+            "skmodel": SkSVC,
+            "model": SVC,
+            "params": {"kernel": ("linear", "rbf"), "C": [1, 10, 80]},
+            "kwargs": dict(),
+            "estimator_kwargs": dict(random_state=0),
+        },
+        {
+            "is_single_node": False,
+            "skmodel": SkRandomForestClassifier,
+            "model": RandomForestClassifier,
+            "params": {"max_depth": [2, 3, 8]},
+            "kwargs": dict(resource="n_estimators", max_resources=60),
+            "estimator_kwargs": dict(random_state=0),
+        },
+    )
+    @mock.patch("snowflake.ml.modeling.model_selection.halving_grid_search_cv.is_single_node")
+    def test_halving_grid_search_fit_and_compare_results(
+        self, mock_is_single_node, is_single_node, skmodel, model, params, kwargs, estimator_kwargs
+    ) -> None:
+        mock_is_single_node.return_value = is_single_node
+
+        sklearn_reg = SkHalvingGridSearchCV(
+            estimator=skmodel(**estimator_kwargs), param_grid=params, factor=2, random_state=0, cv=3, **kwargs
+        )
+
+        reg = HalvingGridSearchCV(
+            estimator=model(**estimator_kwargs), param_grid=params, factor=2, random_state=0, cv=3, **kwargs
+        )
+        reg.set_input_cols(self._input_cols)
+        output_cols = ["OUTPUT_" + c for c in self._label_col]
+        reg.set_output_cols(output_cols)
+        reg.set_label_cols(self._label_col)
+
+        reg.fit(self._input_df)
+        sklearn_reg.fit(X=self._input_df_pandas[self._input_cols], y=self._input_df_pandas[self._label_col].squeeze())
+        sk_obj = reg.to_sklearn()
+
+        self.assertEqual(sk_obj.n_candidates_, sklearn_reg.n_candidates_)
+        self.assertEqual(sk_obj.n_resources_, sklearn_reg.n_resources_)
+        np.testing.assert_array_equal(sk_obj.cv_results_["iter"], sklearn_reg.cv_results_["iter"])
+        np.testing.assert_allclose(
+            sk_obj.cv_results_["mean_test_score"], sklearn_reg.cv_results_["mean_test_score"], rtol=1.0e-1, atol=1.0e-2
+        )
+        np.testing.assert_allclose(sk_obj.best_score_, sklearn_reg.best_score_)
+        self.assertEqual(sk_obj.best_params_, sklearn_reg.best_params_)
+
+        actual_arr = reg.predict(self._input_df).to_pandas().sort_values(by="INDEX")[output_cols].to_numpy()
+        sklearn_numpy_arr = sklearn_reg.predict(self._input_df_pandas[self._input_cols])
+        np.testing.assert_allclose(actual_arr.flatten(), sklearn_numpy_arr.flatten())
+
+    @parameterized.parameters(True, False)
+    @mock.patch("snowflake.ml.modeling.model_selection.halving_random_search_cv.is_single_node")
+    def test_halving_random_search_fit_and_compare_results(self, is_single_node, mock_is_single_node) -> None:
+        mock_is_single_node.return_value = is_single_node
+        params = {"kernel": ("linear", "rbf"), "C": [1, 10, 80]}
+
+        sklearn_reg = SkHalvingRandomSearchCV(
+            estimator=SkSVC(random_state=0), param_distributions=params, factor=2, random_state=0, cv=3
+        )
+
+        reg = HalvingRandomSearchCV(
+            estimator=SVC(random_state=0), param_distributions=params, factor=2, random_state=0, cv=3
+        )
+        reg.set_input_cols(self._input_cols)
+        reg.set_output_cols(["OUTPUT_" + c for c in self._label_col])
+        reg.set_label_cols(self._label_col)
+
+        reg.fit(self._input_df)
+        sklearn_reg.fit(X=self._input_df_pandas[self._input_cols], y=self._input_df_pandas[self._label_col].squeeze())
+        sk_obj = reg.to_sklearn()
+
+        self.assertEqual(sk_obj.n_candidates_, sklearn_reg.n_candidates_)
+        self.assertEqual(sk_obj.n_resources_, sklearn_reg.n_resources_)
+        self.assertEqual(sk_obj.best_params_, sklearn_reg.best_params_)
+        np.testing.assert_allclose(sk_obj.best_score_, sklearn_reg.best_score_)
+
+
+if __name__ == "__main__":
+    absltest.main()
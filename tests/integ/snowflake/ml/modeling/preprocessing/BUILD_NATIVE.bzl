@@ -1,4 +1,4 @@
-load("//bazel:py_rules.bzl", "py_test")
+load("//bazel:py_rules.bzl", "py_binary", "py_library", "py_test")
 
 def get_build_rules_for_native_impl():
     SHARD_COUNT = 5
@@ -77,7 +77,9 @@ def get_build_rules_for_native_impl():
         shard_count = SHARD_COUNT,
         timeout = TIMEOUT,
         deps = [
+            ":one_hot_encoder_test_util",
             "//snowflake/ml/_internal/utils:identifier",
+            "//snowflake/ml/modeling/framework",
             "//snowflake/ml/modeling/preprocessing:one_hot_encoder",
             "//snowflake/ml/utils:connection_params",
             "//snowflake/ml/utils:sparse",
@@ -86,12 +88,33 @@ def get_build_rules_for_native_impl():
         data = ["//tests/integ/snowflake/ml/test_data:UCI_BANK_MARKETING_20COLUMNS.csv"],
     )
 
+    py_library(
+        name = "one_hot_encoder_test_util",
+        testonly = True,
+        srcs = ["one_hot_encoder_test_util.py"],
+        deps = [
+            "//snowflake/ml/modeling/preprocessing:one_hot_encoder",
+        ],
+    )
+
+    py_binary(
+        name = "one_hot_encoder_benchmark",
+        testonly = True,
+        srcs = ["one_hot_encoder_benchmark.py"],
+        deps = [
+            ":one_hot_encoder_test_util",
+            "//snowflake/ml/modeling/preprocessing:one_hot_encoder",
+            "//snowflake/ml/utils:connection_params",
+        ],
+    )
+
     py_test(
         name = "ordinal_encoder_test",
         srcs = ["ordinal_encoder_test.py"],
         shard_count = SHARD_COUNT,
         timeout = TIMEOUT,
         deps = [
+            "//snowflake/ml/modeling/framework",
             "//snowflake/ml/modeling/preprocessing:ordinal_encoder",
             "//snowflake/ml/utils:connection_params",
             "//tests/integ/snowflake/ml/modeling/framework:utils",
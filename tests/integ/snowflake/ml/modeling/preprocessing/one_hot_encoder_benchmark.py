@@ -0,0 +1,57 @@
+# A benchmark of the category count state OneHotEncoder computes when fitted, comparing the single UNPIVOT scan with
+# the union of one windowed select per input column it replaced, across numbers of input columns. It runs on generated
+# data in the warehouse of the connection.
+#
+# Run it with, e.g.:
+#   python one_hot_encoder_benchmark.py --num_rows=1000000 --num_columns=1,10,50 --num_categories=100
+
+import time
+from typing import Callable, List
+
+from absl import app, flags
+
+from snowflake.ml.modeling.preprocessing import one_hot_encoder
+from snowflake.ml.utils.connection_params import SnowflakeLoginOptions
+from snowflake.snowpark import DataFrame, Session, functions as F
+from tests.integ.snowflake.ml.modeling.preprocessing import one_hot_encoder_test_util
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_rows", 1_000_000, "Number of rows.")
+flags.DEFINE_list("num_columns", ["1", "10", "50"], "Numbers of input columns, one case per number.")
+flags.DEFINE_integer("num_categories", 100, "Number of categories of every input column.")
+
+
+def _time(get_state_df: Callable[[], DataFrame]) -> float:
+    start = time.perf_counter()
+    get_state_df().collect()
+    return time.perf_counter() - start
+
+
+def main(argv: List[str]) -> None:
+    del argv
+    session = Session.builder.configs(SnowflakeLoginOptions()).create()
+    # Results of identical queries would be reused, which would hide the cost of every run but the first.
+    session.sql("ALTER SESSION SET USE_CACHED_RESULT = FALSE").collect()
+
+    print(f"{'columns':>8}{'union s':>9}{'unpivot s':>11}{'speedup':>9}")
+    for num_columns in map(int, FLAGS.num_columns):
+        input_cols = [f"C_{i}" for i in range(num_columns)]
+        dataset = session.generator(
+            *[
+                F.concat(F.lit("category_"), F.uniform(0, FLAGS.num_categories - 1, F.random()).cast("STRING")).as_(c)
+                for c in input_cols
+            ],
+            rowcount=FLAGS.num_rows,
+        ).cache_result()
+        encoder = one_hot_encoder.OneHotEncoder(input_cols=input_cols)
+        union_seconds = _time(
+            lambda: one_hot_encoder_test_util.get_union_based_category_count_state_df(dataset, input_cols)
+        )
+        unpivot_seconds = _time(lambda: encoder._get_found_category_count_state_df(dataset))
+        print(f"{num_columns:>8}{union_seconds:>9.1f}{unpivot_seconds:>11.1f}{union_seconds / unpivot_seconds:>9.2f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -6,6 +6,7 @@ import pickle
 import sys
 import tempfile
 from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
 
 import cloudpickle
 import importlib_resources
@@ -19,9 +20,11 @@ from scipy.sparse import csr_matrix
 from sklearn.preprocessing import OneHotEncoder as SklearnOneHotEncoder
 
 from snowflake.ml._internal.utils import identifier
+from snowflake.ml.modeling.framework import _utils
 from snowflake.ml.modeling.preprocessing import (
     OneHotEncoder,  # type: ignore[attr-defined]
 )
+from snowflake.ml.modeling.preprocessing import one_hot_encoder
 from snowflake.ml.utils import sparse as utils_sparse
 from snowflake.ml.utils.connection_params import SnowflakeLoginOptions
 from snowflake.snowpark import DataFrame, Session, functions, types
@@ -45,6 +48,7 @@ from tests.integ.snowflake.ml.modeling.framework.utils import (
     equal_optional_of,
     equal_pandas_df_ignore_row_order,
 )
+from tests.integ.snowflake.ml.modeling.preprocessing import one_hot_encoder_test_util
 
 _DATA_QUOTES = [
     ["1", '"A"', "'g1ehQlL80t'", -1.0, 0.0],
@@ -181,6 +185,44 @@ class OneHotEncoderTest(parameterized.TestCase):
         for actual_cats, sklearn_cats in zip(actual_categories, encoder_sklearn.categories_):
             self.assertEqual(sklearn_cats.tolist(), actual_cats.tolist())
 
+    def test_fit_state_null_empty_nan(self) -> None:
+        """
+        Verify the fitted category counts of columns with NULL, empty string and NaN values.
+
+        Raises
+        ------
+        AssertionError
+            If the fitted category counts do not match those of the union-based state.
+        """
+        input_cols = ["STR", "FLOAT"]
+        df = self._session.create_dataframe(
+            [
+                [None, np.nan],
+                ["", None],
+                ["", np.nan],
+                ["a", 1.0],
+                ["a", 1.0],
+                [None, 2.5],
+                ["NaN", None],
+            ],
+            schema=types.StructType(
+                [types.StructField("STR", types.StringType()), types.StructField("FLOAT", types.DoubleType())]
+            ),
+        )
+
+        encoder = OneHotEncoder().set_input_cols(input_cols)
+        encoder.fit(df)
+
+        state_cols = [one_hot_encoder._COLUMN_NAME, one_hot_encoder._CATEGORY, one_hot_encoder._COUNT]
+        expected_state_pandas = one_hot_encoder_test_util.get_union_based_category_count_state_df(
+            df, input_cols
+        ).to_pandas()
+        pd.testing.assert_frame_equal(
+            encoder._state_pandas[state_cols].sort_values(by=state_cols).reset_index(drop=True),
+            expected_state_pandas[state_cols].sort_values(by=state_cols).reset_index(drop=True),
+            check_dtype=False,
+        )
+
     @parameterized.parameters(  # type: ignore[misc]
         {"params": {}},
         {"params": {"min_frequency": 2}},
@@ -469,6 +511,11 @@ class OneHotEncoderTest(parameterized.TestCase):
         df_pandas_output = utils_sparse.to_pandas_with_sparse(transformed_df.sort(id_col)[output_cols], output_cols)
         np.testing.assert_allclose(df_pandas_output.to_numpy(), sklearn_arr.toarray())
 
+        # loading into memory with `to_csr_matrix`
+        csr_output, csr_output_cols = utils_sparse.to_csr_matrix(transformed_df.sort(id_col), output_cols)
+        np.testing.assert_allclose(csr_output.toarray(), sklearn_arr.toarray())
+        self.assertListEqual(csr_output_cols, df_pandas_output.columns.tolist())
+
     def test_transform_null_dense(self) -> None:
         """
         Verify dense transformed results when the NULL category exists.
@@ -525,6 +572,37 @@ class OneHotEncoderTest(parameterized.TestCase):
 
         self.assertTrue(self.compare_sparse_transform_results(actual_arr, sklearn_arr))
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"sparse": False, "inline_max_categories": 0},
+        {"sparse": False, "inline_max_categories": 3},
+        {"sparse": True, "inline_max_categories": 0},
+        {"sparse": True, "inline_max_categories": 3},
+    )
+    def test_transform_null_joined_states(self, sparse: bool, inline_max_categories: int) -> None:
+        """
+        Verify transformed results of columns encoded by joins with their states match the ones encoded inline.
+
+        Args:
+            sparse: Whether to output the sparse representation.
+            inline_max_categories: Maximum number of categories of the columns encoded inline.
+        """
+        input_cols, output_cols, id_col = CATEGORICAL_COLS, OUTPUT_COLS, ID_COL
+        input_cols_extended = input_cols.copy()
+        input_cols_extended.append(id_col)
+        _, df = framework_utils.get_df(self._session, DATA_NONE_NAN, SCHEMA, np.nan)
+
+        encoder = OneHotEncoder(sparse=sparse).set_input_cols(input_cols).set_output_cols(output_cols)
+        encoder.fit(df)
+
+        expected_pandas = encoder.transform(df[input_cols_extended]).sort(id_col).to_pandas()
+        with mock.patch.object(_utils, "INLINE_ENCODING_MAX_CATEGORIES", inline_max_categories):
+            actual_pandas = encoder.transform(df[input_cols_extended]).sort(id_col).to_pandas()
+
+        if sparse:
+            expected_pandas[output_cols] = expected_pandas[output_cols].applymap(lambda x: json.loads(x) if x else None)
+            actual_pandas[output_cols] = actual_pandas[output_cols].applymap(lambda x: json.loads(x) if x else None)
+        pd.testing.assert_frame_equal(actual_pandas, expected_pandas, check_dtype=False)
+
     def test_transform_boolean_dense(self) -> None:
         """
         Verify dense transformed results on boolean categories.
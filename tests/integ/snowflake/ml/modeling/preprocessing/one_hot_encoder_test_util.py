@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from snowflake import snowpark
+from snowflake.ml.modeling.preprocessing import one_hot_encoder
+from snowflake.snowpark import functions as F, types as T
+
+
+def get_union_based_category_count_state_df(dataset: snowpark.DataFrame, input_cols: List[str]) -> snowpark.DataFrame:
+    """Get the state dataframe with columns [COLUMN_NAME, CATEGORY, COUNT] the way OneHotEncoder used to, with one
+    select of windowed counts per input column chained by UNION.
+
+    Args:
+        dataset: Input dataset.
+        input_cols: Input columns.
+
+    Returns:
+        State dataframe with columns [COLUMN_NAME, CATEGORY, COUNT].
+    """
+    found_state_df: Optional[snowpark.DataFrame] = None
+    for input_col in input_cols:
+        state_columns = [
+            F.lit(input_col).alias(one_hot_encoder._COLUMN_NAME),
+            F.col(input_col).cast(T.StringType()).alias(one_hot_encoder._CATEGORY),
+            F.iff(
+                # null or nan values
+                F.col(input_col).is_null() | (F.col(input_col).cast(T.StringType()).equal_nan()),
+                # count null and nan values
+                F.sum(
+                    F.iff(
+                        F.col(input_col).is_null() | (F.col(input_col).cast(T.StringType()).equal_nan()),
+                        1,
+                        0,
+                    )
+                ).over(snowpark.Window.partition_by(input_col)),
+                # count values that are not null or nan
+                F.count(input_col).over(snowpark.Window.partition_by(input_col)),
+            ).alias(one_hot_encoder._COUNT),
+        ]
+        temp_df = dataset.select(state_columns).distinct()
+        found_state_df = found_state_df.union_by_name(temp_df) if found_state_df is not None else temp_df
+
+    assert found_state_df is not None
+    return found_state_df
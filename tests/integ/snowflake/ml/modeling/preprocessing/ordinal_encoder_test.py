@@ -5,6 +5,7 @@ import pickle
 import sys
 import tempfile
 from typing import Any, Dict, List, Tuple
+from unittest import mock
 
 import cloudpickle
 import joblib
@@ -15,6 +16,7 @@ from absl.testing import parameterized
 from absl.testing.absltest import main
 from sklearn.preprocessing import OrdinalEncoder as SklearnOrdinalEncoder
 
+from snowflake.ml.modeling.framework import _utils
 from snowflake.ml.modeling.preprocessing import (  # type: ignore[attr-defined]
     OrdinalEncoder,
 )
@@ -340,6 +342,31 @@ class OrdinalEncoderTest(parameterized.TestCase):
 
         np.testing.assert_allclose(actual_arr, sklearn_arr, equal_nan=True)
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"inline_max_categories": 0},
+        {"inline_max_categories": 3},
+    )
+    def test_transform_null_joined_states(self, inline_max_categories: int) -> None:
+        """
+        Verify transformed results of columns encoded by joins with their states match the ones encoded inline.
+
+        Args:
+            inline_max_categories: Maximum number of categories of the columns encoded inline.
+        """
+        input_cols, output_cols, id_col = CATEGORICAL_COLS, OUTPUT_COLS, ID_COL
+        input_cols_extended = input_cols.copy()
+        input_cols_extended.append(id_col)
+        _, df = framework_utils.get_df(self._session, DATA_NONE_NAN, SCHEMA, np.nan)
+
+        encoder = OrdinalEncoder().set_input_cols(input_cols).set_output_cols(output_cols)
+        encoder.fit(df)
+
+        expected_pandas = encoder.transform(df[input_cols_extended]).sort(id_col).to_pandas()
+        with mock.patch.object(_utils, "INLINE_ENCODING_MAX_CATEGORIES", inline_max_categories):
+            actual_pandas = encoder.transform(df[input_cols_extended]).sort(id_col).to_pandas()
+
+        pd.testing.assert_frame_equal(actual_pandas, expected_pandas, check_dtype=False)
+
     def test_transform_boolean(self) -> None:
         """
         Verify transformed results on boolean categories.